@@ -45,6 +45,9 @@ from vibe.backtester.analysis.regime_research.features import FeatureEngine
 from vibe.backtester.analysis.regime_research.filter_evaluator import FilterEvaluator
 from vibe.backtester.analysis.regime_research.labeler import DayRegimeLabeler, LabelerConfig
 from vibe.backtester.analysis.regime_research.reporting import ReportGenerator
+from vibe.backtester.data.bar_cache import get_bar_cache
+from vibe.backtester.data.feature_store import get_feature_store
+from vibe.backtester.data.parquet_dataset import is_partitioned
 
 logging.basicConfig(
     level=logging.INFO,
@@ -54,8 +57,22 @@ logging.basicConfig(
 logger = logging.getLogger("analyze_regimes")
 
 
+def _normalise_frame(df: pd.DataFrame) -> pd.DataFrame:
+    df.columns = [c.lower() for c in df.columns]
+    # Remove timezone info from index to match trades CSV (loaded as naive)
+    if isinstance(df.index, pd.DatetimeIndex) and df.index.tz is not None:
+        df.index = df.index.tz_localize(None)
+    # Ensure nanosecond precision to match trades
+    if isinstance(df.index, pd.DatetimeIndex):
+        df.index = pd.DatetimeIndex(df.index.values.astype('datetime64[ns]'))
+    return df
+
+
 def _load_ohlcv(data_dir: Path, symbol: str) -> pd.DataFrame:
-    """Load OHLCV parquet for symbol.  Tries <symbol>.parquet and <symbol>_1min.parquet."""
+    """Load OHLCV parquet for symbol.  Tries <symbol>/ (partitioned), <symbol>.parquet and <symbol>_1min.parquet."""
+    if is_partitioned(data_dir, symbol):
+        logger.info("Loading OHLCV from partitioned dataset %s", data_dir / symbol)
+        return _normalise_frame(get_bar_cache().minute_bars(data_dir, symbol).copy())
     candidates = [
         data_dir / f"{symbol}.parquet",
         data_dir / f"{symbol}_1min.parquet",
@@ -64,15 +81,7 @@ def _load_ohlcv(data_dir: Path, symbol: str) -> pd.DataFrame:
     for path in candidates:
         if path.exists():
             logger.info("Loading OHLCV from %s", path)
-            df = pd.read_parquet(path)
-            df.columns = [c.lower() for c in df.columns]
-            # Remove timezone info from index to match trades CSV (loaded as naive)
-            if isinstance(df.index, pd.DatetimeIndex) and df.index.tz is not None:
-                df.index = df.index.tz_localize(None)
-            # Ensure nanosecond precision to match trades
-            if isinstance(df.index, pd.DatetimeIndex):
-                df.index = pd.DatetimeIndex(df.index.values.astype('datetime64[ns]'))
-            return df
+            return _normalise_frame(get_bar_cache().read_parquet(path).copy())
     raise FileNotFoundError(
         f"No parquet file found for symbol '{symbol}' in {data_dir}. "
         f"Tried: {[str(p) for p in candidates]}"
@@ -131,7 +140,6 @@ def main(argv: list[str] | None = None) -> None:
     # ------------------------------------------------------------------ #
     # 1. Load data
     # ------------------------------------------------------------------ #
-    ohlcv = _load_ohlcv(Path(args.data_dir), args.symbol)
     trades = _load_trades(Path(args.trades_csv))
 
     # ------------------------------------------------------------------ #
@@ -139,8 +147,16 @@ def main(argv: list[str] | None = None) -> None:
     # ------------------------------------------------------------------ #
     feature_list = "all" if args.features == "all" else args.features.split(",")
     logger.info("Computing features: %s", feature_list)
-    engine = FeatureEngine()
-    features = engine.compute(ohlcv, feature_list)
+    data_dir = Path(args.data_dir)
+    if is_partitioned(data_dir, args.symbol) or (data_dir / f"{args.symbol}.parquet").exists():
+        # Persistent store: features are only recomputed when the source data changes
+        features = _normalise_frame(
+            get_feature_store().features(data_dir, args.symbol, "1m", feature_list)
+        )
+    else:
+        ohlcv = _load_ohlcv(data_dir, args.symbol)
+        engine = FeatureEngine()
+        features = engine.compute(ohlcv, feature_list)
     logger.info("Feature table: %d rows × %d columns", len(features), len(features.columns))
 
     # ------------------------------------------------------------------ #
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark BacktestEngine event-loop modes (row-by-row vs columnar) and the
+VectorizedORBEngine kernel.
+
+Reports bars/sec for each mode and checks that all produce identical trades.
+
+Usage:
+    # Real data (BACKTEST__DATA_DIR or --data-dir)
+    python scripts/benchmark_engine_modes.py --symbol QQQ --start 2020-01-01 --end 2024-12-31
+
+    # Synthetic data (no Parquet files needed)
+    python scripts/benchmark_engine_modes.py --synthetic-days 250
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from vibe.backtester.core.engine import BacktestEngine
+from vibe.backtester.core.vectorized import VectorizedORBEngine
+from vibe.backtester.data.synthetic import write_synthetic_parquet
+from vibe.common.ruleset.loader import RuleSetLoader
+
+ET = ZoneInfo("America/New_York")
+
+
+MODES = {
+    "rows": lambda ruleset, data_dir: BacktestEngine(ruleset, data_dir, columnar=False),
+    "columnar": lambda ruleset, data_dir: BacktestEngine(ruleset, data_dir, columnar=True),
+    "vector": lambda ruleset, data_dir: VectorizedORBEngine(ruleset, data_dir),
+}
+
+
+def _time_run(make_engine, ruleset, data_dir, symbol, start, end, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        engine = make_engine(ruleset, data_dir)
+        t0 = time.perf_counter()
+        result = engine.run(symbol, start, end)
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark row, columnar and vectorized engines")
+    parser.add_argument("--ruleset", default="orb_production")
+    parser.add_argument("--symbol", default="QQQ")
+    parser.add_argument("--start", default="2024-01-01")
+    parser.add_argument("--end", default="2024-12-31")
+    parser.add_argument("--data-dir", type=Path,
+                        default=Path(os.getenv("BACKTEST__DATA_DIR", "vibe/data/parquet")))
+    parser.add_argument("--synthetic-days", type=int, default=0,
+                        help="Generate N sessions of synthetic 1m bars instead of reading --data-dir")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per mode (best time is reported)")
+    args = parser.parse_args()
+
+    # Strategy logging is very chatty at INFO and would dominate the timings.
+    logging.disable(logging.INFO)
+
+    ruleset = RuleSetLoader.from_name(args.ruleset)
+    start = datetime.strptime(args.start, "%Y-%m-%d").replace(tzinfo=ET)
+    end = datetime.strptime(args.end, "%Y-%m-%d").replace(tzinfo=ET)
+
+    data_dir = args.data_dir
+    if args.synthetic_days:
+        data_dir = Path(tempfile.mkdtemp(prefix="engine_bench_"))
+        write_synthetic_parquet(data_dir, symbol=args.symbol, start=args.start, days=args.synthetic_days)
+        end = datetime(2100, 1, 1, tzinfo=ET)
+
+    timings = {}
+    results = {}
+    for mode, make_engine in MODES.items():
+        timings[mode], results[mode] = _time_run(
+            make_engine, ruleset, data_dir, args.symbol, start, end, args.repeat
+        )
+
+    n_bars = len(results["rows"].equity.equity_curve)
+    print(f"Bars: {n_bars:,}   Trades: {len(results['rows'].trades)}")
+    for mode, elapsed in timings.items():
+        speedup = timings["rows"] / elapsed
+        print(f"  {mode:<9} {elapsed:8.3f}s   {n_bars / elapsed:12,.0f} bars/sec   {speedup:6.1f}x")
+
+    reference = [t.model_dump() for t in results["rows"].trades]
+    identical = all(
+        [t.model_dump() for t in result.trades] == reference for result in results.values()
+    )
+    print(f"  trades identical: {identical}")
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
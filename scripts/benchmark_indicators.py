@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark the vectorized batch indicators against the reference loops.
+
+Times atr_series, adx_series and rolling_percentile_rank (window 252) and
+their *_fast counterparts on random-walk OHLC data, and checks the outputs
+agree. The reference loops take minutes at 1M rows, so they run on at most
+--reference-rows rows and are compared by rows/sec.
+
+Usage:
+    python scripts/benchmark_indicators.py
+    python scripts/benchmark_indicators.py --rows 100000 1000000 --reference-rows 50000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from vibe.common.indicators.batch import (
+    adx_series,
+    adx_series_fast,
+    atr_series,
+    atr_series_fast,
+    rolling_percentile_rank,
+    rolling_percentile_rank_fast,
+)
+
+PCTILE_WINDOW = 252
+
+INDICATORS = {
+    "atr_14": (lambda df: atr_series(df, 14), lambda df: atr_series_fast(df, 14)),
+    "adx_14": (lambda df: adx_series(df, 14), lambda df: adx_series_fast(df, 14)),
+    "pctile_rank": (
+        lambda df: rolling_percentile_rank(df["close"], PCTILE_WINDOW),
+        lambda df: rolling_percentile_rank_fast(df["close"], PCTILE_WINDOW),
+    ),
+}
+
+
+def _ohlc(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame({
+        "high": close + rng.uniform(0, 2, n),
+        "low": close - rng.uniform(0, 2, n),
+        "close": close,
+    })
+
+
+def _time(fn, df):
+    t0 = time.perf_counter()
+    result = fn(df)
+    return time.perf_counter() - t0, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vectorized batch indicators")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000])
+    parser.add_argument("--reference-rows", type=int, default=100_000,
+                        help="Max rows for the (slow) reference implementations")
+    args = parser.parse_args()
+
+    print(f"{'indicator':<12} {'rows':>10} {'reference rows/s':>17} {'fast rows/s':>14} {'speedup':>9}")
+    for rows in args.rows:
+        df = _ohlc(rows)
+        ref_df = df.iloc[:min(rows, args.reference_rows)]
+        for name, (reference, fast) in INDICATORS.items():
+            ref_secs, expected = _time(reference, ref_df)
+            fast_secs, result = _time(fast, df)
+            np.testing.assert_allclose(
+                result.iloc[:len(ref_df)].to_numpy(), expected.to_numpy(), rtol=1e-10, equal_nan=True
+            )
+            ref_rate = len(ref_df) / ref_secs
+            fast_rate = rows / fast_secs
+            print(f"{name:<12} {rows:>10,} {ref_rate:>17,.0f} {fast_rate:>14,.0f} {fast_rate / ref_rate:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -73,7 +73,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--cache-dir",
         default="cache/optimization",
-        help="Directory containing cached backtest result pickles",
+        help="Result cache directory (ResultCache entries)",
     )
     parser.add_argument(
         "--no-cache",
@@ -253,7 +253,7 @@ def main() -> None:
     base_cfg = load_ruleset_yaml(ruleset_path)
     variant = VariantConfig(trigger_r=args.trigger_r, plus_ticks=args.plus_ticks)
 
-    # ParameterSweep provides deterministic cache key + pkl load/save utilities.
+    # ParameterSweep provides the content-addressed cache key + ResultCache load/save.
     pre = ParameterSweep(
         base_ruleset_path=ruleset_path,
         data_dir=data_dir,
@@ -8,10 +8,16 @@ Paths are configured via .env (or environment variables):
 
 Run once before first backtest; re-run only if source files change.
 
+Output is a year/month partitioned dataset per symbol
+(<SYMBOL>/year=YYYY/month=MM/data.parquet) so short backtest windows read only
+the partitions they need. --layout single writes the legacy <SYMBOL>.parquet.
+
 Usage:
     python scripts/convert_databento.py              # convert all symbols
     python scripts/convert_databento.py --symbol QQQ # one symbol only
     python scripts/convert_databento.py --dry-run    # validate only, no write
+    python scripts/convert_databento.py --partition day    # year/month/day partitions
+    python scripts/convert_databento.py --layout single    # one file per symbol
 """
 
 import argparse
@@ -32,6 +38,9 @@ except ImportError:
     pass
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from vibe.backtester.data.parquet_dataset import write_partitioned
 
 def _resolve(env_key: str, default: str) -> Path:
     raw = os.environ.get(env_key, default)
@@ -226,7 +235,13 @@ def _validate(df: pd.DataFrame, symbol: str) -> ValidationResult:
 
 # ── Per-symbol conversion ──────────────────────────────────────────────────────
 
-def _convert_one(path: Path, out_dir: Path, dry_run: bool) -> ValidationResult:
+def _convert_one(
+    path: Path,
+    out_dir: Path,
+    dry_run: bool,
+    layout: str = "partitioned",
+    partition: str = "month",
+) -> ValidationResult:
     symbol = _symbol_from_path(path)
 
     print(f"  {symbol:6s}  loading {path.name} ...", end=" ", flush=True)
@@ -253,7 +268,14 @@ def _convert_one(path: Path, out_dir: Path, dry_run: bool) -> ValidationResult:
     for msg in result.warnings:
         print(f"           WARN : {msg}")
 
-    if result.ok and not dry_run:
+    if result.ok and not dry_run and layout == "partitioned":
+        files = write_partitioned(df, out_dir, symbol, granularity=partition)
+        size_mb = sum(f.stat().st_size for f in files) / 1_000_000
+        print(f"           >> {symbol}/  ({len(files)} partitions, {size_mb:.1f} MB)")
+        legacy = out_dir / f"{symbol}.parquet"
+        if legacy.exists():
+            print(f"           NOTE : {legacy.name} is shadowed by the partitioned dataset")
+    elif result.ok and not dry_run:
         out_path = out_dir / f"{symbol}.parquet"
         df.to_parquet(out_path, engine="pyarrow", compression="snappy", index=True)
         size_mb = out_path.stat().st_size / 1_000_000
@@ -273,6 +295,14 @@ def main() -> None:
         "--dry-run", action="store_true",
         help="Validate and report only — do not write Parquet files",
     )
+    parser.add_argument(
+        "--layout", choices=["partitioned", "single"], default="partitioned",
+        help="partitioned: <SYMBOL>/year=/month=/ dataset (default); single: <SYMBOL>.parquet",
+    )
+    parser.add_argument(
+        "--partition", choices=["month", "day"], default="month",
+        help="Partition granularity for --layout partitioned (default: month)",
+    )
     args = parser.parse_args()
 
     if not DATABENTO_DIR.exists():
@@ -295,7 +325,10 @@ def main() -> None:
     label = "  [dry-run - no files written]" if args.dry_run else ""
     print(f"Converting {len(files)} file(s){label}\n")
 
-    results = [_convert_one(f, PARQUET_DIR, args.dry_run) for f in files]
+    results = [
+        _convert_one(f, PARQUET_DIR, args.dry_run, args.layout, args.partition)
+        for f in files
+    ]
 
     # ── Summary ────────────────────────────────────────────────────────────────
     n_ok = sum(1 for r in results if r.ok)
@@ -304,7 +337,7 @@ def main() -> None:
     print(f"  {n_ok}/{len(results)} symbols clean"
           + (f"  ({n_warn} with warnings)" if n_warn else ""))
     if not args.dry_run and n_ok > 0:
-        print(f"  Parquet files: {PARQUET_DIR}")
+        print(f"  Parquet data ({args.layout}): {PARQUET_DIR}")
 
     if n_ok < len(results):
         print("  Symbols with errors must be fixed before backtesting.")
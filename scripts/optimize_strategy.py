@@ -16,6 +16,9 @@ Usage:
     # With robustness and walk-forward
     python scripts/optimize_strategy.py --strategy orb \
         --robustness --walk-forward
+
+    # Walk-forward optimization: re-select parameters every window from one sweep
+    python scripts/optimize_strategy.py --strategy orb --walk-forward --wfo
     
     # Custom date range
     python scripts/optimize_strategy.py --strategy orb \
@@ -24,6 +27,17 @@ Usage:
     # Grid search mode with surface analysis
     python scripts/optimize_strategy.py --strategy orb \
         --mode grid --surface
+
+    # Spread the parameter sweep over 8 worker processes
+    python scripts/optimize_strategy.py --strategy orb --mode full --workers 8
+
+    # Distribute the sweep over hosts: publish to a shared queue file, then run
+    # scripts/sweep_worker.py /shared/sweeps/orb.sqlite on every node
+    python scripts/optimize_strategy.py --strategy orb --mode full \
+        --queue /shared/sweeps/orb.sqlite --workers 0
+
+    # Successive halving: score the grid on recent history, promote the top third
+    python scripts/optimize_strategy.py --strategy orb --mode full --search halving
 """
 import argparse
 import logging
@@ -235,18 +249,100 @@ def main():
         help="Slippage simulation in ticks (default: 5)",
     )
     
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for the parameter sweep (default: 1, serial)",
+    )
+    
+    parser.add_argument(
+        "--queue",
+        type=str,
+        default=None,
+        help="Distribute the sweep through a job queue file on shared storage; "
+        "--workers local workers join it (0 = only scripts/sweep_worker.py workers)",
+    )
+    
+    parser.add_argument(
+        "--batched",
+        action="store_true",
+        help="Evaluate the sweep in one shared pass over the bars (BatchORBEngine)",
+    )
+    
+    parser.add_argument(
+        "--search",
+        choices=["exhaustive", "halving"],
+        default="exhaustive",
+        help="exhaustive (every combination on the full period) or halving "
+             "(successive halving over growing history spans)",
+    )
+    
+    parser.add_argument(
+        "--halving-eta",
+        type=int,
+        default=3,
+        help="Keep the top 1/eta candidates per budget level (default: 3)",
+    )
+    
+    parser.add_argument(
+        "--halving-min-days",
+        type=int,
+        default=365,
+        help="Span of the first budget level in calendar days (default: 365)",
+    )
+    
+    parser.add_argument(
+        "--tpe-trials",
+        type=int,
+        default=0,
+        help="TPE trials over float parameters after halving (requires optuna; default: 0)",
+    )
+    
     parser.add_argument(
         "--robustness",
         action="store_true",
         help="Run robustness analysis on best candidate",
     )
     
+    parser.add_argument(
+        "--monte-carlo",
+        action="store_true",
+        help="Resample the best candidate's trades (bootstrap, block bootstrap, shuffle)",
+    )
+    
+    parser.add_argument(
+        "--mc-paths",
+        type=int,
+        default=10_000,
+        help="Monte Carlo paths per resampling method (default: 10000)",
+    )
+    
+    parser.add_argument(
+        "--mc-seed",
+        type=int,
+        default=0,
+        help="Monte Carlo seed for reproducible output (default: 0)",
+    )
+    
+    parser.add_argument(
+        "--reprice-slippage",
+        action="store_true",
+        help="Robustness slippage variants by re-pricing one run's trades (fast)",
+    )
+    
     parser.add_argument(
         "--walk-forward",
         action="store_true",
         help="Run walk-forward validation",
     )
     
+    parser.add_argument(
+        "--wfo",
+        action="store_true",
+        help="With --walk-forward, re-select the best combination in every train window",
+    )
+    
     parser.add_argument(
         "--surface",
         action="store_true",
@@ -398,6 +494,7 @@ def main():
             cache_dir=cache_dir,
             run_robustness=args.robustness,
             run_walk_forward=args.walk_forward,
+            walk_forward_reoptimize=args.wfo,
             run_surface=args.surface,
             output_dir=output_dir,
             register_in_research_journal=args.journal,
@@ -408,6 +505,17 @@ def main():
             journal_tags=[t.strip() for t in args.journal_tags.split(",") if t.strip()],
             experiment_tags=["optimization", "parameter-sweep", args.strategy],
             strategy_name=f"{args.strategy.upper()}Strategy",
+            workers=args.workers,
+            search_mode=args.search,
+            halving_eta=args.halving_eta,
+            halving_min_span_days=args.halving_min_days,
+            tpe_trials=args.tpe_trials,
+            batched=args.batched,
+            queue_path=Path(args.queue) if args.queue else None,
+            reprice_slippage=args.reprice_slippage,
+            run_monte_carlo=args.monte_carlo,
+            monte_carlo_paths=args.mc_paths,
+            monte_carlo_seed=args.mc_seed,
         )
         
         # Print summary
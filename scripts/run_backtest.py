@@ -7,12 +7,25 @@ Usage:
         --start 2023-01-01 --end 2024-12-31 --capital 10000 \
         --output reports/backtest.html \
         --trades-csv reports/our_trades.csv
+
+    # Several symbols on one merged timeline with shared capital
+    python scripts/run_backtest.py --symbols QQQ,SPY,IWM --capital 100000
+
+    # Keep the end-of-run state, then later extend it with only the new bars
+    python scripts/run_backtest.py --end 2024-12-31 --save-snapshot cache/snapshots/qqq
+    python scripts/run_backtest.py --resume cache/snapshots/qqq --end 2025-03-31 \
+        --save-snapshot cache/snapshots/qqq --verify-resume
+
+    # Resolve ambiguous stop/TP bars from 1m data; --intrabar-report also
+    # times a plain 5m run and prints the drill-down count and overhead
+    python scripts/run_backtest.py --intrabar --intrabar-report
 """
 import argparse
 import csv
 import logging
 import os
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
@@ -67,14 +80,29 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Run ORB backtest")
     parser.add_argument("--ruleset", default="orb_production", help="Ruleset name")
     parser.add_argument("--symbol",  default="QQQ",           help="Symbol to test")
+    parser.add_argument("--symbols", default=None,
+                        help="Comma-separated universe traded against one shared portfolio "
+                             "(overrides --symbol)")
     parser.add_argument("--start",   default="2020-01-01",    help="Start date YYYY-MM-DD")
     parser.add_argument("--end",     default="2024-12-31",    help="End date YYYY-MM-DD")
     parser.add_argument("--capital", default=10_000.0, type=float, help="Initial capital")
     parser.add_argument("--slippage-ticks", default=5, type=int, help="Slippage in ticks")
     parser.add_argument("--output",     default="reports/backtest.html", help="Output HTML path")
     parser.add_argument("--trades-csv", default=None, help="Optional path to dump trade list as CSV")
+    parser.add_argument("--save-snapshot", default=None,
+                        help="Directory to save the end-of-run engine state to")
+    parser.add_argument("--resume", default=None,
+                        help="Snapshot directory to extend to --end (--symbol/--start come from it)")
+    parser.add_argument("--verify-resume", action="store_true",
+                        help="With --resume, also run the full range and fail on any difference")
+    parser.add_argument("--intrabar", action="store_true",
+                        help="Resolve bars touching both stop and TP from 1m bars")
+    parser.add_argument("--intrabar-report", action="store_true",
+                        help="With --intrabar, also run plain 5m mode and report the overhead")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
     args = parser.parse_args()
+    if args.symbols and (args.save_snapshot or args.resume):
+        parser.error("--save-snapshot/--resume support a single --symbol only")
     
     # Configure logging
     logging.basicConfig(
@@ -93,18 +121,49 @@ def main() -> None:
     ruleset = RuleSetLoader.from_name(args.ruleset)
     engine  = BacktestEngine(ruleset=ruleset, data_dir=data_dir,
                               initial_capital=args.capital,
-                              slippage_ticks=args.slippage_ticks)
+                              slippage_ticks=args.slippage_ticks,
+                              intrabar=args.intrabar)
 
     start = datetime.strptime(args.start, "%Y-%m-%d").replace(tzinfo=ET)
     end   = datetime.strptime(args.end,   "%Y-%m-%d").replace(tzinfo=ET)
 
-    print(f"Running {args.ruleset} on {args.symbol} from {args.start} to {args.end}...")
-    result = engine.run(symbol=args.symbol, start_date=start, end_date=end)
+    run_start = time.perf_counter()
+    if args.resume:
+        print(f"Resuming {args.ruleset} from {args.resume} to {args.end}...")
+        result = engine.resume(args.resume, end_date=end, save_snapshot=args.save_snapshot,
+                               verify=args.verify_resume)
+    elif args.symbols:
+        symbols = [s.strip() for s in args.symbols.split(",") if s.strip()]
+        print(f"Running {args.ruleset} on {','.join(symbols)} (shared capital) "
+              f"from {args.start} to {args.end}...")
+        result = engine.run_portfolio(symbols, start_date=start, end_date=end)
+    else:
+        print(f"Running {args.ruleset} on {args.symbol} from {args.start} to {args.end}...")
+        result = engine.run(symbol=args.symbol, start_date=start, end_date=end,
+                            save_snapshot=args.save_snapshot)
+
+    run_seconds = time.perf_counter() - run_start
 
     cm = result.overall
     print(f"Trades: {cm.n_trades}  Win: {cm.win_rate:.1%}  "
           f"Expectancy: {cm.expectancy_r:.2f}R  P&L: ${cm.total_pnl:,.0f}")
 
+    stats = engine.intrabar_stats
+    if stats is not None:
+        print(f"Intrabar: {stats.drilled}/{stats.exit_checks} exit checks drilled into 1m bars "
+              f"({stats.overhead_seconds:.3f}s load + replay)")
+        if args.intrabar_report and not (args.resume or args.symbols):
+            plain = BacktestEngine(ruleset=ruleset, data_dir=data_dir,
+                                   initial_capital=args.capital,
+                                   slippage_ticks=args.slippage_ticks)
+            plain_start = time.perf_counter()
+            plain_result = plain.run(symbol=args.symbol, start_date=start, end_date=end)
+            plain_seconds = time.perf_counter() - plain_start
+            overhead = (run_seconds - plain_seconds) / plain_seconds if plain_seconds else 0.0
+            print(f"          intrabar run {run_seconds:.2f}s vs 5m run {plain_seconds:.2f}s "
+                  f"({overhead:+.1%}); 5m mode: Expectancy {plain_result.overall.expectancy_r:.2f}R  "
+                  f"P&L ${plain_result.overall.total_pnl:,.0f}")
+
     out = Path(args.output)
     out.parent.mkdir(parents=True, exist_ok=True)
     ReportGenerator().generate_html(result, out)
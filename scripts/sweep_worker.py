@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Run parameter-sweep jobs from a shared job queue.
+
+A coordinator publishes the sweep with
+`optimize_strategy.py --queue PATH` (or `ParameterSweep.run(queue_path=...)`);
+start this script on any number of hosts that can reach PATH. Each worker
+claims one combination at a time under a lease, backtests it and writes the
+result back, and exits once every job has finished.
+
+Usage:
+    python scripts/sweep_worker.py /shared/sweeps/orb.sqlite
+
+    # Data mounted at a different path on this host; give up after 10 idle minutes
+    python scripts/sweep_worker.py /shared/sweeps/orb.sqlite \
+        --data-dir /mnt/market/parquet --idle-timeout 600
+
+    # Several workers on one host
+    for i in 1 2 3 4; do python scripts/sweep_worker.py /shared/sweeps/orb.sqlite & done
+"""
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from vibe.backtester.analysis.sweep_queue import DEFAULT_LEASE_SECONDS, run_worker
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run parameter-sweep jobs from a shared queue")
+    parser.add_argument("queue", type=str, help="Queue file published by the sweep coordinator")
+    parser.add_argument("--worker-id", type=str, default=None, help="Lease owner name (default: host:pid)")
+    parser.add_argument(
+        "--lease-seconds",
+        type=float,
+        default=DEFAULT_LEASE_SECONDS,
+        help=f"Job lease length, renewed while a job runs (default: {DEFAULT_LEASE_SECONDS:.0f})",
+    )
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds between claim attempts")
+    parser.add_argument("--idle-timeout", type=float, default=None, help="Exit after this long without a job")
+    parser.add_argument("--max-jobs", type=int, default=None, help="Exit after this many jobs")
+    parser.add_argument("--data-dir", type=str, default=None, help="Local path of the sweep's Parquet data")
+    args = parser.parse_args()
+
+    if not Path(args.queue).exists():
+        print(f"ERROR: Queue not found: {args.queue}", file=sys.stderr)
+        sys.exit(1)
+
+    run_worker(
+        args.queue,
+        worker_id=args.worker_id,
+        lease_seconds=args.lease_seconds,
+        poll_interval=args.poll_interval,
+        idle_timeout=args.idle_timeout,
+        max_jobs=args.max_jobs,
+        data_dir=args.data_dir,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,393 @@
+"""
+Combinatorial purged cross-validation (CPCV) over a sweep's per-day outcomes.
+
+The trading days are split into n_groups contiguous groups. Every choice of
+n_test_groups of them is one split: those groups are the test set, and the
+rest is the training set. The training set loses purge_days before each test
+group and embargo_days after it, so nothing next to a test day (overnight
+gaps, indicator warm-up) informs training.
+
+Two things come out of the splits:
+
+- Per combination, the out-of-sample expectancy and Sharpe on every split's
+  test set: C(n_groups, n_test_groups) values each.
+- Per split, the combination a selection rule picks on the training set.
+  Stitching each group's test outcome from the splits that tested it gives
+  n_test_groups * C(n_groups, n_test_groups) / n_groups complete
+  out-of-sample paths of "re-optimize, then trade". The distribution of
+  those paths, and how often the pick lands in the bottom half out of
+  sample (probability of backtest overfitting), show whether selection
+  generalizes.
+
+ORB trades are one per day and independent across days (see
+outcome_matrix), so every set is a day mask. Sums, squares and counts come
+from mask x outcome matrix products, which makes a 10-group / 2-test CPCV of
+a 1k-combination sweep take seconds. Without cached outcomes the sweep is
+run once first (workers > 1 fans it out over a process pool).
+
+    analysis = CPCVAnalyzer(n_groups=10, n_test_groups=2).analyze(outcomes=sweep.outcomes)
+    analysis.summary()                       # per-combination OOS distribution
+    analysis.path_expectancy, analysis.pbo   # selection process
+"""
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import combinations
+from math import comb
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from vibe.backtester.analysis.outcome_matrix import _DAYS_PER_YEAR, OutcomeMatrix
+from vibe.backtester.analysis.parallel_runs import AnalysisTiming
+
+if TYPE_CHECKING:
+    from vibe.backtester.analysis.parameter_sweep import ParameterSweep
+
+logger = logging.getLogger(__name__)
+
+SELECTION_METRICS = ("composite_score", "expectancy_r", "sharpe_ratio")
+
+
+@dataclass
+class CPCVSplit:
+    """One train/test split: boolean masks over CPCVAnalysis.days."""
+    test_groups: Tuple[int, ...]
+    test_days: np.ndarray
+    train_days: np.ndarray
+
+
+@dataclass
+class _Stats:
+    """Per-set sufficient statistics, arrays of shape (n_sets, n_combos)."""
+    n_days: np.ndarray
+    n_trades: np.ndarray
+    sum_r: np.ndarray
+    sum_r2: np.ndarray
+
+    def expectancy(self) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.n_trades > 0, self.sum_r / self.n_trades, 0.0)
+
+    def sharpe(self) -> np.ndarray:
+        """Annualized Sharpe of per-day R (0 on days without a trade)."""
+        n = self.n_days
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = self.sum_r / n
+            var = (self.sum_r2 - self.sum_r * mean) / (n - 1)
+            return np.where((n > 1) & (var > 0), mean / np.sqrt(var) * np.sqrt(_DAYS_PER_YEAR), 0.0)
+
+
+def _stats(masks: np.ndarray, r: np.ndarray, traded: np.ndarray) -> _Stats:
+    """Sufficient statistics of every day mask (rows of masks) for every combination."""
+    weights = masks.astype(np.float64)
+    n_days = masks.sum(axis=1, dtype=np.float64)[:, None]
+    return _Stats(
+        n_days=np.broadcast_to(n_days, (len(masks), r.shape[1])),
+        n_trades=weights @ traded,
+        sum_r=weights @ r,
+        sum_r2=weights @ (r * r),
+    )
+
+
+@dataclass
+class CPCVAnalysis:
+    """
+    CPCV result. Split arrays have shape (n_splits, n_combos); path arrays
+    have one value per stitched out-of-sample path.
+    """
+    n_groups: int
+    n_test_groups: int
+    purge_days: int
+    embargo_days: int
+    select_by: str
+    days: pd.DatetimeIndex
+    outcomes: OutcomeMatrix  # The matrix the splits were drawn from
+    groups: np.ndarray  # Group number of every day
+    splits: List[CPCVSplit]
+
+    test_expectancy: np.ndarray
+    test_sharpe: np.ndarray
+    test_trades: np.ndarray
+    train_score: np.ndarray  # select_by on each training set
+
+    selected: np.ndarray  # Combination picked on each split's training set
+    path_splits: np.ndarray  # (n_paths, n_groups): split supplying each group
+    path_expectancy: np.ndarray
+    path_sharpe: np.ndarray
+
+    timing: Optional[AnalysisTiming] = None
+
+    @property
+    def combos(self) -> pd.DataFrame:
+        return self.outcomes.combos
+
+    @property
+    def n_splits(self) -> int:
+        return len(self.splits)
+
+    @property
+    def n_paths(self) -> int:
+        return len(self.path_splits)
+
+    @property
+    def pbo(self) -> float:
+        """
+        Probability of backtest overfitting: the fraction of splits whose
+        training-set pick ranks in the bottom half of combinations by test
+        expectancy.
+        """
+        if self.n_splits == 0 or len(self.combos) < 2:
+            return 0.0
+        picked = self.test_expectancy[np.arange(self.n_splits), self.selected]
+        # Relative rank in (0, 1) of the pick among all combinations on the test set
+        rank = ((self.test_expectancy < picked[:, None]).sum(axis=1) + 0.5) / len(self.combos)
+        return float(np.mean(rank <= 0.5))
+
+    def distribution(self, combo: Dict[str, Any] | int) -> Dict[str, np.ndarray]:
+        """Test expectancy, Sharpe and trade count of one combination on every split."""
+        j = self.outcomes.combo_index(combo)
+        return {
+            "expectancy_r": self.test_expectancy[:, j],
+            "sharpe_ratio": self.test_sharpe[:, j],
+            "n_trades": self.test_trades[:, j],
+        }
+
+    def summary(self, q: Sequence[float] = (5, 50, 95)) -> pd.DataFrame:
+        """
+        Out-of-sample distribution over splits for every combination.
+
+        Returns:
+            combos plus mean/std/percentiles of test expectancy and Sharpe,
+            the fraction of splits with positive expectancy, and how often
+            the combination was selected; sorted by median test expectancy.
+        """
+        columns: Dict[str, np.ndarray] = {}
+        for name, values in (("expectancy_r", self.test_expectancy), ("sharpe_ratio", self.test_sharpe)):
+            columns[f"{name}_mean"] = values.mean(axis=0)
+            columns[f"{name}_std"] = values.std(axis=0)
+            for p, row in zip(q, np.percentile(values, q, axis=0)):
+                columns[f"{name}_p{p:g}"] = row
+        columns["positive_fraction"] = (self.test_expectancy > 0).mean(axis=0)
+        columns["times_selected"] = np.bincount(self.selected, minlength=len(self.combos))
+        frame = pd.concat([self.combos.reset_index(drop=True), pd.DataFrame(columns)], axis=1)
+        median = f"expectancy_r_p{50:g}" if 50 in q else "expectancy_r_mean"
+        return frame.sort_values(median, ascending=False, kind="stable")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "n_groups": self.n_groups,
+            "n_test_groups": self.n_test_groups,
+            "purge_days": self.purge_days,
+            "embargo_days": self.embargo_days,
+            "select_by": self.select_by,
+            "n_splits": self.n_splits,
+            "n_paths": self.n_paths,
+            "n_combos": len(self.combos),
+            "pbo": self.pbo,
+            "path_expectancy": {
+                f"p{p}": float(v) for p, v in zip((5, 50, 95), np.percentile(self.path_expectancy, (5, 50, 95)))
+            } if self.n_paths else {},
+            "path_sharpe": {
+                f"p{p}": float(v) for p, v in zip((5, 50, 95), np.percentile(self.path_sharpe, (5, 50, 95)))
+            } if self.n_paths else {},
+            "timing": self.timing.to_dict() if self.timing else None,
+        }
+
+
+class CPCVAnalyzer:
+    """
+    Combinatorial purged cross-validation of a parameter sweep.
+
+    Args:
+        n_groups: Contiguous day groups (N)
+        n_test_groups: Groups in each test set (k); C(N, k) splits
+        purge_days: Training days dropped before each test group
+        embargo_days: Training days dropped after each test group
+        select_by: Training-set metric that picks a combination per split
+            ("composite_score", "expectancy_r" or "sharpe_ratio")
+        min_trades: composite_score sample-size threshold
+    """
+
+    def __init__(
+        self,
+        n_groups: int = 10,
+        n_test_groups: int = 2,
+        purge_days: int = 1,
+        embargo_days: int = 1,
+        select_by: str = "composite_score",
+        min_trades: int = 30,
+    ):
+        if n_groups < 2:
+            raise ValueError(f"n_groups must be >= 2, got {n_groups}")
+        if not 1 <= n_test_groups < n_groups:
+            raise ValueError(f"n_test_groups must be in [1, {n_groups - 1}], got {n_test_groups}")
+        if purge_days < 0 or embargo_days < 0:
+            raise ValueError("purge_days and embargo_days must be non-negative")
+        if select_by not in SELECTION_METRICS:
+            raise ValueError(f"select_by must be one of {SELECTION_METRICS}, got {select_by!r}")
+        self.n_groups = n_groups
+        self.n_test_groups = n_test_groups
+        self.purge_days = purge_days
+        self.embargo_days = embargo_days
+        self.select_by = select_by
+        self.min_trades = min_trades
+
+    @property
+    def n_splits(self) -> int:
+        return comb(self.n_groups, self.n_test_groups)
+
+    @property
+    def n_paths(self) -> int:
+        return self.n_test_groups * self.n_splits // self.n_groups
+
+    def analyze(
+        self,
+        outcomes: Optional[OutcomeMatrix] = None,
+        sweep: Optional["ParameterSweep"] = None,
+        symbol: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        workers: int = 1,
+    ) -> CPCVAnalysis:
+        """
+        Run CPCV over a sweep's outcomes.
+
+        Args:
+            outcomes: Per-day outcome matrix (ParameterSweep.run(collect_outcomes=True))
+            sweep: Sweep to run over [start_date, end_date] when outcomes is not given
+            symbol: Trading symbol (with sweep)
+            start_date: Restrict to days from here (and the sweep period)
+            end_date: Restrict to days up to here (and the sweep period)
+            workers: Worker processes for the sweep run
+
+        Raises:
+            ValueError: If neither outcomes nor a sweep with its period is
+                given, or there are fewer days than groups
+        """
+        wall_start = time.perf_counter()
+        swept = outcomes is None
+        if outcomes is None:
+            if sweep is None or symbol is None or start_date is None or end_date is None:
+                raise ValueError("CPCV needs an OutcomeMatrix, or a ParameterSweep with symbol and period")
+            logger.info(f"Running sweep for CPCV on {symbol} ({workers} worker(s))...")
+            sweep.run(symbol, start_date, end_date, collect_outcomes=True, workers=workers)
+            outcomes = sweep.outcomes
+
+        rows = outcomes.window(start_date, end_date)
+        days = outcomes.days[rows]
+        if len(days) < self.n_groups:
+            raise ValueError(f"{len(days)} trading days cannot form {self.n_groups} groups")
+        r_full = outcomes.r_multiple[rows]
+        traded = (~np.isnan(r_full)).astype(np.float64)
+        r = np.where(np.isnan(r_full), 0.0, r_full)
+
+        groups = np.empty(len(days), dtype=np.int64)
+        for g, members in enumerate(np.array_split(np.arange(len(days)), self.n_groups)):
+            groups[members] = g
+        splits = self._splits(groups)
+        logger.info(f"CPCV: {len(days)} days, {self.n_groups} groups, {len(splits)} splits, "
+                   f"{self.n_paths} paths, {len(outcomes.combos)} combinations")
+
+        test = _stats(np.array([s.test_days for s in splits]), r, traded)
+        train_masks = np.array([s.train_days for s in splits])
+        train_score = self._train_scores(outcomes, rows, train_masks, r, traded)
+        selected = np.argmax(train_score, axis=1)
+
+        # Group-level statistics of every combination; a path sums one
+        # (group, selected combination) cell per group.
+        by_group = _stats(groups[None, :] == np.arange(self.n_groups)[:, None], r, traded)
+        path_splits = self._path_splits(splits)
+        path_stats = self._path_stats(by_group, selected, path_splits)
+
+        timing = AnalysisTiming(
+            wall_seconds=time.perf_counter() - wall_start,
+            workers=workers if swept else 1,
+        )
+        logger.info(f"  ✓ CPCV done in {timing.wall_seconds:.1f}s")
+        return CPCVAnalysis(
+            n_groups=self.n_groups,
+            n_test_groups=self.n_test_groups,
+            purge_days=self.purge_days,
+            embargo_days=self.embargo_days,
+            select_by=self.select_by,
+            days=days,
+            outcomes=outcomes,
+            groups=groups,
+            splits=splits,
+            test_expectancy=test.expectancy(),
+            test_sharpe=test.sharpe(),
+            test_trades=test.n_trades.astype(np.int64),
+            train_score=train_score,
+            selected=selected,
+            path_splits=path_splits,
+            path_expectancy=path_stats.expectancy()[:, 0],
+            path_sharpe=path_stats.sharpe()[:, 0],
+            timing=timing,
+        )
+
+    def _splits(self, groups: np.ndarray) -> List[CPCVSplit]:
+        """Every k-of-N test group choice with its purged, embargoed training set."""
+        n_days = len(groups)
+        position = np.arange(n_days)
+        splits = []
+        for test_groups in combinations(range(self.n_groups), self.n_test_groups):
+            test = np.isin(groups, test_groups)
+            blocked = test.copy()
+            for g in test_groups:
+                members = position[groups == g]
+                lo, hi = members[0], members[-1]
+                blocked[max(lo - self.purge_days, 0):lo] = True
+                blocked[hi + 1:min(hi + 1 + self.embargo_days, n_days)] = True
+            splits.append(CPCVSplit(test_groups=test_groups, test_days=test, train_days=~blocked))
+        return splits
+
+    def _train_scores(
+        self,
+        outcomes: OutcomeMatrix,
+        rows: np.ndarray,
+        train_masks: np.ndarray,
+        r: np.ndarray,
+        traded: np.ndarray,
+    ) -> np.ndarray:
+        """select_by on every split's training set, shape (n_splits, n_combos)."""
+        if self.select_by == "composite_score":
+            window_days = np.flatnonzero(rows)
+            scores = []
+            for mask in train_masks:
+                full_mask = np.zeros(len(outcomes.days), dtype=bool)
+                full_mask[window_days[mask]] = True
+                scores.append(outcomes.scores(full_mask, min_trades=self.min_trades)["composite_score"].to_numpy())
+            return np.array(scores)
+        train = _stats(train_masks, r, traded)
+        return train.expectancy() if self.select_by == "expectancy_r" else train.sharpe()
+
+    def _path_splits(self, splits: List[CPCVSplit]) -> np.ndarray:
+        """
+        Split supplying each group's test outcome on each path.
+
+        Group g is tested by C(N-1, k-1) splits; path p takes the p-th of
+        them (in split order) for every group.
+        """
+        by_group = [
+            [s for s, split in enumerate(splits) if g in split.test_groups]
+            for g in range(self.n_groups)
+        ]
+        return np.array(by_group, dtype=np.int64).T
+
+    def _path_stats(self, by_group: _Stats, selected: np.ndarray, path_splits: np.ndarray) -> _Stats:
+        """Statistics of each stitched path, shape (n_paths, 1)."""
+        picks = selected[path_splits]  # (n_paths, n_groups)
+        group_index = np.arange(self.n_groups)[None, :]
+
+        def total(values: np.ndarray) -> np.ndarray:
+            return values[group_index, picks].sum(axis=1, keepdims=True)
+
+        return _Stats(
+            n_days=total(by_group.n_days),
+            n_trades=total(by_group.n_trades),
+            sum_r=total(by_group.sum_r),
+            sum_r2=total(by_group.sum_r2),
+        )
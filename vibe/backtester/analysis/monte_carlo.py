@@ -0,0 +1,271 @@
+"""
+Monte Carlo resampling of a strategy's trade sequence.
+
+A single backtest yields one ordering of one sample of trades. Resampling
+the R-multiples shows how much of the observed drawdown, losing streak and
+terminal equity is luck of the sequence:
+
+- bootstrap: trades drawn with replacement (sample uncertainty)
+- block:     circular block bootstrap, contiguous runs of block_size trades,
+             keeping short-range dependence such as clustered losses
+- shuffle:   the same trades in random order (sequence risk only; expectancy
+             and total R are unchanged, drawdown and streaks are not)
+
+Every method builds its paths as one (n_paths, n_trades) NumPy matrix, in
+row chunks to bound memory, and computes all metrics with array ops. Each
+method draws from its own child of SeedSequence(seed), so a given seed
+reproduces every distribution regardless of which methods are run.
+"""
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from vibe.backtester.analysis.metrics import BacktestResult
+
+logger = logging.getLogger(__name__)
+
+METHODS = ("bootstrap", "block", "shuffle")
+
+# Upper bound on path-matrix elements materialised at once (~16 MB per float array)
+_CHUNK_ELEMENTS = 2_000_000
+
+
+@dataclass
+class MonteCarloDistribution:
+    """Per-path metrics of one resampling method (arrays of length n_paths)."""
+    method: str
+    expectancy_r: np.ndarray
+    total_r: np.ndarray
+    max_drawdown_r: np.ndarray
+    max_drawdown_pct: np.ndarray
+    max_losing_streak: np.ndarray
+    terminal_equity: np.ndarray
+
+    @property
+    def probability_of_loss(self) -> float:
+        """Fraction of paths ending with negative total R."""
+        return float(np.mean(self.total_r < 0))
+
+    def percentiles(self, q: Sequence[float] = (5, 50, 95)) -> Dict[str, Dict[str, float]]:
+        """Metric -> {"p5": ..., "p50": ..., "p95": ...}."""
+        metrics = {
+            "expectancy_r": self.expectancy_r,
+            "total_r": self.total_r,
+            "max_drawdown_r": self.max_drawdown_r,
+            "max_drawdown_pct": self.max_drawdown_pct,
+            "max_losing_streak": self.max_losing_streak,
+            "terminal_equity": self.terminal_equity,
+        }
+        return {
+            name: {f"p{p:g}": float(v) for p, v in zip(q, np.percentile(values, q))}
+            for name, values in metrics.items()
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "method": self.method,
+            "probability_of_loss": self.probability_of_loss,
+            "percentiles": self.percentiles(),
+        }
+
+
+@dataclass
+class MonteCarloAnalysis:
+    """Resampled distributions of one trade sequence."""
+    n_paths: int
+    n_trades: int
+    seed: int  # SeedSequence entropy: reproduces every distribution
+    block_size: int
+    risk_fraction: float
+    initial_capital: float
+    observed: Dict[str, float]  # Metrics of the original sequence
+    distributions: Dict[str, MonteCarloDistribution] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "n_paths": self.n_paths,
+            "n_trades": self.n_trades,
+            "seed": self.seed,
+            "block_size": self.block_size,
+            "risk_fraction": self.risk_fraction,
+            "initial_capital": self.initial_capital,
+            "observed": dict(self.observed),
+            "distributions": {name: d.to_dict() for name, d in self.distributions.items()},
+        }
+
+
+def path_metrics(
+    paths: np.ndarray,
+    risk_fraction: float,
+    initial_capital: float,
+) -> Dict[str, np.ndarray]:
+    """
+    Metrics of every row of an (n_paths, n_trades) R-multiple matrix.
+
+    Drawdown in R is measured on cumulative R from a 0 start; equity
+    compounds risk_fraction of equity per trade (fixed-fractional sizing).
+    A losing trade is R <= 0, as in ConvexityMetrics.max_losing_streak.
+    """
+    n_paths, n_trades = paths.shape
+    zeros = np.zeros((n_paths, 1))
+
+    cum_r = np.concatenate([zeros, np.cumsum(paths, axis=1)], axis=1)
+    max_drawdown_r = (np.maximum.accumulate(cum_r, axis=1) - cum_r).max(axis=1)
+
+    equity = initial_capital * np.cumprod(1.0 + risk_fraction * paths, axis=1)
+    equity = np.concatenate([np.full((n_paths, 1), initial_capital), equity], axis=1)
+    peak = np.maximum.accumulate(equity, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        max_drawdown_pct = np.nan_to_num((peak - equity) / peak).max(axis=1)
+
+    # Losing streaks: running loss count minus its value at the last win
+    losses = paths <= 0
+    count = np.cumsum(losses, axis=1)
+    at_last_win = np.maximum.accumulate(np.where(losses, 0, count), axis=1)
+    max_losing_streak = (count - at_last_win).max(axis=1) if n_trades else np.zeros(n_paths, dtype=int)
+
+    return {
+        "expectancy_r": paths.mean(axis=1) if n_trades else np.zeros(n_paths),
+        "total_r": cum_r[:, -1],
+        "max_drawdown_r": max_drawdown_r,
+        "max_drawdown_pct": max_drawdown_pct,
+        "max_losing_streak": max_losing_streak,
+        "terminal_equity": equity[:, -1],
+    }
+
+
+class MonteCarloAnalyzer:
+    """
+    Bootstrap, block-bootstrap and shuffle analysis of a trade sequence.
+
+    Example:
+        ```python
+        analyzer = MonteCarloAnalyzer(n_paths=10_000, seed=42)
+        analysis = analyzer.analyze(backtest_result)
+
+        boot = analysis.distributions["bootstrap"]
+        print(f"P(loss): {boot.probability_of_loss:.1%}")
+        print(boot.percentiles()["max_drawdown_r"])
+        ```
+    """
+
+    def __init__(
+        self,
+        n_paths: int = 10_000,
+        methods: Sequence[str] = METHODS,
+        block_size: Optional[int] = None,
+        seed: Optional[int] = None,
+        risk_fraction: float = 0.01,
+        initial_capital: float = 10_000.0,
+    ):
+        """
+        Initialize Monte Carlo analyzer.
+
+        Args:
+            n_paths: Resampled sequences per method
+            methods: Subset of "bootstrap", "block", "shuffle"
+            block_size: Block length for "block" (default: sqrt(n_trades))
+            seed: Seed for reproducible paths (None = fresh entropy, recorded
+                on the result)
+            risk_fraction: Fraction of equity risked per 1R (terminal equity)
+            initial_capital: Starting equity of every path
+        """
+        unknown = set(methods) - set(METHODS)
+        if unknown:
+            raise ValueError(f"Invalid methods: {sorted(unknown)}. Must be in {list(METHODS)}")
+        if n_paths < 1:
+            raise ValueError(f"n_paths must be >= 1, got {n_paths}")
+        self.n_paths = n_paths
+        self.methods = list(methods)
+        self.block_size = block_size
+        self.seed = seed
+        self.risk_fraction = risk_fraction
+        self.initial_capital = initial_capital
+
+    def analyze(self, trades: BacktestResult | Sequence[float] | np.ndarray) -> MonteCarloAnalysis:
+        """
+        Resample a backtest's R-multiples (or an R-multiple sequence).
+
+        Args:
+            trades: BacktestResult (uses overall.r_multiples) or R-multiples
+
+        Returns:
+            MonteCarloAnalysis with one distribution per method
+        """
+        if isinstance(trades, BacktestResult):
+            r = np.asarray(trades.overall.r_multiples, dtype=np.float64)
+        else:
+            r = np.asarray(trades, dtype=np.float64)
+        n_trades = len(r)
+        block_size = self.block_size or max(1, int(round(np.sqrt(n_trades))))
+
+        seed_seq = np.random.SeedSequence(self.seed)
+        children = dict(zip(METHODS, seed_seq.spawn(len(METHODS))))
+
+        observed = {
+            name: float(values[0])
+            for name, values in path_metrics(r[None, :], self.risk_fraction, self.initial_capital).items()
+        }
+
+        logger.info(f"Running Monte Carlo analysis: {n_trades} trades, {self.n_paths} paths "
+                   f"x {len(self.methods)} method(s)...")
+
+        distributions = {}
+        for method in self.methods:
+            rng = np.random.default_rng(children[method])
+            distributions[method] = self._distribution(method, r, block_size, rng)
+            d = distributions[method]
+            logger.info(f"  {method}: P(loss) {d.probability_of_loss:.1%}, "
+                       f"median max DD {np.median(d.max_drawdown_r):.2f}R, "
+                       f"95th pct losing streak {np.percentile(d.max_losing_streak, 95):.0f}")
+
+        return MonteCarloAnalysis(
+            n_paths=self.n_paths,
+            n_trades=n_trades,
+            seed=seed_seq.entropy,
+            block_size=block_size,
+            risk_fraction=self.risk_fraction,
+            initial_capital=self.initial_capital,
+            observed=observed,
+            distributions=distributions,
+        )
+
+    def _distribution(
+        self,
+        method: str,
+        r: np.ndarray,
+        block_size: int,
+        rng: np.random.Generator,
+    ) -> MonteCarloDistribution:
+        n_trades = len(r)
+        chunk = max(1, _CHUNK_ELEMENTS // max(n_trades, 1))
+        parts: List[Dict[str, np.ndarray]] = []
+        for start in range(0, self.n_paths, chunk):
+            rows = min(chunk, self.n_paths - start)
+            paths = r[self._indices(method, rows, n_trades, block_size, rng)]
+            parts.append(path_metrics(paths, self.risk_fraction, self.initial_capital))
+        merged = {name: np.concatenate([p[name] for p in parts]) for name in parts[0]}
+        return MonteCarloDistribution(method=method, **merged)
+
+    @staticmethod
+    def _indices(
+        method: str,
+        rows: int,
+        n_trades: int,
+        block_size: int,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        """(rows, n_trades) indices into the trade sequence."""
+        if n_trades == 0:
+            return np.zeros((rows, 0), dtype=np.int64)
+        if method == "bootstrap":
+            return rng.integers(0, n_trades, size=(rows, n_trades))
+        if method == "block":
+            n_blocks = -(-n_trades // block_size)
+            starts = rng.integers(0, n_trades, size=(rows, n_blocks, 1))
+            idx = (starts + np.arange(block_size)) % n_trades
+            return idx.reshape(rows, n_blocks * block_size)[:, :n_trades]
+        # shuffle: an independent permutation per row
+        return rng.permuted(np.broadcast_to(np.arange(n_trades), (rows, n_trades)), axis=1)
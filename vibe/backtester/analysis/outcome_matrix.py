@@ -0,0 +1,409 @@
+"""
+Per-day trade outcome matrix for parameter sweeps.
+
+ORB takes at most one trade per symbol per trading day, and a day's trade
+does not depend on other days. Its R-multiple is also independent of
+position size. So the trades of one full-history run per parameter
+combination answer any sub-period question: a walk-forward window, a
+calendar year, a regime bucket or a CPCV fold is a row mask over a
+(day x combination) matrix. No re-run is needed.
+
+OutcomeMatrix holds, per cell, the trade's R-multiple, P&L, initial risk
+and exit reason code (NaN / -1 where the combination did not trade that day):
+
+    outcomes = OutcomeMatrix.from_trades(combos, trade_frames)
+    outcomes.save("results/outcomes")
+    outcomes.summary(outcomes.window(start, end))      # one row per combination
+    outcomes.summary_by(labels)                        # per regime bucket
+    outcomes.convexity(best_params, start, end)        # ConvexityMetrics
+    outcomes.scores(outcomes.window(start, end))       # composite_score per combination
+
+Trades with no positive initial risk are excluded from every metric, as in
+PerformanceAnalyzer. P&L comes from the full-history run, so it reflects
+that run's position sizing; R-based metrics are exact for any window.
+
+scores() ranks combinations by composite_score without an equity curve: its
+Sharpe term is the annualized Sharpe of per-day R over the matrix's days
+(0 where the combination did not trade), not the bar-level equity Sharpe of
+a BacktestResult.
+"""
+import json
+import warnings
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from vibe.backtester.analysis.metrics import ConvexityMetrics
+from vibe.backtester.analysis.performance import PerformanceAnalyzer
+from vibe.backtester.analysis.scoring import composite_scores
+from vibe.backtester.data.parquet_dataset import MARKET_TZ
+from vibe.common.models.trade import Trade
+
+# Exit reason codes stored in the matrix (-1 = no trade); the strings
+# PortfolioManager.check_exits records
+EXIT_REASONS = ("STOP", "TP", "EOD", "SIGNAL")
+_NO_TRADE = -1
+_OTHER_REASON = len(EXIT_REASONS)
+
+# Trading days per year for the per-day R Sharpe in scores()
+_DAYS_PER_YEAR = 252
+
+# Columns of a trade frame (see trades_frame)
+TRADE_COLUMNS = ["entry_time", "pnl", "initial_risk", "exit_reason"]
+
+
+def trades_frame(trades: Sequence[Trade]) -> pd.DataFrame:
+    """TRADE_COLUMNS of a trade list as a DataFrame."""
+    return pd.DataFrame(
+        [(t.entry_time, t.pnl, t.initial_risk, t.exit_reason) for t in trades],
+        columns=TRADE_COLUMNS,
+    )
+
+
+def _market_dates(times: pd.Series | pd.DatetimeIndex) -> pd.DatetimeIndex:
+    """Market-time calendar dates (tz-naive midnight) of timestamps."""
+    index = pd.DatetimeIndex(pd.to_datetime(times, utc=False))
+    if index.tz is not None:
+        index = index.tz_convert(MARKET_TZ).tz_localize(None)
+    return index.normalize()
+
+
+def _date_bound(ts: datetime, is_end: bool) -> pd.Timestamp:
+    """
+    Trading-date bound of a period edge.
+
+    An end at exactly midnight excludes that date, since the engine's
+    [start, end] bar window then contains none of its session.
+    """
+    ts = pd.Timestamp(ts)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert(MARKET_TZ).tz_localize(None)
+    day = ts.normalize()
+    if is_end and ts == day:
+        day -= pd.Timedelta(days=1)
+    return day
+
+
+@dataclass
+class OutcomeMatrix:
+    """
+    Day x combination trade outcomes.
+
+    Attributes:
+        days: Trading dates (tz-naive, market time), one row each
+        combos: Parameter values, one row per combination (column j of the arrays)
+        r_multiple: R-multiple per cell; NaN where no (valid) trade
+        pnl: P&L per cell; NaN where no trade
+        initial_risk: Dollar risk at entry per cell; NaN where no trade
+        exit_reason: Index into EXIT_REASONS per cell; -1 where no trade
+    """
+    days: pd.DatetimeIndex
+    combos: pd.DataFrame
+    r_multiple: np.ndarray
+    pnl: np.ndarray
+    initial_risk: np.ndarray
+    exit_reason: np.ndarray
+
+    @classmethod
+    def from_trades(
+        cls,
+        combos: Sequence[Dict[str, Any]],
+        trades: Sequence[pd.DataFrame],
+        days: Optional[pd.DatetimeIndex] = None,
+    ) -> "OutcomeMatrix":
+        """
+        Build from one trade frame (TRADE_COLUMNS) per combination.
+
+        Args:
+            combos: Parameter dict per combination
+            trades: Trade frame per combination (see trades_frame)
+            days: Optional full trading calendar; defaults to every date on
+                which some combination traded
+
+        Raises:
+            ValueError: If a combination has more than one trade on a day
+        """
+        dated = []
+        for frame in trades:
+            frame = frame.assign(day=_market_dates(frame["entry_time"]))
+            if frame["day"].duplicated().any():
+                raise ValueError("OutcomeMatrix requires at most one trade per day per combination")
+            dated.append(frame)
+
+        all_days = [f["day"] for f in dated]
+        if days is not None:
+            all_days.append(pd.Series(_market_dates(days)))
+        days = pd.DatetimeIndex(
+            np.unique(np.concatenate([d.to_numpy(dtype="datetime64[ns]") for d in all_days]))
+            if all_days else np.array([], dtype="datetime64[ns]")
+        )
+
+        shape = (len(days), len(dated))
+        r_multiple = np.full(shape, np.nan)
+        pnl = np.full(shape, np.nan)
+        initial_risk = np.full(shape, np.nan)
+        exit_reason = np.full(shape, _NO_TRADE, dtype=np.int8)
+        codes = {reason: code for code, reason in enumerate(EXIT_REASONS)}
+        for j, frame in enumerate(dated):
+            if frame.empty:
+                continue
+            rows = days.get_indexer(frame["day"])
+            trade_pnl = frame["pnl"].to_numpy(dtype=float)
+            risk = frame["initial_risk"].to_numpy(dtype=float)
+            valid = risk > 0
+            pnl[rows, j] = trade_pnl
+            initial_risk[rows, j] = risk
+            r_multiple[rows[valid], j] = trade_pnl[valid] / risk[valid]
+            exit_reason[rows, j] = [codes.get(reason, _OTHER_REASON) for reason in frame["exit_reason"]]
+
+        return cls(
+            days=days,
+            combos=pd.DataFrame(list(combos)),
+            r_multiple=r_multiple,
+            pnl=pnl,
+            initial_risk=initial_risk,
+            exit_reason=exit_reason,
+        )
+
+    # ------------------------------------------------------------------
+    # Selection
+    # ------------------------------------------------------------------
+
+    def combo_index(self, params: Dict[str, Any] | int) -> int:
+        """Column of the combination with these parameter values."""
+        if isinstance(params, (int, np.integer)):
+            return int(params)
+        match = np.ones(len(self.combos), dtype=bool)
+        for name, value in params.items():
+            match &= (self.combos[name] == value).to_numpy()
+        hits = np.flatnonzero(match)
+        if len(hits) != 1:
+            raise KeyError(f"{len(hits)} combinations match {params}")
+        return int(hits[0])
+
+    def window(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> np.ndarray:
+        """Row mask of days whose session lies in the engine period [start, end]."""
+        mask = np.ones(len(self.days), dtype=bool)
+        if start is not None:
+            mask &= self.days >= _date_bound(start, is_end=False)
+        if end is not None:
+            mask &= self.days <= _date_bound(end, is_end=True)
+        return mask
+
+    # ------------------------------------------------------------------
+    # Aggregation
+    # ------------------------------------------------------------------
+
+    def summary(self, rows: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        Core ConvexityMetrics fields for every combination over rows.
+
+        Args:
+            rows: Boolean day mask (default: all days)
+
+        Returns:
+            DataFrame with one row per combination (same order as combos).
+        """
+        r = self.r_multiple if rows is None else self.r_multiple[rows]
+        pnl = self.pnl if rows is None else self.pnl[rows]
+        reason = self.exit_reason if rows is None else self.exit_reason[rows]
+
+        valid = ~np.isnan(r)
+        n = valid.sum(axis=0)
+        win = valid & (r > 0)
+        loss = valid & (r <= 0)
+        n_win, n_loss = win.sum(axis=0), loss.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            win_rate = np.where(n > 0, n_win / n, 0.0)
+            avg_win = np.where(n_win > 0, np.where(win, r, 0.0).sum(axis=0) / n_win, 0.0)
+            avg_loss = np.where(n_loss > 0, np.where(loss, r, 0.0).sum(axis=0) / n_loss, 0.0)
+            mean_r = np.where(n > 0, np.where(valid, r, 0.0).sum(axis=0) / n, 0.0)
+            dev = np.where(valid, r - mean_r, 0.0)
+            std = np.sqrt(np.where(n > 0, (dev ** 2).sum(axis=0) / n, 0.0))
+            skew = np.where(std > 0, (dev ** 3).sum(axis=0) / np.maximum(n, 1) / std ** 3, 0.0)
+        valid_pnl = np.where(valid, pnl, 0.0)
+        stop = valid & (reason == EXIT_REASONS.index("STOP"))
+        eod = valid & (reason == EXIT_REASONS.index("EOD"))
+
+        return pd.DataFrame({
+            "n_trades": n,
+            "win_rate": win_rate,
+            "avg_win_r": avg_win,
+            "avg_loss_r": avg_loss,
+            "expectancy_r": win_rate * avg_win + (1 - win_rate) * avg_loss,
+            "max_win_r": np.where(n > 0, np.where(valid, r, -np.inf).max(axis=0, initial=-np.inf), 0.0),
+            "max_loss_r": np.where(n > 0, np.where(valid, r, np.inf).min(axis=0, initial=np.inf), 0.0),
+            "skewness": skew,
+            "total_pnl": valid_pnl.sum(axis=0),
+            "gross_profit": np.where(valid_pnl > 0, valid_pnl, 0.0).sum(axis=0),
+            "gross_loss": -np.where(valid_pnl < 0, valid_pnl, 0.0).sum(axis=0),
+            "stop_wins": (stop & (pnl > 0)).sum(axis=0),
+            "stop_losses": (stop & ~(pnl > 0)).sum(axis=0),
+            "eod_wins": (eod & (pnl > 0)).sum(axis=0),
+            "eod_losses": (eod & ~(pnl > 0)).sum(axis=0),
+        })
+
+    def summary_by(self, labels: pd.Series) -> pd.DataFrame:
+        """
+        summary() per label value (e.g. regime bucket) for every combination.
+
+        Args:
+            labels: Label per trading date (index of dates); days without a
+                label are left out
+
+        Returns:
+            DataFrame indexed by (label, combo).
+        """
+        aligned = pd.Series(labels.to_numpy(), index=_market_dates(labels.index)).reindex(self.days)
+        frames = {
+            label: self.summary((aligned == label).to_numpy())
+            for label in aligned.dropna().unique()
+        }
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, names=["label", "combo"])
+
+    def summary_by_year(self) -> pd.DataFrame:
+        """summary() per calendar year, indexed by (year, combo)."""
+        return self.summary_by(pd.Series(self.days.year, index=self.days))
+
+    def scores(
+        self,
+        rows: Optional[np.ndarray] = None,
+        weights: Optional[Dict[str, float]] = None,
+        min_trades: int = 30,
+    ) -> pd.DataFrame:
+        """
+        summary() plus composite_score and its inputs for every combination.
+
+        Adds sharpe_ratio (per-day R, annualized), tail_ratio and
+        profit_factor, computed as in scoring, and composite_score.
+
+        Args:
+            rows: Boolean day mask (default: all days)
+            weights: Optional composite_score weights
+            min_trades: Trades below which the score is scaled down
+        """
+        summary = self.summary(rows)
+        r = self.r_multiple if rows is None else self.r_multiple[rows]
+        n = summary["n_trades"].to_numpy()
+
+        daily_r = np.where(np.isnan(r), 0.0, r)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = daily_r.std(axis=0, ddof=1) if len(daily_r) > 1 else np.zeros(r.shape[1])
+            sharpe = np.where(std > 0, daily_r.mean(axis=0) / std * np.sqrt(_DAYS_PER_YEAR), 0.0)
+
+            with warnings.catch_warnings():
+                # All-NaN columns (no trades) are masked out below
+                warnings.simplefilter("ignore", RuntimeWarning)
+                upper = np.nanpercentile(r, 95, axis=0) if len(r) else np.full(r.shape[1], np.nan)
+                lower = np.abs(np.nanpercentile(r, 5, axis=0)) if len(r) else upper
+            tail_ratio = np.where((n >= 10) & (lower != 0), upper / lower, 0.0)
+
+            gross_loss = summary["gross_loss"].to_numpy()
+            profit_factor = np.where(gross_loss > 0, summary["gross_profit"].to_numpy() / gross_loss, 0.0)
+
+        return summary.assign(
+            sharpe_ratio=sharpe,
+            tail_ratio=tail_ratio,
+            profit_factor=profit_factor,
+            composite_score=composite_scores(
+                sharpe,
+                summary["expectancy_r"].to_numpy(),
+                tail_ratio,
+                summary["win_rate"].to_numpy(),
+                profit_factor,
+                n,
+                weights=weights,
+                min_trades=min_trades,
+            ),
+        )
+
+    def convexity(
+        self,
+        combo: Dict[str, Any] | int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> ConvexityMetrics:
+        """
+        Full ConvexityMetrics of one combination over [start, end].
+
+        Identical to PerformanceAnalyzer on that combination's trades in the
+        period (R-based fields exactly; P&L from the full-history run).
+        """
+        return self.stitched_convexity([(combo, start, end)])
+
+    def stitched_convexity(
+        self, pieces: Sequence[Tuple[Dict[str, Any] | int, Optional[datetime], Optional[datetime]]]
+    ) -> ConvexityMetrics:
+        """
+        ConvexityMetrics of the trades of several (combo, start, end) pieces
+        taken in order, e.g. each walk-forward window's selected combination
+        over its test window.
+        """
+        trades = []
+        for combo, start, end in pieces:
+            j = self.combo_index(combo)
+            rows = np.flatnonzero(self.window(start, end) & ~np.isnan(self.initial_risk[:, j]))
+            for i in rows:
+                code = self.exit_reason[i, j]
+                trades.append(_Outcome(
+                    pnl=float(self.pnl[i, j]),
+                    initial_risk=float(self.initial_risk[i, j]),
+                    exit_reason=EXIT_REASONS[code] if code < len(EXIT_REASONS) else None,
+                    entry_time=self.days[i].to_pydatetime(),
+                ))
+        return PerformanceAnalyzer._calc_convexity(trades)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: Path | str) -> None:
+        """Write to a directory: combos.parquet, outcomes.parquet (one row per trade)."""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        rows, cols = np.nonzero(self.exit_reason != _NO_TRADE)
+        pd.DataFrame({
+            "day": self.days[rows],
+            "combo": cols.astype(np.int32),
+            "r_multiple": self.r_multiple[rows, cols],
+            "pnl": self.pnl[rows, cols],
+            "initial_risk": self.initial_risk[rows, cols],
+            "exit_reason": self.exit_reason[rows, cols],
+        }).to_parquet(path / "outcomes.parquet", index=False)
+        self.combos.to_parquet(path / "combos.parquet", index=False)
+        with open(path / "days.json", "w") as f:
+            json.dump([d.date().isoformat() for d in self.days], f)
+
+    @classmethod
+    def load(cls, path: Path | str) -> "OutcomeMatrix":
+        path = Path(path)
+        combos = pd.read_parquet(path / "combos.parquet")
+        with open(path / "days.json") as f:
+            days = pd.DatetimeIndex(json.load(f))
+        cells = pd.read_parquet(path / "outcomes.parquet")
+
+        shape = (len(days), len(combos))
+        rows = days.get_indexer(cells["day"])
+        cols = cells["combo"].to_numpy()
+        arrays: Dict[str, np.ndarray] = {}
+        for name in ("r_multiple", "pnl", "initial_risk"):
+            arrays[name] = np.full(shape, np.nan)
+            arrays[name][rows, cols] = cells[name].to_numpy()
+        exit_reason = np.full(shape, _NO_TRADE, dtype=np.int8)
+        exit_reason[rows, cols] = cells["exit_reason"].to_numpy()
+        return cls(days=days, combos=combos, exit_reason=exit_reason, **arrays)
+
+
+@dataclass
+class _Outcome:
+    """Trade fields PerformanceAnalyzer._calc_convexity reads."""
+    pnl: float
+    initial_risk: float
+    exit_reason: Optional[str]
+    entry_time: datetime
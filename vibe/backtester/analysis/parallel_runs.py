@@ -0,0 +1,140 @@
+"""
+Independent backtests (walk-forward windows, robustness variants) run
+serially or on a process pool over data loaded once.
+
+With workers > 1 the minute bars for the whole span and the pre-computed
+features are shared with the workers through SharedBars, as in
+ParameterSweep, so a task only carries its ruleset, window and slippage. Results come back in task order whatever the
+completion order, and every task's run time is measured where it ran.
+"""
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from vibe.backtester.analysis.metrics import BacktestResult
+from vibe.backtester.core.engine import BacktestEngine
+from vibe.backtester.data.bar_cache import get_bar_cache
+from vibe.backtester.data.parquet_loader import ParquetLoader
+from vibe.backtester.data.shared_pool import SharedBars, worker_state
+from vibe.common.ruleset.models import StrategyRuleSet
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BacktestTask:
+    """
+    One backtest to dispatch.
+
+    subset_features restricts the pre-computed features to [start, end]
+    (walk-forward windows); otherwise the full frame is passed through.
+    """
+    label: str
+    ruleset: StrategyRuleSet
+    start_date: datetime
+    end_date: datetime
+    slippage_ticks: int
+    initial_capital: float
+    subset_features: bool = False
+
+
+@dataclass
+class AnalysisTiming:
+    """Wall-clock time of an analysis and the run time of each of its backtests."""
+    wall_seconds: float
+    workers: int
+    task_seconds: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def total_task_seconds(self) -> float:
+        return sum(self.task_seconds.values())
+
+    @property
+    def speedup(self) -> float:
+        """Summed task time over wall time (about workers when well balanced)."""
+        return self.total_task_seconds / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "wall_seconds": self.wall_seconds,
+            "workers": self.workers,
+            "total_task_seconds": self.total_task_seconds,
+            "speedup": self.speedup,
+            "task_seconds": dict(self.task_seconds),
+        }
+
+
+def _subset(features: Optional[pd.DataFrame], start: datetime, end: datetime) -> Optional[pd.DataFrame]:
+    if features is None:
+        return None
+    return features[(features.index >= start) & (features.index <= end)]
+
+
+def _run_task(
+    task: BacktestTask,
+    data_dir: Path,
+    symbol: str,
+    features: Optional[pd.DataFrame],
+    loader: Optional[ParquetLoader] = None,
+) -> Tuple[BacktestResult, float]:
+    t0 = time.perf_counter()
+    engine = BacktestEngine(
+        ruleset=task.ruleset,
+        data_dir=data_dir,
+        initial_capital=task.initial_capital,
+        slippage_ticks=task.slippage_ticks,
+        loader=loader,
+    )
+    result = engine.run(
+        symbol=symbol,
+        start_date=task.start_date,
+        end_date=task.end_date,
+        precomputed_features=(
+            _subset(features, task.start_date, task.end_date) if task.subset_features else features
+        ),
+    )
+    return result, time.perf_counter() - t0
+
+
+def _run_pool_task(task: BacktestTask) -> Tuple[BacktestResult, float]:
+    state = worker_state
+    return _run_task(task, state["data_dir"], symbol=state["symbol"],
+                     features=state["features"], loader=state["loader"])
+
+
+def run_backtests(
+    tasks: List[BacktestTask],
+    data_dir: Path,
+    symbol: str,
+    precomputed_features: Optional[pd.DataFrame] = None,
+    workers: int = 1,
+) -> Tuple[List[BacktestResult], Dict[str, float]]:
+    """
+    Run tasks and return (results in task order, label -> run seconds).
+
+    A task that raises propagates its exception, as the serial loops did.
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+    if not tasks:
+        return [], {}
+
+    if workers == 1 or len(tasks) == 1:
+        outputs = [_run_task(task, data_dir, symbol, precomputed_features) for task in tasks]
+    else:
+        start = min(task.start_date for task in tasks)
+        end = max(task.end_date for task in tasks)
+        minute_bars = get_bar_cache().minute_bars(data_dir, symbol, start, end)
+        with SharedBars(symbol, minute_bars, precomputed_features, prefix="analysis_shared_") as shared:
+            with shared.pool(min(workers, len(tasks)), data_dir=data_dir) as pool:
+                # map() yields in submission order: deterministic result order
+                outputs = list(pool.map(_run_pool_task, tasks))
+
+    results = [result for result, _ in outputs]
+    seconds = {task.label: elapsed for task, (_, elapsed) in zip(tasks, outputs)}
+    return results, seconds
@@ -3,28 +3,76 @@ Generic parameter sensitivity testing framework for backtesting strategies.
 
 Supports testing parameter combinations across any ruleset configuration.
 """
-import asyncio
-import hashlib
+import copy
+import heapq
 import itertools
 import logging
-import pickle
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import pandas as pd
 import yaml
 
-from vibe.backtester.core.engine import BacktestEngine, _resample
+from vibe.backtester.core.batch import BatchORBEngine
+from vibe.backtester.core.engine import BacktestEngine
 from vibe.backtester.analysis.metrics import BacktestResult
-from vibe.backtester.analysis.regime_research.features import FeatureEngine
+from vibe.backtester.analysis.outcome_matrix import TRADE_COLUMNS, OutcomeMatrix, trades_frame
+from vibe.backtester.analysis.regime_research.features import feature_version
+from vibe.backtester.analysis.result_cache import ResultCache
 from vibe.backtester.analysis.scoring import composite_score, calculate_tail_ratio
+from vibe.backtester.analysis.sweep_queue import (
+    DEFAULT_LEASE_SECONDS,
+    FAILED,
+    SweepQueue,
+    default_worker_id,
+    encode_datetime,
+    run_worker,
+)
+from vibe.backtester.analysis.sweep_store import SweepStore, combo_key
+from vibe.backtester.data.bar_cache import get_bar_cache
+from vibe.backtester.data.feature_store import FeatureStore, get_feature_store
+from vibe.backtester.data.parquet_dataset import source_fingerprint
 from vibe.backtester.data.parquet_loader import ParquetLoader
+from vibe.backtester.data.shared_pool import SharedBars, worker_state
 from vibe.common.ruleset.models import StrategyRuleSet
 
 logger = logging.getLogger(__name__)
 
+# Indicators pre-computed for every sweep (and reused by robustness / walk-forward)
+SWEEP_FEATURES = ["atr_14", "atr_pctile", "adx_14", "slope_20d", "slope_50d"]
+
+# How many times a sweep rebuilds its process pool after a worker dies
+# (segfault, OOM kill) before giving up on the combinations still in flight.
+_MAX_POOL_RESTARTS = 2
+
+# Seconds between SweepQueue polls of a queued sweep's coordinator and local workers
+_QUEUE_POLL_SECONDS = 0.5
+
+# Variants per BatchORBEngine pass (bounds the full results held at once)
+_BATCH_SIZE = 64
+
+def _run_combination(index: int, params: Dict[str, Any]) -> Tuple[int, Optional[BacktestResult], Optional[str]]:
+    """Pool task: backtest one combination, returning (index, result, error)."""
+    state = worker_state
+    try:
+        result = state["sweep"]._run_backtest(
+            params,
+            state["symbol"],
+            state["start_date"],
+            state["end_date"],
+            precomputed_features=state["features"],
+            loader=state["loader"],
+        )
+        return index, result, None
+    except Exception as e:
+        return index, None, f"{type(e).__name__}: {e}"
+
 
 @dataclass
 class ParameterDefinition:
@@ -49,53 +97,132 @@ class ParameterDefinition:
             self.base_value = self.values[0]
 
 
+def _result_summary(result: BacktestResult) -> Dict[str, Any]:
+    """Flat metrics row for one backtest (the sweep report columns)."""
+    metrics = result.overall
+    equity = result.equity
+    
+    # Calculate profit factor (gross profit / gross loss)
+    wins = [t.pnl for t in result.trades if t.pnl > 0]
+    losses = [t.pnl for t in result.trades if t.pnl < 0]
+    gross_profit = sum(wins) if wins else 0.0
+    gross_loss = abs(sum(losses)) if losses else 0.0
+    profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0.0
+    losing_trades = sum(1 for r in metrics.r_multiples if r < 0)
+    
+    # Calculate avg win/loss in dollars
+    avg_win = sum(wins) / len(wins) if wins else 0.0
+    avg_loss = sum(losses) / len(losses) if losses else 0.0
+    
+    # Calculate composite score and tail ratio
+    score = composite_score(result)
+    tail_ratio = calculate_tail_ratio(metrics.r_multiples)
+    
+    return {
+        "composite_score": score,  # ← New: Multi-metric ranking score
+        "n_trades": metrics.n_trades,
+        "win_rate": metrics.win_rate,
+        "expectancy_r": metrics.expectancy_r,
+        "losing_trades": losing_trades,
+        "total_pnl": metrics.total_pnl,
+        "max_drawdown": equity.max_drawdown,
+        "profit_factor": profit_factor,
+        "avg_win": avg_win,
+        "avg_loss": avg_loss,
+        "sharpe_ratio": equity.sharpe_ratio,
+        "tail_ratio": tail_ratio,  # ← New: Convexity measure
+        "top10_pct": metrics.top10_pct,
+        "max_win_r": metrics.max_win_r,
+        "max_loss_r": metrics.max_loss_r,
+        "skewness": metrics.skewness,
+        "max_losing_streak": metrics.max_losing_streak,
+    }
+
+
 @dataclass
 class SweepResult:
-    """Result from a single parameter combination test."""
+    """
+    Result from a single parameter combination test.
+    
+    result is None when the combination was served from the result cache:
+    only its summary row is loaded (ResultCache.load_summary). Combinations
+    run by queue workers carry their outcome-matrix trade columns instead.
+    """
     params: Dict[str, Any]
-    result: BacktestResult
+    result: Optional[BacktestResult] = None
+    summary: Optional[Dict[str, Any]] = None
+    trades: Optional[pd.DataFrame] = None
+    
+    def __post_init__(self):
+        if self.summary is None:
+            self.summary = _result_summary(self.result)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to flat dictionary for DataFrame."""
-        metrics = self.result.overall
-        equity = self.result.equity
-        
-        # Calculate profit factor (gross profit / gross loss)
-        wins = [t.pnl for t in self.result.trades if t.pnl > 0]
-        losses = [t.pnl for t in self.result.trades if t.pnl < 0]
-        gross_profit = sum(wins) if wins else 0.0
-        gross_loss = abs(sum(losses)) if losses else 0.0
-        profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0.0
-        losing_trades = sum(1 for r in metrics.r_multiples if r < 0)
-        
-        # Calculate avg win/loss in dollars
-        avg_win = sum(wins) / len(wins) if wins else 0.0
-        avg_loss = sum(losses) / len(losses) if losses else 0.0
-        
-        # Calculate composite score and tail ratio
-        score = composite_score(self.result)
-        tail_ratio = calculate_tail_ratio(metrics.r_multiples)
-        
-        return {
-            **self.params,  # Parameter values
-            "composite_score": score,  # ← New: Multi-metric ranking score
-            "n_trades": metrics.n_trades,
-            "win_rate": metrics.win_rate,
-            "expectancy_r": metrics.expectancy_r,
-            "losing_trades": losing_trades,
-            "total_pnl": metrics.total_pnl,
-            "max_drawdown": equity.max_drawdown,
-            "profit_factor": profit_factor,
-            "avg_win": avg_win,
-            "avg_loss": avg_loss,
-            "sharpe_ratio": equity.sharpe_ratio,
-            "tail_ratio": tail_ratio,  # ← New: Convexity measure
-            "top10_pct": metrics.top10_pct,
-            "max_win_r": metrics.max_win_r,
-            "max_loss_r": metrics.max_loss_r,
-            "skewness": metrics.skewness,
-            "max_losing_streak": metrics.max_losing_streak,
-        }
+        return {**self.params, **self.summary}
+
+
+class _TopK:
+    """
+    Bounds the full BacktestResults a sweep holds to the k best composite scores.
+    
+    Every finished combination is offered; the one that falls out of the top
+    k has its result dropped (and its on-disk copy deleted when the sweep
+    streams to a SweepStore), leaving only its summary row.
+    """
+    
+    def __init__(self, k: int, store: Optional[SweepStore] = None):
+        if k < 0:
+            raise ValueError(f"keep_top_k must be >= 0, got {k}")
+        self.k = k
+        self.store = store
+        self._heap: List[Tuple[float, int, SweepResult]] = []
+        self._seq = 0
+    
+    def offer(self, sweep_result: SweepResult) -> None:
+        # Ties evict the later arrival, keeping earlier combinations
+        self._seq += 1
+        entry = (sweep_result.summary["composite_score"], -self._seq, sweep_result)
+        evicted = heapq.heappushpop(self._heap, entry) if len(self._heap) >= self.k else None
+        if evicted is None:
+            heapq.heappush(self._heap, entry)
+        if evicted is not entry and self.store is not None and sweep_result.result is not None:
+            self.store.save_full(sweep_result.params, sweep_result.result, sweep_result.summary)
+        if evicted is not None:
+            evicted[2].result = None
+            if evicted is not entry and self.store is not None:
+                self.store.drop_full(evicted[2].params)
+    
+    def results(self) -> List[SweepResult]:
+        """Retained combinations, best first."""
+        return [entry[2] for entry in sorted(self._heap, reverse=True)]
+
+
+class _SweepProgress:
+    """
+    Finished combinations of a sweep run.
+    
+    Cached combinations are recorded first and, in parallel and queued runs,
+    the rest finish out of order; results() restores generation order.
+    """
+    
+    def __init__(
+        self,
+        combinations: List[Dict[str, Any]],
+        progress_callback: Optional[callable],
+        result_callback: Optional[callable],
+    ):
+        self.combinations = combinations
+        self.total = len(combinations)
+        self.progress_callback = progress_callback
+        self.result_callback = result_callback
+        self.completed = 0
+        self.cache_hits = 0
+        self.by_index: Dict[int, SweepResult] = {}
+    
+    def results(self) -> Tuple[List[SweepResult], int]:
+        """(finished results in generation order, cache hits)"""
+        return [self.by_index[i] for i in sorted(self.by_index)], self.cache_hits
 
 
 class ParameterSweep:
@@ -137,6 +264,8 @@ class ParameterSweep:
         initial_capital: float = 10_000.0,
         slippage_ticks: int = 5,
         sweep_mode: str = "one_at_a_time",
+        feature_store: Optional[FeatureStore] = None,
+        base_config: Optional[Dict[str, Any]] = None,
     ):
         """
         Initialize parameter sweep.
@@ -148,6 +277,8 @@ class ParameterSweep:
             initial_capital: Starting capital for each backtest
             slippage_ticks: Slippage simulation (ticks)
             sweep_mode: "one_at_a_time" (vary one param at a time) or "grid" (Cartesian product)
+            feature_store: Store for pre-computed features (defaults to the process-wide one)
+            base_config: Parsed base ruleset to use instead of reading base_ruleset_path
         """
         self.base_ruleset_path = Path(base_ruleset_path)
         self.data_dir = Path(data_dir)
@@ -155,13 +286,46 @@ class ParameterSweep:
         self.initial_capital = initial_capital
         self.slippage_ticks = slippage_ticks
         self.sweep_mode = sweep_mode
+        self.feature_store = feature_store or get_feature_store()
+        # Day x combination outcomes of the last run(collect_outcomes=True)
+        self.outcomes: Optional[OutcomeMatrix] = None
+        # Best combinations of the last run(keep_top_k=...), with full results
+        self.top_results: Optional[List[SweepResult]] = None
         
         if sweep_mode not in ("one_at_a_time", "grid"):
             raise ValueError(f"Invalid sweep_mode: {sweep_mode}. Must be 'one_at_a_time' or 'grid'")
         
         # Load base ruleset YAML
-        with open(self.base_ruleset_path, "r") as f:
-            self.base_config = yaml.safe_load(f)
+        if base_config is None:
+            with open(self.base_ruleset_path, "r") as f:
+                base_config = yaml.safe_load(f)
+        self.base_config = base_config
+    
+    @classmethod
+    def from_spec(
+        cls,
+        spec: Dict[str, Any],
+        data_dir: Optional[Path | str] = None,
+        feature_store: Optional[FeatureStore] = None,
+    ) -> "ParameterSweep":
+        """
+        Rebuild the sweep a SweepQueue was published from (see _queue_spec).
+        
+        Args:
+            spec: SweepQueue.spec()
+            data_dir: Local path of the data directory (defaults to the spec's)
+            feature_store: Store for pre-computed features
+        """
+        return cls(
+            base_ruleset_path=spec["base_ruleset"],
+            data_dir=data_dir or spec["data_dir"],
+            parameters=[ParameterDefinition(**p) for p in spec["parameters"]],
+            initial_capital=spec["initial_capital"],
+            slippage_ticks=spec["slippage_ticks"],
+            sweep_mode=spec["sweep_mode"],
+            feature_store=feature_store,
+            base_config=spec["base_config"],
+        )
     
     def _precompute_features(
         self, 
@@ -174,7 +338,9 @@ class ParameterSweep:
         Pre-compute technical indicators for the entire date range.
         
         This is a CRITICAL optimization: compute indicators ONCE instead of
-        recalculating on every parameter combination.
+        recalculating on every parameter combination. Features come from the
+        persistent FeatureStore, which computes them over the symbol's full
+        history once per source data version and serves the requested window.
         
         Args:
             symbol: Trading symbol
@@ -187,21 +353,13 @@ class ParameterSweep:
         """
         logger.info(f"Pre-computing features for {symbol} ({start_date.date()} to {end_date.date()})...")
         
-        # Load 1-minute data
-        loader = ParquetLoader(self.data_dir, [symbol])
-        df_1m = asyncio.run(
-            loader.get_bars(symbol, start_time=start_date, end_time=end_date)
-        )
-        
-        # Resample to target timeframe
-        pd_interval = timeframe.replace("m", "min")
-        df = _resample(df_1m, pd_interval)
-        
-        # Compute all features using FeatureEngine
-        feature_engine = FeatureEngine()
-        features = feature_engine.compute(
-            df, 
-            features=["atr_14", "atr_pctile", "adx_14", "slope_20d", "slope_50d"]
+        features = self.feature_store.features(
+            self.data_dir,
+            symbol,
+            timeframe,
+            SWEEP_FEATURES,
+            start=start_date,
+            end=end_date,
         )
         
         # Also add ATR_{period} column for backward compatibility
@@ -209,41 +367,65 @@ class ParameterSweep:
         if "atr_14" in features.columns:
             features["ATR_14"] = features["atr_14"]
         
-        logger.info(f"  ✓ Computed {len(features.columns)} indicators for {len(features)} bars")
+        logger.info(f"  ✓ Loaded {len(features.columns)} indicators for {len(features)} bars")
         
         return features
     
+    def _load_minute_bars(self, symbol: str, start_date: datetime, end_date: datetime) -> pd.DataFrame:
+        """Load raw 1-minute bars for the sweep period."""
+        return get_bar_cache().minute_bars(self.data_dir, symbol, start_date, end_date)
+    
     def _cache_key(
         self, 
         params: Dict[str, Any], 
         symbol: str, 
         start_date: datetime, 
-        end_date: datetime
+        end_date: datetime,
+        use_precomputed_features: bool = True,
     ) -> str:
         """
-        Generate a unique cache key for a parameter combination.
+        Content address of a parameter combination's result.
+        
+        Covers the resolved ruleset config, run settings, the feature mode
+        (with the feature code versions when pre-computed), the source data
+        fingerprint and ENGINE_VERSION, so re-converted data or engine changes
+        miss the cache instead of serving stale results.
         
         Args:
             params: Parameter values
             symbol: Trading symbol
             start_date: Backtest start
             end_date: Backtest end
+            use_precomputed_features: Whether the run uses FeatureStore features
         
         Returns:
-            MD5 hash string
+            SHA-256 hex digest
         """
-        # Sort params for consistent hashing
-        sorted_params = sorted(params.items())
-        key_string = (
-            f"{self.base_ruleset_path.name}_"
-            f"{symbol}_"
-            f"{start_date.isoformat()}_"
-            f"{end_date.isoformat()}_"
-            f"{sorted_params}_"
-            f"capital_{self.initial_capital}_"
-            f"slippage_{self.slippage_ticks}"
+        return ResultCache.key(
+            config=self._apply_params(params),
+            symbol=symbol,
+            start=start_date.isoformat(),
+            end=end_date.isoformat(),
+            initial_capital=self.initial_capital,
+            slippage_ticks=self.slippage_ticks,
+            features=self._features_key(use_precomputed_features),
+            data=source_fingerprint(self.data_dir, symbol),
         )
-        return hashlib.md5(key_string.encode()).hexdigest()
+    
+    @staticmethod
+    def _features_key(use_precomputed_features: bool) -> Optional[Dict[str, str]]:
+        """
+        Feature part of cache and run keys. Pre-computed features are computed
+        over the full history, so they can differ slightly from the engine's
+        in-run indicators; their code versions are part of the key.
+        """
+        if not use_precomputed_features:
+            return None
+        return {name: feature_version(name) for name in SWEEP_FEATURES}
+    
+    def _get_cached_summary(self, cache_dir: Path, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Load only the cached summary row (no trades or curves)."""
+        return ResultCache(cache_dir).load_summary(cache_key)
     
     def _get_cached_result(
         self, 
@@ -251,15 +433,7 @@ class ParameterSweep:
         cache_key: str
     ) -> Optional[BacktestResult]:
         """Load cached backtest result if it exists."""
-        cache_file = cache_dir / f"{cache_key}.pkl"
-        if cache_file.exists():
-            try:
-                with open(cache_file, "rb") as f:
-                    return pickle.load(f)
-            except Exception as e:
-                logger.warning(f"Failed to load cache {cache_key}: {e}")
-                return None
-        return None
+        return ResultCache(cache_dir).load(cache_key)
     
     def _save_cached_result(
         self, 
@@ -268,13 +442,7 @@ class ParameterSweep:
         result: BacktestResult
     ) -> None:
         """Save backtest result to cache."""
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        cache_file = cache_dir / f"{cache_key}.pkl"
-        try:
-            with open(cache_file, "wb") as f:
-                pickle.dump(result, f)
-        except Exception as e:
-            logger.warning(f"Failed to save cache {cache_key}: {e}")
+        ResultCache(cache_dir).save(cache_key, result, summary=_result_summary(result))
     
     def _set_nested_value(self, config: Dict[str, Any], path: str, value: Any) -> None:
         """Set a value in nested dictionary using dot-separated path.
@@ -350,17 +518,43 @@ class ParameterSweep:
         Returns:
             StrategyRuleSet with modified parameters
         """
-        # Deep copy base config
-        import copy
+        return StrategyRuleSet(**self._apply_params(params))
+    
+    def _apply_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of the base config with params set at their paths."""
         config = copy.deepcopy(self.base_config)
-        
-        # Apply parameter modifications
         for param_def in self.parameters:
-            value = params[param_def.name]
-            self._set_nested_value(config, param_def.path, value)
+            self._set_nested_value(config, param_def.path, params[param_def.name])
+        return config
+    
+    def _run_backtest(
+        self,
+        params: Dict[str, Any],
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        precomputed_features: Optional[pd.DataFrame] = None,
+        loader: Optional[ParquetLoader] = None,
+    ) -> BacktestResult:
+        """Backtest a single parameter combination."""
+        # Create modified ruleset
+        ruleset = self._create_modified_ruleset(params)
+        
+        # Run backtest with pre-computed features
+        engine = BacktestEngine(
+            ruleset=ruleset,
+            data_dir=self.data_dir,
+            initial_capital=self.initial_capital,
+            slippage_ticks=self.slippage_ticks,
+            loader=loader,
+        )
         
-        # Convert to StrategyRuleSet
-        return StrategyRuleSet(**config)
+        return engine.run(
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date,
+            precomputed_features=precomputed_features,  # ← Key optimization!
+        )
     
     def run(
         self,
@@ -370,24 +564,140 @@ class ParameterSweep:
         progress_callback: Optional[callable] = None,
         use_precomputed_features: bool = True,
         cache_dir: Optional[Path] = None,
+        workers: int = 1,
+        result_callback: Optional[callable] = None,
+        collect_outcomes: bool = False,
+        combinations: Optional[List[Dict[str, Any]]] = None,
+        results_dir: Optional[Path] = None,
+        resume: bool = False,
+        keep_top_k: Optional[int] = None,
+        batched: bool = False,
+        queue_path: Optional[Path] = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
     ) -> pd.DataFrame:
         """
         Run parameter sweep across all combinations.
         
+        With workers > 1 combinations are fanned out to a process pool. The
+        minute bars and pre-computed features are written once to
+        memory-mapped files that every worker maps read-only, so tasks only
+        carry the parameter dict. Results arrive in completion order. A
+        combination that raises is logged and skipped, and a worker crash
+        restarts the pool for the unfinished combinations.
+        
+        With results_dir every finished combination is committed to a
+        SweepStore (summary row, trade columns, run manifest) as it arrives,
+        and resume=True skips the combinations a previous, interrupted run of
+        the same sweep already recorded. keep_top_k bounds memory on large
+        grids: only the k best combinations by composite score keep their
+        full BacktestResult (also written to results_dir/top_k), the rest
+        keep just their summary row.
+        
+        With batched=True combinations are evaluated in-process by
+        BatchORBEngine, chunks of variants sharing one pass over the bars and
+        each distinct opening-range / breakout computation (legacy execution
+        path only; results are identical to the per-combination engine).
+        
+        With queue_path the uncached combinations are published as jobs in a
+        SweepQueue (a SQLite file, typically on shared storage) and this call
+        becomes the coordinator: it starts `workers` local worker processes
+        (0 = rely on workers started elsewhere with scripts/sweep_worker.py),
+        collects results as workers write them back, returns expired leases to
+        the queue and restarts local workers that die. Re-running the same
+        sweep against the same queue continues it. Queued combinations come
+        back with their summary row and trade columns but no full result.
+        
         Args:
             symbol: Symbol to backtest
             start_date: Start date for backtest
             end_date: End date for backtest
-            progress_callback: Optional callback(current, total, params) for progress updates
+            progress_callback: Optional callback(completed, total, params) called as
+                each combination finishes (cache hits first)
             use_precomputed_features: If True, pre-compute indicators once (50-90% speedup)
             cache_dir: Optional directory for caching results (avoids re-running same params)
+            workers: Number of worker processes (1 = run serially in this process)
+            result_callback: Optional callback(SweepResult) called as each result arrives
+                (SweepResult.result is None for combinations served from the cache)
+            collect_outcomes: If True, build self.outcomes, the per-day trade
+                outcome matrix of all successful combinations
+            combinations: Optional explicit parameter dicts to test instead of
+                the generated grid / one-at-a-time set (e.g. search survivors)
+            results_dir: Optional directory to stream results and a run manifest to
+            resume: Continue the run recorded in results_dir instead of restarting it
+            keep_top_k: Keep full results only for the k best combinations
+                (None = keep all)
+            batched: Evaluate combinations together with BatchORBEngine
+                (requires workers == 1)
+            queue_path: Distribute combinations through a SweepQueue at this path
+            lease_seconds: Lease length of a queued job (renewed while it runs)
             
         Returns:
             DataFrame with results for all parameter combinations
         """
-        combinations = self._generate_combinations()
+        # A queued sweep may leave every job to external workers
+        min_workers = 0 if queue_path is not None else 1
+        if workers < min_workers:
+            raise ValueError(f"workers must be >= {min_workers}, got {workers}")
+        if resume and results_dir is None:
+            raise ValueError("resume=True requires results_dir")
+        if batched and (workers > 1 or queue_path is not None):
+            raise ValueError("batched=True runs in-process; use workers=1")
+        
+        if combinations is None:
+            combinations = self._generate_combinations()
         total = len(combinations)
         
+        store = None
+        resumed: List[SweepResult] = []
+        if results_dir is not None:
+            store = SweepStore(results_dir)
+            store.open(
+                self._run_key(combinations, symbol, start_date, end_date, use_precomputed_features),
+                manifest=self._run_manifest(combinations, symbol, start_date, end_date),
+                resume=resume,
+            )
+            recorded = store.completed()
+            resumed = [
+                SweepResult(params=params, summary=recorded[combo_key(params)][1])
+                for params in combinations
+                if combo_key(params) in recorded
+            ]
+            if resumed:
+                logger.info(f"Resuming sweep: {len(resumed)}/{total} combinations already recorded")
+                combinations = [p for p in combinations if combo_key(p) not in recorded]
+        
+        top_k = _TopK(keep_top_k, store) if keep_top_k is not None else None
+        if top_k is not None and store is not None:
+            best = sorted(resumed, key=lambda r: r.summary["composite_score"], reverse=True)
+            for sweep_result in best[:keep_top_k]:
+                sweep_result.result = store.load_full(sweep_result.params)
+            for sweep_result in resumed:
+                top_k.offer(sweep_result)
+        
+        # Trade columns of results whose full result may be dropped (top-K
+        # without a store to read them back from)
+        frames: Optional[Dict[str, pd.DataFrame]] = (
+            {} if collect_outcomes and top_k is not None and store is None else None
+        )
+        n_recorded = len(resumed)
+        
+        def on_result(sweep_result: SweepResult) -> None:
+            nonlocal n_recorded
+            if store is not None or frames is not None:
+                trades = self._outcome_trades(
+                    sweep_result, symbol, start_date, end_date, use_precomputed_features, cache_dir
+                )
+                if store is not None:
+                    n_recorded += 1
+                    store.append(sweep_result.params, sweep_result.summary, trades)
+                    store.update_progress(n_recorded, total)
+                else:
+                    frames[combo_key(sweep_result.params)] = trades
+            if result_callback:
+                result_callback(sweep_result)
+            if top_k is not None:
+                top_k.offer(sweep_result)
+        
         logger.info(f"Running parameter sweep: {total} combinations")
         logger.info(f"Parameters: {[p.name for p in self.parameters]}")
         logger.info(f"Symbol: {symbol}, Period: {start_date.date()} to {end_date.date()}")
@@ -397,67 +707,50 @@ class ParameterSweep:
             cache_dir = Path(cache_dir)
             logger.info(f"Result caching enabled: {cache_dir}")
         
+        # Raw bars are only loaded up front when workers need them shared
+        df_1m = (
+            self._load_minute_bars(symbol, start_date, end_date)
+            if workers > 1 and queue_path is None and combinations else None
+        )
+        
         # Pre-compute features ONCE for massive performance gain
         precomputed_features = None
-        if use_precomputed_features:
+        if use_precomputed_features and combinations and queue_path is None:
             # Get timeframe from base config (default to 5m)
             timeframe = self.base_config.get("instruments", {}).get("timeframe", "5m")
             precomputed_features = self._precompute_features(symbol, start_date, end_date, timeframe)
         
-        results = []
-        cache_hits = 0
+        if queue_path is not None:
+            results, cache_hits = self._run_queued(
+                combinations, symbol, start_date, end_date, use_precomputed_features,
+                Path(queue_path), workers, lease_seconds, cache_dir, progress_callback, on_result,
+            )
+        elif workers > 1:
+            results, cache_hits = self._run_parallel(
+                combinations, symbol, start_date, end_date, df_1m, precomputed_features,
+                workers, cache_dir, progress_callback, on_result,
+            )
+        elif batched:
+            results, cache_hits = self._run_batched(
+                combinations, symbol, start_date, end_date, precomputed_features,
+                cache_dir, progress_callback, on_result,
+            )
+        else:
+            results, cache_hits = self._run_serial(
+                combinations, symbol, start_date, end_date, precomputed_features,
+                cache_dir, progress_callback, on_result,
+            )
+        results = resumed + results
         
-        for i, params in enumerate(combinations, 1):
-            logger.info(f"[{i}/{total}] Testing: {params}")
-            
-            if progress_callback:
-                progress_callback(i, total, params)
-            
-            try:
-                # Check cache first
-                result = None
-                if cache_dir:
-                    cache_key = self._cache_key(params, symbol, start_date, end_date)
-                    result = self._get_cached_result(cache_dir, cache_key)
-                    if result:
-                        cache_hits += 1
-                        logger.info(f"  ✓ Loaded from cache ({cache_hits} hits so far)")
-                
-                # Run backtest if not cached
-                if result is None:
-                    # Create modified ruleset
-                    ruleset = self._create_modified_ruleset(params)
-                    
-                    # Run backtest with pre-computed features
-                    engine = BacktestEngine(
-                        ruleset=ruleset,
-                        data_dir=self.data_dir,
-                        initial_capital=self.initial_capital,
-                        slippage_ticks=self.slippage_ticks,
-                    )
-                    
-                    result = engine.run(
-                        symbol=symbol,
-                        start_date=start_date,
-                        end_date=end_date,
-                        precomputed_features=precomputed_features,  # ← Key optimization!
-                    )
-                    
-                    # Save to cache
-                    if cache_dir:
-                        self._save_cached_result(cache_dir, cache_key, result)
-                
-                # Store result
-                sweep_result = SweepResult(params=params, result=result)
-                results.append(sweep_result)
-                
-                metrics = result.overall
-                logger.info(f"  → Trades: {metrics.n_trades}, Win%: {metrics.win_rate:.1%}, "
-                           f"Exp: {metrics.expectancy_r:.2f}R, P&L: ${metrics.total_pnl:,.0f}")
-                
-            except Exception as e:
-                logger.error(f"Failed for {params}: {e}")
-                # Continue with next combination
+        self.outcomes = (
+            self._collect_outcomes(
+                results, symbol, start_date, end_date, use_precomputed_features, cache_dir, store, frames
+            )
+            if collect_outcomes else None
+        )
+        self.top_results = top_k.results() if top_k is not None else None
+        if store is not None:
+            store.finish(len(results), total)
         
         # Convert to DataFrame
         df = pd.DataFrame([r.to_dict() for r in results])
@@ -471,6 +764,429 @@ class ParameterSweep:
         
         return df
     
+    def _run_serial(
+        self,
+        combinations: List[Dict[str, Any]],
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        precomputed_features: Optional[pd.DataFrame],
+        cache_dir: Optional[Path],
+        progress_callback: Optional[callable],
+        result_callback: Optional[callable],
+    ) -> Tuple[List[SweepResult], int]:
+        """Test uncached combinations one after another in this process."""
+        progress = _SweepProgress(combinations, progress_callback, result_callback)
+        pending = self._partition_cached(
+            progress, symbol, start_date, end_date, precomputed_features is not None, cache_dir
+        )
+        
+        for index in pending:
+            params = combinations[index]
+            logger.info(f"[{progress.completed + 1}/{progress.total}] Testing: {params}")
+            try:
+                result = self._run_backtest(params, symbol, start_date, end_date, precomputed_features)
+            except Exception as e:
+                self._record_failure(progress, index, e)
+                continue
+            
+            sweep_result = SweepResult(params=params, result=result)
+            if cache_dir:
+                cache_key = self._cache_key(
+                    params, symbol, start_date, end_date, precomputed_features is not None
+                )
+                ResultCache(cache_dir).save(cache_key, result, summary=sweep_result.summary)
+            self._record_result(progress, index, sweep_result)
+        
+        return progress.results()
+    
+    def _partition_cached(
+        self,
+        progress: _SweepProgress,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        use_precomputed_features: bool,
+        cache_dir: Optional[Path],
+    ) -> List[int]:
+        """Record every combination with a cached summary; returns the indices left to run."""
+        pending = []
+        for index, params in enumerate(progress.combinations):
+            summary = None
+            if cache_dir:
+                summary = self._get_cached_summary(
+                    cache_dir,
+                    self._cache_key(params, symbol, start_date, end_date, use_precomputed_features),
+                )
+            if summary is not None:
+                progress.cache_hits += 1
+                self._record_result(progress, index, SweepResult(params=params, summary=summary))
+            else:
+                pending.append(index)
+        return pending
+    
+    def _record_result(self, progress: _SweepProgress, index: int, sweep_result: SweepResult) -> None:
+        """Keep a finished combination's result and report it to the log and callbacks."""
+        progress.completed += 1
+        params = progress.combinations[index]
+        logger.info(f"[{progress.completed}/{progress.total}] Finished: {params}")
+        if progress.progress_callback:
+            progress.progress_callback(progress.completed, progress.total, params)
+        progress.by_index[index] = sweep_result
+        self._log_result(sweep_result.summary)
+        if progress.result_callback:
+            progress.result_callback(sweep_result)
+    
+    def _record_failure(self, progress: _SweepProgress, index: int, error: Any) -> None:
+        """Count a failed combination; the sweep continues with the next one."""
+        progress.completed += 1
+        params = progress.combinations[index]
+        logger.error(f"Failed for {params}: {error}")
+        if progress.progress_callback:
+            progress.progress_callback(progress.completed, progress.total, params)
+    
+    def _run_batched(
+        self,
+        combinations: List[Dict[str, Any]],
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        precomputed_features: Optional[pd.DataFrame],
+        cache_dir: Optional[Path],
+        progress_callback: Optional[callable],
+        result_callback: Optional[callable],
+    ) -> Tuple[List[SweepResult], int]:
+        """Test uncached combinations in BatchORBEngine chunks of _BATCH_SIZE."""
+        progress = _SweepProgress(combinations, progress_callback, result_callback)
+        pending = self._partition_cached(
+            progress, symbol, start_date, end_date, precomputed_features is not None, cache_dir
+        )
+        
+        for offset in range(0, len(pending), _BATCH_SIZE):
+            chunk = []
+            rulesets = []
+            for index in pending[offset:offset + _BATCH_SIZE]:
+                try:
+                    rulesets.append(self._create_modified_ruleset(combinations[index]))
+                    chunk.append(index)
+                except Exception as e:
+                    self._record_failure(progress, index, e)
+            if not chunk:
+                continue
+            
+            try:
+                batch_results = BatchORBEngine(
+                    rulesets, self.data_dir, self.initial_capital, self.slippage_ticks
+                ).run(symbol, start_date, end_date, precomputed_features)
+            except Exception as e:
+                for index in chunk:
+                    self._record_failure(progress, index, e)
+                continue
+            
+            for index, result in zip(chunk, batch_results):
+                sweep_result = SweepResult(params=combinations[index], result=result)
+                if cache_dir:
+                    cache_key = self._cache_key(
+                        combinations[index], symbol, start_date, end_date, precomputed_features is not None
+                    )
+                    ResultCache(cache_dir).save(cache_key, result, summary=sweep_result.summary)
+                self._record_result(progress, index, sweep_result)
+        
+        return progress.results()
+    
+    def _run_parallel(
+        self,
+        combinations: List[Dict[str, Any]],
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        df_1m: pd.DataFrame,
+        precomputed_features: Optional[pd.DataFrame],
+        workers: int,
+        cache_dir: Optional[Path],
+        progress_callback: Optional[callable],
+        result_callback: Optional[callable],
+    ) -> Tuple[List[SweepResult], int]:
+        """Test combinations on a process pool, collecting results as they complete."""
+        progress = _SweepProgress(combinations, progress_callback, result_callback)
+        # Cached combinations never reach the pool; dict keeps generation order
+        pending = dict.fromkeys(self._partition_cached(
+            progress, symbol, start_date, end_date, precomputed_features is not None, cache_dir
+        ))
+        
+        if not pending:
+            return progress.results()
+        
+        with SharedBars(symbol, df_1m, precomputed_features, prefix="sweep_shared_") as shared:
+            restarts = 0
+            while pending:
+                with shared.pool(
+                    min(workers, len(pending)), sweep=self, start_date=start_date, end_date=end_date
+                ) as pool:
+                    futures = {pool.submit(_run_combination, i, combinations[i]): i for i in pending}
+                    try:
+                        while futures:
+                            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                            for future in done:
+                                index = futures.pop(future)
+                                _, result, error = future.result()
+                                del pending[index]
+                                if error is not None:
+                                    self._record_failure(progress, index, error)
+                                    continue
+                                sweep_result = SweepResult(params=combinations[index], result=result)
+                                if cache_dir:
+                                    cache_key = self._cache_key(
+                                        combinations[index], symbol, start_date, end_date,
+                                        precomputed_features is not None,
+                                    )
+                                    ResultCache(cache_dir).save(
+                                        cache_key, result, summary=sweep_result.summary
+                                    )
+                                self._record_result(progress, index, sweep_result)
+                    except BrokenProcessPool as e:
+                        restarts += 1
+                        if restarts > _MAX_POOL_RESTARTS:
+                            for index in pending:
+                                self._record_failure(progress, index, e)
+                            break
+                        logger.warning(
+                            f"Worker process died ({e}); restarting pool for "
+                            f"{len(pending)} remaining combinations"
+                        )
+        
+        return progress.results()
+    
+    def _run_queued(
+        self,
+        combinations: List[Dict[str, Any]],
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        use_precomputed_features: bool,
+        queue_path: Path,
+        workers: int,
+        lease_seconds: float,
+        cache_dir: Optional[Path],
+        progress_callback: Optional[callable],
+        result_callback: Optional[callable],
+    ) -> Tuple[List[SweepResult], int]:
+        """Publish uncached combinations to a SweepQueue and collect what workers return."""
+        progress = _SweepProgress(combinations, progress_callback, result_callback)
+        # Cached combinations are never published
+        pending = self._partition_cached(
+            progress, symbol, start_date, end_date, use_precomputed_features, cache_dir
+        )
+        
+        if not pending:
+            return progress.results()
+        
+        index_of = {combo_key(combinations[i]): i for i in pending}
+        queue = SweepQueue(queue_path)
+        added = queue.publish(
+            self._run_key(combinations, symbol, start_date, end_date, use_precomputed_features),
+            self._queue_spec(symbol, start_date, end_date, use_precomputed_features),
+            [combinations[i] for i in pending],
+        )
+        logger.info(f"Published {added} jobs to {queue_path} ({len(pending) - added} already queued)")
+        
+        coordinator = default_worker_id()
+        local: Dict[str, multiprocessing.Process] = {}
+        
+        def start_worker(worker_id: str) -> None:
+            process = multiprocessing.Process(
+                target=run_worker,
+                args=(queue_path,),
+                kwargs=dict(
+                    worker_id=worker_id,
+                    lease_seconds=lease_seconds,
+                    poll_interval=_QUEUE_POLL_SECONDS,
+                    feature_store_dir=self.feature_store.root,
+                ),
+                daemon=True,
+            )
+            process.start()
+            local[worker_id] = process
+        
+        for n in range(min(workers, len(pending))):
+            start_worker(f"{coordinator}/worker-{n}")
+        
+        restarts = 0
+        last_seq = -1
+        remaining = set(index_of)
+        try:
+            while remaining:
+                queue.requeue_expired()
+                for job in queue.finished(last_seq):
+                    last_seq = job.finished_seq
+                    index = index_of.get(job.key)
+                    if index is None or job.key not in remaining:
+                        continue
+                    remaining.discard(job.key)
+                    if job.status == FAILED:
+                        self._record_failure(progress, index, job.error)
+                        continue
+                    self._record_result(progress, index, SweepResult(
+                        params=combinations[index], summary=job.summary, trades=job.trades,
+                    ))
+                if not remaining:
+                    break
+                
+                for worker_id, process in list(local.items()):
+                    if process.is_alive() or process.exitcode == 0:
+                        continue
+                    # A crashed worker's lease need not run out before its job is retried
+                    del local[worker_id]
+                    queue.release_worker(worker_id)
+                    restarts += 1
+                    if restarts > _MAX_POOL_RESTARTS:
+                        logger.error(f"Worker {worker_id} died (exit code {process.exitcode})")
+                        continue
+                    logger.warning(
+                        f"Worker {worker_id} died (exit code {process.exitcode}); restarting it"
+                    )
+                    start_worker(f"{worker_id}.{restarts}")
+                if workers > 0 and not local:
+                    raise RuntimeError(
+                        f"All local sweep workers died with {len(remaining)} jobs unfinished "
+                        f"in {queue_path}; re-run to continue"
+                    )
+                time.sleep(_QUEUE_POLL_SECONDS)
+        finally:
+            for process in local.values():
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+            queue.close()
+        
+        return progress.results()
+    
+    def _queue_spec(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        use_precomputed_features: bool,
+    ) -> Dict[str, Any]:
+        """Everything a queue worker needs to rebuild this sweep (JSON-serializable)."""
+        return {
+            "base_ruleset": str(self.base_ruleset_path),
+            "base_config": self.base_config,
+            "data_dir": str(self.data_dir),
+            "parameters": [
+                {"path": p.path, "values": p.values, "name": p.name, "base_value": p.base_value}
+                for p in self.parameters
+            ],
+            "initial_capital": self.initial_capital,
+            "slippage_ticks": self.slippage_ticks,
+            "sweep_mode": self.sweep_mode,
+            "symbol": symbol,
+            "start_date": encode_datetime(start_date),
+            "end_date": encode_datetime(end_date),
+            "use_precomputed_features": use_precomputed_features,
+            "timeframe": self.base_config.get("instruments", {}).get("timeframe", "5m"),
+        }
+    
+    def _run_key(
+        self,
+        combinations: List[Dict[str, Any]],
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        use_precomputed_features: bool = True,
+    ) -> str:
+        """Identity of a sweep run: a resumed run must match it exactly."""
+        return ResultCache.key(
+            config=self.base_config,
+            paths={p.name: p.path for p in self.parameters},
+            combinations=combinations,
+            symbol=symbol,
+            start=start_date.isoformat(),
+            end=end_date.isoformat(),
+            initial_capital=self.initial_capital,
+            slippage_ticks=self.slippage_ticks,
+            features=self._features_key(use_precomputed_features),
+            data=source_fingerprint(self.data_dir, symbol),
+        )
+    
+    def _run_manifest(
+        self,
+        combinations: List[Dict[str, Any]],
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Dict[str, Any]:
+        """Human-readable description of a run for its SweepStore manifest."""
+        return {
+            "base_ruleset": str(self.base_ruleset_path),
+            "data_dir": str(self.data_dir),
+            "symbol": symbol,
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "sweep_mode": self.sweep_mode,
+            "parameters": [
+                {"path": p.path, "name": p.name, "values": p.values} for p in self.parameters
+            ],
+            "initial_capital": self.initial_capital,
+            "slippage_ticks": self.slippage_ticks,
+            "total": len(combinations),
+        }
+    
+    def _outcome_trades(
+        self,
+        sweep_result: SweepResult,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        use_precomputed_features: bool,
+        cache_dir: Optional[Path],
+    ) -> pd.DataFrame:
+        """Outcome-matrix trade columns of a result (cache hits read only those)."""
+        if sweep_result.result is not None:
+            return trades_frame(sweep_result.result.trades)
+        if sweep_result.trades is not None:
+            return sweep_result.trades
+        frame = None
+        if cache_dir:
+            cache_key = self._cache_key(
+                sweep_result.params, symbol, start_date, end_date, use_precomputed_features
+            )
+            frame = ResultCache(cache_dir).load_trades(cache_key, columns=TRADE_COLUMNS)
+        if frame is None:
+            raise RuntimeError(f"Cached trades for {sweep_result.params} are missing")
+        return frame
+    
+    def _collect_outcomes(
+        self,
+        results: List[SweepResult],
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        use_precomputed_features: bool,
+        cache_dir: Optional[Path],
+        store: Optional[SweepStore] = None,
+        frames: Optional[Dict[str, pd.DataFrame]] = None,
+    ) -> OutcomeMatrix:
+        """Outcome matrix of results, from the run's store or frames when given."""
+        trade_frames = []
+        for sweep_result in results:
+            if store is not None:
+                frame = store.load_trades(sweep_result.params)
+            elif frames is not None:
+                frame = frames.get(combo_key(sweep_result.params))
+            else:
+                frame = self._outcome_trades(
+                    sweep_result, symbol, start_date, end_date, use_precomputed_features, cache_dir
+                )
+            if frame is None:
+                raise RuntimeError(f"Recorded trades for {sweep_result.params} are missing")
+            trade_frames.append(frame)
+        return OutcomeMatrix.from_trades([r.params for r in results], trade_frames)
+    
+    def _log_result(self, summary: Dict[str, Any]) -> None:
+        logger.info(f"  → Trades: {summary['n_trades']}, Win%: {summary['win_rate']:.1%}, "
+                   f"Exp: {summary['expectancy_r']:.2f}R, P&L: ${summary['total_pnl']:,.0f}")
+    
     def save_results(self, df: pd.DataFrame, output_path: Path | str) -> None:
         """Save results to CSV file.
         
@@ -17,10 +17,10 @@ import numpy as np
 import pandas as pd
 
 from vibe.common.indicators.batch import (
-    adx_series,
-    atr_series,
+    adx_series_fast,
+    atr_series_fast,
     linear_slope,
-    rolling_percentile_rank,
+    rolling_percentile_rank_fast,
     sma_series,
 )
 
@@ -53,6 +53,19 @@ _FEATURE_REGISTRY: dict[str, list[str]] = {
 
 _ALL_FEATURES = list(_FEATURE_REGISTRY.keys())
 
+# Code version per feature (default 1). Bump when a compute function changes
+# so persisted values (FeatureStore) are recomputed.
+_FEATURE_VERSIONS: dict[str, int] = {}
+
+
+def feature_version(name: str) -> str:
+    """Version key for name, including the versions of its dependencies."""
+    if name not in _FEATURE_REGISTRY:
+        raise ValueError(f"Unknown feature: {name!r}")
+    return "+".join(
+        f"{dep}@{_FEATURE_VERSIONS.get(dep, 1)}" for dep in _resolve_dependencies([name])
+    )
+
 
 class FeatureEngine:
     """Compute a table of regime-research features from an OHLCV DataFrame."""
@@ -125,17 +138,17 @@ def _resolve_dependencies(requested: list[str]) -> list[str]:
 def _compute_one(name: str, df: pd.DataFrame, ctx: pd.DataFrame) -> pd.Series:
     """Compute a single feature, pulling dependencies from ctx."""
     if name == "atr_14":
-        return atr_series(df, 14)
+        return atr_series_fast(df, 14)
 
     if name == "atr_pctile":
-        return rolling_percentile_rank(ctx["atr_14"], 252).clip(0.0, 1.0)
+        return rolling_percentile_rank_fast(ctx["atr_14"], 252).clip(0.0, 1.0)
 
     if name == "realized_vol":
         log_ret = np.log(df["close"] / df["close"].shift(1))
         return log_ret.rolling(window=20, min_periods=20).std()
 
     if name == "vol_pctile":
-        return rolling_percentile_rank(ctx["realized_vol"], 252).clip(0.0, 1.0)
+        return rolling_percentile_rank_fast(ctx["realized_vol"], 252).clip(0.0, 1.0)
 
     if name == "gap_pct":
         prev_close = df["close"].shift(1)
@@ -162,7 +175,7 @@ def _compute_one(name: str, df: pd.DataFrame, ctx: pd.DataFrame) -> pd.Series:
     if name == "adx_14":
         # If intraday, resample to daily then forward-fill; if already daily, use as-is
         daily_df = _to_daily_ohlcv(df)
-        adx = adx_series(daily_df, 14)
+        adx = adx_series_fast(daily_df, 14)
         return adx.reindex(df.index, method="ffill")
 
     if name == "or_size_pct":
@@ -174,7 +187,7 @@ def _compute_one(name: str, df: pd.DataFrame, ctx: pd.DataFrame) -> pd.Series:
 
     if name == "open_vol_pctile":
         first_bar_vol = df["volume"].copy()
-        return rolling_percentile_rank(first_bar_vol, 252).clip(0.0, 1.0)
+        return rolling_percentile_rank_fast(first_bar_vol, 252).clip(0.0, 1.0)
 
     if name == "or_expansion":
         if "or_size_pct" in ctx.columns and "atr_14" in ctx.columns:
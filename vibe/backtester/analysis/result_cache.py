@@ -0,0 +1,214 @@
+"""
+Content-addressed on-disk cache of backtest results.
+
+ParameterSweep used to pickle every BacktestResult whole (Trade objects,
+equity/drawdown Series, per-year metrics) under an MD5 of the parameters and
+dates. Those caches grew large, loaded slowly and went stale silently when
+the data was re-converted. ResultCache stores one directory per key:
+
+    <root>/<key>/summary.json     small header: caller's summary row + run metadata
+    <root>/<key>/metrics.json     overall / by-year / regime metrics, equity scalars
+    <root>/<key>/trades.parquet   one row per Trade
+    <root>/<key>/equity.parquet   equity and drawdown curves
+
+Keys are content addresses (ResultCache.key): a SHA-256 over everything that
+determines the result - resolved ruleset config, symbol, period, capital,
+slippage, the source data fingerprint and ENGINE_VERSION. Re-converting
+data or changing the engine therefore simply misses instead of serving a
+stale result. load_summary() reads only the header, so sweep reporting
+never deserializes trade lists.
+
+Entries are written to a temporary directory and renamed into place, so
+readers never see a partial entry.
+"""
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from vibe.backtester.analysis.metrics import BacktestResult, ConvexityMetrics, EquityMetrics
+from vibe.backtester.core.engine import ENGINE_VERSION
+from vibe.common.models.trade import Trade
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout changes
+_FORMAT_VERSION = 1
+
+_SUMMARY_FILE = "summary.json"
+_METRICS_FILE = "metrics.json"
+_TRADES_FILE = "trades.parquet"
+_EQUITY_FILE = "equity.parquet"
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _write_json(data: Dict[str, Any], path: Path) -> None:
+    with open(path, "w") as f:
+        json.dump(data, f, default=_json_default)
+
+
+def _read_json(path: Path) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+class ResultCache:
+    """
+    Directory of cached BacktestResults addressed by ResultCache.key().
+
+    Example:
+        ```python
+        cache = ResultCache("results/sweep_cache")
+        key = cache.key(config=config, symbol="QQQ", data=source_fingerprint(data_dir, "QQQ"))
+        summary = cache.load_summary(key)
+        if summary is None:
+            cache.save(key, result, summary=row)
+        ```
+    """
+
+    def __init__(self, root: Path | str) -> None:
+        self.root = Path(root)
+
+    @staticmethod
+    def key(**parts: Any) -> str:
+        """
+        Content address for a result determined by parts (JSON-able values).
+
+        ENGINE_VERSION and the cache format version are always included.
+        """
+        payload = {**parts, "engine_version": ENGINE_VERSION, "format_version": _FORMAT_VERSION}
+        encoded = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.root / key
+
+    def __contains__(self, key: str) -> bool:
+        return (self.path(key) / _SUMMARY_FILE).exists()
+
+    def save(self, key: str, result: BacktestResult, summary: Optional[Dict[str, Any]] = None) -> None:
+        """Store result under key, with summary as its header row."""
+        final = self.path(key)
+        tmp = self.root / f".{key}.{os.getpid()}.tmp"
+        try:
+            shutil.rmtree(tmp, ignore_errors=True)
+            tmp.mkdir(parents=True)
+            pq.write_table(
+                pa.Table.from_pylist([t.model_dump() for t in result.trades]), tmp / _TRADES_FILE
+            )
+            equity = pd.DataFrame({
+                "equity": result.equity.equity_curve,
+                "drawdown": result.equity.drawdown_curve,
+            })
+            equity.to_parquet(tmp / _EQUITY_FILE, engine="pyarrow", index=True)
+            _write_json(self._metrics_payload(result), tmp / _METRICS_FILE)
+            _write_json(
+                {
+                    "summary": summary or {},
+                    "symbol": result.symbol,
+                    "start_date": result.start_date,
+                    "end_date": result.end_date,
+                    "ruleset_name": result.ruleset_name,
+                    "ruleset_version": result.ruleset_version,
+                    "n_trades": len(result.trades),
+                    "engine_version": ENGINE_VERSION,
+                },
+                tmp / _SUMMARY_FILE,
+            )
+            if final.exists():
+                shutil.rmtree(final)
+            os.replace(tmp, final)
+        except Exception as e:
+            logger.warning(f"Failed to save cached result {key}: {e}")
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def load_summary(self, key: str) -> Optional[Dict[str, Any]]:
+        """The summary row stored with key, without loading trades or curves."""
+        path = self.path(key) / _SUMMARY_FILE
+        if not path.exists():
+            return None
+        try:
+            return _read_json(path)["summary"]
+        except Exception as e:
+            logger.warning(f"Failed to load cached summary {key}: {e}")
+            return None
+
+    def load_trades(self, key: str, columns: Optional[list] = None) -> Optional[pd.DataFrame]:
+        """Trades stored with key as a DataFrame (optionally only some columns)."""
+        path = self.path(key) / _TRADES_FILE
+        if not path.exists():
+            return None
+        try:
+            table = pq.read_table(path)
+            if table.num_rows == 0:
+                return pd.DataFrame(columns=columns or table.column_names)
+            return table.select(columns).to_pandas() if columns else table.to_pandas()
+        except Exception as e:
+            logger.warning(f"Failed to load cached trades {key}: {e}")
+            return None
+
+    def load(self, key: str) -> Optional[BacktestResult]:
+        """The full BacktestResult stored with key."""
+        directory = self.path(key)
+        if not (directory / _SUMMARY_FILE).exists():
+            return None
+        try:
+            header = _read_json(directory / _SUMMARY_FILE)
+            metrics = _read_json(directory / _METRICS_FILE)
+            trades = [Trade(**row) for row in pq.read_table(directory / _TRADES_FILE).to_pylist()]
+            curves = pd.read_parquet(directory / _EQUITY_FILE)
+        except Exception as e:
+            logger.warning(f"Failed to load cached result {key}: {e}")
+            return None
+
+        equity_curve = curves["equity"].rename(metrics["equity"].pop("equity_name"))
+        drawdown_curve = curves["drawdown"].rename(metrics["equity"].pop("drawdown_name"))
+        return BacktestResult(
+            overall=ConvexityMetrics(**metrics["overall"]),
+            by_year={int(year): ConvexityMetrics(**m) for year, m in metrics["by_year"].items()},
+            equity=EquityMetrics(
+                **metrics["equity"], equity_curve=equity_curve, drawdown_curve=drawdown_curve
+            ),
+            trades=trades,
+            regime_breakdown={
+                name: ConvexityMetrics(**m) for name, m in metrics["regime_breakdown"].items()
+            },
+            symbol=header["symbol"],
+            start_date=header["start_date"],
+            end_date=header["end_date"],
+            ruleset_name=header["ruleset_name"],
+            ruleset_version=header["ruleset_version"],
+        )
+
+    @staticmethod
+    def _metrics_payload(result: BacktestResult) -> Dict[str, Any]:
+        equity = {
+            field.name: getattr(result.equity, field.name)
+            for field in dataclasses.fields(EquityMetrics)
+            if field.name not in ("equity_curve", "drawdown_curve")
+        }
+        equity["equity_name"] = result.equity.equity_curve.name
+        equity["drawdown_name"] = result.equity.drawdown_curve.name
+        return {
+            "overall": dataclasses.asdict(result.overall),
+            "by_year": {str(year): dataclasses.asdict(m) for year, m in result.by_year.items()},
+            "regime_breakdown": {
+                name: dataclasses.asdict(m) for name, m in result.regime_breakdown.items()
+            },
+            "equity": equity,
+        }
@@ -8,6 +8,7 @@ Tests strategy stability under perturbations:
 """
 import logging
 import random
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -16,8 +17,9 @@ from typing import List, Optional, Dict, Any
 import numpy as np
 import pandas as pd
 
-from vibe.backtester.core.engine import BacktestEngine
 from vibe.backtester.analysis.metrics import BacktestResult
+from vibe.backtester.analysis.parallel_runs import AnalysisTiming, BacktestTask, run_backtests
+from vibe.backtester.core.repricing import SlippageRepricer
 from vibe.common.ruleset.models import StrategyRuleSet
 
 logger = logging.getLogger(__name__)
@@ -57,6 +59,9 @@ class RobustnessAnalysis:
     # Robustness score (0-1, higher = more robust)
     robustness_score: float
     
+    # Wall-clock and per-variant backtest times
+    timing: Optional[AnalysisTiming] = None
+    
     def to_dict(self) -> Dict[str, Any]:
         """Export summary as dictionary."""
         return {
@@ -68,6 +73,7 @@ class RobustnessAnalysis:
             "sharpe_std": self.sharpe_std,
             "pnl_std": self.pnl_std,
             "robustness_score": self.robustness_score,
+            "timing": self.timing.to_dict() if self.timing else None,
         }
 
 
@@ -91,6 +97,13 @@ class RobustnessAnalyzer:
         )
         
         print(f"Robustness score: {analysis.robustness_score:.2f}")
+    
+    The baseline and the noise variants are independent backtests; with
+    workers > 1 they run on a process pool over data loaded once (see
+    parallel_runs), with results identical to the serial run. With
+    reprice=True they are instead derived from one run by re-pricing its
+    trades per slippage value (SlippageRepricer), falling back to full runs
+    only where the trade set could differ.
     """
     
     def __init__(
@@ -114,6 +127,8 @@ class RobustnessAnalyzer:
         perturbation_tests: int = 5,
         subsample_tests: int = 0,  # Future: random date subsets
         precomputed_features: Optional[pd.DataFrame] = None,
+        workers: int = 1,
+        reprice: bool = False,
     ) -> RobustnessAnalysis:
         """
         Run robustness analysis.
@@ -126,42 +141,54 @@ class RobustnessAnalyzer:
             perturbation_tests: Number of parameter perturbation tests
             subsample_tests: Number of random subsample tests (future)
             precomputed_features: Optional pre-computed indicators
+            workers: Worker processes for the backtests (1 = serial)
+            reprice: Re-price one run's trades per slippage value instead of
+                re-running the backtest (legacy execution path; ignores workers)
         
         Returns:
             RobustnessAnalysis with summary metrics
         """
         logger.info(f"Running robustness analysis on {symbol}...")
+        wall_start = time.perf_counter()
         
-        # 1. Run baseline
-        baseline_engine = BacktestEngine(
-            ruleset=self.ruleset,
-            data_dir=self.data_dir,
-            initial_capital=self.initial_capital,
-            slippage_ticks=self.baseline_slippage_ticks,
-        )
-        
-        baseline_result = baseline_engine.run(
-            symbol=symbol,
-            start_date=start_date,
-            end_date=end_date,
-            precomputed_features=precomputed_features,
+        # 1. Baseline and 2. noise injection tests (vary slippage), dispatched together
+        slippage_values = self._noise_slippages(noise_tests) if noise_tests > 0 else []
+        tasks = [self._task("baseline", start_date, end_date, self.baseline_slippage_ticks)]
+        tasks.extend(
+            self._task(f"noise_injection {i}: {slippage} ticks", start_date, end_date, slippage)
+            for i, slippage in enumerate(slippage_values)
         )
+        if noise_tests > 0:
+            logger.info(f"  Running baseline + {noise_tests} noise injection tests...")
+        if reprice:
+            workers = 1
+            repricer = SlippageRepricer(self.ruleset, self.data_dir, self.initial_capital)
+            results = repricer.run(
+                symbol, start_date, end_date,
+                slippage_ticks=[task.slippage_ticks for task in tasks],
+                precomputed_features=precomputed_features,
+            )
+            task_seconds = {"repricing": time.perf_counter() - wall_start}
+            if repricer.rerun_slippages:
+                logger.info(f"  Re-ran {len(repricer.rerun_slippages)} slippage value(s) in full "
+                           f"(trade set not slippage-invariant)")
+        else:
+            results, task_seconds = run_backtests(
+                tasks, self.data_dir, symbol, precomputed_features, workers=workers
+            )
         
+        baseline_result = results[0]
         logger.info(f"  Baseline: {baseline_result.overall.expectancy_r:.3f}R expectancy, "
                    f"{baseline_result.equity.sharpe_ratio:.2f} Sharpe")
         
         test_results = []
-        
-        # 2. Noise injection tests (vary slippage)
-        if noise_tests > 0:
-            logger.info(f"  Running {noise_tests} noise injection tests...")
-            test_results.extend(
-                self._run_noise_tests(
-                    symbol, start_date, end_date, 
-                    n_tests=noise_tests,
-                    precomputed_features=precomputed_features
-                )
-            )
+        for slippage, result in zip(slippage_values, results[1:]):
+            test_results.append(RobustnessTestResult(
+                test_type="noise_injection",
+                variation=float(slippage),
+                result=result,
+            ))
+            logger.info(f"    Slippage {slippage} ticks: {result.overall.expectancy_r:.3f}R")
         
         # 3. Parameter perturbation tests (future: wiggle params by ±10%)
         if perturbation_tests > 0:
@@ -194,8 +221,16 @@ class RobustnessAnalyzer:
         else:
             robustness_score = 0.0
         
+        timing = AnalysisTiming(
+            wall_seconds=time.perf_counter() - wall_start,
+            workers=workers,
+            task_seconds=task_seconds,
+        )
+        
         logger.info(f"  ✓ Robustness score: {robustness_score:.2f} "
                    f"(expectancy std: {expectancy_std:.3f}R)")
+        logger.info(f"    Wall time: {timing.wall_seconds:.1f}s "
+                   f"({timing.total_task_seconds:.1f}s of backtests, {workers} worker(s))")
         
         return RobustnessAnalysis(
             baseline_result=baseline_result,
@@ -204,48 +239,21 @@ class RobustnessAnalyzer:
             sharpe_std=sharpe_std,
             pnl_std=pnl_std,
             robustness_score=robustness_score,
+            timing=timing,
         )
     
-    def _run_noise_tests(
-        self,
-        symbol: str,
-        start_date: datetime,
-        end_date: datetime,
-        n_tests: int,
-        precomputed_features: Optional[pd.DataFrame],
-    ) -> List[RobustnessTestResult]:
-        """Run noise injection tests by varying slippage."""
-        results = []
-        
-        # Test slippage from baseline +/- 50%
+    def _noise_slippages(self, n_tests: int) -> List[int]:
+        """Slippage values for noise injection tests: baseline +/- 50%."""
         min_slippage = max(1, int(self.baseline_slippage_ticks * 0.5))
         max_slippage = int(self.baseline_slippage_ticks * 1.5)
-        
-        slippage_values = np.linspace(min_slippage, max_slippage, n_tests, dtype=int)
-        
-        for slippage in slippage_values:
-            engine = BacktestEngine(
-                ruleset=self.ruleset,
-                data_dir=self.data_dir,
-                initial_capital=self.initial_capital,
-                slippage_ticks=int(slippage),
-            )
-            
-            result = engine.run(
-                symbol=symbol,
-                start_date=start_date,
-                end_date=end_date,
-                precomputed_features=precomputed_features,
-            )
-            
-            test_result = RobustnessTestResult(
-                test_type="noise_injection",
-                variation=float(slippage),
-                result=result,
-            )
-            
-            results.append(test_result)
-            
-            logger.info(f"    Slippage {slippage} ticks: {result.overall.expectancy_r:.3f}R")
-        
-        return results
+        return [int(s) for s in np.linspace(min_slippage, max_slippage, n_tests, dtype=int)]
+    
+    def _task(self, label: str, start_date: datetime, end_date: datetime, slippage: int) -> BacktestTask:
+        return BacktestTask(
+            label=label,
+            ruleset=self.ruleset,
+            start_date=start_date,
+            end_date=end_date,
+            slippage_ticks=slippage,
+            initial_capital=self.initial_capital,
+        )
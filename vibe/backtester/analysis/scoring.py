@@ -8,6 +8,15 @@ import numpy as np
 from typing import List, Dict, Any
 from vibe.backtester.analysis.metrics import BacktestResult
 
+# Component weights of composite_score, score_breakdown and composite_scores
+DEFAULT_WEIGHTS: Dict[str, float] = {
+    "sharpe": 0.30,
+    "expectancy_r": 0.20,
+    "tail_ratio": 0.10,
+    "win_rate": 0.20,
+    "profit_factor": 0.20,
+}
+
 
 def calculate_tail_ratio(r_multiples: List[float], percentile: float = 0.95) -> float:
     """
@@ -60,13 +69,7 @@ def composite_score(
     """
     # Default weights (can be overridden)
     if weights is None:
-        weights = {
-            "sharpe": 0.30,
-            "expectancy_r": 0.20,
-            "tail_ratio": 0.10,
-            "win_rate": 0.20,
-            "profit_factor": 0.20,
-        }
+        weights = DEFAULT_WEIGHTS
     
     metrics = result.overall
     equity = result.equity
@@ -173,13 +176,7 @@ def score_breakdown(result: BacktestResult, weights: Dict[str, float] = None) ->
         Dictionary with component scores and total
     """
     if weights is None:
-        weights = {
-            "sharpe": 0.30,
-            "expectancy_r": 0.20,
-            "tail_ratio": 0.10,
-            "win_rate": 0.20,
-            "profit_factor": 0.20,
-        }
+        weights = DEFAULT_WEIGHTS
     
     metrics = result.overall
     equity = result.equity
@@ -221,3 +218,37 @@ def score_breakdown(result: BacktestResult, weights: Dict[str, float] = None) ->
         
         "total_score": composite_score(result, weights=weights),
     }
+
+
+def composite_scores(
+    sharpe: np.ndarray,
+    expectancy_r: np.ndarray,
+    tail_ratio: np.ndarray,
+    win_rate: np.ndarray,
+    profit_factor: np.ndarray,
+    n_trades: np.ndarray,
+    weights: Dict[str, float] = None,
+    min_trades: int = 30,
+) -> np.ndarray:
+    """
+    composite_score() for many candidates at once from metric arrays.
+    
+    Each argument holds one value per candidate; the normalization, weights
+    and sample-size penalty are those of composite_score().
+    
+    Returns:
+        Composite score per candidate
+    """
+    if weights is None:
+        weights = DEFAULT_WEIGHTS
+    
+    n_trades = np.asarray(n_trades, dtype=float)
+    sample_penalty = np.where(n_trades < min_trades, n_trades / min_trades, 1.0)
+    score = (
+        weights["sharpe"] * np.minimum(np.asarray(sharpe) / 2.0, 1.0) +
+        weights["expectancy_r"] * np.minimum(np.asarray(expectancy_r) / 0.5, 1.0) +
+        weights["tail_ratio"] * np.minimum(np.asarray(tail_ratio) / 3.0, 1.0) +
+        weights["win_rate"] * np.asarray(win_rate) +
+        weights["profit_factor"] * np.minimum(np.asarray(profit_factor) / 2.0, 1.0)
+    )
+    return score * sample_penalty
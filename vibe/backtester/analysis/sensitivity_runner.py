@@ -13,6 +13,9 @@ Usage:
     # Test with custom output path
     python -m vibe.backtester.analysis.sensitivity_runner --strategy orb \
         --output reports/orb_sensitivity.csv
+    
+    # Full grid on 8 worker processes
+    python -m vibe.backtester.analysis.sensitivity_runner --strategy orb --mode full --workers 8
 """
 import argparse
 import logging
@@ -229,7 +232,7 @@ def get_base_ruleset_for_strategy(strategy: str) -> Path:
 def progress_callback(current: int, total: int, params: dict) -> None:
     """Print progress updates during sweep."""
     pct = (current / total) * 100
-    print(f"\n[{current}/{total} - {pct:.1f}%] Testing: {params}")
+    print(f"\n[{current}/{total} - {pct:.1f}%] Finished: {params}")
 
 
 def main() -> None:
@@ -260,6 +263,12 @@ def main() -> None:
     parser.add_argument("--end", default="2024-12-31", help="End date (YYYY-MM-DD)")
     parser.add_argument("--capital", default=10_000.0, type=float, help="Initial capital")
     parser.add_argument("--slippage-ticks", default=5, type=int, help="Slippage in ticks")
+    parser.add_argument(
+        "--workers",
+        default=1,
+        type=int,
+        help="Worker processes for the sweep (default: 1, serial)",
+    )
     
     # Output
     parser.add_argument(
@@ -354,6 +363,7 @@ def main() -> None:
         start_date=start,
         end_date=end,
         progress_callback=progress_callback,
+        workers=args.workers,
     )
     
     # Save results
@@ -1,14 +1,20 @@
 """
 Parameter surface analysis for trading strategies.
 
-Visualizes 2D parameter performance landscapes to identify:
-- Stable plateaus (low gradient regions)
+Visualizes 2D parameter performance landscapes, and analyzes N-D grids as
+a whole, to identify:
+- Stable plateaus (connected low-gradient regions)
 - Sharp cliffs (overfitting risk)
-- Optimal parameter regions
+- Optimal parameter regions and robust optima (best neighbourhood)
+
+Sweep results are pivoted into a dense NumPy array (NaN = combination not
+evaluated); gradients, plateau labelling and neighbourhood scores are array
+ops over all dimensions at once, so 20k-cell grids take well under a second.
 """
 import logging
+import warnings
 from dataclasses import dataclass
-from typing import List, Tuple, Dict, Any, Optional
+from typing import List, Tuple, Dict, Any, Optional, Sequence
 
 import numpy as np
 import pandas as pd
@@ -16,6 +22,99 @@ import pandas as pd
 logger = logging.getLogger(__name__)
 
 
+def _pivot(
+    results_df: pd.DataFrame, params: Sequence[str], metric: str
+) -> Tuple[np.ndarray, List[List[Any]]]:
+    """Dense array of metric over the sorted unique values of each parameter."""
+    codes, values = [], []
+    for param in params:
+        param_codes, uniques = pd.factorize(results_df[param], sort=True)
+        codes.append(param_codes)
+        values.append(list(uniques))
+    array = np.full(tuple(len(v) for v in values), np.nan)
+    if len(results_df):
+        valid = np.all(np.stack(codes) >= 0, axis=0)
+        array[tuple(c[valid] for c in codes)] = results_df[metric].to_numpy(dtype=np.float64)[valid]
+    return array, values
+
+
+def _gradient_magnitude(array: np.ndarray) -> np.ndarray:
+    """Euclidean norm of the per-step gradient over every axis with >= 2 values."""
+    squared = np.zeros(array.shape)
+    for axis, size in enumerate(array.shape):
+        if size >= 2:
+            squared += np.gradient(array, axis=axis) ** 2
+    return np.sqrt(squared)
+
+
+def _shifted(ndim: int, axis: int) -> Tuple[tuple, tuple]:
+    """Index pairs (lower, upper) selecting every pair of neighbours along axis."""
+    lower = [slice(None)] * ndim
+    upper = [slice(None)] * ndim
+    lower[axis] = slice(None, -1)
+    upper[axis] = slice(1, None)
+    return tuple(lower), tuple(upper)
+
+
+def _label_regions(mask: np.ndarray) -> np.ndarray:
+    """
+    Face-connected regions of mask: 0 = background, 1..k = region.
+
+    Every cell starts with its own id; neighbouring cells repeatedly take
+    the smaller id, and pointer jumping (id -> id of the cell it points to)
+    collapses long chains, so convergence takes few whole-array passes.
+    """
+    labels = np.where(mask, np.arange(1, mask.size + 1).reshape(mask.shape), 0)
+    while True:
+        new = labels.copy()
+        for axis in range(mask.ndim):
+            lower, upper = _shifted(mask.ndim, axis)
+            a, b = labels[lower], labels[upper]
+            both = (a > 0) & (b > 0)
+            np.minimum(new[lower], np.where(both, b, a), out=new[lower])
+            np.minimum(new[upper], np.where(both, a, b), out=new[upper])
+        changed = not np.array_equal(new, labels)
+        labels = new
+        ids = labels.reshape(-1)
+        while True:
+            jumped = np.where(ids > 0, ids[np.maximum(ids, 1) - 1], 0)
+            if np.array_equal(jumped, ids):
+                break
+            ids[:] = jumped
+        if not changed:
+            break
+
+    out = np.zeros(mask.shape, dtype=np.int64)
+    if mask.any():
+        _, inverse = np.unique(labels[mask], return_inverse=True)
+        out[mask] = inverse.reshape(-1) + 1
+    return out
+
+
+def _large_regions(mask: np.ndarray, min_area: int) -> np.ndarray:
+    """mask restricted to its connected regions of at least min_area cells."""
+    labels = _label_regions(mask)
+    sizes = np.bincount(labels.reshape(-1))
+    keep = sizes >= min_area
+    keep[0] = False
+    return keep[labels]
+
+
+def _sliding(array: np.ndarray, axis: int, radius: int, op, fill: float) -> np.ndarray:
+    """op-reduction of the 2*radius+1 cell window along axis (edges padded with fill)."""
+    pad = [(0, 0)] * array.ndim
+    pad[axis] = (radius, radius)
+    padded = np.pad(array, pad, constant_values=fill)
+    n = array.shape[axis]
+    out = None
+    for k in range(2 * radius + 1):
+        window = [slice(None)] * array.ndim
+        window[axis] = slice(k, k + n)
+        view = padded[tuple(window)]
+        out = view.copy() if out is None else op(out, view)
+    return out
+
+
 @dataclass
 class ParameterSurface:
     """2D parameter performance surface."""
@@ -39,12 +138,8 @@ class ParameterSurface:
         Returns:
             List of (row, col) indices where cliffs detected
         """
-        # Compute gradients
-        grad_x = np.gradient(self.metric_matrix, axis=1)
-        grad_y = np.gradient(self.metric_matrix, axis=0)
-        
-        # Gradient magnitude
-        grad_magnitude = np.sqrt(grad_x**2 + grad_y**2)
+        # Gradient magnitude over both axes
+        grad_magnitude = _gradient_magnitude(self.metric_matrix)
         
         # Find points exceeding threshold
         cliff_mask = grad_magnitude > gradient_threshold
@@ -70,20 +165,11 @@ class ParameterSurface:
         Returns:
             List of (row, col) indices in plateau regions
         """
-        # Compute gradients
-        grad_x = np.gradient(self.metric_matrix, axis=1)
-        grad_y = np.gradient(self.metric_matrix, axis=0)
-        
-        # Gradient magnitude
-        grad_magnitude = np.sqrt(grad_x**2 + grad_y**2)
-        
-        # Find low-gradient points
-        plateau_mask = grad_magnitude < gradient_threshold
+        # Low-gradient points in regions of at least min_area connected cells
+        plateau_mask = _gradient_magnitude(self.metric_matrix) < gradient_threshold
+        plateau_mask = _large_regions(plateau_mask, min_area)
         plateau_coords = list(zip(*np.where(plateau_mask)))
         
-        # TODO: Filter by contiguous area (require min_area connected cells)
-        # For now, just return all low-gradient points
-        
         return plateau_coords
     
     def find_optimal_region(
@@ -109,8 +195,8 @@ class ParameterSurface:
             # Also identify plateau regions
             plateaus = self.detect_plateaus()
             plateau_mask = np.zeros_like(self.metric_matrix, dtype=bool)
-            for row, col in plateaus:
-                plateau_mask[row, col] = True
+            if plateaus:
+                plateau_mask[tuple(np.array(plateaus).T)] = True
             
             # Optimal = top performance AND in plateau
             optimal_mask = top_mask & plateau_mask
@@ -140,6 +226,159 @@ class ParameterSurface:
         }
 
 
+@dataclass
+class NDParameterSurface:
+    """
+    N-dimensional parameter performance surface, one axis per parameter.
+    
+    Cells are indexed like metric_array; cell coordinates are returned as
+    (k, n_params) integer arrays and mapped to values with params_at().
+    """
+    param_names: List[str]
+    param_values: List[List[Any]]
+    metric_array: np.ndarray  # Shape: tuple(len(v) for v in param_values); NaN = not evaluated
+    metric_name: str
+    
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.metric_array.shape
+    
+    @property
+    def n_evaluated(self) -> int:
+        return int(np.count_nonzero(~np.isnan(self.metric_array)))
+    
+    def gradient_magnitude(self) -> np.ndarray:
+        """Per-cell gradient magnitude over all parameter axes (metric units per grid step)."""
+        return _gradient_magnitude(self.metric_array)
+    
+    def detect_cliffs(self, gradient_threshold: float = 0.5) -> np.ndarray:
+        """Coordinates of cells whose gradient magnitude exceeds gradient_threshold."""
+        return np.argwhere(self.gradient_magnitude() > gradient_threshold)
+    
+    def plateau_regions(self, gradient_threshold: float = 0.1, min_area: int = 4) -> np.ndarray:
+        """
+        Label array of plateaus: face-connected low-gradient regions of at
+        least min_area cells, numbered 1..k (0 = not on a plateau).
+        """
+        mask = _large_regions(self.gradient_magnitude() < gradient_threshold, min_area)
+        return _label_regions(mask)
+    
+    def detect_plateaus(self, gradient_threshold: float = 0.1, min_area: int = 4) -> np.ndarray:
+        """Coordinates of cells in plateau regions (see plateau_regions)."""
+        return np.argwhere(self.plateau_regions(gradient_threshold, min_area) > 0)
+    
+    def neighborhood_score(self, radius: int = 1, statistic: str = "mean") -> np.ndarray:
+        """
+        Metric aggregated over each cell's box neighbourhood (+/- radius
+        steps on every axis, unevaluated cells ignored): "mean" rewards
+        broad good regions, "min" is the worst case of a small parameter
+        error. NaN where the cell itself was not evaluated.
+        """
+        if statistic not in ("mean", "min"):
+            raise ValueError(f"Invalid statistic: {statistic}. Must be 'mean' or 'min'")
+        missing = np.isnan(self.metric_array)
+        if statistic == "mean":
+            total = np.where(missing, 0.0, self.metric_array)
+            count = (~missing).astype(np.float64)
+            for axis in range(self.metric_array.ndim):
+                total = _sliding(total, axis, radius, np.add, 0.0)
+                count = _sliding(count, axis, radius, np.add, 0.0)
+            score = total / np.maximum(count, 1.0)
+        else:
+            score = self.metric_array
+            for axis in range(self.metric_array.ndim):
+                score = _sliding(score, axis, radius, np.fmin, np.nan)
+        return np.where(missing, np.nan, score)
+    
+    def robust_optimum(self, radius: int = 1, statistic: str = "mean") -> Dict[str, Any]:
+        """
+        Cell with the best neighbourhood score: the optimum least sensitive
+        to small parameter changes, rather than the single best cell.
+        """
+        score = self.neighborhood_score(radius, statistic)
+        if np.all(np.isnan(score)):
+            return {}
+        index = np.unravel_index(np.nanargmax(score), self.shape)
+        return {
+            "params": self._params_of(index),
+            self.metric_name: float(self.metric_array[index]),
+            f"neighborhood_{statistic}": float(score[index]),
+            "radius": radius,
+        }
+    
+    def find_optimal_region(
+        self,
+        top_percentile: float = 0.90,
+        plateau_bonus: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Identify optimal parameter region (as ParameterSurface.find_optimal_region).
+        
+        Args:
+            top_percentile: Consider parameters in top X% of performance
+            plateau_bonus: Prefer parameters in plateau regions (more robust)
+        
+        Returns:
+            Dict with optimal region info
+        """
+        if self.n_evaluated == 0:
+            return {"n_optimal_points": 0, "optimal_params": [], "threshold": float("nan")}
+        threshold = np.nanpercentile(self.metric_array, top_percentile * 100)
+        optimal_mask = self.metric_array >= threshold
+        if plateau_bonus:
+            optimal_mask &= self.plateau_regions() > 0
+        
+        coords = np.argwhere(optimal_mask)
+        if len(coords) == 0:
+            # Fall back to absolute best
+            coords = np.array([np.unravel_index(np.nanargmax(self.metric_array), self.shape)])
+        
+        return {
+            "n_optimal_points": len(coords),
+            "optimal_params": self.params_at(coords).to_dict("records"),
+            "threshold": threshold,
+        }
+    
+    def params_at(self, coords: np.ndarray) -> pd.DataFrame:
+        """Parameter values and metric of each (k, n_params) cell coordinate."""
+        coords = np.asarray(coords, dtype=np.int64).reshape(-1, len(self.param_names))
+        frame = pd.DataFrame({
+            name: np.asarray(values, dtype=object)[coords[:, axis]]
+            for axis, (name, values) in enumerate(zip(self.param_names, self.param_values))
+        })
+        frame[self.metric_name] = self.metric_array[tuple(coords.T)]
+        return frame
+    
+    def project(self, param_x: str, param_y: str, reduce: str = "max") -> ParameterSurface:
+        """
+        2D ParameterSurface of two parameters, reducing the other axes with
+        nan-aware max (best achievable) or mean.
+        """
+        if reduce not in ("max", "mean"):
+            raise ValueError(f"Invalid reduce: {reduce}. Must be 'max' or 'mean'")
+        x_axis = self.param_names.index(param_x)
+        y_axis = self.param_names.index(param_y)
+        others = tuple(a for a in range(len(self.param_names)) if a not in (x_axis, y_axis))
+        with warnings.catch_warnings():
+            # All-NaN slices (pairs never evaluated) stay NaN
+            warnings.simplefilter("ignore", RuntimeWarning)
+            reducer = np.nanmax if reduce == "max" else np.nanmean
+            reduced = reducer(self.metric_array, axis=others) if others else self.metric_array
+        # Remaining axes keep their order; rows must be y
+        matrix = reduced.T if y_axis > x_axis else reduced
+        return ParameterSurface(
+            param_x_name=param_x,
+            param_y_name=param_y,
+            param_x_values=self.param_values[x_axis],
+            param_y_values=self.param_values[y_axis],
+            metric_matrix=matrix,
+            metric_name=self.metric_name,
+        )
+    
+    def _params_of(self, index: Tuple[int, ...]) -> Dict[str, Any]:
+        return {name: values[i] for name, values, i in zip(self.param_names, self.param_values, index)}
+
+
 class SurfaceAnalyzer:
     """
     Analyze 2D parameter performance surfaces.
@@ -180,17 +419,8 @@ class SurfaceAnalyzer:
         Returns:
             ParameterSurface object
         """
-        # Get unique parameter values
-        x_values = sorted(results_df[param_x].unique())
-        y_values = sorted(results_df[param_y].unique())
-        
-        # Create matrix
-        matrix = np.full((len(y_values), len(x_values)), np.nan)
-        
-        for _, row in results_df.iterrows():
-            x_idx = x_values.index(row[param_x])
-            y_idx = y_values.index(row[param_y])
-            matrix[y_idx, x_idx] = row[metric]
+        # Rows = sorted y values, columns = sorted x values
+        matrix, (y_values, x_values) = _pivot(results_df, [param_y, param_x], metric)
         
         return ParameterSurface(
             param_x_name=param_x,
@@ -201,6 +431,31 @@ class SurfaceAnalyzer:
             metric_name=metric,
         )
     
+    def create_nd_surface(
+        self,
+        results_df: pd.DataFrame,
+        params: Sequence[str],
+        metric: str = "composite_score",
+    ) -> NDParameterSurface:
+        """
+        Create an N-D parameter surface from sweep results.
+        
+        Args:
+            results_df: DataFrame from ParameterSweep.run()
+            params: Parameter columns, one surface axis each
+            metric: Column name for metric to analyze
+        
+        Returns:
+            NDParameterSurface object
+        """
+        array, values = _pivot(results_df, params, metric)
+        return NDParameterSurface(
+            param_names=list(params),
+            param_values=values,
+            metric_array=array,
+            metric_name=metric,
+        )
+    
     def plot_surface(
         self,
         surface: ParameterSurface,
@@ -283,8 +538,11 @@ class SurfaceAnalyzer:
         
         plt.close()
     
-    def summary_report(self, surface: ParameterSurface) -> Dict[str, Any]:
+    def summary_report(self, surface: ParameterSurface | NDParameterSurface) -> Dict[str, Any]:
         """Generate summary statistics for parameter surface."""
+        if isinstance(surface, NDParameterSurface):
+            return self._nd_summary_report(surface)
+        
         cliffs = surface.detect_cliffs()
         plateaus = surface.detect_plateaus()
         optimal = surface.find_optimal_region()
@@ -302,3 +560,22 @@ class SurfaceAnalyzer:
             "n_plateaus": len(plateaus),
             "optimal_region": optimal,
         }
+    
+    def _nd_summary_report(self, surface: NDParameterSurface) -> Dict[str, Any]:
+        values = surface.metric_array
+        evaluated = surface.n_evaluated > 0
+        return {
+            "params": surface.param_names,
+            "metric": surface.metric_name,
+            "grid_size": "x".join(str(n) for n in surface.shape),
+            "n_evaluated": surface.n_evaluated,
+            "min_value": float(np.nanmin(values)) if evaluated else float("nan"),
+            "max_value": float(np.nanmax(values)) if evaluated else float("nan"),
+            "mean_value": float(np.nanmean(values)) if evaluated else float("nan"),
+            "std_value": float(np.nanstd(values)) if evaluated else float("nan"),
+            "n_cliffs": len(surface.detect_cliffs()),
+            "n_plateaus": len(surface.detect_plateaus()),
+            "n_plateau_regions": int(surface.plateau_regions().max(initial=0)),
+            "optimal_region": surface.find_optimal_region(),
+            "robust_optimum": surface.robust_optimum(),
+        }
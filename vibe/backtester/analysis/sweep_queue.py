@@ -0,0 +1,470 @@
+"""
+Durable job queue for distributing a parameter sweep over worker processes.
+
+ParameterSweep.run(queue_path=...) publishes every combination as a job in a
+single SQLite file on storage all nodes can reach:
+
+    meta    run identity (run_key) and the sweep spec workers rebuild from
+    jobs    one row per combination: status, lease, attempts, and once done
+            its summary row and outcome-matrix trade columns
+
+Any number of workers, on any number of hosts, run
+
+    python scripts/sweep_worker.py <queue_path>
+
+They claim one job at a time under a lease, renew the lease from a heartbeat
+thread while the backtest runs, and write the result back into the queue. The
+coordinator (the ParameterSweep.run call) polls the queue for finished jobs,
+returns expired leases to the queue and marks a job failed once it has been
+claimed max_attempts times. Everything lives in the queue file, so both sides
+are restartable: a re-run coordinator with the same run_key picks up where
+the previous one stopped, and a killed worker only costs its lease.
+
+The database uses a rollback journal rather than WAL because WAL needs shared
+memory, which network filesystems don't provide. Leases compare wall-clock
+time across hosts, so nodes should run NTP and lease_seconds should be well
+above their clock skew.
+"""
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+from vibe.backtester.analysis.result_cache import _json_default
+from vibe.backtester.analysis.sweep_store import _frame_bytes, _frame_from_bytes, combo_key
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+# Seconds a claimed job stays leased without a heartbeat
+DEFAULT_LEASE_SECONDS = 300.0
+
+# Claims of one job (a worker dying mid-job counts as one) before it is failed
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def encode_datetime(value: datetime) -> Dict[str, Any]:
+    """JSON form of a datetime that keeps a ZoneInfo zone (not just its offset)."""
+    zone = value.tzinfo.key if isinstance(value.tzinfo, ZoneInfo) else None
+    return {"iso": value.isoformat(), "zone": zone}
+
+
+def decode_datetime(value: Dict[str, Any]) -> datetime:
+    decoded = datetime.fromisoformat(value["iso"])
+    return decoded.astimezone(ZoneInfo(value["zone"])) if value["zone"] else decoded
+
+
+@dataclass
+class Job:
+    """A claimed combination."""
+    key: str
+    params: Dict[str, Any]
+    attempts: int
+
+
+@dataclass
+class FinishedJob:
+    """A combination that finished (status DONE or FAILED) in the queue."""
+    key: str
+    params: Dict[str, Any]
+    status: str
+    summary: Optional[Dict[str, Any]]
+    trades: Optional[pd.DataFrame]
+    error: Optional[str]
+    finished_seq: int
+
+
+class SweepQueue:
+    """
+    Job table of one distributed sweep run.
+
+    Example:
+        ```python
+        queue = SweepQueue("/shared/sweeps/orb_grid.sqlite")
+        queue.publish(run_key, spec, combinations)
+
+        # worker side
+        job = queue.claim("node-3:4121", lease_seconds=300)
+        queue.complete(job.key, "node-3:4121", summary, trades)
+        ```
+    """
+
+    def __init__(self, path: Path | str, timeout: float = 60.0):
+        self.path = Path(path)
+        self.timeout = timeout
+        self._conn: Optional[sqlite3.Connection] = None
+        # The heartbeat thread shares the connection with the worker loop
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Autocommit; writes that read-then-update take BEGIN IMMEDIATE
+            self._conn = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False
+            )
+            self._conn.execute("PRAGMA journal_mode=DELETE")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    combo_key TEXT PRIMARY KEY,
+                    seq INTEGER NOT NULL,
+                    params TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    worker TEXT,
+                    lease_until REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    summary TEXT,
+                    trades BLOB,
+                    error TEXT,
+                    finished_seq INTEGER
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, seq)")
+            # MAX(finished_seq) on every finish and the coordinator's finished() polls
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_finished ON jobs (finished_seq)")
+        return self._conn
+
+    def _query(self, sql: str, args: tuple = ()) -> List[tuple]:
+        conn = self._connect()
+        with self._lock:
+            return conn.execute(sql, args).fetchall()
+
+    def _update(self, sql: str, args: tuple = ()) -> int:
+        """Run one write statement (its own transaction); returns the rows changed."""
+        conn = self._connect()
+        with self._lock:
+            return conn.execute(sql, args).rowcount
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def run_key(self) -> Optional[str]:
+        rows = self._query("SELECT value FROM meta WHERE key = 'run_key'")
+        return rows[0][0] if rows else None
+
+    def spec(self) -> Dict[str, Any]:
+        """The sweep spec workers rebuild the ParameterSweep from."""
+        rows = self._query("SELECT value FROM meta WHERE key = 'spec'")
+        if not rows:
+            raise ValueError(f"No sweep has been published to {self.path}")
+        return json.loads(rows[0][0])
+
+    def publish(self, run_key: str, spec: Dict[str, Any], combinations: List[Dict[str, Any]]) -> int:
+        """
+        Add combinations as pending jobs of the run identified by run_key.
+
+        Publishing to a queue that already holds the same run keeps every
+        recorded job as it is (finished jobs are not re-run), so a restarted
+        coordinator simply publishes again.
+
+        Returns:
+            Number of jobs added
+
+        Raises:
+            ValueError: the queue holds a different run
+        """
+        conn = self._connect()
+        with self._lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT value FROM meta WHERE key = 'run_key'").fetchone()
+                if row is not None and row[0] != run_key:
+                    raise ValueError(
+                        f"Cannot publish to {self.path}: it holds a different sweep run "
+                        f"(delete the queue file to start over)"
+                    )
+                if row is None:
+                    conn.executemany(
+                        "INSERT INTO meta (key, value) VALUES (?, ?)",
+                        [
+                            ("run_key", run_key),
+                            ("spec", json.dumps(spec, default=_json_default)),
+                            ("created_at", datetime.now().isoformat()),
+                        ],
+                    )
+                (seq,) = conn.execute("SELECT COALESCE(MAX(seq), -1) + 1 FROM jobs").fetchone()
+                before = conn.total_changes
+                conn.executemany(
+                    "INSERT OR IGNORE INTO jobs (combo_key, seq, params, status) VALUES (?, ?, ?, ?)",
+                    [
+                        (combo_key(params), seq + i, json.dumps(params, default=_json_default), PENDING)
+                        for i, params in enumerate(combinations)
+                    ],
+                )
+                added = conn.total_changes - before
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return added
+
+    def claim(self, worker: str, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> Optional[Job]:
+        """Lease the oldest pending job to worker (None when nothing is pending)."""
+        conn = self._connect()
+        with self._lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT combo_key, params, attempts FROM jobs WHERE status = ? ORDER BY seq LIMIT 1",
+                    (PENDING,),
+                ).fetchone()
+                if row is not None:
+                    conn.execute(
+                        "UPDATE jobs SET status = ?, worker = ?, lease_until = ?, attempts = attempts + 1 "
+                        "WHERE combo_key = ?",
+                        (LEASED, worker, time.time() + lease_seconds, row[0]),
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        return Job(key=row[0], params=json.loads(row[1]), attempts=row[2] + 1)
+
+    def renew(self, key: str, worker: str, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> bool:
+        """Extend worker's lease on key; False when the lease was lost."""
+        return self._update(
+            "UPDATE jobs SET lease_until = ? WHERE combo_key = ? AND status = ? AND worker = ?",
+            (time.time() + lease_seconds, key, LEASED, worker),
+        ) == 1
+
+    def complete(
+        self,
+        key: str,
+        worker: str,
+        summary: Dict[str, Any],
+        trades: Optional[pd.DataFrame] = None,
+    ) -> bool:
+        """
+        Record a finished combination.
+
+        Accepted even if worker's lease expired meanwhile (backtests are
+        deterministic, so any worker's result is the result); ignored when the
+        job already finished. Returns whether the result was recorded.
+        """
+        return self._update(
+            "UPDATE jobs SET status = ?, worker = ?, lease_until = NULL, summary = ?, trades = ?, "
+            "error = NULL, finished_seq = (SELECT COALESCE(MAX(finished_seq), -1) + 1 FROM jobs) "
+            "WHERE combo_key = ? AND status IN (?, ?)",
+            (
+                DONE,
+                worker,
+                json.dumps(summary, default=_json_default),
+                _frame_bytes(trades) if trades is not None else None,
+                key,
+                PENDING,
+                LEASED,
+            ),
+        ) == 1
+
+    def fail(self, key: str, worker: str, error: str) -> bool:
+        """Record a combination whose backtest raised (not retried)."""
+        return self._update(
+            "UPDATE jobs SET status = ?, worker = ?, lease_until = NULL, error = ?, "
+            "finished_seq = (SELECT COALESCE(MAX(finished_seq), -1) + 1 FROM jobs) "
+            "WHERE combo_key = ? AND status IN (?, ?)",
+            (FAILED, worker, error, key, PENDING, LEASED),
+        ) == 1
+
+    def requeue_expired(self, max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> int:
+        """Return expired leases to the queue (or fail them after max_attempts claims)."""
+        return self._release("lease_until < ?", (time.time(),), max_attempts)
+
+    def release_worker(self, worker: str, max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> int:
+        """Return the leases of a worker known to be dead without waiting for expiry."""
+        return self._release("worker = ?", (worker,), max_attempts)
+
+    def _release(self, condition: str, args: tuple, max_attempts: int) -> int:
+        conn = self._connect()
+        with self._lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                failed = conn.execute(
+                    f"UPDATE jobs SET status = ?, lease_until = NULL, "
+                    f"error = 'worker lease lost ' || attempts || ' times', "
+                    f"finished_seq = (SELECT COALESCE(MAX(finished_seq), -1) + 1 FROM jobs) "
+                    f"WHERE status = ? AND attempts >= ? AND {condition}",
+                    (FAILED, LEASED, max_attempts, *args),
+                ).rowcount
+                requeued = conn.execute(
+                    f"UPDATE jobs SET status = ?, worker = NULL, lease_until = NULL "
+                    f"WHERE status = ? AND {condition}",
+                    (PENDING, LEASED, *args),
+                ).rowcount
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        if failed:
+            logger.warning(f"{failed} sweep jobs failed after {max_attempts} lost leases")
+        return requeued
+
+    def finished(self, after_seq: int = -1) -> List[FinishedJob]:
+        """Jobs finished after after_seq, in finishing order."""
+        rows = self._query(
+            "SELECT combo_key, params, status, summary, trades, error, finished_seq FROM jobs "
+            "WHERE finished_seq > ? ORDER BY finished_seq",
+            (after_seq,),
+        )
+        return [
+            FinishedJob(
+                key=key,
+                params=json.loads(params),
+                status=status,
+                summary=json.loads(summary) if summary is not None else None,
+                trades=_frame_from_bytes(trades) if trades is not None else None,
+                error=error,
+                finished_seq=seq,
+            )
+            for key, params, status, summary, trades, error, seq in rows
+        ]
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs per status."""
+        rows = self._query("SELECT status, COUNT(*) FROM jobs GROUP BY status")
+        return {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0, **dict(rows)}
+
+    def unfinished(self) -> int:
+        counts = self.counts()
+        return counts[PENDING] + counts[LEASED]
+
+
+class _Heartbeat:
+    """Renews a job lease from a background thread while the backtest runs."""
+
+    def __init__(self, queue: SweepQueue, key: str, worker: str, lease_seconds: float):
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(queue, key, worker, lease_seconds), daemon=True
+        )
+
+    def _run(self, queue: SweepQueue, key: str, worker: str, lease_seconds: float) -> None:
+        while not self._stop.wait(lease_seconds / 3):
+            if not queue.renew(key, worker, lease_seconds):
+                logger.warning(f"Lost lease on {key}; another worker may run it too")
+                return
+
+    def __enter__(self) -> "_Heartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def run_worker(
+    queue_path: Path | str,
+    worker_id: Optional[str] = None,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    poll_interval: float = 1.0,
+    idle_timeout: Optional[float] = None,
+    max_jobs: Optional[int] = None,
+    data_dir: Optional[Path | str] = None,
+    feature_store_dir: Optional[Path | str] = None,
+) -> int:
+    """
+    Claim and backtest jobs from a sweep queue until none are left.
+
+    The worker rebuilds the ParameterSweep from the queue's spec, so it needs
+    nothing but the queue path (and, on hosts that mount the market data
+    elsewhere, data_dir). It exits once every job has finished, after
+    idle_timeout seconds without a claimable job, or after max_jobs jobs.
+
+    Args:
+        queue_path: Queue file published by ParameterSweep.run(queue_path=...)
+        worker_id: Lease owner name (default "<hostname>:<pid>")
+        lease_seconds: Lease length; renewed every lease_seconds / 3
+        poll_interval: Seconds between claims while jobs are leased elsewhere
+        idle_timeout: Give up after this long without a claimable job
+        max_jobs: Stop after this many jobs
+        data_dir: Local path of the spec's Parquet data directory
+        feature_store_dir: FeatureStore root (default: the process-wide store)
+
+    Returns:
+        Number of jobs this worker finished (successfully or not)
+    """
+    from vibe.backtester.analysis.outcome_matrix import trades_frame
+    from vibe.backtester.analysis.parameter_sweep import ParameterSweep, SweepResult
+    from vibe.backtester.data.feature_store import FeatureStore
+
+    queue = SweepQueue(queue_path)
+    worker_id = worker_id or default_worker_id()
+    spec = queue.spec()
+    sweep = ParameterSweep.from_spec(
+        spec,
+        data_dir=data_dir,
+        feature_store=FeatureStore(feature_store_dir) if feature_store_dir else None,
+    )
+    symbol = spec["symbol"]
+    start_date = decode_datetime(spec["start_date"])
+    end_date = decode_datetime(spec["end_date"])
+
+    features = None
+    processed = 0
+    idle_since = time.monotonic()
+    logger.info(f"Sweep worker {worker_id} started on {queue.path}")
+    try:
+        while max_jobs is None or processed < max_jobs:
+            job = queue.claim(worker_id, lease_seconds)
+            if job is None:
+                if queue.unfinished() == 0:
+                    break
+                if idle_timeout is not None and time.monotonic() - idle_since > idle_timeout:
+                    logger.info(f"Sweep worker {worker_id} idle for {idle_timeout}s, exiting")
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            if features is None and spec["use_precomputed_features"]:
+                features = sweep._precompute_features(symbol, start_date, end_date, spec["timeframe"])
+
+            logger.info(f"[{worker_id}] Testing: {job.params} (attempt {job.attempts})")
+            with _Heartbeat(queue, job.key, worker_id, lease_seconds):
+                try:
+                    result = sweep._run_backtest(
+                        job.params, symbol, start_date, end_date, precomputed_features=features
+                    )
+                    error = None
+                except Exception as e:
+                    error = f"{type(e).__name__}: {e}"
+            if error is None:
+                sweep_result = SweepResult(params=job.params, result=result)
+                queue.complete(job.key, worker_id, sweep_result.summary, trades_frame(result.trades))
+            else:
+                logger.error(f"Failed for {job.params}: {error}")
+                queue.fail(job.key, worker_id, error)
+            processed += 1
+            idle_since = time.monotonic()
+    finally:
+        queue.close()
+
+    logger.info(f"Sweep worker {worker_id} finished {processed} jobs")
+    return processed
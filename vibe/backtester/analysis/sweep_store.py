@@ -0,0 +1,195 @@
+"""
+Checkpointed on-disk record of a parameter sweep run.
+
+ParameterSweep.run(results_dir=...) streams every finished combination here
+instead of only holding it in memory until the end:
+
+    <root>/manifest.json     run identity (run_key) and progress
+    <root>/results.sqlite    one row per finished combination: params, summary
+                             row and the trade columns the outcome matrix needs
+    <root>/top_k/            full BacktestResults (ResultCache layout) of the
+                             best keep_top_k combinations by composite score
+
+Rows are committed one transaction per combination, so a crash loses at
+most the combinations in flight. A run re-opened with resume=True and the
+same run_key (ruleset, parameter grid, period, settings, source data
+fingerprint, ENGINE_VERSION) skips every combination already recorded; a
+different run_key raises instead of mixing results of different runs.
+"""
+import io
+import json
+import logging
+import shutil
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from vibe.backtester.analysis.metrics import BacktestResult
+from vibe.backtester.analysis.result_cache import ResultCache, _json_default
+from vibe.backtester.core.engine import ENGINE_VERSION
+
+logger = logging.getLogger(__name__)
+
+_MANIFEST_FILE = "manifest.json"
+_DB_FILE = "results.sqlite"
+_TOP_K_DIR = "top_k"
+
+
+def combo_key(params: Dict[str, Any]) -> str:
+    """Stable identity of a parameter combination within a run."""
+    return json.dumps(params, sort_keys=True, default=_json_default)
+
+
+def _frame_bytes(frame: pd.DataFrame) -> bytes:
+    return frame.to_parquet(engine="pyarrow", index=False)
+
+
+def _frame_from_bytes(data: bytes) -> pd.DataFrame:
+    return pd.read_parquet(io.BytesIO(data), engine="pyarrow")
+
+
+class SweepStore:
+    """
+    Results directory of one sweep run.
+
+    Example:
+        ```python
+        store = SweepStore("results/sweeps/orb_grid")
+        store.open(run_key, manifest={"symbol": "QQQ"}, resume=True)
+        done = store.completed()          # combo_key -> (params, summary)
+        store.append(params, summary, trades)
+        store.finish(completed=len(done) + 1, total=n_combinations)
+        ```
+    """
+
+    def __init__(self, root: Path | str) -> None:
+        self.root = Path(root)
+        self.manifest_path = self.root / _MANIFEST_FILE
+        self.db_path = self.root / _DB_FILE
+        self.top_k = ResultCache(self.root / _TOP_K_DIR)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def open(self, run_key: str, manifest: Dict[str, Any], resume: bool = False) -> None:
+        """
+        Start (or, with resume, continue) the run identified by run_key.
+
+        Without resume any previous run in the directory is discarded.
+
+        Raises:
+            ValueError: resume=True and the directory holds a different run
+        """
+        existing = self.read_manifest()
+        if resume and existing is not None and existing.get("run_key") != run_key:
+            raise ValueError(
+                f"Cannot resume sweep in {self.root}: it holds a different run "
+                f"(ruleset, parameters, period, settings or data changed)"
+            )
+        if not resume or existing is None:
+            self.close()
+            for name in (_MANIFEST_FILE, _DB_FILE, f"{_DB_FILE}-wal", f"{_DB_FILE}-shm"):
+                (self.root / name).unlink(missing_ok=True)
+            shutil.rmtree(self.top_k.root, ignore_errors=True)
+            existing = None
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS results (
+                combo_key TEXT PRIMARY KEY,
+                seq INTEGER NOT NULL,
+                params TEXT NOT NULL,
+                summary TEXT NOT NULL,
+                trades BLOB
+            )
+        """)
+        self._conn.commit()
+
+        now = datetime.now().isoformat()
+        self._manifest = {
+            **(existing or {"created_at": now}),
+            **manifest,
+            "run_key": run_key,
+            "engine_version": ENGINE_VERSION,
+            "status": "running",
+            "updated_at": now,
+        }
+        self._write_manifest()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def read_manifest(self) -> Optional[Dict[str, Any]]:
+        if not self.manifest_path.exists():
+            return None
+        with open(self.manifest_path) as f:
+            return json.load(f)
+
+    def _write_manifest(self) -> None:
+        tmp = self.manifest_path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(self._manifest, f, indent=2, default=str)
+        tmp.replace(self.manifest_path)
+
+    def completed(self) -> Dict[str, tuple]:
+        """combo_key -> (params, summary) of every recorded combination."""
+        rows = self._conn.execute("SELECT combo_key, params, summary FROM results ORDER BY seq")
+        return {key: (json.loads(params), json.loads(summary)) for key, params, summary in rows}
+
+    def append(
+        self,
+        params: Dict[str, Any],
+        summary: Dict[str, Any],
+        trades: Optional[pd.DataFrame] = None,
+    ) -> None:
+        """Record a finished combination (committed immediately)."""
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (combo_key, seq, params, summary, trades) "
+                "VALUES (?, (SELECT COALESCE(MAX(seq), -1) + 1 FROM results), ?, ?, ?)",
+                (
+                    combo_key(params),
+                    json.dumps(params, default=_json_default),
+                    json.dumps(summary, default=_json_default),
+                    _frame_bytes(trades) if trades is not None else None,
+                ),
+            )
+
+    def load_trades(self, params: Dict[str, Any]) -> Optional[pd.DataFrame]:
+        """Outcome-matrix trade columns recorded for params."""
+        row = self._conn.execute(
+            "SELECT trades FROM results WHERE combo_key = ?", (combo_key(params),)
+        ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return _frame_from_bytes(row[0])
+
+    def results_frame(self) -> pd.DataFrame:
+        """Every recorded row (params + summary), in completion order."""
+        return pd.DataFrame([{**params, **summary} for params, summary in self.completed().values()])
+
+    def save_full(self, params: Dict[str, Any], result: BacktestResult, summary: Dict[str, Any]) -> None:
+        """Keep the full result of a top-K combination."""
+        self.top_k.save(ResultCache.key(combo=combo_key(params)), result, summary=summary)
+
+    def drop_full(self, params: Dict[str, Any]) -> None:
+        """Delete the full result of a combination that left the top K."""
+        shutil.rmtree(self.top_k.path(ResultCache.key(combo=combo_key(params))), ignore_errors=True)
+
+    def load_full(self, params: Dict[str, Any]) -> Optional[BacktestResult]:
+        return self.top_k.load(ResultCache.key(combo=combo_key(params)))
+
+    def update_progress(self, completed: int, total: int) -> None:
+        self._manifest.update(completed=completed, total=total, updated_at=datetime.now().isoformat())
+        self._write_manifest()
+
+    def finish(self, completed: int, total: int) -> None:
+        """Mark the run complete and close the database."""
+        self._manifest["status"] = "complete"
+        self.update_progress(completed, total)
+        self.close()
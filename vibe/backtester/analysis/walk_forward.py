@@ -2,21 +2,27 @@
 Walk-forward analysis for trading strategies.
 
 Evaluates strategy performance on rolling train/test splits to detect overfitting
-and measure out-of-sample degradation.
+and measure out-of-sample degradation, either for one fixed ruleset (analyze)
+or re-selecting the best sweep combination in every train window (optimize).
 """
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Tuple, Dict, Any
 
 import numpy as np
 import pandas as pd
 
-from vibe.backtester.core.engine import BacktestEngine
-from vibe.backtester.analysis.metrics import BacktestResult
+from vibe.backtester.analysis.metrics import BacktestResult, ConvexityMetrics
+from vibe.backtester.analysis.outcome_matrix import OutcomeMatrix
+from vibe.backtester.analysis.parallel_runs import AnalysisTiming, BacktestTask, run_backtests
 from vibe.common.ruleset.models import StrategyRuleSet
 
+if TYPE_CHECKING:
+    from vibe.backtester.analysis.parameter_sweep import ParameterSweep
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,14 +35,22 @@ class WalkForwardPeriod:
     test_end: datetime
     train_result: Optional[BacktestResult] = None
     test_result: Optional[BacktestResult] = None
+    # Set instead of the results when aggregated from an OutcomeMatrix
+    train_metrics: Optional[ConvexityMetrics] = None
+    test_metrics: Optional[ConvexityMetrics] = None
+    # Set by WalkForwardEngine.optimize: the combination chosen on the train window
+    selected_params: Optional[Dict[str, Any]] = None
+    train_score: Optional[float] = None
     
     @property
     def train_expectancy(self) -> float:
-        return self.train_result.overall.expectancy_r if self.train_result else 0.0
+        metrics = self.train_metrics or (self.train_result.overall if self.train_result else None)
+        return metrics.expectancy_r if metrics else 0.0
     
     @property
     def test_expectancy(self) -> float:
-        return self.test_result.overall.expectancy_r if self.test_result else 0.0
+        metrics = self.test_metrics or (self.test_result.overall if self.test_result else None)
+        return metrics.expectancy_r if metrics else 0.0
     
     @property
     def degradation(self) -> float:
@@ -59,14 +73,24 @@ class WalkForwardAnalysis:
     # Walk-forward score (0-1, higher = better OOS performance)
     walk_forward_score: float
     
+    # Wall-clock and per-window backtest times
+    timing: Optional[AnalysisTiming] = None
+    
+    # Set by WalkForwardEngine.optimize: all test windows' trades, each from
+    # the combination selected on its train window
+    oos_metrics: Optional[ConvexityMetrics] = None
+    
     def to_dict(self) -> Dict[str, Any]:
         """Export summary as dictionary."""
         return {
             "n_periods": len(self.periods),
+            "timing": self.timing.to_dict() if self.timing else None,
             "avg_train_expectancy": self.avg_train_expectancy,
             "avg_test_expectancy": self.avg_test_expectancy,
             "avg_degradation": self.avg_degradation,
             "walk_forward_score": self.walk_forward_score,
+            "oos_expectancy": self.oos_metrics.expectancy_r if self.oos_metrics else None,
+            "oos_trades": self.oos_metrics.n_trades if self.oos_metrics else None,
             "periods": [
                 {
                     "train_start": p.train_start.isoformat(),
@@ -76,6 +100,8 @@ class WalkForwardAnalysis:
                     "train_exp": p.train_expectancy,
                     "test_exp": p.test_expectancy,
                     "degradation": p.degradation,
+                    "selected_params": p.selected_params,
+                    "train_score": p.train_score,
                 }
                 for p in self.periods
             ],
@@ -107,6 +133,23 @@ class WalkForwardEngine:
         
         print(f"Walk-forward score: {analysis.walk_forward_score:.2f}")
         print(f"Average degradation: {analysis.avg_degradation:.2%}")
+    
+    Given a sweep's OutcomeMatrix (ParameterSweep.run(collect_outcomes=True))
+    and the combination matching the ruleset, every window is aggregated from
+    the per-day outcomes instead of re-running the engine:
+    
+        analysis = engine.analyze("QQQ", start, end, outcomes=sweep.outcomes, combo=best_params)
+    
+    Otherwise the train and test windows of all periods are independent
+    backtests; with workers > 1 they run on a process pool over data loaded
+    once (see parallel_runs), with results identical to the serial run.
+    
+    optimize() re-selects the top combination by composite_score in every
+    train window from the same outcomes, testing whether re-optimizing on a
+    schedule generalizes:
+    
+        analysis = engine.optimize("QQQ", start, end, outcomes=sweep.outcomes, anchored=True)
+        print(analysis.oos_metrics.expectancy_r, [p.selected_params for p in analysis.periods])
     """
     
     def __init__(
@@ -130,6 +173,10 @@ class WalkForwardEngine:
         test_months: int = 1,
         step_months: int = 1,
         precomputed_features: Optional[pd.DataFrame] = None,
+        outcomes: Optional[OutcomeMatrix] = None,
+        combo: Optional[Dict[str, Any] | int] = None,
+        workers: int = 1,
+        anchored: bool = False,
     ) -> WalkForwardAnalysis:
         """
         Run walk-forward analysis.
@@ -142,57 +189,143 @@ class WalkForwardEngine:
             test_months: Test window size in months
             step_months: Roll-forward step size in months
             precomputed_features: Optional pre-computed indicators
+            outcomes: Optional sweep outcome matrix covering the period
+            combo: Parameters (or column) of this ruleset in outcomes
+            workers: Worker processes for the window backtests (1 = serial)
+            anchored: Keep every train window starting at start_date (it
+                grows by step_months) instead of rolling it forward
         
         Returns:
             WalkForwardAnalysis with summary metrics
         """
         logger.info(f"Running walk-forward analysis on {symbol}...")
+        wall_start = time.perf_counter()
         logger.info(f"  Train: {train_months}mo, Test: {test_months}mo, Step: {step_months}mo")
         
         # Generate periods
         periods = self._generate_periods(
             start_date, end_date, 
-            train_months, test_months, step_months
+            train_months, test_months, step_months, anchored
         )
         
         logger.info(f"  Generated {len(periods)} train/test periods")
         
-        # Run backtests for each period
+        task_seconds: Dict[str, float] = {}
+        if outcomes is None:
+            task_seconds = self._run_periods(symbol, periods, precomputed_features, workers)
+        
         for i, period in enumerate(periods, 1):
             logger.info(f"  [{i}/{len(periods)}] Train: {period.train_start.date()} to {period.train_end.date()}, "
                        f"Test: {period.test_start.date()} to {period.test_end.date()}")
             
-            # Run train backtest
-            engine = BacktestEngine(
-                ruleset=self.ruleset,
-                data_dir=self.data_dir,
-                initial_capital=self.initial_capital,
-                slippage_ticks=self.slippage_ticks,
-            )
-            
-            # Use subset of pre-computed features if provided
-            train_features = self._subset_features(precomputed_features, period.train_start, period.train_end)
-            test_features = self._subset_features(precomputed_features, period.test_start, period.test_end)
-            
-            period.train_result = engine.run(
-                symbol=symbol,
-                start_date=period.train_start,
-                end_date=period.train_end,
-                precomputed_features=train_features,
-            )
-            
-            # Run test backtest
-            period.test_result = engine.run(
-                symbol=symbol,
-                start_date=period.test_start,
-                end_date=period.test_end,
-                precomputed_features=test_features,
-            )
+            if outcomes is not None:
+                period.train_metrics = outcomes.convexity(combo, period.train_start, period.train_end)
+                period.test_metrics = outcomes.convexity(combo, period.test_start, period.test_end)
             
             logger.info(f"    Train exp: {period.train_expectancy:.3f}R, "
                        f"Test exp: {period.test_expectancy:.3f}R, "
                        f"Degradation: {period.degradation:.1%}")
         
+        timing = AnalysisTiming(
+            wall_seconds=time.perf_counter() - wall_start,
+            workers=workers if outcomes is None else 1,
+            task_seconds=task_seconds,
+        )
+        return self._summarize(periods, timing)
+    
+    def optimize(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        outcomes: Optional[OutcomeMatrix] = None,
+        sweep: Optional["ParameterSweep"] = None,
+        train_months: int = 6,
+        test_months: int = 1,
+        step_months: int = 1,
+        anchored: bool = False,
+        weights: Optional[Dict[str, float]] = None,
+        min_trades: int = 30,
+        workers: int = 1,
+    ) -> WalkForwardAnalysis:
+        """
+        Walk-forward optimization: re-select parameters in every train window.
+        
+        For each train window the combination with the highest
+        composite_score (OutcomeMatrix.scores) is selected and scored on the
+        following test window. Every window is a row mask over one sweep's
+        per-day outcomes, so the cost is one sweep however many windows there
+        are. Pass the outcomes of a finished sweep (run with
+        collect_outcomes=True), or a ParameterSweep to run once over
+        [start_date, end_date].
+        
+        Args:
+            symbol: Trading symbol
+            start_date: Overall start
+            end_date: Overall end
+            outcomes: Sweep outcome matrix covering the period
+            sweep: Sweep to run when outcomes is not given
+            train_months: Training window size in months
+            test_months: Test window size in months
+            step_months: Roll-forward step size in months
+            anchored: Keep every train window starting at start_date
+            weights: Optional composite_score weights
+            min_trades: Train trades below which a combination's score is
+                scaled down (as in composite_score)
+            workers: Worker processes for the sweep run
+        
+        Returns:
+            WalkForwardAnalysis whose periods carry selected_params and
+            train_score, with oos_metrics over the stitched test windows
+        
+        Raises:
+            ValueError: If neither outcomes nor sweep is given
+        """
+        wall_start = time.perf_counter()
+        swept = outcomes is None
+        if outcomes is None:
+            if sweep is None:
+                raise ValueError("optimize() needs a sweep OutcomeMatrix or a ParameterSweep to run")
+            logger.info(f"Running sweep once for walk-forward optimization on {symbol}...")
+            sweep.run(symbol, start_date, end_date, collect_outcomes=True, workers=workers)
+            outcomes = sweep.outcomes
+        
+        periods = self._generate_periods(
+            start_date, end_date, train_months, test_months, step_months, anchored
+        )
+        logger.info(f"Walk-forward optimization over {len(periods)} windows, "
+                   f"{len(outcomes.combos)} combinations")
+        
+        selected = []
+        for i, period in enumerate(periods, 1):
+            train_rows = outcomes.window(period.train_start, period.train_end)
+            scores = outcomes.scores(train_rows, weights=weights, min_trades=min_trades)["composite_score"]
+            best = int(np.argmax(scores.to_numpy()))
+            selected.append(best)
+            period.selected_params = outcomes.combos.iloc[best].to_dict()
+            period.train_score = float(scores.iloc[best])
+            period.train_metrics = outcomes.convexity(best, period.train_start, period.train_end)
+            period.test_metrics = outcomes.convexity(best, period.test_start, period.test_end)
+            logger.info(f"  [{i}/{len(periods)}] Train {period.train_start.date()}..{period.train_end.date()} "
+                       f"-> {period.selected_params} (score {period.train_score:.3f}); "
+                       f"test exp: {period.test_expectancy:.3f}R")
+        
+        timing = AnalysisTiming(
+            wall_seconds=time.perf_counter() - wall_start,
+            workers=workers if swept else 1,
+            task_seconds={},
+        )
+        analysis = self._summarize(periods, timing)
+        analysis.oos_metrics = outcomes.stitched_convexity([
+            (j, p.test_start, p.test_end) for j, p in zip(selected, periods)
+        ])
+        logger.info(f"    Stitched OOS: {analysis.oos_metrics.n_trades} trades, "
+                   f"{analysis.oos_metrics.expectancy_r:.3f}R")
+        return analysis
+    
+    @staticmethod
+    def _summarize(periods: List[WalkForwardPeriod], timing: AnalysisTiming) -> WalkForwardAnalysis:
+        """Aggregate per-period expectancies into a WalkForwardAnalysis."""
         # Calculate aggregate metrics
         train_expectancies = [p.train_expectancy for p in periods]
         test_expectancies = [p.test_expectancy for p in periods]
@@ -223,6 +356,8 @@ class WalkForwardEngine:
         logger.info(f"  ✓ Walk-forward score: {walk_forward_score:.2f}")
         logger.info(f"    Avg train: {avg_train_expectancy:.3f}R, Avg test: {avg_test_expectancy:.3f}R")
         logger.info(f"    Avg degradation: {avg_degradation:.1%}")
+        logger.info(f"    Wall time: {timing.wall_seconds:.1f}s "
+                   f"({timing.total_task_seconds:.1f}s of backtests, {timing.workers} worker(s))")
         
         return WalkForwardAnalysis(
             periods=periods,
@@ -230,8 +365,42 @@ class WalkForwardEngine:
             avg_test_expectancy=avg_test_expectancy,
             avg_degradation=avg_degradation,
             walk_forward_score=walk_forward_score,
+            timing=timing,
         )
     
+    def _run_periods(
+        self,
+        symbol: str,
+        periods: List[WalkForwardPeriod],
+        precomputed_features: Optional[pd.DataFrame],
+        workers: int,
+    ) -> Dict[str, float]:
+        """Backtest every period's train and test windows; returns per-window seconds."""
+        tasks = []
+        for period in periods:
+            for kind, start, end in (
+                ("train", period.train_start, period.train_end),
+                ("test", period.test_start, period.test_end),
+            ):
+                tasks.append(BacktestTask(
+                    label=f"{kind} {start.date()}..{end.date()}",
+                    ruleset=self.ruleset,
+                    start_date=start,
+                    end_date=end,
+                    slippage_ticks=self.slippage_ticks,
+                    initial_capital=self.initial_capital,
+                    # Use subset of pre-computed features if provided
+                    subset_features=True,
+                ))
+        
+        results, seconds = run_backtests(
+            tasks, self.data_dir, symbol, precomputed_features, workers=workers
+        )
+        for i, period in enumerate(periods):
+            period.train_result = results[2 * i]
+            period.test_result = results[2 * i + 1]
+        return seconds
+    
     def _generate_periods(
         self,
         start_date: datetime,
@@ -239,14 +408,19 @@ class WalkForwardEngine:
         train_months: int,
         test_months: int,
         step_months: int,
+        anchored: bool = False,
     ) -> List[WalkForwardPeriod]:
-        """Generate train/test period splits."""
+        """Generate train/test period splits (anchored: train always starts at start_date)."""
         periods = []
         current_train_start = start_date
+        steps = 0
         
         while True:
             # Calculate period boundaries
-            train_end = current_train_start + timedelta(days=train_months * 30)
+            if anchored:
+                train_end = start_date + timedelta(days=(train_months + steps * step_months) * 30)
+            else:
+                train_end = current_train_start + timedelta(days=train_months * 30)
             test_start = train_end + timedelta(days=1)
             test_end = test_start + timedelta(days=test_months * 30)
             
@@ -263,19 +437,8 @@ class WalkForwardEngine:
             periods.append(period)
             
             # Roll forward
-            current_train_start = current_train_start + timedelta(days=step_months * 30)
+            steps += 1
+            if not anchored:
+                current_train_start = current_train_start + timedelta(days=step_months * 30)
         
         return periods
-    
-    def _subset_features(
-        self,
-        features: Optional[pd.DataFrame],
-        start: datetime,
-        end: datetime,
-    ) -> Optional[pd.DataFrame]:
-        """Extract subset of pre-computed features for a date range."""
-        if features is None:
-            return None
-        
-        mask = (features.index >= start) & (features.index <= end)
-        return features[mask]
@@ -0,0 +1,95 @@
+"""
+Batched ORB backtests: many ruleset variants over one shared bar stream.
+
+A sweep normally builds an engine per combination, and each one re-reads
+the bar frame, re-derives the session arrays (time of day, day codes, EOD
+bars) and recomputes the same opening ranges, even when the variants only
+differ in thresholds such as orb_duration_minutes or take_profit.multiplier.
+
+BatchORBEngine takes the whole list of StrategyRuleSet variants:
+
+  1. variants are grouped by timeframe and each group's bars are loaded once,
+  2. one _SessionArrays per group is shared by every variant in it, so each
+     distinct opening-range window and each distinct breakout-candidate set
+     (keyed by the entry-side config fields) is computed once for the grid,
+  3. each variant then walks its own candidates with VectorizedORBEngine's
+     trade/exit kernel, since position sizing depends on that variant's
+     realised cash and trades cannot be shared between variants.
+
+Results are exactly those of VectorizedORBEngine (and hence BacktestEngine
+on the legacy execution path), one BacktestResult per variant in input order.
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from vibe.backtester.analysis.metrics import BacktestResult
+from vibe.backtester.analysis.performance import PerformanceAnalyzer
+from vibe.backtester.core.engine import _load_bars
+from vibe.backtester.core.vectorized import VectorizedORBEngine, _SessionArrays
+from vibe.common.ruleset.models import StrategyRuleSet
+
+
+class BatchORBEngine:
+    """
+    Evaluates a list of ORB ruleset variants in one pass over shared bars.
+
+    Example:
+        ```python
+        variants = [sweep._create_modified_ruleset(p) for p in combinations]
+        results = BatchORBEngine(variants, data_dir).run("QQQ", start, end)
+        ```
+    """
+
+    def __init__(
+        self,
+        rulesets: Sequence[StrategyRuleSet],
+        data_dir: Path,
+        initial_capital: float = 10_000.0,
+        slippage_ticks: int = 2,
+    ) -> None:
+        self.rulesets = list(rulesets)
+        self.data_dir = data_dir
+        self.initial_capital = initial_capital
+        self.slippage_ticks = slippage_ticks
+
+    def run(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        precomputed_features: Optional[pd.DataFrame] = None,
+    ) -> List[BacktestResult]:
+        """Backtest every variant; arguments match BacktestEngine.run()."""
+        groups: Dict[str, List[int]] = defaultdict(list)
+        for i, ruleset in enumerate(self.rulesets):
+            groups[ruleset.instruments.timeframe].append(i)
+
+        results: List[Optional[BacktestResult]] = [None] * len(self.rulesets)
+        for indices in groups.values():
+            df = _load_bars(
+                self.data_dir, self.rulesets[indices[0]], symbol, start_date, end_date,
+                precomputed_features,
+            )
+            arrays = _SessionArrays(df)
+            for i in indices:
+                ruleset = self.rulesets[i]
+                engine = VectorizedORBEngine(
+                    ruleset, self.data_dir, self.initial_capital, self.slippage_ticks
+                )
+                trades, equity_curve = engine.simulate(symbol, df, arrays)
+                results[i] = PerformanceAnalyzer.analyze(
+                    trades=trades,
+                    equity_curve=equity_curve,
+                    initial_capital=self.initial_capital,
+                    symbol=symbol,
+                    start_date=start_date,
+                    end_date=end_date,
+                    ruleset_name=ruleset.name,
+                    ruleset_version=ruleset.version,
+                )
+        return results
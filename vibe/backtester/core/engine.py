@@ -1,20 +1,26 @@
 import asyncio
-from datetime import datetime
+import copy
+import dataclasses
+import time
+from datetime import date, datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
+import numpy as np
 import pandas as pd
 
 from vibe.backtester.core.clock import SimulatedClock
 from vibe.backtester.core.fill_simulator import FillSimulator, FillResult
 from vibe.backtester.core.portfolio import PortfolioManager
+from vibe.backtester.core.snapshot import EngineSnapshot, snapshot_key
 from vibe.backtester.core.execution.config import ExecutionConfig
 from vibe.backtester.core.execution.simulator import ExecutionSimulator
-from vibe.backtester.core.execution.pending_queue import PendingOrderQueue
+from vibe.backtester.core.execution.order_book import PendingOrderBook
 from vibe.backtester.core.execution.models import Order
 from vibe.backtester.core.execution.slippage import FixedTickSlippage
 from vibe.backtester.core.execution.volume import UnlimitedVolume
 from vibe.backtester.core.execution.impact import NoImpact
+from vibe.backtester.data.bar_cache import get_bar_cache, resample_ohlcv as _resample
 from vibe.backtester.data.parquet_loader import ParquetLoader
 from vibe.backtester.runner import RuleSetRunner
 from vibe.backtester.analysis.metrics import BacktestResult
@@ -23,31 +29,78 @@ from vibe.common.models.bar import Bar
 from vibe.common.ruleset.models import StrategyRuleSet
 
 
-def _resample(df: pd.DataFrame, interval: str = "5min") -> pd.DataFrame:
-    return df.resample(interval, closed="left", label="left").agg(
-        open=("open", "first"),
-        high=("high", "max"),
-        low=("low", "min"),
-        close=("close", "last"),
-        volume=("volume", "sum"),
-    ).dropna()
+_ATR_PERIOD = 14
+_ADV_WINDOW = 20
 
 
-def _add_atr(df: pd.DataFrame, period: int = 14) -> pd.DataFrame:
-    """Add ATR_{period} column using Wilder's smoothing (alpha = 1/period)."""
+def _true_range(df: pd.DataFrame, prev_close: Optional[float] = None) -> pd.Series:
+    """True range per bar; prev_close seeds the first bar's previous close."""
     high, low, close = df["high"], df["low"], df["close"]
-    prev_close = close.shift(1)
-    tr = pd.concat([
+    prev = close.shift(1)
+    if prev_close is not None and len(prev):
+        prev.iloc[0] = prev_close
+    return pd.concat([
         high - low,
-        (high - prev_close).abs(),
-        (low - prev_close).abs(),
+        (high - prev).abs(),
+        (low - prev).abs(),
     ], axis=1).max(axis=1)
+
+
+def _wilder(tr: pd.Series, period: int, warm: Optional[dict] = None) -> pd.Series:
+    """
+    Unmasked Wilder smoothing of tr, continuing from warm["value"] if given.
+
+    Seeding the recursion with the previous smoothed value reproduces the
+    full-history ewm(adjust=False) bit for bit.
+    """
+    if warm is None:
+        return tr.ewm(alpha=1.0 / period, adjust=False).mean()
+    seeded = pd.Series(np.concatenate([[warm["value"]], tr.to_numpy(dtype=np.float64)]))
+    smoothed = seeded.ewm(alpha=1.0 / period, adjust=False).mean().to_numpy()[1:]
+    return pd.Series(smoothed, index=tr.index)
+
+
+def _add_atr(df: pd.DataFrame, period: int = _ATR_PERIOD, warm: Optional[dict] = None) -> pd.DataFrame:
+    """
+    Add ATR_{period} column using Wilder's smoothing (alpha = 1/period).
+
+    warm is the state _atr_state() returned for the bars just before df, so
+    a resumed run gets the same values as one over the whole history.
+    """
     df = df.copy()
-    df[f"ATR_{period}"] = tr.ewm(alpha=1.0 / period, adjust=False, min_periods=period).mean()
+    if warm is None:
+        tr = _true_range(df)
+        df[f"ATR_{period}"] = tr.ewm(alpha=1.0 / period, adjust=False, min_periods=period).mean()
+        return df
+    tr = _true_range(df, warm["prev_close"])
+    n_obs = warm["n_obs"] + tr.notna().cumsum()
+    df[f"ATR_{period}"] = _wilder(tr, period, warm).where(n_obs >= period)
     return df
 
 
-def _compute_adv(df: pd.DataFrame, window: int = 20) -> pd.Series:
+def _atr_state(df: pd.DataFrame, period: int = _ATR_PERIOD, warm: Optional[dict] = None) -> Optional[dict]:
+    """Wilder state after the last bar of df, for _add_atr(warm=...)."""
+    if df.empty:
+        return warm
+    tr = _true_range(df, None if warm is None else warm["prev_close"])
+    return {
+        "prev_close": float(df["close"].iloc[-1]),
+        "value": float(_wilder(tr, period, warm).iloc[-1]),
+        "n_obs": int(tr.notna().sum()) + (0 if warm is None else warm["n_obs"]),
+    }
+
+
+def _daily_volume(df: pd.DataFrame, history: Optional[pd.Series] = None) -> pd.Series:
+    """Volume per calendar day, continuing history (a previous result) if given."""
+    daily = df["volume"].resample("1D").sum()
+    if history is not None and len(history):
+        daily = pd.concat([history, daily]).resample("1D").sum()
+    return daily
+
+
+def _compute_adv(
+    df: pd.DataFrame, window: int = _ADV_WINDOW, history: Optional[pd.Series] = None
+) -> pd.Series:
     """
     Pre-compute Average Daily Volume (ADV) efficiently.
     
@@ -56,15 +109,280 @@ def _compute_adv(df: pd.DataFrame, window: int = 20) -> pd.Series:
     Args:
         df: DataFrame with volume column and daily index
         window: Rolling window size (default 20 days)
+        history: Daily volumes of the days before df (resumed runs)
         
     Returns:
         Series indexed by date with ADV values
     """
-    daily_volumes = df["volume"].resample("1D").sum()
+    daily_volumes = _daily_volume(df, history)
     adv = daily_volumes.rolling(window=window).mean()
     return adv
 
 
+def _prepare_frame(
+    df_1m: pd.DataFrame,
+    ruleset: StrategyRuleSet,
+    precomputed_features: Optional[pd.DataFrame] = None,
+    warm_atr: Optional[dict] = None,
+) -> pd.DataFrame:
+    """Resample 1m bars to the ruleset timeframe and attach indicators."""
+    interval = ruleset.instruments.timeframe  # e.g. "5m"
+    pd_interval = interval.replace("m", "min")
+    return _attach_features(_resample(df_1m, pd_interval), precomputed_features, warm_atr)
+
+
+def _attach_features(
+    df: pd.DataFrame,
+    precomputed_features: Optional[pd.DataFrame] = None,
+    warm_atr: Optional[dict] = None,
+) -> pd.DataFrame:
+    """
+    Join pre-computed indicators (or compute ATR) onto resampled bars.
+
+    warm_atr continues the computed ATR from earlier bars (see _atr_state).
+    """
+    # Use pre-computed features if provided, otherwise compute ATR on-the-fly
+    if precomputed_features is not None:
+        # Merge pre-computed features (indexed by timestamp)
+        # Only use features that align with our df index
+        aligned_features = precomputed_features.loc[df.index.intersection(precomputed_features.index)]
+        df = df.join(aligned_features, how="left")
+    else:
+        # Backward compatibility: compute ATR if not provided
+        df = _add_atr(df, warm=warm_atr)
+
+    # ORBCalculator requires a 'timestamp' column (not just the DatetimeIndex)
+    df["timestamp"] = df.index
+    return df
+
+
+def _load_bars(
+    data_dir: Path,
+    ruleset: StrategyRuleSet,
+    symbol: str,
+    start_date: datetime,
+    end_date: datetime,
+    precomputed_features: Optional[pd.DataFrame] = None,
+    loader: Optional[ParquetLoader] = None,
+    warm_atr: Optional[dict] = None,
+) -> pd.DataFrame:
+    """Load 1m bars, resample to the ruleset timeframe and attach indicators."""
+    if loader is None:
+        # Shared cache: resampled once per file, sliced per run
+        df = get_bar_cache().bars(
+            data_dir, symbol, ruleset.instruments.timeframe, start_date, end_date
+        )
+        return _attach_features(df, precomputed_features, warm_atr)
+    df_1m = asyncio.run(
+        loader.get_bars(symbol, start_time=start_date, end_time=end_date)
+    )
+    return _prepare_frame(df_1m, ruleset, precomputed_features, warm_atr)
+
+
+def _position_size(capital: float, entry_price: float, stop_price: float, risk_pct: float) -> int:
+    """Risk risk_pct of capital per trade based on stop distance."""
+    risk_dollars = capital * risk_pct
+    stop_distance = abs(entry_price - stop_price)
+    if stop_distance <= 0:
+        return 0
+    return max(1, int(risk_dollars / stop_distance))
+
+
+def _running_mean(values: np.ndarray, prior_sum: float = 0.0, prior_count: int = 0) -> np.ndarray:
+    """
+    Mean of values[:i + 1] for every i (exact for integer-valued floats).
+
+    prior_sum/prior_count continue the mean from values seen before.
+    """
+    sums = np.cumsum(np.concatenate([[prior_sum], values]))[1:]
+    return sums / np.arange(prior_count + 1, prior_count + len(values) + 1)
+
+
+def _result_mismatch(result: BacktestResult, expected: BacktestResult) -> Optional[str]:
+    """First difference in trades or equity between two results, or None."""
+    if len(result.trades) != len(expected.trades):
+        return f"{len(result.trades)} trades vs {len(expected.trades)}"
+    for k, (got, want) in enumerate(zip(result.trades, expected.trades)):
+        if got.model_dump() != want.model_dump():
+            return f"trade {k} differs: {got.model_dump()} vs {want.model_dump()}"
+    if not result.equity.equity_curve.equals(expected.equity.equity_curve):
+        return "equity curves differ"
+    return None
+
+
+# Bump whenever a change alters backtest results for the same inputs, so
+# persisted sweep results (ResultCache) keyed on it are invalidated.
+ENGINE_VERSION = 1
+
+_TICK = 0.01
+_OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+class _BarArrays:
+    """
+    One symbol's prepared bar frame as per-column arrays, extracted once.
+
+    Bars and bar dicts are materialised on demand; the most recently built
+    Bar is cached so exits, fills and marking to market on the same bar
+    share one object.
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.timestamps = df.index.to_pydatetime()
+        self.dates = df.index.date
+        self.open, self.high, self.low, self.close, self.volume = (
+            df[col].to_numpy(dtype=np.float64).tolist() for col in _OHLCV_COLUMNS
+        )
+        # Per-column values as Python scalars, matching what row.to_dict() yields.
+        self._columns = [c for c in df.columns if c != "timestamp"]
+        self._column_values = [df[c].tolist() for c in self._columns]
+        self._column_order = list(df.columns)
+        self._cached_index = -1
+        self._cached_bar: Optional[Bar] = None
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def bar(self, i: int) -> Bar:
+        if i != self._cached_index:
+            self._cached_bar = Bar(
+                timestamp=self.timestamps[i],
+                open=self.open[i],
+                high=self.high[i],
+                low=self.low[i],
+                close=self.close[i],
+                volume=self.volume[i],
+            )
+            self._cached_index = i
+        return self._cached_bar
+
+    def bar_dict(self, i: int) -> dict:
+        current_bar = dict.fromkeys(self._column_order)
+        for col, values in zip(self._columns, self._column_values):
+            current_bar[col] = values[i]
+        current_bar["timestamp"] = self.timestamps[i]
+        return current_bar
+
+
+class _MinuteBars:
+    """
+    A symbol's 1m bars, indexed by the prepared bar each one was resampled into.
+
+    Only the positional [start, end) range of every bar's minutes is computed
+    up front; Bars for one bar's minutes are built when an exit check drills
+    into it.
+    """
+
+    def __init__(self, df_1m: pd.DataFrame, bar_index: pd.DatetimeIndex, interval: pd.Timedelta) -> None:
+        minute_ns = df_1m.index.asi8
+        bar_ns = bar_index.asi8
+        self._starts = np.searchsorted(minute_ns, bar_ns, side="left")
+        self._ends = np.searchsorted(minute_ns, bar_ns + interval.value, side="left")
+        self._index = df_1m.index
+        self._ohlcv = df_1m[list(_OHLCV_COLUMNS)].to_numpy(dtype=np.float64)
+
+    def bars(self, i: int) -> list[Bar]:
+        lo, hi = self._starts[i], self._ends[i]
+        return [
+            Bar(timestamp=ts, open=o, high=h, low=l, close=c, volume=v)
+            for ts, (o, h, l, c, v) in zip(self._index[lo:hi].to_pydatetime(), self._ohlcv[lo:hi].tolist())
+        ]
+
+
+@dataclasses.dataclass
+class IntrabarStats:
+    """
+    Drill-down report of a run with intrabar=True.
+
+    exit_checks counts bars checked for exits with a position open; drilled
+    counts those replayed from 1m bars. setup_seconds is spent loading and
+    indexing the minute bars, drill_seconds building the replayed bars.
+    """
+    exit_checks: int = 0
+    drilled: int = 0
+    setup_seconds: float = 0.0
+    drill_seconds: float = 0.0
+
+    @property
+    def overhead_seconds(self) -> float:
+        return self.setup_seconds + self.drill_seconds
+
+    def to_dict(self) -> dict:
+        return {**dataclasses.asdict(self), "overhead_seconds": self.overhead_seconds}
+
+
+class _SymbolState:
+    """Per-symbol loop state: bar data, pending order metadata and session tracking."""
+
+    def __init__(
+        self,
+        symbol: str,
+        df: pd.DataFrame,
+        adv_series: pd.Series,
+        avg_volumes: Optional[list[float]],
+    ) -> None:
+        self.symbol = symbol
+        self.df = df
+        self.adv_series = adv_series
+        self.avg_volumes = avg_volumes
+        self.arrays: Optional[_BarArrays] = None  # Set by the array-backed loops
+        self.minutes: Optional[_MinuteBars] = None  # Set in intrabar mode
+
+        self.pending_order_meta: dict[str, dict[str, float | None]] = {}
+        self.prev_date: Optional[date] = None
+        self.bar_index = 0  # Track bar index for latency support
+        self.position = 0  # Positional index of the current bar
+        self.session_start = 0  # Positional index of the current session's first bar
+        self.first_bar = 0  # Bars before this are context restored from a snapshot
+
+
+class _RunState:
+    """
+    Mutable per-run state shared by every event loop.
+
+    All loops drive the same helpers on this object so that entry sizing,
+    order queueing, fills and exits cannot drift apart between modes.
+    Cash, positions and the strategy are shared across symbols.
+    """
+
+    def __init__(
+        self,
+        engine: "BacktestEngine",
+        execution_config: ExecutionConfig,
+        use_realistic_execution: bool,
+    ) -> None:
+        self.execution_config = execution_config
+        self.clock = SimulatedClock()
+
+        # Use ExecutionSimulator only when user explicitly opts in with execution_config.
+        if use_realistic_execution:
+            self.execution_sim: Optional[ExecutionSimulator] = ExecutionSimulator(config=execution_config)
+        else:
+            # Backward compatibility: use old FillSimulator
+            self.execution_sim = None
+        self.fill_sim = FillSimulator(slippage_ticks=engine.slippage_ticks)  # Fallback
+
+        # Preserve legacy instant-fill behavior by default; explicitly allow
+        # legacy-like configs to preserve old behavior too.
+        self.use_price_override = (not use_realistic_execution) or (
+            isinstance(execution_config.slippage_model, FixedTickSlippage)
+            and isinstance(execution_config.volume_model, UnlimitedVolume)
+            and isinstance(execution_config.impact_model, NoImpact)
+        )
+
+        trailing_stop_config = None
+        if engine.ruleset.exit.trailing_stop is not None:
+            trailing_stop_config = engine.ruleset.exit.trailing_stop.model_dump()
+        self.portfolio = PortfolioManager(
+            engine.initial_capital,
+            trailing_stop_config=trailing_stop_config,
+        )
+        self.runner = RuleSetRunner(engine.ruleset)
+        self.symbols: dict[str, _SymbolState] = {}
+        self.orders = PendingOrderBook()
+        self.intrabar: Optional[IntrabarStats] = IntrabarStats() if engine.intrabar else None
+
+
 class BacktestEngine:
     """
     Event-driven backtester. Iterates a sorted bar index from Parquet data,
@@ -73,6 +391,32 @@ class BacktestEngine:
     
     Supports pluggable execution models via ExecutionConfig for realistic
     fills with volume constraints, dynamic slippage, and market impact.
+
+    With columnar=True the event loop reads OHLCV and feature columns from
+    NumPy arrays extracted once up front, and only builds a validated Bar
+    when the portfolio or execution simulator needs one (open position or
+    an eligible pending order). Trades and equity are identical to the
+    default row-by-row loop; bars are not pydantic-validated while flat.
+
+    The strategy sees a bounded context per bar: the current session's bars
+    plus context_lookback_bars preceding bars, so run time grows linearly
+    with history length. The volume filter baseline is passed separately as
+    a running mean over all bars so far, which equals the old full-history
+    df_context["volume"].mean() exactly for integer share volumes.
+    context_lookback_bars=None restores the unbounded df.loc[:ts] slice.
+
+    An already-built ParquetLoader may be passed as loader to reuse minute
+    bars held in memory (ParameterSweep workers do this) instead of reading
+    data_dir on every run.
+
+    run_portfolio() backtests several symbols against one shared portfolio
+    on a merged timeline (see its docstring).
+
+    intrabar=True resolves bars whose stop/TP order is ambiguous from the
+    1m bars they were resampled from (see PortfolioManager.check_exits).
+    The minute frame is kept alongside the prepared bars, and only those
+    bars are replayed. intrabar_stats reports how many bars were replayed
+    and the time spent after each run.
     """
 
     def __init__(
@@ -82,13 +426,29 @@ class BacktestEngine:
         initial_capital: float = 10_000.0,
         slippage_ticks: int = 2,
         execution_config: Optional[ExecutionConfig] = None,
+        columnar: bool = False,
+        context_lookback_bars: Optional[int] = 0,
+        loader: Optional[ParquetLoader] = None,
+        intrabar: bool = False,
     ) -> None:
         self.ruleset = ruleset
         self.data_dir = data_dir
         self.initial_capital = initial_capital
         self.slippage_ticks = slippage_ticks
         self.execution_config = execution_config
-        self.pending_orders: list[Order] = []
+        self.columnar = columnar
+        if context_lookback_bars is not None and context_lookback_bars < 0:
+            raise ValueError(f"context_lookback_bars must be non-negative, got {context_lookback_bars}")
+        self.context_lookback_bars = context_lookback_bars
+        self.loader = loader
+        self.intrabar = intrabar
+        self.intrabar_stats: Optional[IntrabarStats] = None
+        self._order_book: Optional[PendingOrderBook] = None
+
+    @property
+    def pending_orders(self) -> list[Order]:
+        """Orders still resting at the end of the last run, per symbol in submission order."""
+        return [] if self._order_book is None else self._order_book.orders()
 
     def run(
         self,
@@ -96,6 +456,7 @@ class BacktestEngine:
         start_date: datetime,
         end_date: datetime,
         precomputed_features: Optional[pd.DataFrame] = None,
+        save_snapshot: Optional[Path | str] = None,
     ) -> BacktestResult:
         """
         Run backtest simulation.
@@ -107,105 +468,364 @@ class BacktestEngine:
             precomputed_features: Optional pre-computed indicators (ATR, ADX, etc.)
                                  If provided, skips indicator computation for performance.
                                  Index must match the resampled bar timestamps.
+            save_snapshot: Optional directory to write the end-of-run state to,
+                           so resume() can later extend the run past end_date.
         
         Returns:
             BacktestResult with trades, metrics, and equity curve
         """
-        # 1. Load and resample data
-        loader = ParquetLoader(self.data_dir, [symbol])
-        df_1m = asyncio.run(
-            loader.get_bars(symbol, start_time=start_date, end_time=end_date)
+        if save_snapshot is not None:
+            self._check_snapshot_support()
+
+        # 1-2. Load, resample, attach features and pre-compute ADV
+        df = self._prepare_bars(symbol, start_date, end_date, precomputed_features)
+
+        # 3-4. Determine execution config and init components
+        state = self._init_state()
+        sym = self._add_symbol(state, symbol, df)
+        self._attach_minutes(state, sym, start_date, end_date)
+
+        # 5. Event loop
+        self._run_single(state, sym)
+
+        if save_snapshot is not None:
+            self._snapshot(state, sym, start_date, end_date).save(save_snapshot)
+
+        # 6. Analyze results
+        return self._analyze(state, symbol, start_date, end_date)
+
+    def resume(
+        self,
+        snapshot_path: Path | str,
+        end_date: datetime,
+        precomputed_features: Optional[pd.DataFrame] = None,
+        save_snapshot: Optional[Path | str] = None,
+        verify: bool = False,
+    ) -> BacktestResult:
+        """
+        Extend a snapshotted run to end_date, simulating only the new bars.
+
+        Cash, open positions, trade history, the equity curve, the strategy's
+        position and one-trade-per-day state, and the ATR / ADV / volume-mean
+        warm state are restored from the snapshot run(save_snapshot=...) wrote;
+        the bars handed to the strategy as context are the snapshot's last
+        context_lookback_bars bars. The result covers the snapshot's start
+        date through end_date and equals run() over that whole range.
+
+        Args:
+            snapshot_path: Directory written by run()/resume(save_snapshot=...)
+            end_date: New backtest end date
+            precomputed_features: As for run(); must cover the new bars
+            save_snapshot: Optional directory for the extended run's state
+            verify: Also run the full range with run() and raise RuntimeError
+                    unless trades and equity are identical
+
+        Raises:
+            ValueError: the snapshot was taken with different engine settings,
+                        or ends part-way through a session
+        """
+        self._check_snapshot_support()
+        snap = EngineSnapshot.load(snapshot_path)
+        if snap.key != self._snapshot_key():
+            raise ValueError(
+                f"Snapshot at {snapshot_path} was taken with a different ruleset, "
+                "capital, slippage, execution config, context_lookback_bars or intrabar mode"
+            )
+
+        interval = pd.Timedelta(self.ruleset.instruments.timeframe.replace("m", "min"))
+        resume_from = (pd.Timestamp(snap.last_timestamp) + interval).to_pydatetime()
+        df_new = _load_bars(
+            self.data_dir, self.ruleset, snap.symbol, resume_from, end_date, precomputed_features,
+            loader=self.loader, warm_atr=snap.atr,
         )
-        interval = self.ruleset.instruments.timeframe  # e.g. "5m"
-        pd_interval = interval.replace("m", "min")
-        df = _resample(df_1m, pd_interval)
-        
-        # Use pre-computed features if provided, otherwise compute ATR on-the-fly
-        if precomputed_features is not None:
-            # Merge pre-computed features (indexed by timestamp)
-            # Only use features that align with our df index
-            aligned_features = precomputed_features.loc[df.index.intersection(precomputed_features.index)]
-            df = df.join(aligned_features, how="left")
+        if len(df_new) and df_new.index[0].date() == snap.last_date:
+            raise ValueError(
+                f"Snapshot at {snapshot_path} ends part-way through the {snap.last_date} "
+                "session; snapshots must end on a session boundary"
+            )
+        if len(snap.context) and list(snap.context.columns) != list(df_new.columns):
+            raise ValueError("Snapshot context columns differ from the resumed bars")
+
+        state = self._init_state()
+        sym = self._restore(state, snap, df_new)
+        self._attach_minutes(state, sym, resume_from, end_date)
+
+        self._run_single(state, sym)
+
+        if save_snapshot is not None:
+            self._snapshot(state, sym, snap.start_date, end_date, prior=snap).save(save_snapshot)
+
+        result = self._analyze(state, snap.symbol, snap.start_date, end_date)
+        if verify:
+            intrabar_stats = self.intrabar_stats
+            full = self.run(snap.symbol, snap.start_date, end_date, precomputed_features)
+            self.intrabar_stats = intrabar_stats
+            mismatch = _result_mismatch(result, full)
+            if mismatch is not None:
+                raise RuntimeError(f"Resumed run differs from a full re-run: {mismatch}")
+        return result
+
+    def run_portfolio(
+        self,
+        symbols: Optional[list[str]],
+        start_date: datetime,
+        end_date: datetime,
+        precomputed_features: Optional[dict[str, pd.DataFrame]] = None,
+    ) -> BacktestResult:
+        """
+        Backtest several symbols in one pass against one shared portfolio.
+
+        All symbols are loaded through a single ParquetLoader and their bar
+        streams merged into one timestamp-ordered timeline. At each timestamp
+        exits are checked for every open position first, then each symbol
+        with a bar evaluates entries and fills in the order given. Sizing
+        uses the shared cash balance, and equity is marked with each open
+        position's latest close. A single-symbol call reproduces run().
+
+        Args:
+            symbols: Symbols to trade (defaults to ruleset.instruments.symbols)
+            start_date: Backtest start date
+            end_date: Backtest end date
+            precomputed_features: Optional {symbol: features} as for run()
+
+        Returns:
+            BacktestResult over the combined portfolio; result.symbol is the
+            comma-joined symbol list.
+        """
+        symbols = list(symbols or self.ruleset.instruments.symbols)
+        if not symbols:
+            raise ValueError("run_portfolio requires at least one symbol")
+        if len(set(symbols)) != len(symbols):
+            raise ValueError(f"Duplicate symbols in universe: {symbols}")
+
+        loader = self.loader or ParquetLoader(
+            self.data_dir, symbols, start_time=start_date, end_time=end_date
+        )
+        state = self._init_state()
+        for symbol in symbols:
+            df_1m = asyncio.run(
+                loader.get_bars(symbol, start_time=start_date, end_time=end_date)
+            )
+            features = (precomputed_features or {}).get(symbol)
+            sym = self._add_symbol(state, symbol, _prepare_frame(df_1m, self.ruleset, features))
+            self._attach_minutes(state, sym, start_date, end_date, df_1m=df_1m)
+
+        self._run_merged(state)
+        return self._analyze(state, ",".join(symbols), start_date, end_date)
+
+    def _prepare_bars(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        precomputed_features: Optional[pd.DataFrame],
+    ) -> pd.DataFrame:
+        return _load_bars(
+            self.data_dir, self.ruleset, symbol, start_date, end_date, precomputed_features,
+            loader=self.loader,
+        )
+
+    def _attach_minutes(
+        self,
+        state: _RunState,
+        sym: _SymbolState,
+        start_date: datetime,
+        end_date: datetime,
+        df_1m: Optional[pd.DataFrame] = None,
+    ) -> None:
+        """Index sym's 1m bars by prepared bar for intrabar drill-down."""
+        if state.intrabar is None:
+            return
+        t0 = time.perf_counter()
+        if df_1m is None:
+            if self.loader is None:
+                df_1m = get_bar_cache().minute_bars(self.data_dir, sym.symbol, start_date, end_date)
+            else:
+                df_1m = asyncio.run(
+                    self.loader.get_bars(sym.symbol, start_time=start_date, end_time=end_date)
+                )
+        interval = pd.Timedelta(self.ruleset.instruments.timeframe.replace("m", "min"))
+        sym.minutes = _MinuteBars(df_1m, sym.df.index, interval)
+        state.intrabar.setup_seconds += time.perf_counter() - t0
+
+    def _run_single(self, state: _RunState, sym: _SymbolState) -> None:
+        if self.columnar:
+            self._run_columnar(state, sym)
         else:
-            # Backward compatibility: compute ATR if not provided
-            df = _add_atr(df)
-        
-        # ORBCalculator requires a 'timestamp' column (not just the DatetimeIndex)
-        df["timestamp"] = df.index
+            self._run_rows(state, sym)
 
-        # 2. Pre-compute ADV (Average Daily Volume) before event loop
-        # This is O(n) one-time computation, not O(n×20) per-bar
-        adv_series = _compute_adv(df)
-        
-        # 3. Determine execution config
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def _check_snapshot_support(self) -> None:
+        if self.context_lookback_bars is None:
+            raise ValueError("Snapshots need a bounded context; set context_lookback_bars")
+
+    def _snapshot_key(self) -> str:
+        config = self.execution_config
+        execution = None
+        if config is not None:
+            execution = {
+                "models": [
+                    [type(model).__name__, getattr(model, "__dict__", {})]
+                    for model in (config.slippage_model, config.volume_model, config.impact_model)
+                ],
+                "latency_bars": config.latency_bars,
+                "adv_window": config.adv_window,
+            }
+        return snapshot_key(
+            engine_version=ENGINE_VERSION,
+            ruleset=self.ruleset.model_dump(mode="json"),
+            initial_capital=self.initial_capital,
+            slippage_ticks=self.slippage_ticks,
+            execution=execution,
+            context_lookback_bars=self.context_lookback_bars,
+            intrabar=self.intrabar,
+        )
+
+    def _snapshot(
+        self,
+        state: _RunState,
+        sym: _SymbolState,
+        start_date: datetime,
+        end_date: datetime,
+        prior: Optional[EngineSnapshot] = None,
+    ) -> EngineSnapshot:
+        """Capture the state the loop carries past sym's last bar."""
+        new_bars = sym.df.iloc[sym.first_bar:]
+        if new_bars.empty:
+            if prior is None:
+                raise ValueError(f"No {sym.symbol} bars between {start_date} and {end_date} to snapshot")
+            return dataclasses.replace(prior, end_date=end_date)
+
+        volumes = new_bars["volume"].to_numpy(dtype=np.float64)
+        prior_sum = 0.0 if prior is None else prior.volume_sum
+        lookback = self.context_lookback_bars
+        strategy = state.runner.strategy
+        return EngineSnapshot(
+            key=self._snapshot_key(),
+            symbol=sym.symbol,
+            start_date=start_date if prior is None else prior.start_date,
+            end_date=end_date,
+            last_timestamp=new_bars.index[-1].to_pydatetime(),
+            tz=None if sym.df.index.tz is None else str(sym.df.index.tz),
+            cash=state.portfolio.cash,
+            positions={s: copy.copy(pos) for s, pos in state.portfolio.positions.items()},
+            trades=list(state.portfolio.trade_history),
+            equity_curve=list(state.portfolio.equity_curve),
+            strategy_positions=copy.deepcopy(strategy.positions),
+            traded_today=dict(getattr(strategy, "_traded_today", {})),
+            volume_sum=float(np.cumsum(np.concatenate([[prior_sum], volumes]))[-1]),
+            n_bars=len(new_bars) + (0 if prior is None else prior.n_bars),
+            atr=_atr_state(new_bars, warm=None if prior is None else prior.atr),
+            daily_volume=_daily_volume(
+                new_bars, None if prior is None else prior.daily_volume
+            ).iloc[-_ADV_WINDOW:],
+            context=sym.df.iloc[len(sym.df) - lookback:] if lookback else sym.df.iloc[0:0],
+        )
+
+    def _restore(self, state: _RunState, snap: EngineSnapshot, df_new: pd.DataFrame) -> _SymbolState:
+        """Rebuild the run state a snapshot describes, ahead of the bars in df_new."""
+        tz = df_new.index.tz
+
+        def in_zone(ts):
+            # Same tzinfo object as the bar index, as in an uninterrupted run
+            return ts if ts is None or tz is None else pd.Timestamp(ts).tz_convert(tz).to_pydatetime()
+
+        portfolio = state.portfolio
+        portfolio.cash = snap.cash
+        portfolio.positions = {
+            s: dataclasses.replace(pos, entry_time=in_zone(pos.entry_time))
+            for s, pos in snap.positions.items()
+        }
+        portfolio.trade_history = [
+            t.model_copy(update={"entry_time": in_zone(t.entry_time), "exit_time": in_zone(t.exit_time)})
+            for t in snap.trades
+        ]
+        portfolio.equity_curve = [(in_zone(ts), value) for ts, value in snap.equity_curve]
+
+        strategy = state.runner.strategy
+        strategy.positions = {
+            s: {**pos, "timestamp": in_zone(pos["timestamp"])}
+            for s, pos in snap.strategy_positions.items()
+        }
+        if hasattr(strategy, "_traded_today"):
+            strategy._traded_today = dict(snap.traded_today)
+
+        context = snap.context
+        if len(context) and tz is not None:
+            context = context.tz_convert(tz)
+            context["timestamp"] = context.index
+        df = pd.concat([context, df_new]) if len(context) else df_new
+        avg_volumes = [float("nan")] * len(context) + _running_mean(
+            df_new["volume"].to_numpy(dtype=np.float64), snap.volume_sum, snap.n_bars
+        ).tolist()
+        sym = _SymbolState(
+            snap.symbol,
+            df,
+            adv_series=_compute_adv(df_new, history=snap.daily_volume),
+            avg_volumes=avg_volumes,
+        )
+        sym.first_bar = len(context)
+        sym.prev_date = snap.last_date
+        state.symbols[snap.symbol] = sym
+        return sym
+
+    def _init_state(self) -> _RunState:
         if self.execution_config is None:
             # Backward compatibility: use legacy config based on slippage_ticks
             execution_config = ExecutionConfig.legacy(slippage_ticks=self.slippage_ticks)
         else:
             execution_config = self.execution_config
+        state = _RunState(
+            self,
+            execution_config=execution_config,
+            use_realistic_execution=self.execution_config is not None,
+        )
+        self._order_book = state.orders
+        return state
 
-        use_realistic_execution = self.execution_config is not None
-
-        def _use_orb_price_override() -> bool:
-            # Preserve legacy instant-fill behavior by default.
-            if not use_realistic_execution:
-                return True
-            # Explicitly allow legacy-like configs to preserve old behavior.
-            return (
-                isinstance(execution_config.slippage_model, FixedTickSlippage)
-                and isinstance(execution_config.volume_model, UnlimitedVolume)
-                and isinstance(execution_config.impact_model, NoImpact)
-            )
-        
-        # 4. Init components
-        clock = SimulatedClock()
-        
-        # Use ExecutionSimulator only when user explicitly opts in with execution_config.
-        if use_realistic_execution:
-            execution_sim = ExecutionSimulator(config=execution_config)
-        else:
-            # Backward compatibility: use old FillSimulator
-            execution_sim = None
-        
-        fill_sim = FillSimulator(slippage_ticks=self.slippage_ticks)  # Fallback
-        
-        trailing_stop_config = None
-        if self.ruleset.exit.trailing_stop is not None:
-            trailing_stop_config = self.ruleset.exit.trailing_stop.model_dump()
+    def _add_symbol(self, state: _RunState, symbol: str, df: pd.DataFrame) -> _SymbolState:
+        # Pre-compute ADV (Average Daily Volume) before the event loop:
+        # O(n) one-time computation, not O(n×20) per-bar
+        sym = _SymbolState(
+            symbol,
+            df,
+            adv_series=_compute_adv(df),
+            avg_volumes=self._running_avg_volume(df),
+        )
+        state.symbols[symbol] = sym
+        return sym
 
-        portfolio = PortfolioManager(
-            self.initial_capital,
-            trailing_stop_config=trailing_stop_config,
+    def _analyze(
+        self, state: _RunState, symbol: str, start_date: datetime, end_date: datetime
+    ) -> BacktestResult:
+        self.intrabar_stats = state.intrabar
+        return PerformanceAnalyzer.analyze(
+            trades=state.portfolio.trade_history,
+            equity_curve=state.portfolio.equity_curve,
+            initial_capital=self.initial_capital,
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date,
+            ruleset_name=self.ruleset.name,
+            ruleset_version=self.ruleset.version,
         )
-        runner = RuleSetRunner(self.ruleset)
-        
-        # Reset pending orders for new backtest
-        pending_queue = PendingOrderQueue()
-        pending_order_meta: dict[str, dict[str, float | None]] = {}
-        self.pending_orders = []
-
-        # 5. Event loop with bar_index counter
-        prev_date = None
-        bar_index = 0  # Track bar index for latency support
-        
-        for ts, row in df.iterrows():
-            clock.set_time(ts.to_pydatetime())
-            current_date = ts.date()
-
-            if current_date != prev_date:
-                # Reset bar index at start of new day
-                bar_index = 0
-                runner.reset_daily_state(symbol)
-                # Expire any unfilled prior-day orders at EOD boundary.
-                pending_queue = PendingOrderQueue()
-                pending_order_meta.clear()
-                self.pending_orders = []
-                prev_date = current_date
-            else:
-                bar_index += 1
+
+    # ------------------------------------------------------------------
+    # Event loops
+    # ------------------------------------------------------------------
+
+    def _run_rows(self, state: _RunState, sym: _SymbolState) -> None:
+        """Reference loop: iterrows + a validated Bar for every bar."""
+        symbol = sym.symbol
+        for i, (ts, row) in enumerate(sym.df.iloc[sym.first_bar:].iterrows(), start=sym.first_bar):
+            ts_py = ts.to_pydatetime()
+            self._begin_bar(state, sym, ts_py, ts.date(), i)
 
             bar = Bar(
-                timestamp=ts.to_pydatetime(),
+                timestamp=ts_py,
                 open=float(row["open"]),
                 high=float(row["high"]),
                 low=float(row["low"]),
@@ -214,168 +834,311 @@ class BacktestEngine:
             )
             current_bars = {symbol: bar}
 
-            # Check exits before entry (stop/EOD); sync runner state for closed positions
-            open_before = set(portfolio.positions.keys())
-            portfolio.check_exits(current_bars, clock)
-            for closed_sym in open_before - set(portfolio.positions.keys()):
-                runner.close_position(closed_sym)
+            self._check_exits(state, current_bars)
 
-            # Generate entry signal only if no open position and no pending order.
-            has_pending_symbol_order = any(o.symbol == symbol for o in self.pending_orders)
-            if symbol not in portfolio.positions and not has_pending_symbol_order:
+            if self._can_enter(state, sym):
                 current_bar_dict = row.to_dict()
-                current_bar_dict["timestamp"] = ts.to_pydatetime()
+                current_bar_dict["timestamp"] = ts_py
+                self._evaluate_entry(state, sym, i, current_bar_dict, bar.close)
 
-                signal_value, metadata = runner.generate_signal(
-                    symbol, current_bar_dict, df.loc[:ts]
-                )
+            self._execute_eligible(state, sym, ts_py, lambda: bar)
+            self._end_bar(state, current_bars, ts_py)
 
-                if signal_value in (1, -1):
-                    side = "buy" if signal_value == 1 else "sell"
-                    stop_price = metadata.get("stop_loss", bar.close * 0.99)
-
-                    # Entry at stop-market trigger price (OR_high+$0.01 / OR_low-$0.01)
-                    # plus configurable slippage ticks for market impact.
-                    _TICK = 0.01
-                    slippage = self.slippage_ticks * _TICK
-                    orb_high = metadata.get("orb_high")
-                    orb_low  = metadata.get("orb_low")
-                    if signal_value == 1 and orb_high is not None:
-                        entry_price = orb_high + _TICK + slippage
-                    elif signal_value == -1 and orb_low is not None:
-                        entry_price = orb_low - _TICK - slippage
-                    else:
-                        entry_price = bar.close
-
-                    quantity = self._position_size(
-                        capital=portfolio.cash,
-                        entry_price=entry_price,
-                        stop_price=stop_price,
-                    )
-                    if quantity > 0:
-                        # Create Order with signal_bar_index for latency tracking
-                        order_price_override = entry_price if _use_orb_price_override() else None
-                        order = Order(
-                            id=f"{symbol}_{ts.timestamp()}",
-                            symbol=symbol,
-                            side=side,
-                            size=quantity,
-                            order_type="market",
-                            limit_price=None,
-                            timestamp=ts.to_pydatetime(),
-                            signal_bar_index=bar_index,
-                            price_override=order_price_override,
-                        )
-
-                        pending_queue.add(order)
-                        pending_order_meta[order.id] = {
-                            "stop_loss": stop_price,
-                            "take_profit": metadata.get("take_profit"),
-                        }
-
-            # Execute all orders eligible for this bar based on configured latency.
-            eligible_orders = pending_queue.get_eligible_orders(
-                current_bar_index=bar_index,
-                latency_bars=execution_config.latency_bars,
-            )
+    def _run_columnar(self, state: _RunState, sym: _SymbolState) -> None:
+        """Array-backed loop: index pre-extracted columns, build Bars lazily."""
+        symbol = sym.symbol
+        arrays = sym.arrays = _BarArrays(sym.df)
+        portfolio = state.portfolio
+        for i in range(sym.first_bar, len(arrays)):
+            ts_py = arrays.timestamps[i]
+            self._begin_bar(state, sym, ts_py, arrays.dates[i], i)
 
-            for order in eligible_orders:
-                fill_result = None
+            if portfolio.positions:
+                self._check_exits(state, {symbol: arrays.bar(i)})
 
-                if execution_sim is not None:
-                    # Align daily ADV lookup key with ADV series index dtype/timezone.
-                    if adv_series.index.tz is not None:
-                        adv_key = pd.Timestamp(ts).tz_convert(adv_series.index.tz).normalize()
-                    else:
-                        adv_key = pd.Timestamp(ts).tz_localize(None).normalize()
+            if self._can_enter(state, sym):
+                self._evaluate_entry(state, sym, i, arrays.bar_dict(i), arrays.close[i])
 
-                    current_adv = adv_series.get(adv_key)
-                    if pd.isna(current_adv):
-                        current_adv = None
+            self._execute_eligible(state, sym, ts_py, lambda: arrays.bar(i))
+            current_bars = {symbol: arrays.bar(i)} if portfolio.positions else {}
+            self._end_bar(state, current_bars, ts_py)
 
-                    fill = execution_sim.execute_order(
-                        order=order,
-                        bar=bar,
-                        adv=current_adv,
-                    )
-                    if fill is not None:
-                        fill_result = FillResult(
-                            symbol=fill.symbol,
-                            side=fill.side,
-                            filled_qty=fill.qty,
-                            avg_price=fill.price,
-                            commission=0.0,
-                        )
-                else:
-                    # Legacy default path: instant market fills with ORB entry override.
-                    if order.order_type != "market":
-                        continue
-                    fill_result = fill_sim.execute(
-                        order.symbol,
-                        order.side,
-                        order.size,
-                        bar,
-                        price_override=order.price_override,
-                    )
+    def _run_merged(self, state: _RunState) -> None:
+        """Array-backed loop over the timestamp-merged bars of every symbol."""
+        syms = list(state.symbols.values())
+        for sym in syms:
+            sym.arrays = _BarArrays(sym.df)
 
-                if fill_result is None or fill_result.filled_qty <= 0:
-                    continue
+        # Pre-aligned timeline: sort (timestamp, symbol order) once; asi8 is
+        # UTC nanoseconds so symbols stored in different timezones still merge.
+        ts_ns = np.concatenate([sym.df.index.asi8 for sym in syms])
+        owner = np.concatenate([np.full(len(sym.df), k) for k, sym in enumerate(syms)])
+        position = np.concatenate([np.arange(len(sym.df)) for sym in syms])
+        order = np.lexsort((owner, ts_ns))
+        if len(order) == 0:
+            return
+        group_starts = np.flatnonzero(np.diff(ts_ns[order])) + 1
 
-                order_meta = pending_order_meta.get(order.id, {})
-                stop_price = float(order_meta.get("stop_loss", bar.close * 0.99))
-                take_profit = order_meta.get("take_profit")
+        portfolio = state.portfolio
+        last_index: dict[str, int] = {}
+        for group in np.split(order, group_starts):
+            members = [(syms[owner[g]], int(position[g])) for g in group]
+            ts_py = members[0][0].arrays.timestamps[members[0][1]]
 
-                if order.symbol not in portfolio.positions:
-                    portfolio.open_position(
-                        fill_result,
-                        stop_price=stop_price,
-                        take_profit=take_profit,
-                        timestamp=ts.to_pydatetime(),
-                    )
-                    runner.track_position(
-                        symbol=order.symbol,
-                        side=order.side,
-                        entry_price=fill_result.avg_price,
-                        take_profit=take_profit,
-                        stop_loss=stop_price,
-                        timestamp=ts.to_pydatetime(),
-                    )
-                else:
-                    # Partial fills can accumulate into an existing position.
-                    portfolio.add_to_position(fill_result, timestamp=ts.to_pydatetime())
+            for sym, i in members:
+                self._begin_bar(state, sym, ts_py, sym.arrays.dates[i], i)
+                last_index[sym.symbol] = i
 
-                pending_queue.mark_filled(order.id)
+            if portfolio.positions:
+                self._check_exits(state, {
+                    sym.symbol: sym.arrays.bar(i)
+                    for sym, i in members
+                    if sym.symbol in portfolio.positions
+                })
 
-                if fill_result.filled_qty < order.size:
-                    remainder = order.remaining(fill_result.filled_qty)
-                    pending_queue.add(remainder)
-                else:
-                    pending_order_meta.pop(order.id, None)
+            for sym, i in members:
+                arrays = sym.arrays
+                if self._can_enter(state, sym):
+                    self._evaluate_entry(state, sym, i, arrays.bar_dict(i), arrays.close[i])
+                self._execute_eligible(state, sym, ts_py, lambda arrays=arrays, i=i: arrays.bar(i))
 
-            # Keep exposed state synchronized for tests/diagnostics.
-            self.pending_orders = [entry.order for entry in pending_queue._orders]
+            # Mark every open position with its latest bar, even if it did not print now.
+            current_bars = {
+                symbol: state.symbols[symbol].arrays.bar(last_index[symbol])
+                for symbol in portfolio.positions
+            }
+            self._end_bar(state, current_bars, ts_py)
 
-            portfolio.update_equity(current_bars, ts.to_pydatetime())
+    # ------------------------------------------------------------------
+    # Per-bar steps shared by all loops
+    # ------------------------------------------------------------------
 
-        # 6. Analyze results
-        return PerformanceAnalyzer.analyze(
-            trades=portfolio.trade_history,
-            equity_curve=portfolio.equity_curve,
-            initial_capital=self.initial_capital,
+    def _running_avg_volume(self, df: pd.DataFrame) -> Optional[list[float]]:
+        """
+        Mean volume over bars [0, i] for every i, replacing the full-history
+        df_context["volume"].mean() once the context is bounded.
+        """
+        if self.context_lookback_bars is None:
+            return None
+        return _running_mean(df["volume"].to_numpy(dtype=np.float64)).tolist()
+
+    def _context_window(self, sym: _SymbolState, i: int) -> pd.DataFrame:
+        """Bars handed to the strategy at positional index i."""
+        if self.context_lookback_bars is None:
+            return sym.df.iloc[: i + 1]
+        lo = max(sym.session_start - self.context_lookback_bars, 0)
+        return sym.df.iloc[lo : i + 1]
+
+    def _begin_bar(
+        self, state: _RunState, sym: _SymbolState, ts: datetime, current_date: date, position: int
+    ) -> None:
+        state.clock.set_time(ts)
+        sym.position = position
+        if current_date != sym.prev_date:
+            # Reset bar index at start of new day
+            sym.bar_index = 0
+            sym.session_start = position
+            state.runner.reset_daily_state(sym.symbol)
+            # Expire any unfilled prior-day orders at EOD boundary.
+            state.orders.clear(sym.symbol)
+            sym.pending_order_meta.clear()
+            sym.prev_date = current_date
+        else:
+            sym.bar_index += 1
+
+    def _check_exits(self, state: _RunState, current_bars: dict[str, Bar]) -> None:
+        """Check exits before entry (stop/EOD); sync runner state for closed positions."""
+        portfolio = state.portfolio
+        open_before = set(portfolio.positions.keys())
+        intrabar_bars = None
+        if state.intrabar is not None:
+            state.intrabar.exit_checks += sum(1 for symbol in current_bars if symbol in open_before)
+            intrabar_bars = lambda symbol: self._drill_down(state, state.symbols[symbol])
+        portfolio.check_exits(current_bars, state.clock, intrabar_bars)
+        for closed_sym in open_before - set(portfolio.positions.keys()):
+            state.runner.close_position(closed_sym)
+
+    def _drill_down(self, state: _RunState, sym: _SymbolState) -> list[Bar]:
+        """Minute bars of sym's current bar, counted in the intrabar report."""
+        t0 = time.perf_counter()
+        minutes = sym.minutes.bars(sym.position)
+        state.intrabar.drilled += 1
+        state.intrabar.drill_seconds += time.perf_counter() - t0
+        return minutes
+
+    def _can_enter(self, state: _RunState, sym: _SymbolState) -> bool:
+        """Entry signals are only evaluated with no open position and no pending order."""
+        return sym.symbol not in state.portfolio.positions and not state.orders.has_orders(sym.symbol)
+
+    def _evaluate_entry(
+        self,
+        state: _RunState,
+        sym: _SymbolState,
+        i: int,
+        current_bar: dict,
+        bar_close: float,
+    ) -> None:
+        signal_value, metadata = state.runner.generate_signal(
+            sym.symbol, current_bar, self._context_window(sym, i),
+            avg_volume=sym.avg_volumes[i] if sym.avg_volumes is not None else None,
+        )
+        self._submit_entry(state, sym, current_bar["timestamp"], bar_close, signal_value, metadata)
+
+    def _submit_entry(
+        self,
+        state: _RunState,
+        sym: _SymbolState,
+        ts: datetime,
+        bar_close: float,
+        signal_value: int,
+        metadata: dict,
+    ) -> None:
+        if signal_value not in (1, -1):
+            return
+
+        symbol = sym.symbol
+        side = "buy" if signal_value == 1 else "sell"
+        stop_price = metadata.get("stop_loss", bar_close * 0.99)
+
+        # Entry at stop-market trigger price (OR_high+$0.01 / OR_low-$0.01)
+        # plus configurable slippage ticks for market impact.
+        slippage = self.slippage_ticks * _TICK
+        orb_high = metadata.get("orb_high")
+        orb_low  = metadata.get("orb_low")
+        if signal_value == 1 and orb_high is not None:
+            entry_price = orb_high + _TICK + slippage
+        elif signal_value == -1 and orb_low is not None:
+            entry_price = orb_low - _TICK - slippage
+        else:
+            entry_price = bar_close
+
+        quantity = self._position_size(
+            capital=state.portfolio.cash,
+            entry_price=entry_price,
+            stop_price=stop_price,
+        )
+        if quantity <= 0:
+            return
+
+        # Create Order with signal_bar_index for latency tracking
+        order_price_override = entry_price if state.use_price_override else None
+        order = Order(
+            id=f"{symbol}_{ts.timestamp()}",
             symbol=symbol,
-            start_date=start_date,
-            end_date=end_date,
-            ruleset_name=self.ruleset.name,
-            ruleset_version=self.ruleset.version,
+            side=side,
+            size=quantity,
+            order_type="market",
+            limit_price=None,
+            timestamp=ts,
+            signal_bar_index=sym.bar_index,
+            price_override=order_price_override,
         )
 
+        state.orders.add(order)
+        sym.pending_order_meta[order.id] = {
+            "stop_loss": stop_price,
+            "take_profit": metadata.get("take_profit"),
+        }
+
+    def _execute_eligible(
+        self,
+        state: _RunState,
+        sym: _SymbolState,
+        ts: datetime,
+        get_bar: Callable[[], Bar],
+    ) -> None:
+        """Execute the orders that can fill on this bar given the configured latency."""
+        orders = state.orders
+        if not orders.has_orders(sym.symbol):
+            return
+        eligible_orders = orders.eligible_orders(
+            sym.symbol,
+            bar_index=sym.bar_index,
+            latency_bars=state.execution_config.latency_bars,
+            get_bar=get_bar,
+        )
+
+        portfolio = state.portfolio
+        for order in eligible_orders:
+            bar = get_bar()
+            fill_result = None
+
+            if state.execution_sim is not None:
+                adv_series = sym.adv_series
+                # Align daily ADV lookup key with ADV series index dtype/timezone.
+                if adv_series.index.tz is not None:
+                    adv_key = pd.Timestamp(ts).tz_convert(adv_series.index.tz).normalize()
+                else:
+                    adv_key = pd.Timestamp(ts).tz_localize(None).normalize()
+
+                current_adv = adv_series.get(adv_key)
+                if pd.isna(current_adv):
+                    current_adv = None
+
+                fill = state.execution_sim.execute_order(
+                    order=order,
+                    bar=bar,
+                    adv=current_adv,
+                )
+                if fill is not None:
+                    fill_result = FillResult(
+                        symbol=fill.symbol,
+                        side=fill.side,
+                        filled_qty=fill.qty,
+                        avg_price=fill.price,
+                        commission=0.0,
+                    )
+            else:
+                # Legacy default path: instant market fills with ORB entry override.
+                if order.order_type != "market":
+                    continue
+                fill_result = state.fill_sim.execute(
+                    order.symbol,
+                    order.side,
+                    order.size,
+                    bar,
+                    price_override=order.price_override,
+                )
+
+            if fill_result is None or fill_result.filled_qty <= 0:
+                continue
+
+            order_meta = sym.pending_order_meta.get(order.id, {})
+            stop_price = float(order_meta.get("stop_loss", bar.close * 0.99))
+            take_profit = order_meta.get("take_profit")
+
+            if order.symbol not in portfolio.positions:
+                portfolio.open_position(
+                    fill_result,
+                    stop_price=stop_price,
+                    take_profit=take_profit,
+                    timestamp=ts,
+                )
+                state.runner.track_position(
+                    symbol=order.symbol,
+                    side=order.side,
+                    entry_price=fill_result.avg_price,
+                    take_profit=take_profit,
+                    stop_loss=stop_price,
+                    timestamp=ts,
+                )
+            else:
+                # Partial fills can accumulate into an existing position.
+                portfolio.add_to_position(fill_result, timestamp=ts)
+
+            orders.mark_filled(order.id)
+
+            if fill_result.filled_qty < order.size:
+                remainder = order.remaining(fill_result.filled_qty)
+                orders.add(remainder)
+            else:
+                sym.pending_order_meta.pop(order.id, None)
+
+    def _end_bar(self, state: _RunState, current_bars: dict[str, Bar], ts: datetime) -> None:
+        state.portfolio.update_equity(current_bars, ts)
+
     def _position_size(
         self, capital: float, entry_price: float, stop_price: float
     ) -> int:
         """Risk position_size.value% of capital per trade based on stop distance."""
-        risk_pct = self.ruleset.position_size.value
-        risk_dollars = capital * risk_pct
-        stop_distance = abs(entry_price - stop_price)
-        if stop_distance <= 0:
-            return 0
-        return max(1, int(risk_dollars / stop_distance))
+        return _position_size(capital, entry_price, stop_price, self.ruleset.position_size.value)
@@ -1,11 +1,16 @@
 """
 Market impact models for the execution simulator.
 Determines how large orders move the market price against the trader.
+
+price_impact_batch() is the array form of price_impact(), with identical
+results per row; a NaN ADV stands for adv=None.
 """
 
 from typing import Protocol, Optional
 import math
 
+import numpy as np
+
 
 class ImpactModel(Protocol):
     """
@@ -29,6 +34,11 @@ class ImpactModel(Protocol):
         """
         ...
 
+    def price_impact_batch(self, order_size: np.ndarray, bar_volume: np.ndarray,
+                           adv: Optional[np.ndarray] = None) -> np.ndarray:
+        """price_impact() for arrays of orders (NaN ADV = not available)."""
+        ...
+
 
 class NoImpact:
     """
@@ -52,6 +62,11 @@ class NoImpact:
         """
         return 0.0
 
+    def price_impact_batch(self, order_size: np.ndarray, bar_volume: np.ndarray,
+                           adv: Optional[np.ndarray] = None) -> np.ndarray:
+        """Zero impact for every order."""
+        return np.zeros(np.shape(order_size))
+
 
 class SqrtImpact:
     """
@@ -118,3 +133,28 @@ class SqrtImpact:
         
         # Impact is always positive (sign applied by caller)
         return impact_pct
+
+    def price_impact_batch(self, order_size: np.ndarray, bar_volume: np.ndarray,
+                           adv: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        price_impact() for arrays of orders.
+
+        Args:
+            order_size: Order quantity per order
+            bar_volume: Current bar volume per order
+            adv: ADV per order; NaN (or adv=None) falls back to bar_volume
+
+        Raises:
+            ValueError: If any order_size or ADV/volume denominator is non-positive
+        """
+        order_size = np.asarray(order_size, dtype=np.float64)
+        denominator = np.asarray(bar_volume, dtype=np.float64)
+        if adv is not None:
+            adv = np.asarray(adv, dtype=np.float64)
+            denominator = np.where(np.isnan(adv), denominator, adv)
+        if np.any(order_size <= 0):
+            raise ValueError("order_size must be positive for every order in batch")
+        if np.any(denominator <= 0):
+            raise ValueError("Cannot calculate sqrt impact with zero ADV/volume in batch")
+        participation_sqrt = np.sqrt(order_size / denominator)
+        return np.minimum(self.k * participation_sqrt, self.max_impact_pct)
@@ -1,11 +1,13 @@
 """
-Data models for the execution simulator: Order and Fill.
+Data models for the execution simulator: Order, Fill and FillBatch.
 """
 
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
+import numpy as np
+
 
 @dataclass
 class Order:
@@ -121,3 +123,29 @@ class Fill:
         
         if self.qty <= 0:
             raise ValueError(f"Fill quantity must be positive, got {self.qty}.")
+
+
+@dataclass
+class FillBatch:
+    """
+    Fills of a batch of orders from ExecutionSimulator.execute_batch, one row per order.
+    
+    Attributes:
+        price: Execution price per order (NaN where the order did not fill)
+        qty: Quantity executed per order (0 where the order did not fill)
+        slippage: Price deviation due to slippage per order (as Fill.slippage)
+        impact: Market impact fraction per order (as Fill.impact)
+    """
+    
+    price: np.ndarray
+    qty: np.ndarray
+    slippage: np.ndarray
+    impact: np.ndarray
+    
+    @property
+    def filled(self) -> np.ndarray:
+        """Boolean mask of orders that executed."""
+        return self.qty > 0
+    
+    def __len__(self) -> int:
+        return len(self.qty)
@@ -0,0 +1,202 @@
+"""
+Indexed book of resting orders for the backtest event loop.
+
+PendingOrderQueue scans, and on removal rebuilds, its whole deque on every
+bar. PendingOrderBook keys orders by id and groups them by symbol, so a bar
+only touches the orders that can fill on it:
+
+- New orders wait in a min-heap on signal_bar_index until
+  signal_bar_index + latency_bars reaches the current bar.
+- Eligible market orders are kept in a dict keyed by id.
+- Eligible limit orders are kept in price-sorted lists per side. A buy limit
+  can fill once bar.low <= limit_price and a sell limit once
+  bar.high >= limit_price, so a bisect finds the triggered ones.
+- A second min-heap drops orders PendingOrderEntry.is_expired would expire.
+
+Orders returned for a bar are in submission order, as PendingOrderQueue
+returns them. A remainder re-added after a partial fill goes to the back.
+For each symbol, bar indices must not decrease between clear() calls; the
+engine clears a symbol's orders at the start of every session.
+"""
+
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any, Callable, Iterator, Optional
+
+from vibe.backtester.core.execution.models import Order
+
+# Same one-day expiry as PendingOrderEntry.is_expired
+_EXPIRY_BARS = 1440
+
+_price = itemgetter(0)
+
+
+@dataclass
+class _BookEntry:
+    order: Order
+    seq: int
+    eligible: bool = False
+
+
+class _SymbolBook:
+    """One symbol's resting orders and their indexes."""
+
+    def __init__(self) -> None:
+        self.entries: dict[str, _BookEntry] = {}
+        self.waiting: list[tuple[int, int, str]] = []  # (signal_bar_index, seq, id)
+        self.expiry: list[tuple[int, int, str]] = []  # (signal_bar_index, seq, id)
+        self.market: dict[str, _BookEntry] = {}
+        self.buy_limits: list[tuple[float, int, str]] = []  # (limit_price, seq, id), ascending
+        self.sell_limits: list[tuple[float, int, str]] = []
+
+    def live(self, item: tuple[Any, int, str]) -> Optional[_BookEntry]:
+        """Entry a heap item refers to, unless it was removed (lazy heap deletion)."""
+        entry = self.entries.get(item[2])
+        return entry if entry is not None and entry.seq == item[1] else None
+
+    def limits(self, order: Order) -> list[tuple[float, int, str]]:
+        return self.buy_limits if order.side == "buy" else self.sell_limits
+
+    def remove(self, entry: _BookEntry) -> None:
+        order = entry.order
+        del self.entries[order.id]
+        if not entry.eligible:
+            return  # Stale heap items are skipped when popped
+        if order.order_type == "market":
+            del self.market[order.id]
+        else:
+            limits = self.limits(order)
+            limits.pop(bisect_left(limits, (order.limit_price, entry.seq, order.id)))
+
+    def expire(self, bar_index: int) -> list[str]:
+        """Remove expired orders; returns their ids."""
+        expired = []
+        while self.expiry and self.expiry[0][0] + _EXPIRY_BARS <= bar_index:
+            entry = self.live(heapq.heappop(self.expiry))
+            if entry is not None:
+                self.remove(entry)
+                expired.append(entry.order.id)
+        return expired
+
+    def promote(self, bar_index: int, latency_bars: int) -> None:
+        while self.waiting and self.waiting[0][0] + latency_bars <= bar_index:
+            entry = self.live(heapq.heappop(self.waiting))
+            if entry is None:
+                continue
+            entry.eligible = True
+            order = entry.order
+            if order.order_type == "market":
+                self.market[order.id] = entry
+            else:
+                insort(self.limits(order), (order.limit_price, entry.seq, order.id))
+
+
+class PendingOrderBook:
+    """
+    Resting orders of every symbol in a run, keyed by order id.
+
+    Order ids must be unique among resting orders.
+    """
+
+    def __init__(self) -> None:
+        self._books: dict[str, _SymbolBook] = {}
+        self._symbol_of: dict[str, str] = {}
+        self._seq = 0
+
+    def add(self, order: Order) -> None:
+        """
+        Add an order; it becomes eligible latency_bars after its signal bar.
+
+        Raises:
+            ValueError: If an order with the same id is already resting
+        """
+        if order.id in self._symbol_of:
+            raise ValueError(f"Order {order.id} is already in the book")
+        if order.signal_bar_index < 0:
+            raise ValueError(f"signal_bar_index must be non-negative, got {order.signal_bar_index}")
+        book = self._books.get(order.symbol)
+        if book is None:
+            book = self._books[order.symbol] = _SymbolBook()
+        self._seq += 1
+        book.entries[order.id] = _BookEntry(order=order, seq=self._seq)
+        item = (order.signal_bar_index, self._seq, order.id)
+        heapq.heappush(book.waiting, item)
+        heapq.heappush(book.expiry, item)
+        self._symbol_of[order.id] = order.symbol
+
+    def eligible_orders(
+        self,
+        symbol: str,
+        bar_index: int,
+        latency_bars: int,
+        get_bar: Callable[[], Any],
+    ) -> list[Order]:
+        """
+        Orders of symbol that can fill on the current bar, in submission order.
+
+        Expired orders are dropped first. Returns every eligible market order
+        and the eligible limit orders the bar's range reaches.
+
+        Args:
+            symbol: Trading symbol
+            bar_index: Current bar index in the event loop
+            latency_bars: Configured latency
+            get_bar: Returns the current bar (with .low and .high); only called
+                when eligible limit orders are resting
+        """
+        book = self._books.get(symbol)
+        if book is None or not book.entries:
+            return []
+        for order_id in book.expire(bar_index):
+            del self._symbol_of[order_id]
+        book.promote(bar_index, latency_bars)
+
+        candidates = list(book.market.values())
+        if book.buy_limits or book.sell_limits:
+            bar = get_bar()
+            for _, _, order_id in book.buy_limits[bisect_left(book.buy_limits, bar.low, key=_price):]:
+                candidates.append(book.entries[order_id])
+            for _, _, order_id in book.sell_limits[:bisect_right(book.sell_limits, bar.high, key=_price)]:
+                candidates.append(book.entries[order_id])
+        candidates.sort(key=lambda entry: entry.seq)
+        return [entry.order for entry in candidates]
+
+    def mark_filled(self, order_id: str) -> None:
+        """Remove an order (filled or cancelled); unknown ids are ignored."""
+        symbol = self._symbol_of.pop(order_id, None)
+        if symbol is not None:
+            book = self._books[symbol]
+            book.remove(book.entries[order_id])
+
+    def clear(self, symbol: Optional[str] = None) -> None:
+        """Drop the resting orders of symbol (default: every symbol)."""
+        symbols = list(self._books) if symbol is None else [symbol]
+        for sym in symbols:
+            book = self._books.pop(sym, None)
+            if book is not None:
+                for order_id in book.entries:
+                    del self._symbol_of[order_id]
+
+    def has_orders(self, symbol: str) -> bool:
+        book = self._books.get(symbol)
+        return book is not None and bool(book.entries)
+
+    def orders(self, symbol: Optional[str] = None) -> list[Order]:
+        """Resting orders of symbol (default: every symbol), in submission order per symbol."""
+        books = self._books.values() if symbol is None else [self._books.get(symbol)]
+        return [
+            entry.order
+            for book in books if book is not None
+            for entry in sorted(book.entries.values(), key=lambda entry: entry.seq)
+        ]
+
+    def __iter__(self) -> Iterator[Order]:
+        return iter(self.orders())
+
+    def __len__(self) -> int:
+        return len(self._symbol_of)
+
+    def __repr__(self) -> str:
+        return f"PendingOrderBook(orders={len(self)}, symbols={len(self._books)})"
@@ -5,10 +5,12 @@ Handles market/limit orders with configurable slippage, volume, and impact model
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Any
+from typing import Optional, Any, Sequence
 import logging
 
-from vibe.backtester.core.execution.models import Order, Fill
+import numpy as np
+
+from vibe.backtester.core.execution.models import Order, Fill, FillBatch
 from vibe.backtester.core.execution.config import ExecutionConfig
 
 
@@ -37,6 +39,9 @@ class ExecutionSimulator:
     - Slippage and market impact calculations
     - Volume constraints (partial fills)
     - Price overrides for special cases (e.g., ORB entries)
+
+    execute_batch() prices many orders at once from arrays, with the same
+    float operations as execute_order() on each row.
     """
     
     def __init__(self, config: ExecutionConfig) -> None:
@@ -289,3 +294,112 @@ class ExecutionSimulator:
         
         else:
             raise ValueError(f"Invalid order_type: {order.order_type}. Must be 'market' or 'limit'.")
+
+    def execute_batch(
+        self,
+        sides: Sequence[str] | np.ndarray,
+        sizes: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+        adv: Optional[np.ndarray] = None,
+        limit_prices: Optional[np.ndarray] = None,
+        price_overrides: Optional[np.ndarray] = None,
+    ) -> FillBatch:
+        """
+        Execute a batch of orders, each against its own bar.
+
+        Row i of the result equals execute_order() for an order with
+        side sides[i], size sizes[i], limit_prices[i] and price_overrides[i]
+        against a bar with the i-th high/low/close/volume and ADV adv[i]
+        (execute_order() never reads the bar's open). Unfilled
+        orders have qty 0 and price NaN, where execute_order() returns None.
+
+        Args:
+            sides: "buy" or "sell" per order
+            sizes: Order size in shares per order
+            high, low, close, volume: Bar values per order
+            adv: ADV per order; NaN where not available (default: none)
+            limit_prices: Limit price per order; NaN for market orders
+                (default: all market)
+            price_overrides: Price override per market order; NaN for none
+                (default: none)
+
+        Returns:
+            FillBatch with price, qty, slippage and impact per order
+
+        Raises:
+            ValueError: If a side is invalid, array lengths differ, a market
+                order's close or override is non-positive, a limit price is
+                non-positive, or a model rejects its inputs (as execute_order)
+        """
+        sides = np.asarray(sides)
+        is_buy = sides == "buy"
+        if not np.all(is_buy | (sides == "sell")):
+            raise ValueError(f"Invalid side in batch: {sorted(set(sides[~is_buy & (sides != 'sell')]))}")
+        sizes, high, low, close, volume = (
+            np.asarray(a, dtype=np.float64) for a in (sizes, high, low, close, volume)
+        )
+        n = len(sides)
+        nan = np.full(n, np.nan)
+        limit_prices = nan if limit_prices is None else np.asarray(limit_prices, dtype=np.float64)
+        price_overrides = nan if price_overrides is None else np.asarray(price_overrides, dtype=np.float64)
+        arrays = (sizes, high, low, close, volume, limit_prices, price_overrides)
+        if adv is not None:
+            adv = np.asarray(adv, dtype=np.float64)
+            arrays += (adv,)
+        if any(len(a) != n for a in arrays):
+            raise ValueError("execute_batch arrays must all have one entry per order")
+
+        price = np.full(n, np.nan)
+        slippage = np.zeros(n)
+        impact = np.zeros(n)
+
+        is_limit = ~np.isnan(limit_prices)
+        is_market = ~is_limit
+        if np.any(close[is_market] <= 0):
+            raise ValueError("Invalid close price in batch: market orders need close > 0")
+        if np.any(limit_prices[is_limit] <= 0):
+            raise ValueError("Limit orders require valid limit_price > 0")
+
+        # Market orders with a price override: override price, no slippage/impact
+        overridden = is_market & ~np.isnan(price_overrides)
+        if np.any(price_overrides[overridden] <= 0):
+            raise ValueError("Invalid price_override in batch: must be > 0")
+        price[overridden] = price_overrides[overridden]
+
+        # Other market orders: slippage off the close, then impact
+        priced = is_market & ~overridden
+        if np.any(priced):
+            base_price = close[priced]
+            buy = is_buy[priced]
+            slippage_price = self.slippage_model.calculate_batch(base_price, buy, sizes[priced], volume[priced])
+            impact_pct = self.impact_model.price_impact_batch(
+                sizes[priced], volume[priced], None if adv is None else adv[priced]
+            )
+            price[priced] = np.where(
+                buy,
+                slippage_price + (impact_pct * base_price),
+                slippage_price - (impact_pct * base_price),
+            )
+            slippage[priced] = np.abs(slippage_price - base_price)
+            impact[priced] = impact_pct
+
+        # Limit orders fill at the limit once the bar reaches it
+        touched = is_limit & np.where(is_buy, low <= limit_prices, high >= limit_prices)
+        price[touched] = limit_prices[touched]
+
+        executable = is_market | touched
+        qty = np.zeros(n)
+        if np.any(executable):
+            max_qty = self.volume_model.max_fill_qty_batch(sizes[executable], volume[executable])
+            qty[executable] = np.minimum(sizes[executable], max_qty)
+        unfilled = qty <= 0
+        if np.any(price[~unfilled] <= 0):
+            raise ValueError("Fill price must be positive for every executed order in batch")
+        qty[unfilled] = 0.0
+        price[unfilled] = np.nan
+        slippage[unfilled] = 0.0
+        impact[unfilled] = 0.0
+        return FillBatch(price=price, qty=qty, slippage=slippage, impact=impact)
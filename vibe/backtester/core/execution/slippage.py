@@ -1,11 +1,17 @@
 """
 Slippage models for the execution simulator.
 Determines how execution price deviates from base price based on order size and liquidity.
+
+Each model also has calculate_batch(), the array form used by
+ExecutionSimulator.execute_batch. It returns exactly what calculate()
+returns for each row.
 """
 
 from typing import Protocol
 import math
 
+import numpy as np
+
 from vibe.common.models.bar import Bar
 
 TICK_SIZE = 0.01  # US equity minimum price increment
@@ -32,6 +38,23 @@ class SlippageModel(Protocol):
         """
         ...
 
+    def calculate_batch(
+        self, base_price: np.ndarray, is_buy: np.ndarray, order_size: np.ndarray, volume: np.ndarray
+    ) -> np.ndarray:
+        """
+        calculate() for arrays of orders.
+
+        Args:
+            base_price: Reference price per order
+            is_buy: True for buy orders, False for sell orders
+            order_size: Order quantity per order
+            volume: Bar volume per order
+
+        Returns:
+            Adjusted price per order
+        """
+        ...
+
 
 class FixedTickSlippage:
     """
@@ -79,6 +102,14 @@ class FixedTickSlippage:
         else:
             raise ValueError(f"Invalid side: {side}")
 
+    def calculate_batch(
+        self, base_price: np.ndarray, is_buy: np.ndarray, order_size: np.ndarray, volume: np.ndarray
+    ) -> np.ndarray:
+        """calculate() for arrays of orders (order_size and volume unused)."""
+        base_price = np.asarray(base_price, dtype=np.float64)
+        slippage_amount = self.ticks * self.tick_size
+        return np.where(is_buy, base_price + slippage_amount, base_price - slippage_amount)
+
 
 class SqrtVolumeSlippage:
     """
@@ -140,3 +171,21 @@ class SqrtVolumeSlippage:
             return base_price - slippage_amount
         else:
             raise ValueError(f"Invalid side: {side}")
+
+    def calculate_batch(
+        self, base_price: np.ndarray, is_buy: np.ndarray, order_size: np.ndarray, volume: np.ndarray
+    ) -> np.ndarray:
+        """
+        calculate() for arrays of orders.
+
+        Raises:
+            ValueError: If any volume is zero or negative
+        """
+        base_price = np.asarray(base_price, dtype=np.float64)
+        volume = np.asarray(volume, dtype=np.float64)
+        if np.any(volume <= 0):
+            raise ValueError("Cannot calculate sqrt slippage with zero volume in batch")
+        participation_sqrt = np.sqrt(np.asarray(order_size, dtype=np.float64) / volume)
+        slippage_pct = np.minimum(self.k * participation_sqrt, self.max_slippage_pct)
+        slippage_amount = base_price * slippage_pct
+        return np.where(is_buy, base_price + slippage_amount, base_price - slippage_amount)
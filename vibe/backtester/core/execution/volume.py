@@ -1,10 +1,22 @@
 """
 Volume models for the execution simulator.
 Determines the maximum quantity that can be filled in a single bar.
+
+max_fill_qty_batch() is the array form of max_fill_qty(), with identical
+results per row.
 """
 
 from typing import Protocol
 
+import numpy as np
+
+
+def _check_sizes(order_size: np.ndarray) -> np.ndarray:
+    order_size = np.asarray(order_size, dtype=np.float64)
+    if np.any(order_size <= 0):
+        raise ValueError("order_size must be positive for every order in batch")
+    return order_size
+
 
 class VolumeModel(Protocol):
     """
@@ -25,6 +37,10 @@ class VolumeModel(Protocol):
         """
         ...
 
+    def max_fill_qty_batch(self, order_size: np.ndarray, bar_volume: np.ndarray) -> np.ndarray:
+        """max_fill_qty() for arrays of orders."""
+        ...
+
 
 class UnlimitedVolume:
     """
@@ -47,6 +63,10 @@ class UnlimitedVolume:
             raise ValueError(f"order_size must be positive, got {order_size}")
         return order_size
 
+    def max_fill_qty_batch(self, order_size: np.ndarray, bar_volume: np.ndarray) -> np.ndarray:
+        """Full order sizes (no volume constraint)."""
+        return _check_sizes(order_size).copy()
+
 
 class ParticipationRateVolume:
     """
@@ -88,3 +108,16 @@ class ParticipationRateVolume:
         
         max_available = self.rate * bar_volume
         return min(order_size, max_available)
+
+    def max_fill_qty_batch(self, order_size: np.ndarray, bar_volume: np.ndarray) -> np.ndarray:
+        """
+        max_fill_qty() for arrays of orders.
+
+        Raises:
+            ValueError: If any order_size is non-positive or bar_volume negative
+        """
+        order_size = _check_sizes(order_size)
+        bar_volume = np.asarray(bar_volume, dtype=np.float64)
+        if np.any(bar_volume < 0):
+            raise ValueError("bar_volume must be non-negative for every order in batch")
+        return np.minimum(order_size, self.rate * bar_volume)
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime, time
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from zoneinfo import ZoneInfo
 
 from vibe.backtester.core.fill_simulator import FillResult
@@ -126,13 +126,23 @@ class PortfolioManager:
             self.cash -= fill.filled_qty * fill.avg_price
 
     def check_exits(
-        self, current_bars: Dict[str, Bar], clock
+        self,
+        current_bars: Dict[str, Bar],
+        clock,
+        intrabar_bars: Optional[Callable[[str], Sequence[Bar]]] = None,
     ) -> None:
         """
         Check take-profit, stop-loss, and EOD exit for all open positions.
         Exit priority: TP > Stop > EOD
-        Stop/TP trigger: bar.close must cross the level (not intrabar wick).
+        Stop/TP trigger: the bar's high/low touching the level (intrabar wick).
         clock must have a .now() method returning a timezone-aware datetime.
+
+        A bar that touches both TP and stop, or whose trailing-stop step moved
+        the stop to a level the same bar touches, cannot tell which came first.
+        With intrabar_bars (symbol -> the bar's minute bars, in time order)
+        such bars are replayed minute by minute and the first level touched
+        wins; within one minute the TP > Stop priority still applies. Without
+        it, the priority above decides.
         """
         local_time = clock.now().astimezone(_ET).time()
         is_eod = local_time >= _EOD_CUTOFF
@@ -142,53 +152,67 @@ class PortfolioManager:
             if bar is None:
                 continue
             pos = self.positions[symbol]
+            stop_before = pos.stop_price
 
             # Update stop from trailing rules before evaluating exits.
             self._maybe_update_trailing_stop(pos=pos, bar=bar)
 
-            # Check take-profit first (highest priority)
-            if pos.take_profit is not None:
-                long_tp  = pos.side == "buy"  and bar.high >= pos.take_profit
-                short_tp = pos.side == "sell" and bar.low  <= pos.take_profit
-                
-                if long_tp:
-                    fill = FillResult(
-                        symbol=symbol, side="sell",
-                        filled_qty=pos.quantity, avg_price=pos.take_profit,
-                    )
-                    self.close_position(fill, exit_reason="TP", timestamp=clock.now())
-                    continue
-                elif short_tp:
-                    fill = FillResult(
-                        symbol=symbol, side="buy",
-                        filled_qty=pos.quantity, avg_price=pos.take_profit,
-                    )
-                    self.close_position(fill, exit_reason="TP", timestamp=clock.now())
-                    continue
-
-            # Check stop-loss
-            long_stop  = pos.side == "buy"  and bar.low  <= pos.stop_price
-            short_stop = pos.side == "sell" and bar.high >= pos.stop_price
-
-            if long_stop:
-                fill = FillResult(
-                    symbol=symbol, side="sell",
-                    filled_qty=pos.quantity, avg_price=pos.stop_price,
-                )
-                self.close_position(fill, exit_reason="STOP", timestamp=clock.now())
-            elif short_stop:
-                fill = FillResult(
-                    symbol=symbol, side="buy",
-                    filled_qty=pos.quantity, avg_price=pos.stop_price,
-                )
-                self.close_position(fill, exit_reason="STOP", timestamp=clock.now())
+            hit = self._touched_exit(pos, bar)
+            if hit is not None and intrabar_bars is not None and self._is_ambiguous(pos, bar, stop_before):
+                minutes = intrabar_bars(symbol)
+                if minutes:
+                    hit = self._first_intrabar_exit(pos, stop_before, minutes)
+
+            if hit is not None:
+                reason, price = hit
             elif is_eod:
-                close_side = "sell" if pos.side == "buy" else "buy"
-                fill = FillResult(
-                    symbol=symbol, side=close_side,
-                    filled_qty=pos.quantity, avg_price=bar.close,
-                )
-                self.close_position(fill, exit_reason="EOD", timestamp=clock.now())
+                reason, price = "EOD", bar.close
+            else:
+                continue
+            close_side = "sell" if pos.side == "buy" else "buy"
+            fill = FillResult(
+                symbol=symbol, side=close_side,
+                filled_qty=pos.quantity, avg_price=price,
+            )
+            self.close_position(fill, exit_reason=reason, timestamp=clock.now())
+
+    @staticmethod
+    def _touched_exit(pos: Position, bar: Bar) -> Optional[Tuple[str, float]]:
+        """(reason, price) of the TP or stop the bar touches, TP first; None if neither."""
+        if pos.take_profit is not None:
+            long_tp  = pos.side == "buy"  and bar.high >= pos.take_profit
+            short_tp = pos.side == "sell" and bar.low  <= pos.take_profit
+            if long_tp or short_tp:
+                return "TP", pos.take_profit
+
+        long_stop  = pos.side == "buy"  and bar.low  <= pos.stop_price
+        short_stop = pos.side == "sell" and bar.high >= pos.stop_price
+        if long_stop or short_stop:
+            return "STOP", pos.stop_price
+        return None
+
+    @staticmethod
+    def _is_ambiguous(pos: Position, bar: Bar, stop_before: float) -> bool:
+        """True if the bar's stop touch may have come before its TP touch or trailing step."""
+        if pos.side == "buy":
+            stop_hit = bar.low <= pos.stop_price
+            tp_hit = pos.take_profit is not None and bar.high >= pos.take_profit
+        else:
+            stop_hit = bar.high >= pos.stop_price
+            tp_hit = pos.take_profit is not None and bar.low <= pos.take_profit
+        return stop_hit and (tp_hit or pos.stop_price != stop_before)
+
+    def _first_intrabar_exit(
+        self, pos: Position, stop_before: float, minutes: Sequence[Bar]
+    ) -> Optional[Tuple[str, float]]:
+        """Replay trailing updates and exit checks over minute bars; first exit touched."""
+        pos.stop_price = stop_before
+        for minute in minutes:
+            self._maybe_update_trailing_stop(pos=pos, bar=minute)
+            hit = self._touched_exit(pos, minute)
+            if hit is not None:
+                return hit
+        return None
 
     def _maybe_update_trailing_stop(self, pos: Position, bar: Bar) -> None:
         """Update stop price based on configured trailing stop logic."""
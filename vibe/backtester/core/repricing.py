@@ -0,0 +1,218 @@
+"""
+Slippage sensitivity by re-pricing one baseline run instead of re-running it.
+
+On the legacy execution path slippage only moves the entry fill
+(OR_high + $0.01 + slippage / OR_low - $0.01 - slippage). Stops, take-profit
+levels and the bars that trigger exits do not depend on it, and sizing is
+not cash-constrained, so every slippage value takes the same trades on the
+same bars; only the entry price, _position_size quantity, cash path, PnL
+and R-multiples differ.
+
+SlippageRepricer simulates the first eligible slippage value once with
+VectorizedORBEngine, then walks its position segments with one NumPy
+vector over all slippage values, recomputing entry, quantity and cash with
+the same float operations as PortfolioManager, so the re-priced results
+equal full re-runs exactly. A value falls back to a full simulation (over
+the same shared bars) where re-pricing could change which trades occur:
+
+  - a trailing stop (breakeven_plus_ticks, stepped_r_multiple) is anchored
+    to the entry price and initial risk, so exits can move,
+  - a breakout candidate whose entry equals its stop at that value (or at
+    the baseline) sizes to zero and is skipped, changing the trade set.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from vibe.backtester.analysis.metrics import BacktestResult
+from vibe.backtester.analysis.performance import PerformanceAnalyzer
+from vibe.backtester.core.engine import _TICK, _load_bars
+from vibe.backtester.core.vectorized import VectorizedORBEngine, _SessionArrays
+from vibe.backtester.runner import RuleSetRunner
+from vibe.common.models.trade import Trade
+from vibe.common.ruleset.models import StrategyRuleSet
+
+_ENTRY_ANCHORED_TRAILING_STOPS = {"breakeven_plus_ticks", "stepped_r_multiple"}
+
+
+class SlippageRepricer:
+    """
+    Backtests one ruleset at many slippage_ticks values from a single run.
+
+    Example:
+        ```python
+        repricer = SlippageRepricer(ruleset, data_dir)
+        results = repricer.run("QQQ", start, end, slippage_ticks=range(1, 21))
+        print(repricer.rerun_slippages)   # values that needed a full run
+        ```
+    """
+
+    def __init__(
+        self,
+        ruleset: StrategyRuleSet,
+        data_dir: Path,
+        initial_capital: float = 10_000.0,
+    ) -> None:
+        self.ruleset = ruleset
+        self.data_dir = data_dir
+        self.initial_capital = initial_capital
+        self.rerun_slippages: List[int] = []
+
+    def run(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        slippage_ticks: Sequence[int],
+        precomputed_features: Optional[pd.DataFrame] = None,
+    ) -> List[BacktestResult]:
+        """
+        One BacktestResult per slippage value, in input order.
+
+        Results equal BacktestEngine runs with each slippage_ticks value on
+        the legacy execution path.
+        """
+        values = [int(s) for s in slippage_ticks]
+        df = _load_bars(self.data_dir, self.ruleset, symbol, start_date, end_date, precomputed_features)
+        arrays = _SessionArrays(df)
+        config = RuleSetRunner(self.ruleset).strategy.config
+
+        repriceable = self._repriceable(arrays, config, values)
+        simulated = {}
+        self.rerun_slippages = []
+        for s, ok in zip(values, repriceable):
+            if not ok and s not in simulated:
+                simulated[s] = self._simulate(symbol, df, arrays, s)
+                self.rerun_slippages.append(s)
+
+        repriced = {}
+        to_reprice = sorted({s for s, ok in zip(values, repriceable) if ok})
+        if to_reprice:
+            baseline = self._engine(to_reprice[0])
+            baseline_trades, _ = baseline.simulate(symbol, df, arrays)
+            repriced = self._reprice(symbol, arrays, config, baseline.segments, baseline_trades, to_reprice)
+
+        results = []
+        for s in values:
+            trades, equity_curve = simulated[s] if s in simulated else repriced[s]
+            results.append(PerformanceAnalyzer.analyze(
+                trades=trades,
+                equity_curve=equity_curve,
+                initial_capital=self.initial_capital,
+                symbol=symbol,
+                start_date=start_date,
+                end_date=end_date,
+                ruleset_name=self.ruleset.name,
+                ruleset_version=self.ruleset.version,
+            ))
+        return results
+
+    def _engine(self, slippage: int) -> VectorizedORBEngine:
+        return VectorizedORBEngine(self.ruleset, self.data_dir, self.initial_capital, slippage)
+
+    def _simulate(self, symbol: str, df: pd.DataFrame, arrays: _SessionArrays, slippage: int):
+        return self._engine(slippage).simulate(symbol, df, arrays)
+
+    def _repriceable(self, arrays: _SessionArrays, config, values: List[int]) -> List[bool]:
+        """Whether each value shares the trade set of every other repriceable value."""
+        trailing = self.ruleset.exit.trailing_stop
+        if trailing is not None and trailing.model_dump().get("method") in _ENTRY_ANCHORED_TRAILING_STOPS:
+            return [False] * len(values)
+
+        candidates, is_long, orb_high, orb_low = arrays.breakout_candidates(config)
+        if len(candidates) == 0:
+            return [True] * len(values)
+        long_side = is_long[candidates]
+        entry_slippage = np.asarray(values, dtype=np.int64)[:, None] * _TICK
+        entry = np.where(
+            long_side,
+            (orb_high[candidates] + _TICK) + entry_slippage,
+            (orb_low[candidates] - _TICK) - entry_slippage,
+        )
+        stop = self._stops(arrays, config, candidates, long_side, orb_high, orb_low)
+        return (~(entry == stop).any(axis=1)).tolist()
+
+    @staticmethod
+    def _stops(
+        arrays: _SessionArrays,
+        config,
+        bars: np.ndarray,
+        long_side: np.ndarray,
+        orb_high: np.ndarray,
+        orb_low: np.ndarray,
+    ) -> np.ndarray:
+        """Initial stop of an entry on each bar, as VectorizedORBEngine.simulate sets it."""
+        if config.stop_loss_at_level:
+            return np.where(long_side, orb_low[bars], orb_high[bars])
+        return np.where(long_side, arrays.close[bars] - arrays.atr[bars], arrays.close[bars] + arrays.atr[bars])
+
+    def _reprice(
+        self,
+        symbol: str,
+        arrays: _SessionArrays,
+        config,
+        segments: list,
+        baseline_trades: List[Trade],
+        values: List[int],
+    ) -> dict:
+        """(trades, equity_curve) per value from the baseline run's segments."""
+        _, _, orb_high, orb_low = arrays.breakout_candidates(config)
+        risk_pct = self.ruleset.position_size.value
+        slippage = np.asarray(values, dtype=np.int64) * _TICK
+
+        bars = np.array([seg[0] for seg in segments], dtype=np.int64)
+        stops = self._stops(
+            arrays, config, bars, np.array([seg[4] > 0 for seg in segments], dtype=bool), orb_high, orb_low
+        )
+
+        cash = np.full(len(values), self.initial_capital)
+        sized = []  # per segment: stop, then entry, qty, cash_open, cash_after vectors over values
+        for k, (i, _, _, _, sign) in enumerate(segments):
+            long_side = sign > 0
+            stop = float(stops[k])
+            if long_side:
+                entry = (orb_high[i] + _TICK) + slippage
+            else:
+                entry = (orb_low[i] - _TICK) - slippage
+            # _position_size: risk position_size.value of cash per stop distance
+            qty = np.maximum(1, (cash * risk_pct / np.abs(entry - stop)).astype(np.int64))
+            cash = cash - qty * entry if long_side else cash + qty * entry
+            cash_open = cash.copy()
+            if k < len(baseline_trades):
+                exit_price = baseline_trades[k].exit_price
+                cash = cash + qty * exit_price if long_side else cash - qty * exit_price
+            sized.append((stop, entry, qty, cash_open, cash.copy()))
+
+        engine = self._engine(values[0])
+        timestamps = arrays.timestamps
+        out = {}
+        for v, s in enumerate(values):
+            trades = []
+            segs = []
+            cash_after = []
+            for k, ((i, j, _, _, sign), (stop, entry, qty, cash_open, cash_closed)) in enumerate(
+                zip(segments, sized)
+            ):
+                entry_v, qty_v = float(entry[v]), int(qty[v])
+                segs.append((i, j, float(cash_open[v]), qty_v, sign))
+                cash_after.append(float(cash_closed[v]))
+                if k < len(baseline_trades):
+                    base = baseline_trades[k]
+                    trades.append(Trade(
+                        symbol=symbol,
+                        side=base.side,
+                        quantity=qty_v,
+                        entry_price=entry_v,
+                        exit_price=base.exit_price,
+                        entry_time=base.entry_time,
+                        exit_time=base.exit_time,
+                        initial_risk=abs(entry_v - stop) * qty_v,
+                        exit_reason=base.exit_reason,
+                    ))
+            equity = engine._equity(len(timestamps), arrays.close, segs, cash_after)
+            out[s] = (trades, list(zip(timestamps, equity.tolist())))
+        return out
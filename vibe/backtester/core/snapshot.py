@@ -0,0 +1,204 @@
+"""
+End-of-run engine state, so a backtest can be extended instead of re-run.
+
+BacktestEngine.run(save_snapshot=...) writes everything the event loop would
+carry into the next bar after its last one:
+
+    <root>/state.json          run identity, cash, open positions, the
+                               strategy's tracked positions and one-trade-per-
+                               day state, ATR (Wilder) and volume-mean warm state
+    <root>/trades.parquet      closed trades so far
+    <root>/equity.parquet      equity curve so far
+    <root>/daily_volume.parquet  last ADV-window days of daily volume
+    <root>/context.parquet     last context_lookback_bars prepared bars
+
+BacktestEngine.resume() restores it and runs only the bars after the
+snapshot. Pending orders are not stored: the engine expires them at every
+session boundary, and a snapshot must end on a complete session.
+
+Snapshots are written to a temporary directory and renamed into place, so a
+crash never leaves a partial snapshot behind.
+"""
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from vibe.backtester.core.portfolio import Position
+from vibe.common.models.trade import Trade
+
+# Bump when the on-disk layout changes
+_FORMAT_VERSION = 1
+
+_STATE_FILE = "state.json"
+_TRADES_FILE = "trades.parquet"
+_EQUITY_FILE = "equity.parquet"
+_DAILY_VOLUME_FILE = "daily_volume.parquet"
+_CONTEXT_FILE = "context.parquet"
+
+
+def snapshot_key(**parts: Any) -> str:
+    """Identity of the settings a snapshot was taken under (SHA-256 of parts)."""
+    encoded = json.dumps({**parts, "format_version": _FORMAT_VERSION}, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def _encode_time(value: Optional[datetime]) -> Optional[str]:
+    return None if value is None else pd.Timestamp(value).isoformat()
+
+
+def _decode_time(value: Optional[str], tz: Optional[str]) -> Optional[datetime]:
+    """Timestamp in the bar index's zone, so restored and fresh times match."""
+    if value is None:
+        return None
+    ts = pd.Timestamp(value)
+    if tz is not None and ts.tzinfo is not None:
+        ts = ts.tz_convert(tz)
+    return ts.to_pydatetime()
+
+
+@dataclass
+class EngineSnapshot:
+    """
+    State of a single-symbol BacktestEngine run after its last bar.
+
+    key covers the ruleset, capital, slippage, execution config, context
+    lookback and ENGINE_VERSION; resume() refuses a snapshot whose key differs.
+    """
+    key: str
+    symbol: str
+    start_date: datetime
+    end_date: datetime
+    last_timestamp: datetime
+    tz: Optional[str]
+    cash: float
+    positions: Dict[str, Position]
+    trades: List[Trade]
+    equity_curve: List[Tuple[datetime, float]]
+    strategy_positions: Dict[str, Dict[str, Any]]
+    traded_today: Dict[str, date]
+    volume_sum: float
+    n_bars: int
+    atr: Optional[Dict[str, float]] = None
+    daily_volume: pd.Series = field(default_factory=lambda: pd.Series(dtype="float64"))
+    context: pd.DataFrame = field(default_factory=pd.DataFrame)
+
+    @property
+    def last_date(self) -> date:
+        return self.last_timestamp.date()
+
+    def save(self, path: Path | str) -> None:
+        """Write the snapshot directory at path (replacing any previous one)."""
+        final = Path(path)
+        tmp = final.parent / f".{final.name}.{os.getpid()}.tmp"
+        try:
+            shutil.rmtree(tmp, ignore_errors=True)
+            tmp.mkdir(parents=True)
+            state = {
+                "format_version": _FORMAT_VERSION,
+                "key": self.key,
+                "symbol": self.symbol,
+                "start_date": _encode_time(self.start_date),
+                "end_date": _encode_time(self.end_date),
+                "last_timestamp": _encode_time(self.last_timestamp),
+                "tz": self.tz,
+                "cash": self.cash,
+                "positions": {
+                    symbol: {
+                        **vars(pos),
+                        "entry_time": _encode_time(pos.entry_time),
+                    }
+                    for symbol, pos in self.positions.items()
+                },
+                "strategy_positions": {
+                    symbol: {**pos, "timestamp": _encode_time(pos["timestamp"])}
+                    for symbol, pos in self.strategy_positions.items()
+                },
+                "traded_today": {
+                    symbol: day.isoformat() for symbol, day in self.traded_today.items()
+                },
+                "volume_sum": self.volume_sum,
+                "n_bars": self.n_bars,
+                "atr": self.atr,
+            }
+            with open(tmp / _STATE_FILE, "w") as f:
+                json.dump(state, f)
+            pq.write_table(
+                pa.Table.from_pylist([t.model_dump() for t in self.trades]), tmp / _TRADES_FILE
+            )
+            pd.DataFrame(
+                {
+                    "timestamp": [ts for ts, _ in self.equity_curve],
+                    "equity": [value for _, value in self.equity_curve],
+                }
+            ).to_parquet(tmp / _EQUITY_FILE, engine="pyarrow", index=False)
+            self.daily_volume.to_frame("volume").to_parquet(
+                tmp / _DAILY_VOLUME_FILE, engine="pyarrow", index=True
+            )
+            self.context.to_parquet(tmp / _CONTEXT_FILE, engine="pyarrow", index=True)
+            if final.exists():
+                shutil.rmtree(final)
+            os.replace(tmp, final)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    @classmethod
+    def load(cls, path: Path | str) -> "EngineSnapshot":
+        """
+        Read a snapshot directory.
+
+        Raises:
+            FileNotFoundError: no snapshot at path
+            ValueError: the snapshot was written in an older layout
+        """
+        root = Path(path)
+        if not (root / _STATE_FILE).exists():
+            raise FileNotFoundError(f"No engine snapshot at {root}")
+        with open(root / _STATE_FILE) as f:
+            state = json.load(f)
+        if state.get("format_version") != _FORMAT_VERSION:
+            raise ValueError(f"Engine snapshot at {root} has an unsupported format")
+
+        tz = state["tz"]
+        equity = pd.read_parquet(root / _EQUITY_FILE)
+        if tz is not None and len(equity):
+            equity["timestamp"] = equity["timestamp"].dt.tz_convert(tz)
+        trades = [Trade(**row) for row in pq.read_table(root / _TRADES_FILE).to_pylist()]
+        return cls(
+            key=state["key"],
+            symbol=state["symbol"],
+            start_date=_decode_time(state["start_date"], tz),
+            end_date=_decode_time(state["end_date"], tz),
+            last_timestamp=_decode_time(state["last_timestamp"], tz),
+            tz=tz,
+            cash=state["cash"],
+            positions={
+                symbol: Position(**{**pos, "entry_time": _decode_time(pos["entry_time"], tz)})
+                for symbol, pos in state["positions"].items()
+            },
+            trades=trades,
+            equity_curve=[
+                (ts.to_pydatetime(), float(value))
+                for ts, value in zip(equity["timestamp"], equity["equity"])
+            ],
+            strategy_positions={
+                symbol: {**pos, "timestamp": _decode_time(pos["timestamp"], tz)}
+                for symbol, pos in state["strategy_positions"].items()
+            },
+            traded_today={
+                symbol: date.fromisoformat(day) for symbol, day in state["traded_today"].items()
+            },
+            volume_sum=state["volume_sum"],
+            n_bars=state["n_bars"],
+            atr=state["atr"],
+            daily_volume=pd.read_parquet(root / _DAILY_VOLUME_FILE)["volume"],
+            context=pd.read_parquet(root / _CONTEXT_FILE),
+        )
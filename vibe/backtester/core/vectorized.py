@@ -0,0 +1,446 @@
+"""
+Vectorized ORB backtest kernel for sweep-scale workloads.
+
+VectorizedORBEngine is a drop-in alternative to BacktestEngine for the
+legacy (default) execution path. Instead of stepping bar by bar it:
+
+  1. computes every session's opening range with a grouped max/min over
+     the opening-window bars,
+  2. builds a per-bar breakout-candidate mask (window complete, before entry
+     cutoff, volume filter, wick/body breakout with the LEAN tie-break, body
+     percentage filter) with array ops,
+  3. walks candidates once per trade (ORB takes at most one trade per day),
+     sizing from realised cash exactly like the event loop, and
+  4. resolves TP / STOP / EOD exits with a forward NumPy search over the bars
+     up to the next EOD bar, applying breakeven_plus_ticks and
+     stepped_r_multiple trailing stops as a running max of favourable R.
+
+Trades are booked through PortfolioManager.open_position/close_position and
+the equity curve is marked to market with the same float operations as
+PortfolioManager.update_equity, so results are fed to
+PerformanceAnalyzer.analyze unchanged.
+
+Tolerance: on the legacy execution path the kernel is exact — trades match
+BacktestEngine field for field and the equity curve matches bar for bar
+(tolerance 0). The volume-filter baseline is the running mean used by the
+bounded-context event loop, which equals the full-history mean exactly for
+integer share volumes; for fractional volumes it can differ in the last ulp,
+which only matters for a bar whose volume sits exactly on the threshold.
+
+Not supported (use BacktestEngine): ExecutionConfig / realistic fills,
+latency and partial fills. Bars are not pydantic-validated.
+
+Per-frame arrays, opening ranges and breakout candidates live on
+_SessionArrays, memoized by the config fields that determine them, so
+BatchORBEngine can share one instance across many ruleset variants.
+"""
+
+from datetime import datetime, time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from vibe.backtester.analysis.metrics import BacktestResult
+from vibe.backtester.analysis.performance import PerformanceAnalyzer
+from vibe.backtester.core.engine import _TICK, _load_bars, _position_size, _running_mean
+from vibe.backtester.core.fill_simulator import FillResult
+from vibe.backtester.core.portfolio import _EOD_CUTOFF, _ET, PortfolioManager
+from vibe.backtester.runner import RuleSetRunner
+from vibe.common.models.trade import Trade
+from vibe.common.ruleset.models import StrategyRuleSet
+
+
+def _seconds(t: time) -> int:
+    return t.hour * 3600 + t.minute * 60 + t.second
+
+
+def _parse_hhmm(value: str) -> time:
+    hour, minute = map(int, value.split(":"))
+    return time(hour, minute)
+
+
+class _SessionArrays:
+    """
+    NumPy views of a prepared bar frame plus memoized signal inputs.
+
+    Opening ranges are keyed by (window start, window end) and breakout
+    candidates by every ORB config field that affects them, so variants
+    differing only in exit settings reuse one computation.
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.df = df
+        self.n = len(df)
+        self.timestamps = df.index.to_pydatetime()
+        index = df.index
+        if index.tz is not None:
+            index = index.tz_convert(_ET)
+        self.tod = (index.hour * 3600 + index.minute * 60 + index.second).to_numpy()
+        self.day_codes, _ = pd.factorize(
+            index.tz_localize(None).normalize() if index.tz is not None else index.normalize()
+        )
+        self.day_ends = np.flatnonzero(np.r_[self.day_codes[1:] != self.day_codes[:-1], True]) + 1
+        self.n_days = int(self.day_codes.max()) + 1 if self.n else 0
+
+        self.open = df["open"].to_numpy(dtype=np.float64)
+        self.high = df["high"].to_numpy(dtype=np.float64)
+        self.low = df["low"].to_numpy(dtype=np.float64)
+        self.close = df["close"].to_numpy(dtype=np.float64)
+        self.atr = df["ATR_14"].to_numpy(dtype=np.float64) if "ATR_14" in df.columns else None
+        self.is_eod = self.tod >= _seconds(_EOD_CUTOFF)
+        self.eod_idx = np.flatnonzero(self.is_eod)
+
+        self._volume_mean: Optional[np.ndarray] = None
+        self._ranges: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._candidates: Dict[tuple, Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = {}
+
+    def volume_mean(self) -> np.ndarray:
+        if self._volume_mean is None:
+            self._volume_mean = _running_mean(self.df["volume"].to_numpy(dtype=np.float64))
+        return self._volume_mean
+
+    def opening_range(self, start_s: int, end_s: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Per-bar (orb_high, orb_low) of the [start_s, end_s) window and per-day has_window."""
+        key = (start_s, end_s)
+        if key not in self._ranges:
+            day_codes = self.day_codes
+            in_window = (self.tod >= start_s) & (self.tod < end_s)
+            day_high = np.full(self.n_days, -np.inf)
+            day_low = np.full(self.n_days, np.inf)
+            np.maximum.at(day_high, day_codes[in_window], self.high[in_window])
+            np.minimum.at(day_low, day_codes[in_window], self.low[in_window])
+            has_window = np.bincount(day_codes[in_window], minlength=self.n_days) > 0
+            self._ranges[key] = (day_high[day_codes], day_low[day_codes], has_window)
+        return self._ranges[key]
+
+    def breakout_candidates(self, config: Any) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Bars where ORBStrategy.generate_signal_incremental would fire if flat
+        and not yet traded today. Returns (indices, is_long, orb_high, orb_low)
+        with the level arrays broadcast per bar.
+        """
+        key = (
+            config.orb_start_time,
+            config.orb_duration_minutes,
+            config.entry_cutoff_time,
+            config.use_volume_filter,
+            config.volume_threshold if config.use_volume_filter else None,
+            config.breakout_evaluation == "body",
+            config.orb_body_pct_filter,
+        )
+        if key not in self._candidates:
+            self._candidates[key] = self._breakout_candidates(config)
+        return self._candidates[key]
+
+    def _breakout_candidates(self, config: Any) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        tod, day_codes = self.tod, self.day_codes
+        open_, high, low, close = self.open, self.high, self.low, self.close
+
+        start_s = _seconds(_parse_hhmm(config.orb_start_time))
+        end_minutes = (start_s // 60) + config.orb_duration_minutes
+        end_s = _seconds(time(end_minutes // 60, end_minutes % 60))
+        orb_high, orb_low, has_window = self.opening_range(start_s, end_s)
+
+        if self.atr is None:
+            return np.empty(0, dtype=np.int64), np.zeros(self.n, dtype=bool), orb_high, orb_low
+
+        # Levels are final (and can be broken) only once the window has closed.
+        mask = has_window[day_codes] & (tod >= end_s)
+        mask &= tod < _seconds(_parse_hhmm(config.entry_cutoff_time))
+
+        if config.use_volume_filter:
+            volume = self.df["volume"].to_numpy(dtype=np.float64)
+            mask &= ~(volume < self.volume_mean() * config.volume_threshold)
+
+        if config.breakout_evaluation == "body":
+            breakout_high = np.maximum(open_, close)
+            breakout_low = np.minimum(open_, close)
+        else:
+            breakout_high = high
+            breakout_low = low
+        long_broke = breakout_high >= orb_high + _TICK
+        short_broke = breakout_low <= orb_low - _TICK
+        # LEAN tie-break: the side that moved further from the open fired first.
+        up_first = (high - open_) >= (open_ - low)
+        is_long = long_broke & (~short_broke | up_first)
+        is_short = short_broke & ~is_long
+
+        total_range = high - low
+        with np.errstate(divide="ignore", invalid="ignore"):
+            body_pct = np.where(total_range == 0, 0.0, np.abs(close - open_) / total_range)
+        mask &= (is_long | is_short) & ~(body_pct < config.orb_body_pct_filter)
+
+        return np.flatnonzero(mask), is_long, orb_high, orb_low
+
+
+class VectorizedORBEngine:
+    """
+    Array-based ORB backtester with the same inputs and BacktestResult as
+    BacktestEngine on its default (legacy fill) execution path.
+    """
+
+    def __init__(
+        self,
+        ruleset: StrategyRuleSet,
+        data_dir: Path,
+        initial_capital: float = 10_000.0,
+        slippage_ticks: int = 2,
+    ) -> None:
+        self.ruleset = ruleset
+        self.data_dir = data_dir
+        self.initial_capital = initial_capital
+        self.slippage_ticks = slippage_ticks
+        self.segments: list[tuple[int, int, float, float, float]] = []
+
+    def run(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        precomputed_features: Optional[pd.DataFrame] = None,
+    ) -> BacktestResult:
+        """Run the backtest; arguments match BacktestEngine.run()."""
+        df = _load_bars(self.data_dir, self.ruleset, symbol, start_date, end_date, precomputed_features)
+        trades, equity_curve = self.simulate(symbol, df)
+        return PerformanceAnalyzer.analyze(
+            trades=trades,
+            equity_curve=equity_curve,
+            initial_capital=self.initial_capital,
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date,
+            ruleset_name=self.ruleset.name,
+            ruleset_version=self.ruleset.version,
+        )
+
+    def simulate(
+        self, symbol: str, df: pd.DataFrame, arrays: Optional[_SessionArrays] = None
+    ) -> tuple[list[Trade], list[tuple[datetime, float]]]:
+        """
+        Simulate on an already-prepared bar frame (resampled, with ATR_14).
+
+        arrays may be a _SessionArrays of df shared with other variants.
+        Returns (trades, equity_curve) in the format PortfolioManager produces.
+        The run's position segments (entry bar, exit bar or len(df) if still
+        open, cash while open, quantity, +1/-1 side) are kept on self.segments.
+        """
+        trailing_stop_config = None
+        if self.ruleset.exit.trailing_stop is not None:
+            trailing_stop_config = self.ruleset.exit.trailing_stop.model_dump()
+        portfolio = PortfolioManager(self.initial_capital, trailing_stop_config=trailing_stop_config)
+
+        n = len(df)
+        self.segments = []
+        if n == 0:
+            return portfolio.trade_history, []
+
+        if arrays is None:
+            arrays = _SessionArrays(df)
+        timestamps = arrays.timestamps
+        day_codes, day_ends = arrays.day_codes, arrays.day_ends
+        high, low, close = arrays.high, arrays.low, arrays.close
+        atr, is_eod, eod_idx = arrays.atr, arrays.is_eod, arrays.eod_idx
+
+        config = RuleSetRunner(self.ruleset).strategy.config
+        candidates, is_long, orb_high, orb_low = arrays.breakout_candidates(config)
+        risk_pct = self.ruleset.position_size.value
+        slippage = self.slippage_ticks * _TICK
+
+        # Position segments [entry_i, exit_j) with the cash balance while open.
+        segments = self.segments  # (i, j, cash_open, qty, sign)
+        cash_after: list[float] = []
+
+        free_from = 0
+        k = 0
+        while k < len(candidates):
+            i = int(candidates[k])
+            if i < free_from:
+                k = int(np.searchsorted(candidates, free_from))
+                continue
+
+            long_side = bool(is_long[i])
+            bar_close = float(close[i])
+            atr_i = atr[i]
+            if long_side:
+                entry_price = orb_high[i] + _TICK + slippage
+                stop_price = orb_low[i] if config.stop_loss_at_level else bar_close - atr_i
+                take_profit = orb_high[i] + atr_i * config.take_profit_multiplier
+            else:
+                entry_price = orb_low[i] - _TICK - slippage
+                stop_price = orb_high[i] if config.stop_loss_at_level else bar_close + atr_i
+                take_profit = orb_low[i] - atr_i * config.take_profit_multiplier
+            if config.take_profit_multiplier <= 0:
+                take_profit = None
+            entry_price, stop_price = float(entry_price), float(stop_price)
+
+            quantity = _position_size(portfolio.cash, entry_price, stop_price, risk_pct)
+            if quantity <= 0:
+                k += 1
+                continue
+
+            side = "buy" if long_side else "sell"
+            portfolio.open_position(
+                FillResult(symbol=symbol, side=side, filled_qty=quantity, avg_price=entry_price),
+                stop_price=stop_price,
+                take_profit=take_profit,
+                timestamp=timestamps[i],
+            )
+            cash_open = portfolio.cash
+            pos = portfolio.positions[symbol]
+
+            exit_ = self._find_exit(pos, i, is_eod, eod_idx, high, low, close, portfolio.trailing_stop_config)
+            if exit_ is None:
+                # Still open at the end of the data: marked to market, never closed.
+                segments.append((i, n, cash_open, quantity, 1.0 if long_side else -1.0))
+                cash_after.append(portfolio.cash)
+                break
+
+            j, exit_price, exit_reason = exit_
+            portfolio.close_position(
+                FillResult(
+                    symbol=symbol,
+                    side="sell" if long_side else "buy",
+                    filled_qty=pos.quantity,
+                    avg_price=exit_price,
+                ),
+                exit_reason=exit_reason,
+                timestamp=timestamps[j],
+            )
+            segments.append((i, j, cash_open, quantity, 1.0 if long_side else -1.0))
+            cash_after.append(portfolio.cash)
+
+            # One trade per day; an overnight exit may re-enter on its exit bar.
+            free_from = max(j, int(day_ends[day_codes[i]]))
+            k = int(np.searchsorted(candidates, free_from))
+
+        equity = self._equity(n, close, segments, cash_after)
+        return portfolio.trade_history, list(zip(timestamps, equity.tolist()))
+
+    # ------------------------------------------------------------------
+    # Exits
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _trailing_stops(
+        pos: Any,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        trailing_stop_config: Optional[dict],
+    ) -> np.ndarray:
+        """
+        Stop in force at each bar after entry, replicating
+        PortfolioManager._maybe_update_trailing_stop: stops only ratchet, so
+        the stop at bar k depends on the running max of favourable R.
+        """
+        stops = np.full(len(highs), pos.stop_price)
+        if not trailing_stop_config:
+            return stops
+        method = trailing_stop_config.get("method")
+        if method not in {"breakeven_plus_ticks", "stepped_r_multiple"}:
+            return stops
+        risk = pos.initial_risk_per_share
+        if risk <= 0:
+            return stops
+
+        long_side = pos.side == "buy"
+        if long_side:
+            favorable_r = np.maximum(0.0, highs - pos.entry_price) / risk
+        else:
+            favorable_r = np.maximum(0.0, pos.entry_price - lows) / risk
+        peak_r = np.maximum.accumulate(favorable_r)
+        ratchet = np.maximum if long_side else np.minimum
+
+        if method == "breakeven_plus_ticks":
+            trigger_r = float(trailing_stop_config.get("trigger_r", 1.0))
+            plus_ticks = int(trailing_stop_config.get("plus_ticks", 0))
+            offset = plus_ticks * 0.01
+            candidate = pos.entry_price + offset if long_side else pos.entry_price - offset
+            return np.where(peak_r >= trigger_r, ratchet(stops, candidate), stops)
+
+        steps = trailing_stop_config.get("steps", [])
+        if not isinstance(steps, list):
+            return stops
+        for step in steps:
+            if not isinstance(step, dict):
+                continue
+            at = float(step.get("at", 0.0))
+            move_stop_to = float(step.get("move_stop_to", 0.0))
+            if long_side:
+                candidate = pos.entry_price + move_stop_to * risk
+            else:
+                candidate = pos.entry_price - move_stop_to * risk
+            stops = np.where(peak_r >= at, ratchet(stops, candidate), stops)
+        return stops
+
+    def _find_exit(
+        self,
+        pos: Any,
+        i: int,
+        is_eod: np.ndarray,
+        eod_idx: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        trailing_stop_config: Optional[dict],
+    ) -> Optional[tuple[int, float, str]]:
+        """
+        First bar after entry bar i that exits the position, with fill price
+        and reason (TP > STOP > EOD, as in PortfolioManager.check_exits).
+        Returns None if the position is still open at the end of the data.
+        """
+        nxt = int(np.searchsorted(eod_idx, i, side="right"))
+        stop_at = int(eod_idx[nxt]) + 1 if nxt < len(eod_idx) else len(close)
+        lo = i + 1
+        if lo >= stop_at:
+            return None
+
+        highs = high[lo:stop_at]
+        lows = low[lo:stop_at]
+        stops = self._trailing_stops(pos, highs, lows, trailing_stop_config)
+        if pos.side == "buy":
+            stop_hit = lows <= stops
+            tp_hit = highs >= pos.take_profit if pos.take_profit is not None else None
+        else:
+            stop_hit = highs >= stops
+            tp_hit = lows <= pos.take_profit if pos.take_profit is not None else None
+        hit = stop_hit | is_eod[lo:stop_at]
+        if tp_hit is not None:
+            hit |= tp_hit
+
+        if not hit.any():
+            return None
+        k = int(np.argmax(hit))
+        j = lo + k
+        if tp_hit is not None and tp_hit[k]:
+            return j, float(pos.take_profit), "TP"
+        if stop_hit[k]:
+            return j, float(stops[k]), "STOP"
+        return j, float(close[j]), "EOD"
+
+    # ------------------------------------------------------------------
+    # Equity
+    # ------------------------------------------------------------------
+
+    def _equity(
+        self,
+        n: int,
+        close: np.ndarray,
+        segments: list[tuple[int, int, float, float, float]],
+        cash_after: list[float],
+    ) -> np.ndarray:
+        """Bar-by-bar equity: cash while flat, cash + signed close * qty while open."""
+        equity = np.empty(n)
+        cash = self.initial_capital
+        prev = 0
+        for (i, j, cash_open, qty, sign), cash_closed in zip(segments, cash_after):
+            equity[prev:i] = cash
+            if sign > 0:
+                equity[i:j] = cash_open + close[i:j] * qty
+            else:
+                equity[i:j] = cash_open - close[i:j] * qty
+            cash = cash_closed
+            prev = j
+        equity[prev:] = cash
+        return equity
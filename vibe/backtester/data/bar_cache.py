@@ -0,0 +1,234 @@
+"""
+Process-wide market data cache for backtests.
+
+Every BacktestEngine run used to read the symbol's whole Parquet file, mask it
+down to the run period and resample it again. Sweeps, walk-forward and
+robustness runs repeat that hundreds of times on identical data. BarCache
+keeps the raw 1m frame and its resampled frames in memory, keyed by
+(symbol, file fingerprint, timeframe), with LRU eviction under a byte budget.
+
+The unit of caching is one Parquet file: the whole file in the legacy
+single-file layout, or one calendar partition of a partitioned dataset (see
+parquet_dataset). A period query only loads the partitions overlapping it,
+so short walk-forward windows never touch the rest of the history.
+
+Period slicing is a binary search on the sorted index. A resampled slice
+equals resampling the 1m slice: bins fully inside the period come from the
+cached resampled frame, and a bin cut by the period boundary is rebuilt
+from the minute bars that fall inside the period.
+
+Budget: BACKTEST__BAR_CACHE_MB (default 2048). A file is re-read when its
+size or mtime changes, since that changes the fingerprint.
+"""
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+
+from vibe.backtester.data.parquet_dataset import partition_files
+
+_DEFAULT_BUDGET_MB = 2048
+_RAW_TIMEFRAME = "1min"
+
+
+def resample_ohlcv(df: pd.DataFrame, interval: str = "5min") -> pd.DataFrame:
+    """Resample OHLCV bars to a pandas interval (left-closed, left-labelled)."""
+    return df.resample(interval, closed="left", label="left").agg(
+        open=("open", "first"),
+        high=("high", "max"),
+        low=("low", "min"),
+        close=("close", "last"),
+        volume=("volume", "sum"),
+    ).dropna()
+
+
+def _pandas_interval(timeframe: str) -> str:
+    """Normalise ruleset timeframes ("5m") to pandas intervals ("5min")."""
+    if timeframe.endswith("m") and not timeframe.endswith("min"):
+        return timeframe[:-1] + "min"
+    return timeframe
+
+
+def _bounds(
+    index: pd.DatetimeIndex, start: Optional[datetime], end: Optional[datetime]
+) -> tuple[int, int]:
+    """Positional [lo, hi) range of index within [start, end] (index must be sorted)."""
+    lo = 0 if start is None else int(index.searchsorted(start, side="left"))
+    hi = len(index) if end is None else int(index.searchsorted(end, side="right"))
+    return lo, max(lo, hi)
+
+
+def slice_bars(
+    df: pd.DataFrame, start: Optional[datetime] = None, end: Optional[datetime] = None
+) -> pd.DataFrame:
+    """Rows with start <= ts <= end; binary search on a sorted index, mask otherwise."""
+    if df.index.is_monotonic_increasing:
+        lo, hi = _bounds(df.index, start, end)
+        return df.iloc[lo:hi]
+    if start is not None:
+        df = df[df.index >= start]
+    if end is not None:
+        df = df[df.index <= end]
+    return df
+
+
+class BarCache:
+    """
+    LRU cache of raw and resampled bar frames with a memory budget.
+
+    Frames returned by minute_bars() / bars() with a period are fresh copies;
+    full frames (no start/end) are shared with the cache and must not be
+    mutated. Thread-safe.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, pd.DataFrame] = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.hits = self.misses = 0
+
+    def read_parquet(self, path: Path | str) -> pd.DataFrame:
+        """Full raw frame of a Parquet file (shared; do not mutate)."""
+        path = Path(path)
+        return self._frame(path.stem, path, _RAW_TIMEFRAME)
+
+    def minute_bars(
+        self,
+        data_dir: Path | str,
+        symbol: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """Raw 1m bars for symbol within [start, end]."""
+        files = partition_files(data_dir, symbol, start, end)
+        df = self._concat(symbol, files, _RAW_TIMEFRAME)
+        if start is None and end is None:
+            return df
+        return slice_bars(df, start, end).copy()
+
+    def bars(
+        self,
+        data_dir: Path | str,
+        symbol: str,
+        timeframe: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """
+        Bars resampled to timeframe for [start, end].
+
+        Identical to resample_ohlcv(minute_bars(..., start, end), timeframe).
+        """
+        files = partition_files(data_dir, symbol, start, end)
+        interval = _pandas_interval(timeframe)
+        minute = self._concat(symbol, files, _RAW_TIMEFRAME)
+        # Partitions split at market-time midnight, which is always a bin
+        # edge, so per-partition resampling concatenates exactly.
+        resampled = self._concat(symbol, files, interval)
+        if start is None and end is None:
+            return resampled
+        if not minute.index.is_monotonic_increasing:
+            return resample_ohlcv(slice_bars(minute, start, end), interval)
+
+        m_index, r_index = minute.index, resampled.index
+        i0, i1 = _bounds(m_index, start, end)
+        if i0 == i1:
+            return resample_ohlcv(minute.iloc[0:0], interval)
+
+        # Resampled bins holding the first and last minute of the period
+        j0 = int(r_index.searchsorted(m_index[i0], side="right")) - 1
+        j1 = int(r_index.searchsorted(m_index[i1 - 1], side="right"))
+        offset = to_offset(interval)
+        head_cut = i0 > 0 and m_index[i0 - 1] >= r_index[j0]
+        tail_cut = i1 < len(minute) and m_index[i1] < r_index[j1 - 1] + offset
+
+        lo, hi = j0, j1
+        head = tail = None
+        if head_cut:
+            head_end = min(int(m_index.searchsorted(r_index[j0] + offset, side="left")), i1)
+            head = resample_ohlcv(minute.iloc[i0:head_end], interval)
+            lo = j0 + 1
+        if tail_cut and j1 - 1 >= lo:
+            tail_start = max(int(m_index.searchsorted(r_index[j1 - 1], side="left")), i0)
+            tail = resample_ohlcv(minute.iloc[tail_start:i1], interval)
+            hi = j1 - 1
+
+        parts = [p for p in (head, resampled.iloc[lo:hi], tail) if p is not None]
+        if len(parts) == 1:
+            return parts[0].copy()
+        return pd.concat(parts)
+
+    def _concat(self, symbol: str, files: list[Path], timeframe: str) -> pd.DataFrame:
+        frames = [self._frame(symbol, path, timeframe) for path in files]
+        return frames[0] if len(frames) == 1 else pd.concat(frames)
+
+    def _frame(self, symbol: str, path: Path, timeframe: str) -> pd.DataFrame:
+        stat = path.stat()
+        key = (symbol, (str(path.resolve()), stat.st_size, stat.st_mtime_ns), timeframe)
+        with self._lock:
+            df = self._entries.get(key)
+            if df is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return df
+            self.misses += 1
+
+        if timeframe == _RAW_TIMEFRAME:
+            df = pd.read_parquet(path)
+        else:
+            df = resample_ohlcv(self._frame(symbol, path, _RAW_TIMEFRAME), timeframe)
+
+        with self._lock:
+            if key not in self._entries:
+                self._store(key, df)
+        return df
+
+    def _store(self, key: tuple, df: pd.DataFrame) -> None:
+        size = int(df.memory_usage(index=True).sum())
+        if size > self.max_bytes:
+            return
+        # Drop entries for older versions of the same file
+        for stale in [k for k in self._entries if k[0] == key[0] and k[1][0] == key[1][0] and k[1] != key[1]]:
+            self._evict(stale)
+        while self._entries and self._nbytes + size > self.max_bytes:
+            self._evict(next(iter(self._entries)))
+        self._entries[key] = df
+        self._nbytes += size
+
+    def _evict(self, key: tuple) -> None:
+        df = self._entries.pop(key)
+        self._nbytes -= int(df.memory_usage(index=True).sum())
+
+
+_bar_cache: Optional[BarCache] = None
+_bar_cache_lock = threading.Lock()
+
+
+def get_bar_cache() -> BarCache:
+    """The process-wide BarCache (budget from BACKTEST__BAR_CACHE_MB)."""
+    global _bar_cache
+    with _bar_cache_lock:
+        if _bar_cache is None:
+            budget_mb = float(os.environ.get("BACKTEST__BAR_CACHE_MB", _DEFAULT_BUDGET_MB))
+            _bar_cache = BarCache(max_bytes=int(budget_mb * 1024 * 1024))
+        return _bar_cache
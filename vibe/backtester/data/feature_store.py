@@ -0,0 +1,269 @@
+"""
+Persistent on-disk store of resampled bars and FeatureEngine features.
+
+Sweeps, walk-forward, robustness and regime research all need the same
+resampled bars and indicator columns (atr_14, atr_pctile, adx_14, slopes).
+FeatureStore computes them once over a symbol's full history and keeps them
+on disk, one file per feature:
+
+    <root>/<SYMBOL>/<timeframe>/bars.parquet
+    <root>/<SYMBOL>/<timeframe>/features/<name>.parquet
+    <root>/<SYMBOL>/<timeframe>/manifest.json
+
+The manifest records the source data hash (source_fingerprint: content hash
+of the symbol's Parquet files), and per feature the code version key
+(feature_version) and how many bars it covers. A request computes only what is missing:
+
+- a feature never computed, or whose code version changed, is computed in full;
+- when the source data only gained bars at the end, stored bars and features
+  are kept and only the new range is computed. The new range is computed
+  with a warm-up of _APPEND_WARMUP of history and accepted only if the
+  overlap reproduces the stored values, otherwise the feature is recomputed
+  in full. Wilder-smoothed features need that long warm-up to converge;
+- any other change to the source data invalidates the entry.
+
+The last stored session is always recomputed on append, since daily
+aggregates of a session change while its bars are still arriving.
+
+Root: BACKTEST__FEATURE_STORE_DIR (default <repo>/data/cache/features, next to
+the trading bot's data cache, so the location does not depend on the
+working directory).
+"""
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from vibe.backtester.analysis.regime_research.features import (
+    _ALL_FEATURES,
+    FeatureEngine,
+    feature_version,
+)
+from vibe.backtester.data.bar_cache import _pandas_interval, get_bar_cache, resample_ohlcv, slice_bars
+from vibe.backtester.data.parquet_dataset import source_fingerprint
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_ROOT = Path(__file__).resolve().parents[3] / "data" / "cache" / "features"
+_APPEND_WARMUP = pd.Timedelta(days=730)
+_VERIFY_BARS = 200
+_VERIFY_RTOL = 1e-9
+
+
+def _write_parquet(df: pd.DataFrame, path: Path) -> None:
+    """Write atomically so concurrent readers never see a partial file."""
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    df.to_parquet(tmp, engine="pyarrow", index=True)
+    os.replace(tmp, path)
+
+
+class FeatureStore:
+    """
+    Disk-backed cache of resampled bars and feature columns.
+
+    Example:
+        ```python
+        store = get_feature_store()
+        features = store.features(data_dir, "QQQ", "5m", ["atr_14", "adx_14"], start, end)
+        ```
+    """
+
+    def __init__(self, root: Path | str) -> None:
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        # (symbol, timeframe) -> (source_hash, bars, {name: Series}) for this process
+        self._loaded: dict[tuple[str, str], tuple[str, pd.DataFrame, dict[str, pd.Series]]] = {}
+
+    def __getstate__(self) -> dict:
+        # Sweeps ship their FeatureStore to worker processes; drop the lock and memo
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_loaded"] = {}
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def bars(
+        self,
+        data_dir: Path | str,
+        symbol: str,
+        timeframe: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """Resampled bars whose bar timestamp lies in [start, end]."""
+        with self._lock:
+            bars, _ = self._sync(Path(data_dir), symbol, timeframe, [])
+        return slice_bars(bars, start, end).copy()
+
+    def features(
+        self,
+        data_dir: Path | str,
+        symbol: str,
+        timeframe: str,
+        names: Sequence[str] | str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """
+        Feature columns (computed over the full history) for bars in [start, end].
+
+        Args:
+            data_dir: Parquet data directory (either layout)
+            symbol: Trading symbol
+            timeframe: Bar timeframe ("5m", "1m", ...)
+            names: Feature names, or "all"
+            start: Optional first bar timestamp
+            end: Optional last bar timestamp
+
+        Returns:
+            DataFrame indexed by bar timestamp with one column per feature.
+        """
+        names = list(_ALL_FEATURES) if names == "all" else list(names)
+        with self._lock:
+            bars, columns = self._sync(Path(data_dir), symbol, timeframe, names)
+        out = pd.DataFrame({name: columns[name] for name in names}, index=bars.index)
+        return slice_bars(out, start, end).copy()
+
+    # ------------------------------------------------------------------
+    # Synchronisation
+    # ------------------------------------------------------------------
+
+    def _sync(
+        self, data_dir: Path, symbol: str, timeframe: str, names: list[str]
+    ) -> tuple[pd.DataFrame, dict[str, pd.Series]]:
+        directory = self.root / symbol / timeframe
+        source_hash = source_fingerprint(data_dir, symbol)
+
+        loaded = self._loaded.get((symbol, timeframe))
+        if loaded is not None and loaded[0] == source_hash:
+            _, bars, columns = loaded
+            manifest = self._read_manifest(directory)
+            valid = {name: entry["rows"] for name, entry in manifest["features"].items()}
+        else:
+            bars, manifest, valid = self._sync_bars(directory, data_dir, symbol, timeframe, source_hash)
+            columns = {}
+
+        changed = False
+        for name in names:
+            version = feature_version(name)
+            entry = manifest["features"].get(name)
+            if name in columns and entry and entry["version"] == version:
+                continue
+            stored = self._read_feature(directory, name) if entry and entry["version"] == version else None
+            good_rows = min(valid.get(name, 0), len(stored)) if stored is not None else 0
+            if stored is None or good_rows < len(bars):
+                columns[name] = self._compute(bars, name, stored, good_rows)
+                _write_parquet(columns[name].to_frame(), directory / "features" / f"{name}.parquet")
+                manifest["features"][name] = {"version": version, "rows": len(bars)}
+                changed = True
+            else:
+                columns[name] = stored
+        if changed:
+            self._write_manifest(directory, manifest)
+
+        self._loaded[(symbol, timeframe)] = (source_hash, bars, columns)
+        return bars, columns
+
+    def _sync_bars(
+        self, directory: Path, data_dir: Path, symbol: str, timeframe: str, source_hash: str
+    ) -> tuple[pd.DataFrame, dict, dict[str, int]]:
+        """Bring bars.parquet up to date; returns (bars, manifest, valid feature rows)."""
+        manifest = self._read_manifest(directory)
+        bars_path = directory / "bars.parquet"
+        stored = pd.read_parquet(bars_path) if bars_path.exists() else None
+
+        if stored is not None and manifest.get("source_hash") == source_hash:
+            valid = {name: entry["rows"] for name, entry in manifest["features"].items()}
+            return stored, manifest, valid
+
+        minute = get_bar_cache().minute_bars(data_dir, symbol)
+        bars = resample_ohlcv(minute, _pandas_interval(timeframe))
+
+        keep = 0
+        if stored is not None and len(stored):
+            # Everything before the last stored session must be unchanged
+            keep = int(stored.index.searchsorted(stored.index[-1].normalize()))
+            if len(bars) < keep or not bars.iloc[:keep].equals(stored.iloc[:keep]):
+                keep = 0
+        if keep:
+            logger.info(f"Feature store: {symbol} {timeframe} source appended; keeping {keep} bars")
+            valid = {name: min(entry["rows"], keep) for name, entry in manifest["features"].items()}
+        else:
+            logger.info(f"Feature store: building {symbol} {timeframe} from source")
+            manifest["features"] = {}
+            valid = {}
+
+        (directory / "features").mkdir(parents=True, exist_ok=True)
+        _write_parquet(bars, bars_path)
+        manifest["source_hash"] = source_hash
+        for name, rows in valid.items():
+            manifest["features"][name]["rows"] = rows
+        self._write_manifest(directory, manifest)
+        return bars, manifest, valid
+
+    def _compute(
+        self, bars: pd.DataFrame, name: str, stored: Optional[pd.Series], good_rows: int
+    ) -> pd.Series:
+        """Compute name over bars, reusing the first good_rows stored values when safe."""
+        engine = FeatureEngine()
+        if stored is None or good_rows == 0:
+            return engine.compute(bars, [name])[name]
+
+        warm = int(bars.index.searchsorted(bars.index[good_rows] - _APPEND_WARMUP))
+        tail = engine.compute(bars.iloc[warm:], [name])[name]
+
+        check_from = max(warm, good_rows - _VERIFY_BARS)
+        recomputed = tail.iloc[check_from - warm:good_rows - warm].to_numpy(dtype=float)
+        expected = stored.iloc[check_from:good_rows].to_numpy(dtype=float)
+        if not np.allclose(recomputed, expected, rtol=_VERIFY_RTOL, atol=0.0, equal_nan=True):
+            logger.info(f"Feature store: {name} did not converge within warm-up; recomputing in full")
+            return engine.compute(bars, [name])[name]
+
+        return pd.concat([stored.iloc[:good_rows], tail.iloc[good_rows - warm:]]).rename(name)
+
+    # ------------------------------------------------------------------
+    # Files
+    # ------------------------------------------------------------------
+
+    def _read_feature(self, directory: Path, name: str) -> Optional[pd.Series]:
+        path = directory / "features" / f"{name}.parquet"
+        if not path.exists():
+            return None
+        return pd.read_parquet(path)[name]
+
+    def _read_manifest(self, directory: Path) -> dict:
+        path = directory / "manifest.json"
+        if path.exists():
+            with open(path) as f:
+                return json.load(f)
+        return {"source_hash": None, "features": {}}
+
+    def _write_manifest(self, directory: Path, manifest: dict) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp = directory / f"manifest.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp, directory / "manifest.json")
+
+
+_feature_store: Optional[FeatureStore] = None
+_feature_store_lock = threading.Lock()
+
+
+def get_feature_store() -> FeatureStore:
+    """The process-wide FeatureStore rooted at BACKTEST__FEATURE_STORE_DIR."""
+    global _feature_store
+    with _feature_store_lock:
+        if _feature_store is None:
+            _feature_store = FeatureStore(os.environ.get("BACKTEST__FEATURE_STORE_DIR", _DEFAULT_ROOT))
+            logger.info(f"Feature store: using {_feature_store.root}")
+        return _feature_store
@@ -0,0 +1,204 @@
+"""
+On-disk layouts for 1-minute bar Parquet data.
+
+Two layouts are supported side by side in the same data directory:
+
+    <data_dir>/<SYMBOL>.parquet                                  single file (legacy)
+    <data_dir>/<SYMBOL>/year=YYYY/month=MM[/day=DD]/data.parquet  partitioned
+
+Partitions follow market-time (America/New_York) calendar boundaries and are
+written with roughly weekly row groups and column statistics, so a read can
+skip whole partitions by their directory keys and whole row groups by their
+ts_event min/max. When both layouts exist for a symbol, the partitioned
+dataset wins.
+"""
+import hashlib
+import shutil
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Sequence
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+MARKET_TZ = ZoneInfo("America/New_York")
+PARTITION_GRANULARITIES = ("month", "day")
+PARTITION_FILE = "data.parquet"
+
+# ~1 week of regular-session minute bars per row group
+_ROW_GROUP_ROWS = 390 * 5
+
+# (resolved path, size, mtime_ns) -> sha256 of the file contents
+_file_digests: dict[tuple, str] = {}
+_file_digests_lock = threading.Lock()
+
+
+def _market_time(ts: datetime) -> pd.Timestamp:
+    ts = pd.Timestamp(ts)
+    return ts.tz_localize(MARKET_TZ) if ts.tzinfo is None else ts
+
+
+def _partition_span(path: Path) -> Optional[tuple[pd.Timestamp, pd.Timestamp]]:
+    """[start, end) market-time span encoded by a partition file's hive keys."""
+    keys = dict(part.split("=", 1) for part in path.parent.parts if "=" in part)
+    if "year" not in keys:
+        return None
+    year = int(keys["year"])
+    if "month" not in keys:
+        start = pd.Timestamp(year, 1, 1, tz=MARKET_TZ)
+        return start, start + pd.DateOffset(years=1)
+    month = int(keys["month"])
+    if "day" not in keys:
+        start = pd.Timestamp(year, month, 1, tz=MARKET_TZ)
+        return start, start + pd.DateOffset(months=1)
+    start = pd.Timestamp(year, month, int(keys["day"]), tz=MARKET_TZ)
+    return start, start + pd.DateOffset(days=1)
+
+
+def is_partitioned(data_dir: Path | str, symbol: str) -> bool:
+    return (Path(data_dir) / symbol).is_dir()
+
+
+def partition_files(
+    data_dir: Path | str,
+    symbol: str,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+) -> list[Path]:
+    """
+    Parquet files holding symbol's bars within [start_time, end_time].
+
+    Partitions are pruned by their directory keys. The single-file layout
+    always yields its one file. If no partition overlaps, the first one is
+    returned so callers still get an (empty after slicing) frame with the
+    right schema.
+    """
+    data_dir = Path(data_dir)
+    if not is_partitioned(data_dir, symbol):
+        return [data_dir / f"{symbol}.parquet"]
+
+    files = sorted((data_dir / symbol).glob(f"year=*/**/{PARTITION_FILE}"))
+    if not files:
+        raise FileNotFoundError(f"Partitioned dataset {data_dir / symbol} has no {PARTITION_FILE} files")
+
+    start = _market_time(start_time) if start_time is not None else None
+    end = _market_time(end_time) if end_time is not None else None
+    selected = []
+    for path in files:
+        span = _partition_span(path)
+        if span is None:
+            selected.append(path)
+            continue
+        span_start, span_end = span
+        if (start is None or span_end > start) and (end is None or span_start <= end):
+            selected.append(path)
+    return selected or files[:1]
+
+
+def _file_digest(path: Path) -> str:
+    stat = path.stat()
+    key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+    with _file_digests_lock:
+        digest = _file_digests.get(key)
+    if digest is None:
+        file_hash = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                file_hash.update(chunk)
+        digest = file_hash.hexdigest()
+        with _file_digests_lock:
+            _file_digests[key] = digest
+    return digest
+
+
+def source_fingerprint(data_dir: Path | str, symbol: str) -> str:
+    """
+    Content hash of all of symbol's source Parquet files (either layout).
+
+    Changes whenever the data is re-converted or appended to, but not when
+    files are merely touched. File hashes are memoised per process by
+    (path, size, mtime), so repeated calls only stat the files.
+    """
+    data_dir = Path(data_dir)
+    digest = hashlib.sha256()
+    for path in partition_files(data_dir, symbol):
+        digest.update(path.relative_to(data_dir).as_posix().encode())
+        digest.update(_file_digest(path).encode())
+    return digest.hexdigest()
+
+
+def read_bars(
+    data_dir: Path | str,
+    symbol: str,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+    columns: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """
+    Read symbol's bars within [start_time, end_time] with predicate pushdown.
+
+    Works for both layouts: partitions outside the window are never opened,
+    row groups are skipped via ts_event statistics, and only the requested
+    columns (plus the index) are decoded.
+    """
+    files = partition_files(data_dir, symbol, start_time, end_time)
+    dataset = ds.dataset([str(f) for f in files], format="parquet")
+
+    index_columns = (dataset.schema.pandas_metadata or {}).get("index_columns", [])
+    index_name = next((c for c in index_columns if isinstance(c, str)), "ts_event")
+
+    expression = None
+    if start_time is not None:
+        expression = ds.field(index_name) >= pa.scalar(_market_time(start_time).to_pydatetime())
+    if end_time is not None:
+        upper = ds.field(index_name) <= pa.scalar(_market_time(end_time).to_pydatetime())
+        expression = upper if expression is None else expression & upper
+
+    projection = None if columns is None else [index_name, *columns]
+    df = dataset.to_table(filter=expression, columns=projection).to_pandas()
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index(kind="stable")
+    return df
+
+
+def write_partitioned(
+    df: pd.DataFrame,
+    data_dir: Path | str,
+    symbol: str,
+    granularity: str = "month",
+) -> list[Path]:
+    """
+    Write 1m bars as a year/month (or year/month/day) partitioned dataset.
+
+    Any existing dataset for symbol is replaced. Returns the written files.
+    """
+    if granularity not in PARTITION_GRANULARITIES:
+        raise ValueError(f"granularity must be one of {PARTITION_GRANULARITIES}, got {granularity!r}")
+
+    root = Path(data_dir) / symbol
+    if root.exists():
+        shutil.rmtree(root)
+
+    local = df.index.tz_convert(MARKET_TZ) if df.index.tz is not None else df.index
+    keys = [local.year, local.month] + ([local.day] if granularity == "day" else [])
+
+    written = []
+    for values, part in df.groupby(keys, sort=True):
+        directory = root / f"year={values[0]}" / f"month={values[1]:02d}"
+        if granularity == "day":
+            directory = directory / f"day={values[2]:02d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / PARTITION_FILE
+        part.to_parquet(
+            path,
+            engine="pyarrow",
+            compression="snappy",
+            index=True,
+            row_group_size=_ROW_GROUP_ROWS,
+            write_statistics=True,
+        )
+        written.append(path)
+    return written
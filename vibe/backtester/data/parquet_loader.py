@@ -4,6 +4,8 @@ from typing import Optional
 
 import pandas as pd
 
+from vibe.backtester.data.bar_cache import get_bar_cache, slice_bars
+from vibe.backtester.data.parquet_dataset import read_bars
 from vibe.common.data.base import DataProvider
 from vibe.common.models.bar import Bar
 
@@ -12,18 +14,46 @@ class ParquetLoader(DataProvider):
     """
     Implements DataProvider for backtesting against local Parquet files.
 
-    All symbols are loaded into memory at init (eager load). Subsequent
-    get_bars / get_current_price / get_bar calls are pure in-memory slices.
+    All symbols are loaded into memory at init (eager load) through the
+    process-wide BarCache, so repeated loaders over the same files share one
+    copy. Subsequent get_bars / get_current_price / get_bar calls are pure
+    in-memory slices (binary search on the sorted index).
 
-    Parquet files are produced by scripts/convert_databento.py.
-    Path configured via BACKTEST__DATA_DIR in .env.
+    Given start_time / end_time and/or columns, only that window and those
+    columns are read, bypassing the cache: partitions outside the window are
+    skipped and row groups are filtered by pyarrow predicate pushdown. This
+    keeps load time and RSS proportional to the window for short runs.
+
+    Parquet data is produced by scripts/convert_databento.py, either as
+    <SYMBOL>.parquet or as a partitioned <SYMBOL>/year=YYYY/month=MM/ dataset
+    (see parquet_dataset). Path configured via BACKTEST__DATA_DIR in .env.
     """
 
-    def __init__(self, data_dir: Path, symbols: list[str]) -> None:
-        self._data: dict[str, pd.DataFrame] = {
-            sym: pd.read_parquet(data_dir / f"{sym}.parquet")
-            for sym in symbols
-        }
+    def __init__(
+        self,
+        data_dir: Path,
+        symbols: list[str],
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        columns: Optional[list[str]] = None,
+    ) -> None:
+        if start_time is None and end_time is None and columns is None:
+            self._data: dict[str, pd.DataFrame] = {
+                sym: get_bar_cache().minute_bars(data_dir, sym)
+                for sym in symbols
+            }
+        else:
+            self._data = {
+                sym: read_bars(data_dir, sym, start_time, end_time, columns)
+                for sym in symbols
+            }
+
+    @classmethod
+    def from_frames(cls, frames: dict[str, pd.DataFrame]) -> "ParquetLoader":
+        """Build a loader over already-loaded 1m frames (e.g. shared with a worker process)."""
+        loader = cls.__new__(cls)
+        loader._data = dict(frames)
+        return loader
 
     async def get_bars(
         self,
@@ -33,11 +63,7 @@ class ParquetLoader(DataProvider):
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
     ) -> pd.DataFrame:
-        df = self._data[symbol]
-        if start_time is not None:
-            df = df[df.index >= start_time]
-        if end_time is not None:
-            df = df[df.index <= end_time]
+        df = slice_bars(self._data[symbol], start_time, end_time).copy()
         if limit is not None:
             df = df.tail(limit)
         return df
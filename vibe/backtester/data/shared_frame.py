@@ -0,0 +1,71 @@
+"""
+Zero-copy DataFrame sharing between processes via memory-mapped .npy files.
+
+share_frame() writes each column (and the DatetimeIndex) of a numeric frame
+to its own .npy file and returns a small, picklable SharedFrame handle.
+Worker processes call handle.load() to rebuild the frame on top of read-only
+memory maps, so the data is paged in from the OS page cache instead of being
+pickled into every task.
+"""
+from dataclasses import dataclass
+from datetime import tzinfo
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class SharedFrame:
+    """Picklable handle to a frame written by share_frame()."""
+    directory: Path
+    columns: tuple[str, ...]
+    index_name: Optional[str]
+    tz: Optional[tzinfo]
+
+    def _path(self, position: int) -> Path:
+        return self.directory / f"col_{position}.npy"
+
+    def load(self) -> pd.DataFrame:
+        """Rebuild the DataFrame on read-only memory maps (no copy)."""
+        index_values = np.load(self.directory / "index.npy", mmap_mode="r")
+        index = pd.DatetimeIndex(index_values, name=self.index_name)
+        if self.tz is not None:
+            index = index.tz_localize("UTC").tz_convert(self.tz)
+        data = {
+            name: np.load(self._path(i), mmap_mode="r")
+            for i, name in enumerate(self.columns)
+        }
+        return pd.DataFrame(data, index=index, columns=list(self.columns), copy=False)
+
+
+def share_frame(df: pd.DataFrame, directory: Path | str) -> SharedFrame:
+    """
+    Write a DatetimeIndex-ed numeric DataFrame to memory-mappable files.
+
+    Args:
+        df: Frame to share (numeric or bool columns only)
+        directory: Empty or new directory to write into
+
+    Returns:
+        SharedFrame handle; pass it to worker processes and call load() there.
+    """
+    if not isinstance(df.index, pd.DatetimeIndex):
+        raise TypeError("share_frame requires a DatetimeIndex")
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    tz = df.index.tz
+    index = df.index.tz_convert("UTC").tz_localize(None) if tz is not None else df.index
+    np.save(directory / "index.npy", index.to_numpy())
+
+    columns = tuple(str(c) for c in df.columns)
+    for i, name in enumerate(df.columns):
+        values = df[name].to_numpy()
+        if values.dtype.kind not in "biuf":
+            raise TypeError(f"Column {name!r} has non-numeric dtype {values.dtype}")
+        np.save(directory / f"col_{i}.npy", values)
+
+    return SharedFrame(directory=directory, columns=columns, index_name=df.index.name, tz=tz)
@@ -0,0 +1,103 @@
+"""
+Process pools whose workers map one symbol's bars and features once.
+
+SharedBars writes the minute bars and the pre-computed features to
+memory-mapped files (share_frame) and starts pools whose initializer loads
+them into worker_state, next to whatever per-run state the caller passes.
+Tasks then only carry what differs between them (a combination, a window).
+
+    with SharedBars(symbol, minute_bars, features) as shared:
+        with shared.pool(workers, sweep=sweep) as pool:
+            ...
+
+In a task, worker_state["loader"] is a ParquetLoader over the shared minute
+bars and worker_state["features"] the shared features (or None). The files
+are removed when the with block exits, so pools restarted inside it reuse them.
+"""
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from vibe.backtester.data.parquet_loader import ParquetLoader
+from vibe.backtester.data.shared_frame import SharedFrame, share_frame
+
+# Per-process state installed by _init_worker (one copy per pool worker).
+worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(
+    symbol: str,
+    minute_bars: SharedFrame,
+    features: Optional[SharedFrame],
+    state: Dict[str, Any],
+) -> None:
+    """Pool initializer: map the shared frames once per worker process."""
+    worker_state.update(
+        state,
+        symbol=symbol,
+        loader=ParquetLoader.from_frames({symbol: minute_bars.load()}),
+        features=features.load() if features is not None else None,
+    )
+
+
+class SharedBars:
+    """
+    A symbol's minute bars and features shared with pool workers.
+
+    Args:
+        symbol: Trading symbol the bars belong to
+        minute_bars: 1-minute OHLCV frame covering every task
+        features: Pre-computed features (optional)
+        prefix: Prefix of the temporary directory holding the files
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        minute_bars: pd.DataFrame,
+        features: Optional[pd.DataFrame] = None,
+        prefix: str = "shared_bars_",
+    ) -> None:
+        self.symbol = symbol
+        self._minute_bars = minute_bars
+        self._features = features
+        self._prefix = prefix
+        self._directory: Optional[Path] = None
+        self._initargs: Optional[tuple] = None
+
+    def __enter__(self) -> "SharedBars":
+        self._directory = Path(tempfile.mkdtemp(prefix=self._prefix))
+        try:
+            self._initargs = (
+                self.symbol,
+                share_frame(self._minute_bars, self._directory / "minute_bars"),
+                share_frame(self._features, self._directory / "features")
+                if self._features is not None else None,
+            )
+        except Exception:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            raise
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        shutil.rmtree(self._directory, ignore_errors=True)
+        self._directory = self._initargs = None
+
+    def pool(self, max_workers: int, **state: Any) -> ProcessPoolExecutor:
+        """
+        A process pool whose workers see the shared frames and state.
+
+        Raises:
+            RuntimeError: If called outside the with block
+        """
+        if self._initargs is None:
+            raise RuntimeError("SharedBars.pool() requires an active with block")
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(*self._initargs, state),
+        )
@@ -0,0 +1,100 @@
+"""
+Synthetic 1-minute OHLCV bars for engine parity tests and benchmarks.
+
+Produces frames in the same shape scripts/convert_databento.py writes:
+a tz-aware America/New_York DatetimeIndex covering 09:30-15:59 on weekdays,
+with float open/high/low/close/volume columns. Each session opens with a
+random gap and trends in a random direction so opening-range breakouts,
+stops, targets and EOD exits all occur in a few weeks of data.
+"""
+
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from vibe.backtester.data.parquet_dataset import write_partitioned
+
+MARKET_TZ = "America/New_York"
+_MINUTES_PER_SESSION = 390  # 09:30-15:59 inclusive
+
+
+def generate_minute_bars(
+    start: str = "2024-01-02",
+    days: int = 20,
+    base_price: float = 400.0,
+    seed: int = 7,
+) -> pd.DataFrame:
+    """
+    Generate `days` weekday sessions of 1-minute bars starting at `start`.
+
+    Deterministic for a given seed.
+    """
+    rng = np.random.default_rng(seed)
+    sessions = pd.bdate_range(start=start, periods=days)
+
+    frames = []
+    price = base_price
+    for session in sessions:
+        open_ts = pd.Timestamp(session.date()).tz_localize(MARKET_TZ) + pd.Timedelta(hours=9, minutes=30)
+        index = pd.date_range(open_ts, periods=_MINUTES_PER_SESSION, freq="1min")
+
+        price *= 1.0 + rng.normal(0.0, 0.004)
+        drift = rng.choice([-1.0, 1.0]) * rng.uniform(0.0, 0.0004)
+        returns = rng.normal(drift, 0.0012, size=_MINUTES_PER_SESSION)
+        close = price * np.cumprod(1.0 + returns)
+        open_ = np.empty_like(close)
+        open_[0] = price
+        open_[1:] = close[:-1]
+        wick = np.abs(rng.normal(0.0, 0.0006, size=(2, _MINUTES_PER_SESSION))) * close
+        high = np.maximum(open_, close) + wick[0]
+        low = np.minimum(open_, close) - wick[1]
+        volume = rng.integers(20_000, 200_000, size=_MINUTES_PER_SESSION).astype(float)
+
+        frames.append(pd.DataFrame(
+            {
+                "open": open_.round(2),
+                "high": high.round(2),
+                "low": low.round(2),
+                "close": close.round(2),
+                "volume": volume,
+            },
+            index=index,
+        ))
+        price = float(close[-1])
+
+    df = pd.concat(frames)
+    # Rounding can push open/close a cent outside the wick; restore OHLC invariants.
+    df["high"] = df[["open", "high", "close"]].max(axis=1)
+    df["low"] = df[["open", "low", "close"]].min(axis=1)
+    df.index.name = "ts_event"
+    return df
+
+
+def write_synthetic_parquet(
+    data_dir: Path,
+    symbol: str = "QQQ",
+    start: str = "2024-01-02",
+    days: int = 20,
+    base_price: float = 400.0,
+    seed: int = 7,
+    df: Optional[pd.DataFrame] = None,
+    partition: Optional[str] = None,
+) -> Path:
+    """
+    Write synthetic bars to `<data_dir>/<symbol>.parquet` and return the path.
+
+    With partition="month" or "day" a partitioned `<data_dir>/<symbol>/`
+    dataset is written instead and its directory returned.
+    """
+    if df is None:
+        df = generate_minute_bars(start=start, days=days, base_price=base_price, seed=seed)
+    data_dir = Path(data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    if partition is not None:
+        write_partitioned(df, data_dir, symbol, granularity=partition)
+        return data_dir / symbol
+    path = data_dir / f"{symbol}.parquet"
+    df.to_parquet(path, engine="pyarrow", compression="snappy", index=True)
+    return path
@@ -1,5 +1,6 @@
 """Optimization framework for trading strategies."""
 
+from vibe.backtester.optimization.adaptive import BudgetLevel, SuccessiveHalving
 from vibe.backtester.optimization.pipeline import OptimizationPipeline, OptimizationResult
 
-__all__ = ["OptimizationPipeline", "OptimizationResult"]
+__all__ = ["BudgetLevel", "OptimizationPipeline", "OptimizationResult", "SuccessiveHalving"]
@@ -0,0 +1,253 @@
+"""
+Adaptive parameter search: successive halving over history budgets.
+
+An exhaustive sweep backtests every combination over the full period even
+though most of them are obviously poor after a year of data. Successive
+halving treats the length of history as the budget: every candidate is
+scored on a short, recent span, the top 1/eta are promoted to a span eta
+times longer, and so on until the last few survivors are scored on the full
+period. With 27 candidates and eta=3 that is 27 short + 9 medium + 3
+full-history backtests instead of 27 full-history ones.
+
+Spans are nested and all end at end_date, so every level re-scores the
+survivors on the data the previous level saw plus older history. Scores are
+only ever compared within a level (same span), never across levels.
+
+An optional TPE stage (refine_tpe, requires optuna) then searches the
+continuous parameters around the halving winner on the full period.
+"""
+import logging
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from vibe.backtester.analysis.parameter_sweep import ParameterSweep, SweepResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BudgetLevel:
+    """
+    One evaluated budget level of an adaptive search.
+
+    results is the ranked sweep DataFrame for the level's span; promoted
+    holds the parameter dicts carried to the next level (empty for the last).
+    """
+    level: int
+    start_date: datetime
+    end_date: datetime
+    results: pd.DataFrame
+    promoted: List[Dict[str, Any]] = field(default_factory=list)
+    name: str = "halving"
+
+    @property
+    def n_evaluated(self) -> int:
+        return len(self.results)
+
+    @property
+    def span_days(self) -> int:
+        return (self.end_date - self.start_date).days
+
+
+@dataclass
+class SuccessiveHalving:
+    """
+    Budget schedule for successive halving.
+
+    Args:
+        eta: Reduction factor; each level keeps the top 1/eta of candidates
+            and evaluates them on a span eta times longer
+        min_span_days: Shortest span (calendar days) any level may use
+    """
+    eta: int = 3
+    min_span_days: int = 365
+
+    def __post_init__(self):
+        if self.eta < 2:
+            raise ValueError(f"eta must be >= 2, got {self.eta}")
+        if self.min_span_days < 1:
+            raise ValueError(f"min_span_days must be >= 1, got {self.min_span_days}")
+
+    def n_reductions(self, total_days: int, n_candidates: int) -> int:
+        """
+        Number of promotion steps for this period and candidate count.
+
+        Stops before the first level would be shorter than min_span_days, or
+        before fewer than eta candidates would reach the full period.
+        """
+        r = 0
+        while (
+            total_days / self.eta ** (r + 1) >= self.min_span_days
+            and math.ceil(n_candidates / self.eta ** (r + 1)) >= self.eta
+        ):
+            r += 1
+        return r
+
+    def spans(
+        self, start_date: datetime, end_date: datetime, n_candidates: int
+    ) -> List[Tuple[datetime, datetime]]:
+        """(start, end) of every level, shortest first; the last is the full period."""
+        total_days = (end_date - start_date).days
+        r = self.n_reductions(total_days, n_candidates)
+        spans = [
+            (end_date - timedelta(days=round(total_days / self.eta ** (r - k))), end_date)
+            for k in range(r)
+        ]
+        spans.append((start_date, end_date))
+        return spans
+
+    def n_survivors(self, n_candidates: int) -> int:
+        """Candidates promoted out of a level that evaluated n_candidates."""
+        return max(1, math.ceil(n_candidates / self.eta))
+
+
+def _ranked(results: List[SweepResult]) -> List[SweepResult]:
+    # Stable: ties keep generation order, as in an exhaustive sweep
+    return sorted(results, key=lambda r: r.summary["composite_score"], reverse=True)
+
+
+def successive_halving(
+    sweep: ParameterSweep,
+    symbol: str,
+    start_date: datetime,
+    end_date: datetime,
+    schedule: Optional[SuccessiveHalving] = None,
+    cache_dir: Optional[Path] = None,
+    workers: int = 1,
+    collect_outcomes: bool = False,
+    level_callback: Optional[Callable[[BudgetLevel], None]] = None,
+) -> List[BudgetLevel]:
+    """
+    Run sweep's combinations through successive halving.
+
+    Args:
+        sweep: ParameterSweep providing the candidate combinations
+        symbol: Symbol to backtest
+        start_date: Start of the full period
+        end_date: End of the full period (every span ends here)
+        schedule: Budget schedule (default SuccessiveHalving())
+        cache_dir: Optional result cache directory (keys include each span)
+        workers: Worker processes per level
+        collect_outcomes: Build sweep.outcomes for the final (full-period) level
+        level_callback: Optional callback(BudgetLevel) after each level
+
+    Returns:
+        Evaluated levels, shortest span first; the last covers the full period
+    """
+    schedule = schedule or SuccessiveHalving()
+    candidates = sweep._generate_combinations()
+    spans = schedule.spans(start_date, end_date, len(candidates))
+
+    levels = []
+    for k, (level_start, level_end) in enumerate(spans):
+        is_final = k == len(spans) - 1
+        logger.info(
+            f"Budget level {k + 1}/{len(spans)}: {len(candidates)} candidates on "
+            f"{level_start.date()} to {level_end.date()}"
+        )
+        evaluated: List[SweepResult] = []
+        results = sweep.run(
+            symbol=symbol,
+            start_date=level_start,
+            end_date=level_end,
+            cache_dir=cache_dir,
+            workers=workers,
+            result_callback=evaluated.append,
+            collect_outcomes=collect_outcomes and is_final,
+            combinations=candidates,
+        )
+        promoted = []
+        if not is_final:
+            promoted = [r.params for r in _ranked(evaluated)[:schedule.n_survivors(len(evaluated))]]
+        level = BudgetLevel(
+            level=k, start_date=level_start, end_date=level_end, results=results, promoted=promoted
+        )
+        levels.append(level)
+        if level_callback:
+            level_callback(level)
+        candidates = promoted
+
+    n_full = levels[-1].n_evaluated
+    n_total = levels[0].n_evaluated
+    logger.info(
+        f"Successive halving: {n_full} full-period backtests instead of {n_total} "
+        f"({sum(level.n_evaluated for level in levels)} backtests over {len(levels)} levels)"
+    )
+    return levels
+
+
+def continuous_parameters(sweep: ParameterSweep) -> Dict[str, Tuple[float, float]]:
+    """Search bounds of parameters with float values (name -> (low, high))."""
+    bounds = {}
+    for param in sweep.parameters:
+        values = param.values
+        if any(isinstance(v, float) for v in values) and all(
+            isinstance(v, (int, float)) and not isinstance(v, bool) for v in values
+        ):
+            bounds[param.name] = (float(min(values)), float(max(values)))
+    return bounds
+
+
+def refine_tpe(
+    sweep: ParameterSweep,
+    best_params: Dict[str, Any],
+    symbol: str,
+    start_date: datetime,
+    end_date: datetime,
+    n_trials: int,
+    level: int,
+    seed: int = 0,
+    cache_dir: Optional[Path] = None,
+) -> Optional[BudgetLevel]:
+    """
+    Tree-structured Parzen estimator search over the continuous parameters.
+
+    Discrete parameters stay at best_params; each trial is one full-period
+    backtest. The first trial re-uses best_params so the stage can only
+    confirm or improve on the halving winner. Returns None when no parameter
+    has float values.
+    """
+    bounds = continuous_parameters(sweep)
+    if not bounds:
+        logger.info("No continuous parameters: skipping TPE stage")
+        return None
+
+    try:
+        import optuna
+    except ImportError as exc:
+        raise ImportError("optuna is required for the TPE refinement stage") from exc
+
+    evaluated: List[SweepResult] = []
+
+    def objective(trial) -> float:
+        params = dict(best_params)
+        for name, (low, high) in bounds.items():
+            params[name] = trial.suggest_float(name, low, high)
+        before = len(evaluated)
+        sweep.run(
+            symbol=symbol,
+            start_date=start_date,
+            end_date=end_date,
+            cache_dir=cache_dir,
+            result_callback=evaluated.append,
+            combinations=[params],
+        )
+        if len(evaluated) == before:
+            return float("-inf")
+        return evaluated[-1].summary["composite_score"]
+
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    study = optuna.create_study(direction="maximize", sampler=optuna.samplers.TPESampler(seed=seed))
+    study.enqueue_trial({name: float(best_params[name]) for name in bounds})
+    study.optimize(objective, n_trials=n_trials)
+
+    results = pd.DataFrame([r.to_dict() for r in _ranked(evaluated)])
+    logger.info(f"TPE stage: best score {study.best_value:.3f} after {n_trials} trials")
+    return BudgetLevel(
+        level=level, start_date=start_date, end_date=end_date, results=results, name="tpe"
+    )
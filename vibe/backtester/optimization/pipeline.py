@@ -3,11 +3,14 @@ Unified optimization pipeline for trading strategies.
 
 Integrates all optimization components:
 - Parameter sweeping with pre-computed indicators
+- Adaptive search (successive halving over history budgets, optional TPE)
 - Composite scoring with tail risk metrics
 - Robustness analysis (noise injection)
 - Walk-forward validation
 - Surface analysis (cliff/plateau detection)
+- Monte Carlo resampling of the best candidate's trades
 """
+import json
 import logging
 import yaml
 from dataclasses import dataclass
@@ -20,8 +23,17 @@ import pandas as pd
 from vibe.backtester.analysis.parameter_sweep import ParameterSweep, ParameterDefinition
 from vibe.backtester.analysis.robustness import RobustnessAnalyzer, RobustnessAnalysis
 from vibe.backtester.analysis.walk_forward import WalkForwardEngine, WalkForwardAnalysis
-from vibe.backtester.analysis.surface import SurfaceAnalyzer, ParameterSurface
+from vibe.backtester.analysis.surface import NDParameterSurface, SurfaceAnalyzer, ParameterSurface
+from vibe.backtester.analysis.monte_carlo import MonteCarloAnalyzer, MonteCarloAnalysis
 from vibe.backtester.analysis.scoring import rank_results
+from vibe.backtester.core.engine import BacktestEngine
+from vibe.backtester.data.feature_store import FeatureStore
+from vibe.backtester.optimization.adaptive import (
+    BudgetLevel,
+    SuccessiveHalving,
+    refine_tpe,
+    successive_halving,
+)
 from vibe.common.ruleset.models import StrategyRuleSet
 from vibe.research_journal.registry import ResearchRegistry
 
@@ -39,6 +51,8 @@ class OptimizationResult:
     - Robustness analysis
     - Walk-forward analysis
     - Surface analysis (for 2D parameter pairs)
+    - Budget levels (adaptive search only)
+    - Monte Carlo trade-sequence distributions
     """
     sweep_results: pd.DataFrame
     best_params: Dict[str, Any]
@@ -47,7 +61,9 @@ class OptimizationResult:
     
     robustness_analysis: Optional[RobustnessAnalysis] = None
     walk_forward_analysis: Optional[WalkForwardAnalysis] = None
-    surface_analysis: Optional[Dict[str, ParameterSurface]] = None
+    surface_analysis: Optional[Dict[str, ParameterSurface | NDParameterSurface]] = None
+    search_levels: Optional[List[BudgetLevel]] = None
+    monte_carlo_analysis: Optional[MonteCarloAnalysis] = None
     
     def summary(self) -> str:
         """Generate human-readable summary."""
@@ -64,6 +80,14 @@ class OptimizationResult:
         
         lines.append(f"\nComposite Score: {self.best_score:.3f}")
         
+        if self.search_levels:
+            lines.append(f"\nAdaptive Search:")
+            for level in self.search_levels:
+                lines.append(
+                    f"  {level.name} {level.level + 1}: {level.n_evaluated} candidates, "
+                    f"{level.start_date.date()} to {level.end_date.date()}"
+                )
+        
         if self.robustness_analysis:
             lines.append(f"\nRobustness Score: {self.robustness_analysis.robustness_score:.3f}")
             lines.append(f"  Expectancy Std: ±{self.robustness_analysis.expectancy_std:.3f}R")
@@ -72,6 +96,9 @@ class OptimizationResult:
             lines.append(f"\nWalk-Forward Score: {self.walk_forward_analysis.walk_forward_score:.3f}")
             lines.append(f"  Avg Test Expectancy: {self.walk_forward_analysis.avg_test_expectancy:.3f}R")
             lines.append(f"  Avg Degradation: {self.walk_forward_analysis.avg_degradation:.1%}")
+            if self.walk_forward_analysis.oos_metrics:
+                oos = self.walk_forward_analysis.oos_metrics
+                lines.append(f"  Re-optimized OOS: {oos.n_trades} trades, {oos.expectancy_r:.3f}R")
         
         if self.surface_analysis:
             lines.append(f"\nSurface Analysis:")
@@ -81,6 +108,19 @@ class OptimizationResult:
                 plateaus = surface.detect_plateaus()
                 lines.append(f"    Cliffs detected: {len(cliffs)}")
                 lines.append(f"    Plateaus detected: {len(plateaus)}")
+                if isinstance(surface, NDParameterSurface):
+                    lines.append(f"    Robust optimum: {surface.robust_optimum().get('params')}")
+        
+        if self.monte_carlo_analysis:
+            mc = self.monte_carlo_analysis
+            lines.append(f"\nMonte Carlo ({mc.n_paths} paths, seed {mc.seed}):")
+            for method, dist in mc.distributions.items():
+                pct = dist.percentiles()
+                lines.append(
+                    f"  {method}: P(loss) {dist.probability_of_loss:.1%}, "
+                    f"max DD p95 {pct['max_drawdown_r']['p95']:.1f}R, "
+                    f"losing streak p95 {pct['max_losing_streak']['p95']:.0f}"
+                )
         
         lines.append("")
         lines.append("=" * 80)
@@ -99,6 +139,7 @@ class OptimizationPipeline:
     - Robustness testing (noise injection)
     - Walk-forward validation
     - Parameter surface analysis
+    - Monte Carlo trade-sequence resampling
     
     Usage:
         pipeline = OptimizationPipeline(
@@ -128,6 +169,7 @@ class OptimizationPipeline:
         data_dir: Path | str,
         initial_capital: float = 10_000.0,
         slippage_ticks: int = 5,
+        feature_store: Optional[FeatureStore] = None,
     ):
         """
         Initialize optimization pipeline.
@@ -137,11 +179,13 @@ class OptimizationPipeline:
             data_dir: Path to Parquet data directory
             initial_capital: Starting capital for backtests
             slippage_ticks: Slippage simulation (ticks)
+            feature_store: Store for pre-computed features (defaults to the process-wide one)
         """
         self.base_ruleset_path = Path(base_ruleset_path)
         self.data_dir = Path(data_dir)
         self.initial_capital = initial_capital
         self.slippage_ticks = slippage_ticks
+        self.feature_store = feature_store
     
     def optimize(
         self,
@@ -163,6 +207,18 @@ class OptimizationPipeline:
         journal_tags: Optional[List[str]] = None,
         experiment_tags: Optional[List[str]] = None,
         strategy_name: str = "ORBStrategy",
+        workers: int = 1,
+        search_mode: str = "exhaustive",
+        halving_eta: int = 3,
+        halving_min_span_days: int = 365,
+        tpe_trials: int = 0,
+        batched: bool = False,
+        reprice_slippage: bool = False,
+        run_monte_carlo: bool = False,
+        monte_carlo_paths: int = 10_000,
+        monte_carlo_seed: Optional[int] = 0,
+        queue_path: Optional[Path] = None,
+        walk_forward_reoptimize: bool = False,
     ) -> OptimizationResult:
         """
         Run complete optimization pipeline.
@@ -178,6 +234,31 @@ class OptimizationPipeline:
             run_walk_forward: Run walk-forward analysis on best candidate
             run_surface: Run surface analysis for 2D parameter pairs
             output_dir: Optional directory for reports/plots
+            workers: Worker processes for the parameter sweep and the
+                robustness / walk-forward backtests (1 = serial)
+            search_mode: "exhaustive" (every combination on the full period) or
+                "halving" (successive halving: every combination on a short
+                recent span, only the top 1/halving_eta promoted to longer spans)
+            halving_eta: Reduction factor between budget levels
+            halving_min_span_days: Shortest span of the first budget level
+            tpe_trials: Full-period TPE trials over float-valued parameters
+                after halving (0 = skip; requires optuna)
+            batched: Evaluate the exhaustive sweep with BatchORBEngine
+                (in-process, legacy execution path; ignores workers)
+            reprice_slippage: Derive the robustness slippage variants by
+                re-pricing one run's trades instead of re-running each
+            run_monte_carlo: Resample the best candidate's trade sequence
+                (bootstrap, block bootstrap, shuffle)
+            monte_carlo_paths: Paths per resampling method
+            monte_carlo_seed: Seed for reproducible Monte Carlo output
+                (None = fresh entropy, recorded on the result)
+            queue_path: Distribute the exhaustive sweep through a SweepQueue at
+                this path; workers then counts local worker processes
+                (0 = only workers started with scripts/sweep_worker.py)
+            walk_forward_reoptimize: With run_walk_forward, re-select the top
+                combination in every train window from the sweep's outcomes
+                instead of holding the best full-period combination fixed
+                (after a TPE stage, the grid is re-swept once to get them)
         
         Returns:
             OptimizationResult with comprehensive analysis
@@ -189,9 +270,14 @@ class OptimizationPipeline:
         logger.info(f"Period: {start_date.date()} to {end_date.date()}")
         logger.info(f"Parameters: {[p.name for p in parameters]}")
         logger.info(f"Sweep mode: {sweep_mode}")
+        if search_mode not in ("exhaustive", "halving"):
+            raise ValueError(f"Invalid search_mode: {search_mode}. Must be 'exhaustive' or 'halving'")
+        logger.info(f"Search mode: {search_mode}")
+        if queue_path is not None and (search_mode != "exhaustive" or batched):
+            raise ValueError("queue_path requires search_mode='exhaustive' without batched")
         
         # Step 1: Parameter sweep with pre-computed features
-        logger.info("\n[1/4] Running parameter sweep...")
+        logger.info("\n[1/5] Running parameter sweep...")
         
         sweep = ParameterSweep(
             base_ruleset_path=self.base_ruleset_path,
@@ -200,18 +286,90 @@ class OptimizationPipeline:
             initial_capital=self.initial_capital,
             slippage_ticks=self.slippage_ticks,
             sweep_mode=sweep_mode,
+            feature_store=self.feature_store,
         )
         
-        sweep_results = sweep.run(
-            symbol=symbol,
-            start_date=start_date,
-            end_date=end_date,
-            use_precomputed_features=True,  # ← Key optimization!
-            cache_dir=cache_dir,
-        )
+        resolved_hypothesis_id = hypothesis_id
+        search_levels = None
+        if search_mode == "halving":
+            def register_level(level: BudgetLevel) -> None:
+                # Every budget level is journaled with its own span
+                nonlocal resolved_hypothesis_id
+                if register_in_research_journal:
+                    level.results, resolved_hypothesis_id = self._register_sweep_in_research_journal(
+                        sweep_results=level.results,
+                        parameters=parameters,
+                        symbol=symbol,
+                        start_date=level.start_date,
+                        end_date=level.end_date,
+                        hypothesis_id=resolved_hypothesis_id,
+                        hypothesis_title=hypothesis_title,
+                        hypothesis_rationale=hypothesis_rationale,
+                        journal_tags=journal_tags,
+                        experiment_tags=(experiment_tags or ["optimization", "parameter-sweep"])
+                        + [f"{level.name}-level-{level.level + 1}"],
+                        research_root=research_root,
+                        strategy_name=strategy_name,
+                    )
+            
+            search_levels = successive_halving(
+                sweep,
+                symbol,
+                start_date,
+                end_date,
+                schedule=SuccessiveHalving(eta=halving_eta, min_span_days=halving_min_span_days),
+                cache_dir=cache_dir,
+                workers=workers,
+                collect_outcomes=run_walk_forward,
+                level_callback=register_level,
+            )
+            sweep_results = search_levels[-1].results
+            
+            if tpe_trials > 0:
+                halving_best = sweep_results.iloc[0]
+                tpe_level = refine_tpe(
+                    sweep,
+                    {p.name: self._to_native(halving_best[p.name]) for p in parameters},
+                    symbol,
+                    start_date,
+                    end_date,
+                    n_trials=tpe_trials,
+                    level=len(search_levels),
+                    cache_dir=cache_dir,
+                )
+                if tpe_level is not None:
+                    register_level(tpe_level)
+                    search_levels.append(tpe_level)
+                    # Both stages scored the full period, so their rows rank together
+                    sweep_results = (
+                        pd.concat([sweep_results, tpe_level.results], ignore_index=True)
+                        .sort_values("composite_score", ascending=False, kind="stable")
+                        .reset_index(drop=True)
+                    )
+                    if run_walk_forward:
+                        # Outcomes only cover the halving survivors
+                        sweep.outcomes = None
+        else:
+            sweep_results = sweep.run(
+                symbol=symbol,
+                start_date=start_date,
+                end_date=end_date,
+                use_precomputed_features=True,  # ← Key optimization!
+                cache_dir=cache_dir,
+                workers=1 if batched else workers,
+                collect_outcomes=run_walk_forward,
+                batched=batched,
+                queue_path=queue_path,
+            )
         
         logger.info(f"  ✓ Tested {len(sweep_results)} parameter combinations")
         
+        # Robustness reuses the sweep's indicators (served by the feature store)
+        precomputed_features = None
+        if run_robustness or run_monte_carlo:
+            timeframe = sweep.base_config.get("instruments", {}).get("timeframe", "5m")
+            precomputed_features = sweep._precompute_features(symbol, start_date, end_date, timeframe)
+        
         # Get best candidate
         best_row = sweep_results.iloc[0]
         best_params = {p.name: best_row[p.name] for p in parameters}
@@ -227,11 +385,14 @@ class OptimizationPipeline:
             sweep_results_path = output_dir / "parameter_sweep.csv"
             sweep.save_results(sweep_results, sweep_results_path)
             logger.info(f"  Saved sweep results to {sweep_results_path}")
+            if sweep.outcomes is not None:
+                sweep.outcomes.save(output_dir / "outcomes")
+                logger.info(f"  Saved per-day outcome matrix to {output_dir / 'outcomes'}")
 
         # Optional: register each sweep row as a completed experiment in research journal.
-        resolved_hypothesis_id = hypothesis_id
-        if register_in_research_journal:
-            logger.info("\n[1.5/4] Registering sweep in research journal...")
+        # (Adaptive search journals each budget level as it completes.)
+        if register_in_research_journal and search_levels is None:
+            logger.info("\n[1.5/5] Registering sweep in research journal...")
             sweep_results, resolved_hypothesis_id = self._register_sweep_in_research_journal(
                 sweep_results=sweep_results,
                 parameters=parameters,
@@ -255,7 +416,7 @@ class OptimizationPipeline:
         # Step 2: Robustness analysis (optional)
         robustness_analysis = None
         if run_robustness:
-            logger.info("\n[2/4] Running robustness analysis...")
+            logger.info("\n[2/5] Running robustness analysis...")
             
             # Load best ruleset
             best_ruleset = sweep._create_modified_ruleset(best_params)
@@ -272,16 +433,19 @@ class OptimizationPipeline:
                 start_date=start_date,
                 end_date=end_date,
                 noise_tests=10,
+                precomputed_features=precomputed_features,
+                workers=max(workers, 1),
+                reprice=reprice_slippage,
             )
             
             logger.info(f"  ✓ Robustness score: {robustness_analysis.robustness_score:.3f}")
         else:
-            logger.info("\n[2/4] Skipping robustness analysis")
+            logger.info("\n[2/5] Skipping robustness analysis")
         
         # Step 3: Walk-forward analysis (optional)
         walk_forward_analysis = None
         if run_walk_forward:
-            logger.info("\n[3/4] Running walk-forward analysis...")
+            logger.info("\n[3/5] Running walk-forward analysis...")
             
             # Load best ruleset
             best_ruleset = sweep._create_modified_ruleset(best_params)
@@ -293,23 +457,41 @@ class OptimizationPipeline:
                 slippage_ticks=self.slippage_ticks,
             )
             
-            walk_forward_analysis = wf_engine.analyze(
-                symbol=symbol,
-                start_date=start_date,
-                end_date=end_date,
-                train_months=6,
-                test_months=1,
-                step_months=1,
-            )
+            if walk_forward_reoptimize:
+                walk_forward_analysis = wf_engine.optimize(
+                    symbol=symbol,
+                    start_date=start_date,
+                    end_date=end_date,
+                    # None after a TPE stage: optimize() re-sweeps the grid once
+                    outcomes=sweep.outcomes,
+                    sweep=sweep,
+                    train_months=6,
+                    test_months=1,
+                    step_months=1,
+                    workers=max(workers, 1),
+                )
+            else:
+                walk_forward_analysis = wf_engine.analyze(
+                    symbol=symbol,
+                    start_date=start_date,
+                    end_date=end_date,
+                    train_months=6,
+                    test_months=1,
+                    step_months=1,
+                    # Windows aggregate the sweep's per-day outcomes: no re-runs
+                    outcomes=sweep.outcomes,
+                    combo=best_params,
+                    workers=max(workers, 1),
+                )
             
             logger.info(f"  ✓ Walk-forward score: {walk_forward_analysis.walk_forward_score:.3f}")
         else:
-            logger.info("\n[3/4] Skipping walk-forward analysis")
+            logger.info("\n[3/5] Skipping walk-forward analysis")
         
         # Step 4: Surface analysis (optional, for 2D parameter pairs)
         surface_analysis = None
         if run_surface and len(parameters) >= 2:
-            logger.info("\n[4/4] Running surface analysis...")
+            logger.info("\n[4/5] Running surface analysis...")
             
             surface_analyzer = SurfaceAnalyzer()
             surface_analysis = {}
@@ -318,12 +500,30 @@ class OptimizationPipeline:
             param_x = parameters[0].name
             param_y = parameters[1].name
             
-            surface = surface_analyzer.create_surface(
-                results_df=sweep_results,
-                param_x=param_x,
-                param_y=param_y,
-                metric="composite_score",
-            )
+            # Halving only scores survivors on the full period; the first
+            # budget level is the one that covered the whole grid
+            surface_results = search_levels[0].results if search_levels else sweep_results
+            if len(parameters) > 2:
+                # Whole grid as one N-D surface; the plotted pair is its
+                # projection (best score over the other parameters)
+                nd_surface = surface_analyzer.create_nd_surface(
+                    results_df=surface_results,
+                    params=[p.name for p in parameters],
+                    metric="composite_score",
+                )
+                surface_analysis["_vs_".join(nd_surface.param_names)] = nd_surface
+                nd_summary = surface_analyzer.summary_report(nd_surface)
+                logger.info(f"  ✓ N-D surface: {nd_summary['grid_size']} grid, "
+                           f"{nd_summary['n_plateau_regions']} plateau region(s)")
+                logger.info(f"    Robust optimum: {nd_summary['robust_optimum'].get('params')}")
+                surface = nd_surface.project(param_x, param_y)
+            else:
+                surface = surface_analyzer.create_surface(
+                    results_df=surface_results,
+                    param_x=param_x,
+                    param_y=param_y,
+                    metric="composite_score",
+                )
             
             surface_analysis[f"{param_x}_vs_{param_y}"] = surface
             
@@ -337,7 +537,39 @@ class OptimizationPipeline:
                 plot_path = output_dir / f"surface_{param_x}_vs_{param_y}.png"
                 surface_analyzer.plot_surface(surface, output_path=str(plot_path))
         else:
-            logger.info("\n[4/4] Skipping surface analysis")
+            logger.info("\n[4/5] Skipping surface analysis")
+        
+        # Step 5: Monte Carlo resampling of the best candidate's trades (optional)
+        monte_carlo_analysis = None
+        if run_monte_carlo:
+            logger.info("\n[5/5] Running Monte Carlo analysis...")
+            
+            # Same ruleset, period and slippage as the robustness baseline
+            best_ruleset = sweep._create_modified_ruleset(best_params)
+            if robustness_analysis is not None:
+                best_result = robustness_analysis.baseline_result
+            else:
+                best_result = BacktestEngine(
+                    ruleset=best_ruleset,
+                    data_dir=self.data_dir,
+                    initial_capital=self.initial_capital,
+                    slippage_ticks=self.slippage_ticks,
+                ).run(symbol, start_date, end_date, precomputed_features=precomputed_features)
+            
+            monte_carlo_analysis = MonteCarloAnalyzer(
+                n_paths=monte_carlo_paths,
+                seed=monte_carlo_seed,
+                risk_fraction=best_ruleset.position_size.value,
+                initial_capital=self.initial_capital,
+            ).analyze(best_result)
+            
+            if output_dir:
+                mc_path = output_dir / "monte_carlo.json"
+                with open(mc_path, "w") as f:
+                    json.dump(monte_carlo_analysis.to_dict(), f, indent=2)
+                logger.info(f"  Saved Monte Carlo distributions to {mc_path}")
+        else:
+            logger.info("\n[5/5] Skipping Monte Carlo analysis")
         
         # Create result
         result = OptimizationResult(
@@ -348,6 +580,8 @@ class OptimizationPipeline:
             robustness_analysis=robustness_analysis,
             walk_forward_analysis=walk_forward_analysis,
             surface_analysis=surface_analysis,
+            search_levels=search_levels,
+            monte_carlo_analysis=monte_carlo_analysis,
         )
         
         logger.info("\n" + "=" * 80)
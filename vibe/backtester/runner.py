@@ -47,16 +47,20 @@ class RuleSetRunner:
         symbol: str,
         current_bar: Dict[str, Any],
         df_context: pd.DataFrame,
+        avg_volume: Optional[float] = None,
     ) -> Tuple[int, Dict[str, Any]]:
         """
         Delegate to strategy.generate_signal_incremental().
         current_bar must include 'timestamp' key (datetime).
-        df_context must include 'ATR_14' column.
+        df_context must include 'ATR_14' column and the current session's bars;
+        it may be bounded (session + lookback) as long as avg_volume carries
+        the full-history volume mean for the volume filter.
         """
         return self.strategy.generate_signal_incremental(
             symbol=symbol,
             current_bar=current_bar,
             df_context=df_context,
+            avg_volume=avg_volume,
         )
 
     def track_position(
@@ -198,3 +198,170 @@ def rolling_percentile_rank(series: pd.Series, window: int) -> pd.Series:
 
     result = series.rolling(window=window, min_periods=window).apply(_rank, raw=True)
     return result.clip(0.0, 1.0)
+
+
+# ---------------------------------------------------------------------------
+# Vectorized kernels
+#
+# atr_series, adx_series and rolling_percentile_rank above loop in Python and
+# are kept as the reference implementations. The *_fast variants below give
+# the same values (to floating-point rounding, see test_batch_indicators.py)
+# without per-element pandas indexing; FeatureEngine uses them.
+# ---------------------------------------------------------------------------
+
+def _true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """TR with row 0 seeded by high-low (no prev_close), as in atr_series."""
+    tr = high - low
+    if len(tr) > 1:
+        prev_close = close[:-1]
+        tr[1:] = np.fmax(tr[1:], np.fmax(np.abs(high[1:] - prev_close), np.abs(low[1:] - prev_close)))
+    return tr
+
+
+def _wilder_smooth(values: np.ndarray, seed_pos: int, seed: float, length: int) -> np.ndarray:
+    """
+    Wilder recursion y_t = (y_{t-1} * (length - 1) + x_t) / length from y_{seed_pos} = seed.
+
+    Runs as an adjust=False EWM (alpha = 1/length) in pandas' compiled loop.
+    NaN before seed_pos; a NaN input poisons every later value, as the
+    reference loops do.
+    """
+    out = np.full(len(values), np.nan)
+    if seed_pos >= len(values):
+        return out
+    tail = values[seed_pos:].astype(float, copy=True)
+    tail[0] = seed
+    nan_at = np.flatnonzero(np.isnan(tail))
+    stop = int(nan_at[0]) if len(nan_at) else len(tail)
+    if stop:
+        smoothed = pd.Series(tail[:stop]).ewm(alpha=1.0 / length, adjust=False).mean()
+        out[seed_pos:seed_pos + stop] = smoothed.to_numpy()
+    return out
+
+
+def atr_series_fast(df: pd.DataFrame, length: int = 14) -> pd.Series:
+    """Vectorized atr_series (same seeding and Wilder smoothing)."""
+    high = df["high"].to_numpy(dtype=float)
+    low = df["low"].to_numpy(dtype=float)
+    close = df["close"].to_numpy(dtype=float)
+    if len(df) < length:
+        return pd.Series(np.nan, index=df.index, dtype=float)
+
+    tr = _true_range(high, low, close)
+    # Seeds use pandas reductions (NaN-skipping) like the reference
+    atr = _wilder_smooth(tr, length - 1, pd.Series(tr[:length]).mean(), length)
+    return pd.Series(atr, index=df.index)
+
+
+def adx_series_fast(df: pd.DataFrame, length: int = 14) -> pd.Series:
+    """Vectorized adx_series (same seeding and Wilder smoothing)."""
+    n = length
+    if len(df) < n + 1:
+        return pd.Series(np.nan, index=df.index, dtype=float)
+
+    high = df["high"].to_numpy(dtype=float)
+    low = df["low"].to_numpy(dtype=float)
+    close = df["close"].to_numpy(dtype=float)
+
+    up_move = np.empty_like(high)
+    down_move = np.empty_like(low)
+    up_move[0] = down_move[0] = np.nan
+    up_move[1:] = high[1:] - high[:-1]
+    down_move[1:] = low[:-1] - low[1:]
+    plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+    minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+    tr = _true_range(high, low, close)
+
+    # Wilder's running sums S_t = S_{t-1} - S_{t-1}/n + x_t are n times the
+    # Wilder average of x seeded at S_n / n; the factor cancels in the DI ratios.
+    def smooth(x: np.ndarray) -> np.ndarray:
+        return _wilder_smooth(x, n, pd.Series(x[1:n + 1]).sum() / n, n)
+
+    plus_s, minus_s, tr_s = smooth(plus_dm), smooth(minus_dm), smooth(tr)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tr_s = np.where(tr_s == 0, np.nan, tr_s)
+        plus_di = 100 * plus_s / tr_s
+        minus_di = 100 * minus_s / tr_s
+        di_sum = plus_di + minus_di
+        dx = 100 * np.abs(plus_di - minus_di) / np.where(di_sum == 0, np.nan, di_sum)
+
+    last_seed = 2 * n - 1
+    if last_seed >= len(df):
+        return pd.Series(np.nan, index=df.index, dtype=float)
+    adx = _wilder_smooth(dx, last_seed, pd.Series(dx[n:last_seed + 1]).mean(), n)
+    return pd.Series(adx, index=df.index)
+
+
+def _count_below_in_lookback(ranks: np.ndarray, lookback: int) -> np.ndarray:
+    """
+    For each i >= lookback: #{j in [i - lookback, i) : ranks[j] < ranks[i]}.
+
+    Each window is split into the O(log lookback) aligned power-of-two blocks
+    of an implicit segment tree. Level k keeps every block of 2**k ranks
+    sorted, and each query counts within its block by a branchless binary
+    search of k steps, vectorized over all queries: O(n log^2 lookback)
+    work in numpy and O(n) memory.
+    """
+    n = len(ranks)
+    value = ranks[lookback:]
+    counts = np.zeros(len(value), dtype=np.int64)
+    lo = np.arange(len(value), dtype=np.int64)
+    hi = lo + lookback
+
+    # Pad to a power of two with a rank above every query rank
+    sorted_blocks = np.full(1 << int(n - 1).bit_length(), int(ranks.max()) + 1, dtype=np.int64)
+    sorted_blocks[:n] = ranks
+    level = 0
+    while (lo < hi).any():
+        size = 1 << level
+        if level:
+            # Two sorted runs per block: timsort merges them in linear time
+            sorted_blocks = np.sort(sorted_blocks.reshape(-1, size), axis=1, kind="stable").ravel()
+
+        take_lo = (lo & 1).astype(bool) & (lo < hi)
+        lo_blocks = lo[take_lo]
+        lo = lo + take_lo
+        take_hi = (hi & 1).astype(bool) & (lo < hi)
+        hi = hi - take_hi
+
+        for take, blocks in ((take_lo, lo_blocks), (take_hi, hi[take_hi])):
+            v = value[take]
+            base = blocks * size
+            below = np.zeros(len(blocks), dtype=np.int64)
+            step = size >> 1
+            while step:
+                below += np.where(sorted_blocks[base + below + step - 1] < v, step, 0)
+                step >>= 1
+            below += sorted_blocks[base + below] < v
+            counts[take] += below
+
+        lo >>= 1
+        hi >>= 1
+        level += 1
+    return counts
+
+
+def rolling_percentile_rank_fast(series: pd.Series, window: int) -> pd.Series:
+    """Vectorized rolling_percentile_rank (O(n log^2 window), no Python callback)."""
+    values = series.to_numpy(dtype=float)
+    n = len(values)
+    result = np.full(n, np.nan)
+    if n < window or window < 1:
+        return pd.Series(result, index=series.index)
+
+    nan = np.isnan(values)
+    ranks = np.full(n, 0, dtype=np.int64)
+    if (~nan).any():
+        _, ranks[~nan] = np.unique(values[~nan], return_inverse=True)
+
+    lookback = window - 1
+    if lookback:
+        result[lookback:] = _count_below_in_lookback(ranks, lookback) / lookback
+    else:
+        result[:] = 0.0
+
+    # rolling(min_periods=window): any NaN in the window gives NaN
+    nan_count = np.concatenate([[0], np.cumsum(nan)])
+    in_window = nan_count[window:] - nan_count[:-window]
+    result[window - 1:][in_window > 0] = np.nan
+    return pd.Series(result, index=series.index).clip(0.0, 1.0)
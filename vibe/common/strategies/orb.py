@@ -184,14 +184,22 @@ class ORBStrategy(StrategyBase):
         symbol: str,
         current_bar: Dict[str, float],
         df_context: pd.DataFrame,
+        avg_volume: Optional[float] = None,
     ) -> Tuple[int, Dict[str, Any]]:
         """
         Generate signal for current bar incrementally.
 
+        Only the current session's bars in df_context are used for ORB levels,
+        so callers may pass a bounded window (current session plus lookback)
+        instead of the full history.
+
         Args:
             symbol: Trading symbol
             current_bar: Current bar {'open', 'high', 'low', 'close', 'volume', 'timestamp'}
             df_context: Historical bars for context
+            avg_volume: Baseline volume for the volume filter. Defaults to
+                df_context["volume"].mean(); pass the running mean over the
+                full history when df_context is bounded.
 
         Returns:
             (signal, metadata)
@@ -266,7 +274,8 @@ class ORBStrategy(StrategyBase):
 
         # Check volume filter
         if self.config.use_volume_filter:
-            avg_volume = df_context["volume"].mean()
+            if avg_volume is None:
+                avg_volume = df_context["volume"].mean()
             if current_bar["volume"] < avg_volume * self.config.volume_threshold:
                 return 0, {"reason": "insufficient_volume"}
 
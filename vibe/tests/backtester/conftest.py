@@ -0,0 +1,46 @@
+"""
+Shared fixtures and helpers for the backtester tests.
+
+data_dir writes synthetic QQQ minute bars once per test module. A module
+picks its history with the synthetic_data marker, whose keyword arguments
+go to write_synthetic_parquet:
+
+    pytestmark = pytest.mark.synthetic_data(days=60, seed=9)
+
+Modules that need hand-shaped bars (gaps, several symbols, per-test data)
+define their own data_dir, which overrides this one.
+"""
+
+import pytest
+
+from vibe.backtester.data.feature_store import FeatureStore
+from vibe.backtester.data.synthetic import write_synthetic_parquet
+from vibe.common.ruleset.loader import RuleSetLoader
+
+
+@pytest.fixture(scope="module")
+def data_dir(request, tmp_path_factory):
+    marker = request.node.get_closest_marker("synthetic_data")
+    options = {"symbol": "QQQ", **(marker.kwargs if marker is not None else {})}
+    path = tmp_path_factory.mktemp("synthetic_parquet")
+    write_synthetic_parquet(path, **options)
+    return path
+
+
+@pytest.fixture(scope="module")
+def feature_store(tmp_path_factory):
+    return FeatureStore(tmp_path_factory.mktemp("features"))
+
+
+def ruleset_with(**sections):
+    """
+    orb_production with top-level sections overridden.
+
+    Each keyword names a section ("strategy", "exit", ...) and maps to the
+    keys to replace in it: ruleset_with(exit={"take_profit": {...}}).
+    """
+    base = RuleSetLoader.from_name("orb_production")
+    data = base.model_dump()
+    for section, overrides in sections.items():
+        data[section].update(overrides)
+    return type(base).model_validate(data)
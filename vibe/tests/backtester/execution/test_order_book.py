@@ -0,0 +1,154 @@
+"""
+Unit tests for the indexed pending order book.
+"""
+
+import random
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from vibe.backtester.core.execution.models import Order
+from vibe.backtester.core.execution.order_book import PendingOrderBook
+from vibe.backtester.core.execution.pending_queue import PendingOrderQueue
+
+TS = datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
+
+
+def _order(order_id, signal_bar_index=100, symbol="QQQ", side="buy", limit_price=None, size=100):
+    return Order(
+        id=order_id,
+        symbol=symbol,
+        side=side,
+        size=size,
+        order_type="market" if limit_price is None else "limit",
+        limit_price=limit_price,
+        timestamp=TS,
+        signal_bar_index=signal_bar_index,
+    )
+
+
+def _bar(low, high):
+    return lambda: SimpleNamespace(low=low, high=high)
+
+
+def _ids(orders):
+    return [o.id for o in orders]
+
+
+def test_latency_and_fifo_order():
+    book = PendingOrderBook()
+    book.add(_order("late", signal_bar_index=101))
+    book.add(_order("early", signal_bar_index=100))
+    book.add(_order("also_early", signal_bar_index=100))
+
+    assert book.eligible_orders("QQQ", 100, latency_bars=1, get_bar=_bar(1, 2)) == []
+    assert _ids(book.eligible_orders("QQQ", 101, latency_bars=1, get_bar=_bar(1, 2))) == ["early", "also_early"]
+    # Submission order, not eligibility order
+    assert _ids(book.eligible_orders("QQQ", 102, latency_bars=1, get_bar=_bar(1, 2))) == [
+        "late", "early", "also_early",
+    ]
+
+
+def test_limit_orders_returned_only_when_reached():
+    book = PendingOrderBook()
+    book.add(_order("buy_99", limit_price=99.0))
+    book.add(_order("buy_101", limit_price=101.0))
+    book.add(_order("sell_103", side="sell", limit_price=103.0))
+    book.add(_order("sell_105", side="sell", limit_price=105.0))
+    book.add(_order("market"))
+
+    got = book.eligible_orders("QQQ", 100, latency_bars=0, get_bar=_bar(100.0, 103.0))
+    assert _ids(got) == ["buy_101", "sell_103", "market"]
+    got = book.eligible_orders("QQQ", 101, latency_bars=0, get_bar=_bar(99.0, 105.0))
+    assert _ids(got) == ["buy_99", "buy_101", "sell_103", "sell_105", "market"]
+
+
+def test_bar_only_built_for_resting_limits():
+    book = PendingOrderBook()
+    book.add(_order("market"))
+
+    def no_bar():
+        raise AssertionError("bar built without limit orders")
+
+    assert _ids(book.eligible_orders("QQQ", 100, latency_bars=0, get_bar=no_bar)) == ["market"]
+
+
+def test_mark_filled_remainder_and_symbols():
+    book = PendingOrderBook()
+    book.add(_order("q1"))
+    book.add(_order("s1", symbol="SPY", limit_price=400.0))
+    book.add(_order("q2", limit_price=99.0))
+    assert len(book) == 3 and book.has_orders("SPY")
+
+    first = book.eligible_orders("QQQ", 100, latency_bars=0, get_bar=_bar(98.0, 101.0))[0]
+    book.mark_filled("q1")
+    book.add(first.remaining(40))
+    assert _ids(book.orders("QQQ")) == ["q2", "q1"]
+    assert book.orders("QQQ")[1].size == 60
+
+    book.mark_filled("q2")
+    book.mark_filled("unknown")
+    assert _ids(book.eligible_orders("QQQ", 101, latency_bars=0, get_bar=_bar(90.0, 110.0))) == ["q1"]
+
+    book.clear("QQQ")
+    assert not book.has_orders("QQQ")
+    assert _ids(book) == ["s1"]
+    with pytest.raises(ValueError, match="already in the book"):
+        book.add(_order("s1", symbol="SPY"))
+
+
+def test_orders_expire_after_one_day_of_bars():
+    book = PendingOrderBook()
+    book.add(_order("o", signal_bar_index=100, limit_price=50.0))
+    assert len(book) == 1
+    book.eligible_orders("QQQ", 1539, latency_bars=0, get_bar=_bar(60.0, 61.0))
+    assert len(book) == 1
+    assert book.eligible_orders("QQQ", 1540, latency_bars=0, get_bar=_bar(40.0, 61.0)) == []
+    assert len(book) == 0
+
+
+def test_matches_queue_with_limit_triggers():
+    """Randomized: book == PendingOrderQueue filtered to orders the bar can fill."""
+    rng = random.Random(3)
+    book, queue = PendingOrderBook(), PendingOrderQueue()
+    latency = 2
+    next_id = 0
+    for bar_index in range(400):
+        for _ in range(rng.randrange(4)):
+            side = rng.choice(["buy", "sell"])
+            limit = None if rng.random() < 0.3 else round(rng.uniform(95, 105), 2)
+            order = _order(f"o{next_id}", signal_bar_index=bar_index, side=side, limit_price=limit)
+            next_id += 1
+            book.add(order)
+            queue.add(order)
+
+        low = rng.uniform(95, 100)
+        high = low + rng.uniform(0, 5)
+        expected = [
+            o for o in queue.get_eligible_orders(bar_index, latency_bars=latency)
+            if o.limit_price is None
+            or (o.side == "buy" and low <= o.limit_price)
+            or (o.side == "sell" and high >= o.limit_price)
+        ]
+        got = book.eligible_orders("QQQ", bar_index, latency, get_bar=_bar(low, high))
+        assert _ids(got) == _ids(expected)
+
+        for order in got:
+            if rng.random() < 0.5:
+                book.mark_filled(order.id)
+                queue.mark_filled(order.id)
+                if rng.random() < 0.3:
+                    remainder = order.remaining(order.size / 2)
+                    book.add(remainder)
+                    queue.add(remainder)
+        assert len(book) == len(queue)
+
+
+def test_thousands_of_resting_limits_touch_only_triggered():
+    book = PendingOrderBook()
+    for i in range(5000):
+        book.add(_order(f"b{i}", signal_bar_index=0, limit_price=50.0 + i * 0.01))
+    # Only limits at or above the bar's low can fill
+    got = book.eligible_orders("QQQ", 1, latency_bars=0, get_bar=_bar(99.95, 100.5))
+    assert _ids(got) == [f"b{i}" for i in range(4995, 5000)]
@@ -0,0 +1,143 @@
+"""
+ExecutionSimulator.execute_batch and the models' batch methods must equal
+their scalar counterparts exactly, row by row.
+"""
+
+from datetime import datetime, timezone
+from itertools import product
+
+import numpy as np
+import pytest
+
+from vibe.backtester.core.execution.config import ExecutionConfig
+from vibe.backtester.core.execution.impact import NoImpact, SqrtImpact
+from vibe.backtester.core.execution.models import Order
+from vibe.backtester.core.execution.simulator import Bar, ExecutionSimulator
+from vibe.backtester.core.execution.slippage import FixedTickSlippage, SqrtVolumeSlippage
+from vibe.backtester.core.execution.volume import ParticipationRateVolume, UnlimitedVolume
+
+TS = datetime(2024, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
+
+SLIPPAGE = [FixedTickSlippage(ticks=3), SqrtVolumeSlippage(k=0.2, max_slippage_pct=0.01)]
+VOLUME = [UnlimitedVolume(), ParticipationRateVolume(rate=0.05)]
+IMPACT = [NoImpact(), SqrtImpact(k=0.3, max_impact_pct=0.02)]
+
+
+def _random_batch(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    close = rng.uniform(50, 500, n)
+    spread = rng.uniform(0, 0.02, n) * close
+    low = close - rng.uniform(0, 1, n) * spread
+    high = close + rng.uniform(0, 1, n) * spread
+    batch = {
+        "sides": rng.choice(["buy", "sell"], n),
+        "sizes": rng.integers(1, 50_000, n).astype(float),
+        "high": high,
+        "low": low,
+        "close": close,
+        "volume": rng.integers(100, 2_000_000, n).astype(float),
+        "adv": np.where(rng.random(n) < 0.3, np.nan, rng.uniform(1e5, 5e7, n)),
+    }
+    kind = rng.integers(0, 3, n)  # 0 market, 1 limit, 2 market with override
+    offset = rng.normal(0, 0.01, n) * close
+    batch["limit_prices"] = np.where(kind == 1, np.round(close + offset, 2), np.nan)
+    batch["price_overrides"] = np.where(kind == 2, np.round(close + 0.05, 2), np.nan)
+    return batch
+
+
+def _scalar(sim, batch, i):
+    limit = batch["limit_prices"][i]
+    override = batch["price_overrides"][i]
+    order = Order(
+        id=f"o{i}",
+        symbol="QQQ",
+        side=str(batch["sides"][i]),
+        size=float(batch["sizes"][i]),
+        order_type="market" if np.isnan(limit) else "limit",
+        limit_price=None if np.isnan(limit) else float(limit),
+        timestamp=TS,
+        signal_bar_index=0,
+        price_override=None if np.isnan(override) else float(override),
+    )
+    bar = Bar(
+        symbol="QQQ",
+        timestamp=TS,
+        open_price=float((batch["low"][i] + batch["high"][i]) / 2),
+        close_price=float(batch["close"][i]),
+        high_price=float(batch["high"][i]),
+        low_price=float(batch["low"][i]),
+        volume=float(batch["volume"][i]),
+    )
+    adv = batch["adv"][i]
+    return sim.execute_order(order, bar, adv=None if np.isnan(adv) else float(adv))
+
+
+@pytest.mark.parametrize("slippage,volume,impact", list(product(SLIPPAGE, VOLUME, IMPACT)))
+def test_batch_matches_execute_order_exactly(slippage, volume, impact):
+    sim = ExecutionSimulator(ExecutionConfig(slippage_model=slippage, volume_model=volume, impact_model=impact))
+    batch = _random_batch()
+    fills = sim.execute_batch(**batch)
+
+    assert len(fills) == len(batch["sizes"])
+    assert fills.filled.any() and not fills.filled.all()
+    for i in range(len(fills)):
+        fill = _scalar(sim, batch, i)
+        if fill is None:
+            assert fills.qty[i] == 0 and np.isnan(fills.price[i])
+            continue
+        assert (fills.price[i], fills.qty[i], fills.slippage[i], fills.impact[i]) == (
+            fill.price, fill.qty, fill.slippage, fill.impact,
+        )
+
+
+def test_model_batch_methods_match_scalar():
+    rng = np.random.default_rng(1)
+    base = rng.uniform(10, 500, 200)
+    is_buy = rng.random(200) < 0.5
+    size = rng.integers(1, 10_000, 200).astype(float)
+    volume = rng.integers(1, 1_000_000, 200).astype(float)
+    adv = np.where(rng.random(200) < 0.5, np.nan, rng.uniform(1e4, 1e7, 200))
+
+    for model in SLIPPAGE:
+        got = model.calculate_batch(base, is_buy, size, volume)
+        for i in range(200):
+            bar = Bar(symbol="QQQ", timestamp=TS, open_price=base[i], close_price=base[i],
+                      high_price=base[i], low_price=base[i], volume=volume[i])
+            assert got[i] == model.calculate(base[i], "buy" if is_buy[i] else "sell", size[i], bar)
+    for model in VOLUME:
+        got = model.max_fill_qty_batch(size, volume)
+        assert got.tolist() == [model.max_fill_qty(s, v) for s, v in zip(size, volume)]
+    for model in IMPACT:
+        got = model.price_impact_batch(size, volume, adv)
+        expected = [
+            model.price_impact(s, v, "buy", adv=None if np.isnan(a) else a)
+            for s, v, a in zip(size, volume, adv)
+        ]
+        assert got.tolist() == expected
+
+
+def test_batch_validation():
+    sim = ExecutionSimulator(ExecutionConfig.realistic())
+    batch = _random_batch(n=5)
+    with pytest.raises(ValueError, match="Invalid side"):
+        sim.execute_batch(**{**batch, "sides": np.array(["buy", "hold", "sell", "buy", "buy"])})
+    with pytest.raises(ValueError, match="one entry per order"):
+        sim.execute_batch(**{**batch, "sizes": batch["sizes"][:3]})
+    with pytest.raises(ValueError, match="zero volume"):
+        sim.execute_batch(**{**batch, "volume": np.zeros(5), "limit_prices": None, "price_overrides": None})
+    with pytest.raises(ValueError, match="order_size"):
+        SqrtImpact().price_impact_batch(np.array([1.0, 0.0]), np.array([10.0, 10.0]))
+
+
+def test_slippage_sensitivity_sweep():
+    """One batch per slippage setting prices every order without per-order calls."""
+    batch = _random_batch(n=1000, seed=4)
+    batch.update(limit_prices=None, price_overrides=None)
+    buys = batch["sides"] == "buy"
+    previous = None
+    for ticks in range(0, 6):
+        sim = ExecutionSimulator(ExecutionConfig.legacy(slippage_ticks=ticks))
+        price = sim.execute_batch(**batch).price
+        if previous is not None:
+            assert np.all(price[buys] > previous[buys]) and np.all(price[~buys] < previous[~buys])
+        previous = price
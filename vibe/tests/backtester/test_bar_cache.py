@@ -0,0 +1,107 @@
+"""
+BarCache: process-wide LRU cache of raw and resampled bars.
+
+Sliced resampled frames must equal resampling the sliced 1m frame, including
+periods that start or end mid-bin, and files are read once per fingerprint.
+"""
+
+import os
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import pytest
+
+from vibe.backtester.core.engine import BacktestEngine
+from vibe.backtester.data import bar_cache as bar_cache_module
+from vibe.backtester.data.bar_cache import BarCache, get_bar_cache, resample_ohlcv
+from vibe.backtester.data.synthetic import generate_minute_bars, write_synthetic_parquet
+from vibe.common.ruleset.loader import RuleSetLoader
+
+ET = ZoneInfo("America/New_York")
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    df = generate_minute_bars(days=10, seed=11)
+    # Holes inside and across bins so edge bins are genuinely partial
+    write_synthetic_parquet(tmp_path, symbol="QQQ", df=df.drop(df.index[[3, 4, 200, 201, 202]]))
+    return tmp_path
+
+
+PERIODS = [
+    (None, None),
+    (datetime(2024, 1, 3, tzinfo=ET), datetime(2024, 1, 9, tzinfo=ET)),
+    (datetime(2024, 1, 3, 9, 32, tzinfo=ET), datetime(2024, 1, 5, 11, 0, tzinfo=ET)),
+    (datetime(2024, 1, 2, 9, 33, tzinfo=ET), datetime(2024, 1, 2, 9, 34, tzinfo=ET)),
+    (datetime(2024, 1, 4, 12, 1, tzinfo=ET), datetime(2024, 1, 4, 12, 3, tzinfo=ET)),
+    (datetime(2030, 1, 1, tzinfo=ET), datetime(2030, 2, 1, tzinfo=ET)),
+]
+
+
+@pytest.mark.parametrize("timeframe", ["5m", "15m"])
+@pytest.mark.parametrize("start,end", PERIODS)
+def test_sliced_bars_match_resampling_the_slice(data_dir, timeframe, start, end):
+    cache = BarCache(max_bytes=1 << 30)
+    minute = pd.read_parquet(data_dir / "QQQ.parquet")
+    if start is not None:
+        minute = minute[(minute.index >= start) & (minute.index <= end)]
+
+    expected = resample_ohlcv(minute, timeframe.replace("m", "min"))
+    actual = cache.bars(data_dir, "QQQ", timeframe, start, end)
+    pd.testing.assert_frame_equal(actual, expected, check_freq=False)
+
+
+def test_files_are_read_once(data_dir, monkeypatch):
+    reads = []
+    real_read = pd.read_parquet
+    monkeypatch.setattr(bar_cache_module.pd, "read_parquet", lambda p: reads.append(p) or real_read(p))
+
+    cache = BarCache(max_bytes=1 << 30)
+    start = datetime(2024, 1, 3, tzinfo=ET)
+    for days in range(1, 4):
+        cache.bars(data_dir, "QQQ", "5m", start, start + timedelta(days=days))
+        cache.minute_bars(data_dir, "QQQ", start, start + timedelta(days=days))
+    assert len(reads) == 1
+    assert cache.misses == 2  # raw 1m + resampled 5m
+
+
+def test_changed_file_is_reloaded(data_dir):
+    cache = BarCache(max_bytes=1 << 30)
+    before = cache.minute_bars(data_dir, "QQQ")
+    write_synthetic_parquet(data_dir, symbol="QQQ", days=3, seed=99)
+    stat = (data_dir / "QQQ.parquet").stat()
+    os.utime(data_dir / "QQQ.parquet", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    after = cache.minute_bars(data_dir, "QQQ")
+    assert len(after) != len(before)
+    assert len(cache) == 1  # stale version evicted
+
+
+def test_lru_eviction_respects_budget(tmp_path):
+    for i, symbol in enumerate(["AAA", "BBB", "CCC"]):
+        write_synthetic_parquet(tmp_path, symbol=symbol, days=5, seed=i)
+    one_frame = int(pd.read_parquet(tmp_path / "AAA.parquet").memory_usage(index=True).sum())
+    cache = BarCache(max_bytes=int(one_frame * 2.5))
+
+    cache.minute_bars(tmp_path, "AAA")
+    cache.minute_bars(tmp_path, "BBB")
+    cache.minute_bars(tmp_path, "AAA")  # refresh AAA
+    cache.minute_bars(tmp_path, "CCC")  # evicts BBB, the least recently used
+
+    symbols = {key[0] for key in cache._entries}
+    assert symbols == {"AAA", "CCC"}
+    assert cache.nbytes <= cache.max_bytes
+
+
+def test_repeated_engine_runs_share_cached_bars(data_dir):
+    ruleset = RuleSetLoader.from_name("orb_production")
+    cache = get_bar_cache()
+    start, end = datetime(2024, 1, 1, tzinfo=ET), datetime(2024, 1, 31, tzinfo=ET)
+
+    first = BacktestEngine(ruleset, data_dir).run("QQQ", start, end)
+    misses = cache.misses
+    second = BacktestEngine(ruleset, data_dir).run("QQQ", start, end)
+
+    assert cache.misses == misses
+    assert [t.model_dump() for t in second.trades] == [t.model_dump() for t in first.trades]
@@ -0,0 +1,98 @@
+"""
+BatchORBEngine: many ruleset variants in one pass must match per-variant
+BacktestEngine runs exactly, computing each distinct opening range once.
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import pytest
+
+from vibe.backtester.analysis.parameter_sweep import ParameterDefinition, ParameterSweep
+from vibe.backtester.core import vectorized
+from vibe.backtester.core.batch import BatchORBEngine
+from vibe.backtester.core.engine import BacktestEngine
+from vibe.backtester.data.feature_store import FeatureStore
+from vibe.tests.backtester.conftest import ruleset_with
+
+ET = ZoneInfo("America/New_York")
+START = datetime(2024, 1, 1, tzinfo=ET)
+END = datetime(2024, 4, 30, tzinfo=ET)
+
+pytestmark = pytest.mark.synthetic_data(days=70, seed=17)
+
+
+VARIANTS = [
+    {},
+    {"strategy": {"orb_duration_minutes": 15}},
+    {"exit": {"take_profit": {"method": "orb_range_multiple", "multiplier": 1.0}}},
+    {"exit": {"trailing_stop": {"method": "breakeven_plus_ticks", "trigger_r": 0.5, "plus_ticks": 3}}},
+    {"strategy": {"orb_duration_minutes": 15, "breakout_evaluation": "body"}},
+    {"instruments": {"timeframe": "15m"}},
+]
+
+
+def test_batch_matches_per_variant_engine(data_dir):
+    rulesets = [ruleset_with(**v) for v in VARIANTS]
+    results = BatchORBEngine(rulesets, data_dir, slippage_ticks=5).run("QQQ", START, END)
+
+    assert len(results) == len(rulesets)
+    for ruleset, actual in zip(rulesets, results):
+        expected = BacktestEngine(ruleset, data_dir, slippage_ticks=5).run("QQQ", START, END)
+        assert expected.trades
+        assert [t.model_dump() for t in actual.trades] == [t.model_dump() for t in expected.trades]
+        assert actual.equity.equity_curve.equals(expected.equity.equity_curve)
+        assert actual.overall == expected.overall
+
+
+def test_shared_computations_run_once(data_dir, monkeypatch):
+    ranges, candidates = [], []
+    opening_range = vectorized._SessionArrays.opening_range
+    breakout_candidates = vectorized._SessionArrays._breakout_candidates
+
+    def count_ranges(self, start_s, end_s):
+        if (start_s, end_s) not in self._ranges:
+            ranges.append((start_s, end_s))
+        return opening_range(self, start_s, end_s)
+
+    def count_candidates(self, config):
+        candidates.append(config.orb_duration_minutes)
+        return breakout_candidates(self, config)
+
+    monkeypatch.setattr(vectorized._SessionArrays, "opening_range", count_ranges)
+    monkeypatch.setattr(vectorized._SessionArrays, "_breakout_candidates", count_candidates)
+
+    rulesets = [
+        ruleset_with(
+            strategy={"orb_duration_minutes": duration},
+            exit={"take_profit": {"method": "orb_range_multiple", "multiplier": tp}},
+        )
+        for duration in (5, 15)
+        for tp in (1.0, 2.0, 3.0)
+    ]
+    BatchORBEngine(rulesets, data_dir).run("QQQ", START, END)
+
+    assert sorted(candidates) == [5, 15]
+    assert len(ranges) == 2
+
+
+def test_batched_sweep_matches_serial(data_dir, tmp_path):
+    def sweep():
+        return ParameterSweep(
+            base_ruleset_path="vibe/rulesets/orb_production.yaml",
+            data_dir=data_dir,
+            parameters=[
+                ParameterDefinition("strategy.orb_duration_minutes", [5, 15, 30], name="orb_duration"),
+                ParameterDefinition("exit.take_profit.multiplier", [2.0, 3.0], name="tp_multiplier"),
+            ],
+            sweep_mode="grid",
+            feature_store=FeatureStore(tmp_path / "features"),
+        )
+
+    serial = sweep().run("QQQ", START, END)
+    batched = sweep().run("QQQ", START, END, batched=True)
+    pd.testing.assert_frame_equal(batched, serial)
+
+    with pytest.raises(ValueError):
+        sweep().run("QQQ", START, END, batched=True, workers=2)
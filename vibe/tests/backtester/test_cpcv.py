@@ -0,0 +1,141 @@
+"""
+CPCV: combinatorial purged splits over an OutcomeMatrix. Vectorized test-set
+statistics must equal OutcomeMatrix.summary/scores on the same day masks.
+"""
+
+from datetime import datetime
+from math import comb
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vibe.backtester.analysis.cpcv import CPCVAnalyzer
+from vibe.backtester.analysis.outcome_matrix import OutcomeMatrix
+from vibe.backtester.analysis.parameter_sweep import ParameterDefinition, ParameterSweep
+from vibe.backtester.data.feature_store import FeatureStore
+from vibe.backtester.data.synthetic import write_synthetic_parquet
+
+ET = ZoneInfo("America/New_York")
+
+
+def _random_outcomes(n_days=120, n_combos=40, seed=0):
+    rng = np.random.default_rng(seed)
+    r = rng.normal(0.05, 1.0, size=(n_days, n_combos))
+    r[rng.random(r.shape) < 0.3] = np.nan
+    risk = np.where(np.isnan(r), np.nan, 100.0)
+    return OutcomeMatrix(
+        days=pd.bdate_range("2024-01-02", periods=n_days),
+        combos=pd.DataFrame({"combo": range(n_combos)}),
+        r_multiple=r,
+        pnl=r * 100.0,
+        initial_risk=risk,
+        exit_reason=np.where(np.isnan(r), -1, 0).astype(np.int8),
+    )
+
+
+def test_splits_are_purged_and_embargoed():
+    outcomes = _random_outcomes()
+    analysis = CPCVAnalyzer(n_groups=6, n_test_groups=2, purge_days=2, embargo_days=3).analyze(outcomes)
+
+    assert analysis.n_splits == comb(6, 2)
+    assert analysis.n_paths == 2 * comb(6, 2) // 6
+    assert np.bincount(analysis.groups).tolist() == [20] * 6
+    for split in analysis.splits:
+        assert not (split.test_days & split.train_days).any()
+        test_positions = np.flatnonzero(split.test_days)
+        train_positions = np.flatnonzero(split.train_days)
+        for g in split.test_groups:
+            members = np.flatnonzero(analysis.groups == g)
+            purged = set(range(members[0] - 2, members[0])) | set(range(members[-1] + 1, members[-1] + 4))
+            assert not purged & set(train_positions) - set(test_positions)
+        dropped = len(analysis.days) - split.test_days.sum() - split.train_days.sum()
+        assert 0 < dropped <= 2 * (2 + 3)
+
+
+def test_test_statistics_match_summary():
+    outcomes = _random_outcomes()
+    analysis = CPCVAnalyzer(n_groups=5, n_test_groups=2, select_by="expectancy_r").analyze(outcomes)
+
+    for s, split in enumerate(analysis.splits):
+        scores = outcomes.scores(split.test_days)
+        np.testing.assert_allclose(analysis.test_expectancy[s], scores["expectancy_r"], atol=1e-12)
+        np.testing.assert_allclose(analysis.test_sharpe[s], scores["sharpe_ratio"], atol=1e-9)
+        np.testing.assert_array_equal(analysis.test_trades[s], scores["n_trades"])
+        train = outcomes.summary(split.train_days)["expectancy_r"].to_numpy()
+        assert analysis.selected[s] == np.argmax(train)
+
+    summary = analysis.summary()
+    assert len(summary) == len(outcomes.combos)
+    assert summary["times_selected"].sum() == analysis.n_splits
+    assert analysis.distribution(3)["expectancy_r"].shape == (analysis.n_splits,)
+    np.testing.assert_array_equal(analysis.distribution({"combo": 3})["sharpe_ratio"], analysis.test_sharpe[:, 3])
+    assert 0.0 <= analysis.pbo <= 1.0
+
+
+def test_paths_cover_every_group_once():
+    outcomes = _random_outcomes()
+    analysis = CPCVAnalyzer(n_groups=6, n_test_groups=3, select_by="sharpe_ratio").analyze(outcomes)
+
+    assert analysis.path_splits.shape == (comb(5, 2), 6)
+    # Every (group, split) pair with the group on test is used by exactly one path
+    pairs = {(g, s) for path in analysis.path_splits for g, s in enumerate(path)}
+    assert len(pairs) == analysis.n_paths * 6
+    for g, column in enumerate(analysis.path_splits.T):
+        assert all(g in analysis.splits[s].test_groups for s in column)
+
+    # Stitched path expectancy equals the trades the picks made on their groups
+    path = analysis.path_splits[0]
+    r = outcomes.r_multiple
+    stitched = np.concatenate([
+        r[analysis.groups == g, analysis.selected[s]] for g, s in enumerate(path)
+    ])
+    assert analysis.path_expectancy[0] == pytest.approx(np.nanmean(stitched))
+
+
+def test_composite_selection_and_to_dict():
+    outcomes = _random_outcomes(n_combos=10)
+    analysis = CPCVAnalyzer(n_groups=4, n_test_groups=1, min_trades=10).analyze(outcomes)
+
+    for s, split in enumerate(analysis.splits):
+        expected = outcomes.scores(split.train_days, min_trades=10)["composite_score"].to_numpy()
+        np.testing.assert_allclose(analysis.train_score[s], expected)
+    data = analysis.to_dict()
+    assert data["n_splits"] == 4 and data["n_paths"] == 1
+    assert set(data["path_expectancy"]) == {"p5", "p50", "p95"}
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError, match="n_test_groups"):
+        CPCVAnalyzer(n_groups=4, n_test_groups=4)
+    with pytest.raises(ValueError, match="select_by"):
+        CPCVAnalyzer(select_by="win_rate")
+    with pytest.raises(ValueError, match="cannot form"):
+        CPCVAnalyzer(n_groups=10).analyze(_random_outcomes(n_days=8))
+    with pytest.raises(ValueError, match="OutcomeMatrix"):
+        CPCVAnalyzer().analyze()
+
+
+def test_runs_sweep_when_outcomes_not_cached(tmp_path):
+    data_dir = tmp_path / "data"
+    write_synthetic_parquet(data_dir, symbol="QQQ", days=60, seed=5)
+    sweep = ParameterSweep(
+        base_ruleset_path="vibe/rulesets/orb_production.yaml",
+        data_dir=data_dir,
+        parameters=[ParameterDefinition("strategy.orb_duration_minutes", [5, 15], name="orb_duration")],
+        sweep_mode="grid",
+        feature_store=FeatureStore(tmp_path / "features"),
+    )
+    start, end = datetime(2024, 1, 1, tzinfo=ET), datetime(2024, 4, 30, tzinfo=ET)
+
+    analysis = CPCVAnalyzer(n_groups=4, n_test_groups=2, select_by="expectancy_r").analyze(
+        sweep=sweep, symbol="QQQ", start_date=start, end_date=end, workers=2
+    )
+    assert sweep.outcomes is not None
+    assert analysis.test_expectancy.shape == (comb(4, 2), 2)
+    assert analysis.timing.workers == 2
+    np.testing.assert_allclose(
+        analysis.test_expectancy[0],
+        sweep.outcomes.summary(analysis.splits[0].test_days)["expectancy_r"],
+    )
@@ -0,0 +1,58 @@
+"""
+Parity tests for BacktestEngine(columnar=True).
+
+The columnar event loop must reproduce the row-by-row loop exactly: same
+trades (field-for-field), same equity curve and same pending-order state.
+Runs on synthetic 1-minute bars so it does not depend on local Parquet data.
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from vibe.backtester.core.engine import BacktestEngine
+from vibe.backtester.core.execution.config import ExecutionConfig
+from vibe.tests.backtester.conftest import ruleset_with
+
+ET = ZoneInfo("America/New_York")
+START = datetime(2024, 1, 1, tzinfo=ET)
+END = datetime(2024, 3, 31, tzinfo=ET)
+
+pytestmark = pytest.mark.synthetic_data(days=40, seed=11)
+
+
+def _run_both(ruleset, data_dir, **engine_kwargs):
+    results = []
+    for columnar in (False, True):
+        engine = BacktestEngine(ruleset, data_dir, columnar=columnar, **engine_kwargs)
+        results.append((engine.run("QQQ", START, END), engine))
+    return results
+
+
+def _assert_identical(rows, cols):
+    (rows_result, rows_engine), (cols_result, cols_engine) = rows, cols
+    assert rows_result.trades, "synthetic data should produce trades"
+    assert [t.model_dump() for t in cols_result.trades] == [t.model_dump() for t in rows_result.trades]
+    assert cols_result.equity.equity_curve.equals(rows_result.equity.equity_curve)
+    assert cols_result.overall == rows_result.overall
+    assert cols_engine.pending_orders == rows_engine.pending_orders
+
+
+def test_columnar_matches_rows_default_ruleset(data_dir):
+    _assert_identical(*_run_both(ruleset_with(), data_dir))
+
+
+def test_columnar_matches_rows_with_take_profit(data_dir):
+    ruleset = ruleset_with(exit={"take_profit": {"method": "orb_range_multiple", "multiplier": 1.5}})
+    _assert_identical(*_run_both(ruleset, data_dir))
+
+
+def test_columnar_matches_rows_with_trailing_stop(data_dir):
+    ruleset = ruleset_with(exit={"trailing_stop": {"method": "breakeven_plus_ticks", "trigger_r": 1.0, "plus_ticks": 2}})
+    _assert_identical(*_run_both(ruleset, data_dir))
+
+
+def test_columnar_matches_rows_realistic_execution_with_latency(data_dir):
+    config = ExecutionConfig.realistic(latency_bars=1)
+    _assert_identical(*_run_both(ruleset_with(), data_dir, execution_config=config))
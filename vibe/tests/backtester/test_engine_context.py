@@ -0,0 +1,98 @@
+"""
+Bounded strategy context in BacktestEngine.
+
+The engine hands the strategy only the current session plus
+context_lookback_bars preceding bars. Signals (and therefore trades) must be
+identical to the legacy unbounded df.loc[:ts] context, including the volume
+filter, whose baseline is passed separately as a running mean.
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import pytest
+
+from vibe.backtester.core.engine import BacktestEngine
+from vibe.backtester.runner import RuleSetRunner
+from vibe.common.ruleset.loader import RuleSetLoader
+from vibe.common.strategies.orb import ORBStrategy, ORBStrategyConfig
+
+ET = ZoneInfo("America/New_York")
+START = datetime(2024, 1, 1, tzinfo=ET)
+END = datetime(2024, 3, 31, tzinfo=ET)
+
+pytestmark = pytest.mark.synthetic_data(days=30, seed=3)
+
+
+def _volume_filtered_ruleset():
+    base = RuleSetLoader.from_name("orb_production")
+    data = base.model_dump()
+    data["trade_filter"].update({"volume_confirmation": True, "volume_threshold": 1.2})
+    return type(base).model_validate(data)
+
+
+def _trades(ruleset, data_dir, **kwargs):
+    result = BacktestEngine(ruleset, data_dir, **kwargs).run("QQQ", START, END)
+    return [t.model_dump() for t in result.trades]
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize("lookback", [0, 12])
+def test_bounded_context_matches_unbounded(data_dir, columnar, lookback):
+    for ruleset in (RuleSetLoader.from_name("orb_production"), _volume_filtered_ruleset()):
+        unbounded = _trades(ruleset, data_dir, columnar=columnar, context_lookback_bars=None)
+        bounded = _trades(ruleset, data_dir, columnar=columnar, context_lookback_bars=lookback)
+        assert unbounded
+        assert bounded == unbounded
+
+
+def test_context_is_bounded_to_session_plus_lookback(data_dir, monkeypatch):
+    seen = []
+    original = RuleSetRunner.generate_signal
+
+    def spy(self, symbol, current_bar, df_context, avg_volume=None):
+        seen.append((current_bar["timestamp"], df_context))
+        return original(self, symbol, current_bar, df_context, avg_volume=avg_volume)
+
+    monkeypatch.setattr(RuleSetRunner, "generate_signal", spy)
+    BacktestEngine(RuleSetLoader.from_name("orb_production"), data_dir, context_lookback_bars=4).run(
+        "QQQ", START, END
+    )
+
+    assert seen
+    for ts, ctx in seen:
+        assert ctx.index[-1] == ts
+        prior = ctx[ctx.index.date < ts.date()]
+        assert len(prior) <= 4
+        # 78 five-minute bars per regular session
+        assert len(ctx) <= 78 + 4
+
+
+def test_negative_lookback_rejected(data_dir):
+    with pytest.raises(ValueError):
+        BacktestEngine(RuleSetLoader.from_name("orb_production"), data_dir, context_lookback_bars=-1)
+
+
+def test_strategy_uses_supplied_avg_volume():
+    """An explicit avg_volume overrides the df_context mean for the volume filter."""
+    strat = ORBStrategy(ORBStrategyConfig(
+        name="t", orb_start_time="09:30", orb_duration_minutes=5,
+        use_volume_filter=True, volume_threshold=1.5,
+    ))
+    ts = [datetime(2024, 1, 2, 9, 30, tzinfo=ET), datetime(2024, 1, 2, 9, 35, tzinfo=ET)]
+    df = pd.DataFrame({
+        "timestamp": pd.to_datetime(ts),
+        "open": [100.0, 100.5], "high": [101.0, 103.0], "low": [99.0, 100.4],
+        "close": [100.5, 102.9], "volume": [1_000.0, 2_000.0], "ATR_14": [1.0, 1.0],
+    })
+    bar = df.iloc[-1].to_dict()
+    bar["timestamp"] = ts[-1]
+
+    # Context mean is 1500 → 2000 < 2250 filters the breakout...
+    signal, meta = strat.generate_signal_incremental("QQQ", bar, df)
+    assert (signal, meta["reason"]) == (0, "insufficient_volume")
+
+    # ...but against a lower full-history baseline it passes.
+    signal, _ = strat.generate_signal_incremental("QQQ", bar, df, avg_volume=1_000.0)
+    assert signal == 1
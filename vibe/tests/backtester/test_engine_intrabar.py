@@ -0,0 +1,69 @@
+"""
+Intrabar mode: bars whose stop/TP order is ambiguous are replayed from the
+1m bars they were resampled from; every other bar is handled as in 5m mode.
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from vibe.backtester.core.engine import BacktestEngine
+from vibe.tests.backtester.conftest import ruleset_with
+
+ET = ZoneInfo("America/New_York")
+START = datetime(2024, 1, 1, tzinfo=ET)
+MID = datetime(2024, 2, 7, tzinfo=ET)
+END = datetime(2024, 6, 30, tzinfo=ET)
+
+pytestmark = pytest.mark.synthetic_data(days=60, seed=7)
+
+
+def _ruleset():
+    return ruleset_with(exit={
+        "take_profit": {"method": "orb_range_multiple", "multiplier": 1.0},
+        "trailing_stop": {
+            "method": "stepped_r_multiple",
+            "steps": [{"at": 0.5, "move_stop_to": 0.0}, {"at": 0.8, "move_stop_to": 0.4}],
+        },
+    })
+
+
+def test_intrabar_matches_across_loops_and_reports_drill_downs(data_dir):
+    plain = BacktestEngine(_ruleset(), data_dir).run("QQQ", START, END)
+    assert plain.trades
+
+    results = []
+    for columnar in (False, True):
+        engine = BacktestEngine(_ruleset(), data_dir, columnar=columnar, intrabar=True)
+        results.append(engine.run("QQQ", START, END))
+        stats = engine.intrabar_stats
+        assert 0 < stats.drilled < stats.exit_checks
+        assert stats.overhead_seconds > 0
+    rows, columnar = results
+    assert [t.model_dump() for t in rows.trades] == [t.model_dump() for t in columnar.trades]
+
+    # Entries and non-replayed exits are unchanged; only exit choices on drilled bars move
+    assert [t.entry_time for t in rows.trades] == [t.entry_time for t in plain.trades]
+    assert any(a.exit_price != b.exit_price for a, b in zip(rows.trades, plain.trades))
+
+
+def test_intrabar_off_by_default(data_dir):
+    engine = BacktestEngine(_ruleset(), data_dir)
+    engine.run("QQQ", START, END)
+    assert engine.intrabar_stats is None
+
+
+def test_intrabar_portfolio_and_resume_match_run(data_dir, tmp_path):
+    def engine():
+        return BacktestEngine(_ruleset(), data_dir, columnar=True, intrabar=True)
+
+    full = engine().run("QQQ", START, END)
+    portfolio = engine().run_portfolio(["QQQ"], START, END)
+    assert [t.model_dump() for t in portfolio.trades] == [t.model_dump() for t in full.trades]
+
+    engine().run("QQQ", START, MID, save_snapshot=tmp_path / "snap")
+    resumed = engine().resume(tmp_path / "snap", END)
+    assert [t.model_dump() for t in resumed.trades] == [t.model_dump() for t in full.trades]
+    with pytest.raises(ValueError, match="different ruleset"):
+        BacktestEngine(_ruleset(), data_dir, columnar=True).resume(tmp_path / "snap", END)
@@ -0,0 +1,101 @@
+"""
+Multi-symbol BacktestEngine.run_portfolio: one loader, one merged timeline,
+one shared portfolio.
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from vibe.backtester.core import engine as engine_module
+from vibe.backtester.core.engine import BacktestEngine
+from vibe.backtester.data.synthetic import generate_minute_bars, write_synthetic_parquet
+from vibe.common.ruleset.loader import RuleSetLoader
+
+ET = ZoneInfo("America/New_York")
+START = datetime(2024, 1, 1, tzinfo=ET)
+END = datetime(2024, 3, 31, tzinfo=ET)
+
+
+@pytest.fixture(scope="module")
+def data_dir(tmp_path_factory):
+    path = tmp_path_factory.mktemp("synthetic_parquet")
+    write_synthetic_parquet(path, symbol="QQQ", days=30, seed=1)
+    write_synthetic_parquet(path, symbol="SPY", days=30, base_price=470.0, seed=2)
+    # IWM is missing a mid-morning stretch on one day: positions must still be marked.
+    iwm = generate_minute_bars(days=30, base_price=200.0, seed=3)
+    gap = (iwm.index.date == sorted(set(iwm.index.date))[5]) & (iwm.index.hour == 10)
+    write_synthetic_parquet(path, symbol="IWM", df=iwm[~gap])
+    return path
+
+
+@pytest.fixture(scope="module")
+def ruleset():
+    return RuleSetLoader.from_name("orb_production")
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_single_symbol_portfolio_matches_run(data_dir, ruleset, columnar):
+    single = BacktestEngine(ruleset, data_dir, columnar=columnar).run("QQQ", START, END)
+    merged = BacktestEngine(ruleset, data_dir).run_portfolio(["QQQ"], START, END)
+
+    assert [t.model_dump() for t in merged.trades] == [t.model_dump() for t in single.trades]
+    assert merged.equity.equity_curve.equals(single.equity.equity_curve)
+    assert merged.symbol == "QQQ"
+
+
+def test_portfolio_merges_timelines_and_shares_capital(data_dir, ruleset):
+    symbols = ["QQQ", "SPY", "IWM"]
+    result = BacktestEngine(ruleset, data_dir, initial_capital=100_000.0).run_portfolio(symbols, START, END)
+
+    assert result.symbol == "QQQ,SPY,IWM"
+    assert {t.symbol for t in result.trades} == set(symbols)
+
+    curve = result.equity.equity_curve
+    standalone = [
+        BacktestEngine(ruleset, data_dir, initial_capital=100_000.0).run(s, START, END) for s in symbols
+    ]
+    union = standalone[0].equity.equity_curve.index
+    for other in standalone[1:]:
+        union = union.union(other.equity.equity_curve.index)
+    assert curve.index.equals(union)
+
+    # Positions overlap in time, so the universe really shares one portfolio.
+    trades = sorted(result.trades, key=lambda t: t.entry_time)
+    assert any(
+        a.symbol != b.symbol and b.entry_time < a.exit_time
+        for a, b in zip(trades, trades[1:])
+    )
+
+    # Every session ends flat, so equity reconciles to realised P&L.
+    assert curve.iloc[-1] == pytest.approx(100_000.0 + sum(t.pnl for t in result.trades))
+
+    # Later entries are sized off cash already committed to earlier positions.
+    standalone_qty = {
+        (t.symbol, t.entry_time): t.quantity for r in standalone for t in r.trades
+    }
+    assert any(standalone_qty.get((t.symbol, t.entry_time)) != t.quantity for t in result.trades)
+
+
+def test_portfolio_loads_all_symbols_through_one_loader(data_dir, ruleset, monkeypatch):
+    created = []
+    real_loader = engine_module.ParquetLoader
+
+    def counting_loader(data_dir, symbols, **kwargs):
+        created.append(list(symbols))
+        return real_loader(data_dir, symbols, **kwargs)
+
+    monkeypatch.setattr(engine_module, "ParquetLoader", counting_loader)
+    BacktestEngine(ruleset, data_dir).run_portfolio(["QQQ", "SPY"], START, END)
+    assert created == [["QQQ", "SPY"]]
+
+
+def test_portfolio_defaults_to_ruleset_symbols(data_dir, ruleset):
+    result = BacktestEngine(ruleset, data_dir).run_portfolio(None, START, END)
+    assert result.symbol == ",".join(ruleset.instruments.symbols)
+
+
+def test_portfolio_rejects_duplicate_symbols(data_dir, ruleset):
+    with pytest.raises(ValueError):
+        BacktestEngine(ruleset, data_dir).run_portfolio(["QQQ", "QQQ"], START, END)
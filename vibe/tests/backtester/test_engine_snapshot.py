@@ -0,0 +1,143 @@
+"""
+Incremental backtests: BacktestEngine.run(save_snapshot=...) persists the
+end-of-run state and resume() extends it over new bars only. The resumed
+result must equal a full run over the combined range.
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import pytest
+
+from vibe.backtester.core.engine import BacktestEngine, _add_atr, _atr_state
+from vibe.backtester.core.execution.config import ExecutionConfig
+from vibe.backtester.core.snapshot import EngineSnapshot
+from vibe.backtester.data.feature_store import FeatureStore
+from vibe.common.ruleset.loader import RuleSetLoader
+
+ET = ZoneInfo("America/New_York")
+START = datetime(2024, 1, 1, tzinfo=ET)
+MID = datetime(2024, 1, 24, tzinfo=ET)
+END = datetime(2024, 3, 31, tzinfo=ET)
+
+pytestmark = pytest.mark.synthetic_data(days=30, seed=3)
+
+
+def _volume_filtered_ruleset():
+    base = RuleSetLoader.from_name("orb_production")
+    data = base.model_dump()
+    data["trade_filter"].update({"volume_confirmation": True, "volume_threshold": 1.2})
+    return type(base).model_validate(data)
+
+
+def _assert_same(resumed, full):
+    assert full.trades
+    assert [t.model_dump() for t in resumed.trades] == [t.model_dump() for t in full.trades]
+    pd.testing.assert_series_equal(resumed.equity.equity_curve, full.equity.equity_curve)
+    assert resumed.overall == full.overall
+    assert (resumed.start_date, resumed.end_date) == (full.start_date, full.end_date)
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+@pytest.mark.parametrize("lookback", [0, 12])
+def test_resume_matches_full_run(data_dir, tmp_path, columnar, lookback):
+    ruleset = _volume_filtered_ruleset()
+    engine = BacktestEngine(ruleset, data_dir, columnar=columnar, context_lookback_bars=lookback)
+    full = engine.run("QQQ", START, END)
+
+    head = engine.run("QQQ", START, MID, save_snapshot=tmp_path / "snap")
+    assert 0 < len(head.trades) < len(full.trades)
+
+    resumed = BacktestEngine(
+        ruleset, data_dir, columnar=columnar, context_lookback_bars=lookback
+    ).resume(tmp_path / "snap", END)
+    _assert_same(resumed, full)
+
+
+def test_chained_resumes_with_realistic_execution(data_dir, tmp_path):
+    def engine():
+        return BacktestEngine(
+            RuleSetLoader.from_name("orb_production"),
+            data_dir,
+            execution_config=ExecutionConfig.realistic(latency_bars=1),
+            columnar=True,
+            context_lookback_bars=6,
+        )
+
+    full = engine().run("QQQ", START, END)
+    engine().run("QQQ", START, datetime(2024, 1, 12, tzinfo=ET), save_snapshot=tmp_path / "a")
+    engine().resume(tmp_path / "a", MID, save_snapshot=tmp_path / "b")
+    _assert_same(engine().resume(tmp_path / "b", END), full)
+
+
+def test_resume_with_precomputed_features(data_dir, tmp_path):
+    features = FeatureStore(tmp_path / "features").features(data_dir, "QQQ", "5m", ["atr_14", "adx_14"])
+    features["ATR_14"] = features["atr_14"]
+    engine = BacktestEngine(RuleSetLoader.from_name("orb_production"), data_dir)
+    full = engine.run("QQQ", START, END, precomputed_features=features)
+
+    engine.run("QQQ", START, MID, precomputed_features=features, save_snapshot=tmp_path / "snap")
+    resumed = engine.resume(tmp_path / "snap", END, precomputed_features=features, verify=True)
+    _assert_same(resumed, full)
+
+
+def test_warm_atr_is_bitwise_identical(data_dir):
+    bars = BacktestEngine(RuleSetLoader.from_name("orb_production"), data_dir)._prepare_bars(
+        "QQQ", START, END, None
+    )[["open", "high", "low", "close", "volume"]]
+    full = _add_atr(bars)["ATR_14"]
+    for split in (5, 14, 200):
+        warm = _atr_state(bars.iloc[:split])
+        tail = _add_atr(bars.iloc[split:], warm=warm)["ATR_14"]
+        pd.testing.assert_series_equal(tail, full.iloc[split:], check_exact=True)
+
+
+def test_snapshot_round_trip(data_dir, tmp_path):
+    engine = BacktestEngine(RuleSetLoader.from_name("orb_production"), data_dir, context_lookback_bars=12)
+    result = engine.run("QQQ", START, MID, save_snapshot=tmp_path / "snap")
+
+    snap = EngineSnapshot.load(tmp_path / "snap")
+    assert snap.symbol == "QQQ"
+    assert snap.start_date == START
+    assert snap.last_timestamp == result.equity.equity_curve.index[-1]
+    assert [t.model_dump() for t in snap.trades] == [t.model_dump() for t in result.trades]
+    assert len(snap.context) == 12
+    assert len(snap.daily_volume) == 20
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_resume_rejects_different_settings(data_dir, tmp_path):
+    ruleset = RuleSetLoader.from_name("orb_production")
+    BacktestEngine(ruleset, data_dir).run("QQQ", START, MID, save_snapshot=tmp_path / "snap")
+
+    with pytest.raises(ValueError, match="different ruleset"):
+        BacktestEngine(ruleset, data_dir, initial_capital=50_000.0).resume(tmp_path / "snap", END)
+    with pytest.raises(ValueError, match="different ruleset"):
+        BacktestEngine(_volume_filtered_ruleset(), data_dir).resume(tmp_path / "snap", END)
+    with pytest.raises(ValueError, match="bounded context"):
+        BacktestEngine(ruleset, data_dir, context_lookback_bars=None).resume(tmp_path / "snap", END)
+
+
+def test_resume_rejects_mid_session_snapshot(data_dir, tmp_path):
+    engine = BacktestEngine(RuleSetLoader.from_name("orb_production"), data_dir)
+    engine.run("QQQ", START, datetime(2024, 1, 23, 12, 0, tzinfo=ET), save_snapshot=tmp_path / "snap")
+
+    with pytest.raises(ValueError, match="part-way through"):
+        engine.resume(tmp_path / "snap", END)
+
+
+def test_verify_detects_divergence(data_dir, tmp_path, monkeypatch):
+    engine = BacktestEngine(RuleSetLoader.from_name("orb_production"), data_dir)
+    engine.run("QQQ", START, MID, save_snapshot=tmp_path / "snap")
+
+    real_load = EngineSnapshot.load
+
+    def lose_cash(path):
+        snap = real_load(path)
+        snap.cash -= 100.0
+        return snap
+
+    monkeypatch.setattr(EngineSnapshot, "load", staticmethod(lose_cash))
+    with pytest.raises(RuntimeError, match="differs from a full re-run"):
+        engine.resume(tmp_path / "snap", END, verify=True)
@@ -0,0 +1,116 @@
+"""
+FeatureStore: persistent resampled bars and features keyed by source hash
+and feature code version, computing only missing features or appended ranges.
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vibe.backtester.analysis.regime_research import features as features_module
+from vibe.backtester.analysis.regime_research.features import FeatureEngine
+from vibe.backtester.data import feature_store as feature_store_module
+from vibe.backtester.data.bar_cache import resample_ohlcv
+from vibe.backtester.data.feature_store import FeatureStore
+from vibe.backtester.data.synthetic import generate_minute_bars, write_synthetic_parquet
+
+ET = ZoneInfo("America/New_York")
+NAMES = ["atr_14", "atr_pctile", "adx_14", "slope_20d"]
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    path = tmp_path / "parquet"
+    write_synthetic_parquet(path, symbol="QQQ", df=generate_minute_bars(days=40, seed=4))
+    return path
+
+
+@pytest.fixture
+def compute_calls(monkeypatch):
+    """Record (features, n_rows) for every FeatureEngine.compute call."""
+    calls = []
+    original = FeatureEngine.compute
+
+    def recording(self, df, features="all"):
+        calls.append((list(features), len(df)))
+        return original(self, df, features)
+
+    monkeypatch.setattr(FeatureEngine, "compute", recording)
+    return calls
+
+
+def _expected(data_dir, names, timeframe="5min"):
+    bars = resample_ohlcv(pd.read_parquet(data_dir / "QQQ.parquet"), timeframe)
+    return FeatureEngine().compute(bars, names)
+
+
+def test_features_match_feature_engine(tmp_path, data_dir):
+    store = FeatureStore(tmp_path / "store")
+    pd.testing.assert_frame_equal(store.features(data_dir, "QQQ", "5m", NAMES), _expected(data_dir, NAMES))
+
+    start, end = datetime(2024, 1, 10, tzinfo=ET), datetime(2024, 1, 20, tzinfo=ET)
+    window = store.features(data_dir, "QQQ", "5m", NAMES, start, end)
+    assert window.index.min() >= start and window.index.max() <= end
+    pd.testing.assert_frame_equal(window, _expected(data_dir, NAMES).loc[start:end])
+
+
+def test_persisted_features_are_not_recomputed(tmp_path, data_dir, compute_calls):
+    n_bars = len(resample_ohlcv(pd.read_parquet(data_dir / "QQQ.parquet"), "5min"))
+    FeatureStore(tmp_path / "store").features(data_dir, "QQQ", "5m", ["atr_14"])
+    assert compute_calls == [(["atr_14"], n_bars)]
+
+    # New process (fresh instance): one stored, one missing feature
+    compute_calls.clear()
+    result = FeatureStore(tmp_path / "store").features(data_dir, "QQQ", "5m", ["atr_14", "adx_14"])
+    assert [names for names, _ in compute_calls] == [["adx_14"]]
+    compute_calls.clear()
+    pd.testing.assert_frame_equal(result, _expected(data_dir, ["atr_14", "adx_14"]))
+
+
+def test_version_bump_recomputes_dependants(tmp_path, data_dir, compute_calls, monkeypatch):
+    FeatureStore(tmp_path / "store").features(data_dir, "QQQ", "5m", ["atr_14", "atr_pctile", "adx_14"])
+    compute_calls.clear()
+
+    monkeypatch.setitem(features_module._FEATURE_VERSIONS, "atr_14", 2)
+    FeatureStore(tmp_path / "store").features(data_dir, "QQQ", "5m", ["atr_14", "atr_pctile", "adx_14"])
+    assert sorted(names[0] for names, _ in compute_calls) == ["atr_14", "atr_pctile"]
+
+
+def test_appended_source_computes_only_the_new_range(tmp_path, compute_calls, monkeypatch):
+    monkeypatch.setattr(feature_store_module, "_APPEND_WARMUP", pd.Timedelta(days=15))
+    data_dir = tmp_path / "parquet"
+    full = generate_minute_bars(days=60, seed=8)
+    dates = sorted(set(full.index.date))
+    store = FeatureStore(tmp_path / "store")
+
+    # Last session still in progress at the first sync
+    first = full[(full.index.date < dates[40]) | ((full.index.date == dates[40]) & (full.index.hour < 12))]
+    write_synthetic_parquet(data_dir, symbol="QQQ", df=first)
+    store.features(data_dir, "QQQ", "5m", ["atr_14", "adx_14"])
+
+    compute_calls.clear()
+    write_synthetic_parquet(data_dir, symbol="QQQ", df=full)
+    result = store.features(data_dir, "QQQ", "5m", ["atr_14", "adx_14"])
+
+    n_bars = len(resample_ohlcv(full, "5min"))
+    calls = {names[0]: rows for names, rows in compute_calls if rows < n_bars}
+    # atr_14 converges inside the warm-up, so only the tail is computed
+    assert "atr_14" in calls
+    expected = _expected(data_dir, ["atr_14", "adx_14"])
+    np.testing.assert_allclose(result["atr_14"], expected["atr_14"], rtol=1e-9)
+    # Daily ADX does not converge in 15 days: the overlap check forces a full recompute
+    pd.testing.assert_series_equal(result["adx_14"], expected["adx_14"])
+
+
+def test_rewritten_source_invalidates_store(tmp_path, data_dir):
+    store = FeatureStore(tmp_path / "store")
+    before = store.features(data_dir, "QQQ", "5m", ["atr_14"])
+
+    write_synthetic_parquet(data_dir, symbol="QQQ", df=generate_minute_bars(days=40, seed=99))
+    after = store.features(data_dir, "QQQ", "5m", ["atr_14"])
+
+    assert not after.equals(before)
+    pd.testing.assert_frame_equal(after, _expected(data_dir, ["atr_14"]))
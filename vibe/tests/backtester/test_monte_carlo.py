@@ -0,0 +1,104 @@
+"""
+Monte Carlo trade-sequence resampling: vectorized path metrics match a
+per-path loop, seeded output is reproducible, and the optional pipeline
+stage resamples the best candidate's trades.
+"""
+
+import json
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+
+from vibe.backtester.analysis.monte_carlo import MonteCarloAnalyzer, path_metrics
+from vibe.backtester.analysis.parameter_sweep import ParameterDefinition
+from vibe.backtester.data.feature_store import FeatureStore
+from vibe.backtester.data.synthetic import write_synthetic_parquet
+from vibe.backtester.optimization.pipeline import OptimizationPipeline
+
+ET = ZoneInfo("America/New_York")
+
+
+def _r_multiples(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.where(rng.random(n) < 0.4, rng.exponential(2.5, n), -1.0)
+
+
+def test_path_metrics_match_loop():
+    paths = _r_multiples(n=400).reshape(8, 50)
+    metrics = path_metrics(paths, risk_fraction=0.01, initial_capital=10_000.0)
+
+    for row, k in zip(paths, range(len(paths))):
+        streak = current = 0
+        cum = peak = max_dd = 0.0
+        equity = 10_000.0
+        for r in row:
+            current = current + 1 if r <= 0 else 0
+            streak = max(streak, current)
+            cum += r
+            peak = max(peak, cum)
+            max_dd = max(max_dd, peak - cum)
+            equity *= 1.0 + 0.01 * r
+        assert metrics["max_losing_streak"][k] == streak
+        assert metrics["max_drawdown_r"][k] == pytest.approx(max_dd)
+        assert metrics["total_r"][k] == pytest.approx(cum)
+        assert metrics["terminal_equity"][k] == pytest.approx(equity)
+
+
+def test_seeded_output_is_reproducible():
+    r = _r_multiples()
+    a = MonteCarloAnalyzer(n_paths=500, seed=11).analyze(r)
+    b = MonteCarloAnalyzer(n_paths=500, seed=11, methods=["shuffle"]).analyze(r)
+    c = MonteCarloAnalyzer(n_paths=500, seed=12).analyze(r)
+
+    np.testing.assert_array_equal(
+        a.distributions["shuffle"].max_drawdown_r, b.distributions["shuffle"].max_drawdown_r
+    )
+    assert not np.array_equal(a.distributions["bootstrap"].total_r, c.distributions["bootstrap"].total_r)
+    assert a.to_dict() == MonteCarloAnalyzer(n_paths=500, seed=11).analyze(r).to_dict()
+
+
+def test_shuffle_preserves_trades_and_block_keeps_runs():
+    r = _r_multiples(n=120)
+    analysis = MonteCarloAnalyzer(n_paths=200, seed=3, block_size=10).analyze(r)
+
+    shuffled = analysis.distributions["shuffle"]
+    np.testing.assert_allclose(shuffled.total_r, r.sum())
+    assert shuffled.max_drawdown_r.min() < shuffled.max_drawdown_r.max()
+
+    idx = MonteCarloAnalyzer._indices("block", 5, len(r), 10, np.random.default_rng(0))
+    assert idx.shape == (5, len(r))
+    assert np.all((np.diff(idx.reshape(5, -1, 10), axis=2) % len(r)) == 1)
+
+
+def test_invalid_method_rejected():
+    with pytest.raises(ValueError):
+        MonteCarloAnalyzer(methods=["jackknife"])
+
+
+def test_pipeline_monte_carlo_stage(tmp_path):
+    data_dir = tmp_path / "parquet"
+    write_synthetic_parquet(data_dir, symbol="QQQ", days=60, seed=4)
+    pipeline = OptimizationPipeline(
+        "vibe/rulesets/orb_production.yaml", data_dir, feature_store=FeatureStore(tmp_path / "features")
+    )
+    result = pipeline.optimize(
+        "QQQ",
+        datetime(2024, 1, 1, tzinfo=ET),
+        datetime(2024, 3, 31, tzinfo=ET),
+        [ParameterDefinition("exit.take_profit.multiplier", [2.0, 3.0], name="tp_multiplier")],
+        sweep_mode="grid",
+        output_dir=tmp_path / "out",
+        run_monte_carlo=True,
+        monte_carlo_paths=300,
+        monte_carlo_seed=5,
+    )
+
+    mc = result.monte_carlo_analysis
+    assert mc.n_trades > 0
+    assert set(mc.distributions) == {"bootstrap", "block", "shuffle"}
+    assert json.loads((tmp_path / "out" / "monte_carlo.json").read_text()) == json.loads(
+        json.dumps(mc.to_dict())
+    )
+    assert "Monte Carlo (300 paths, seed 5)" in result.summary()
@@ -0,0 +1,191 @@
+"""
+OutcomeMatrix: per-day x combination trade outcomes from a sweep must
+reproduce PerformanceAnalyzer metrics for any window without re-running.
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vibe.backtester.analysis.outcome_matrix import EXIT_REASONS, TRADE_COLUMNS, OutcomeMatrix, trades_frame
+from vibe.backtester.analysis.parameter_sweep import ParameterDefinition, ParameterSweep
+from vibe.backtester.analysis.performance import PerformanceAnalyzer
+from vibe.backtester.analysis.scoring import calculate_tail_ratio, composite_score, composite_scores
+from vibe.backtester.analysis.walk_forward import WalkForwardEngine
+from vibe.backtester.core.engine import BacktestEngine
+from vibe.backtester.data.feature_store import FeatureStore
+
+ET = ZoneInfo("America/New_York")
+START = datetime(2024, 1, 1, tzinfo=ET)
+END = datetime(2024, 7, 31, tzinfo=ET)
+
+pytestmark = pytest.mark.synthetic_data(days=140, seed=21)
+
+
+def _sweep(data_dir, store_dir):
+    return ParameterSweep(
+        base_ruleset_path="vibe/rulesets/orb_production.yaml",
+        data_dir=data_dir,
+        parameters=[ParameterDefinition("strategy.orb_duration_minutes", [5, 15, 30], name="orb_duration")],
+        sweep_mode="grid",
+        feature_store=FeatureStore(store_dir),
+    )
+
+
+@pytest.fixture(scope="module")
+def swept(data_dir, tmp_path_factory):
+    sweep = _sweep(data_dir, tmp_path_factory.mktemp("features"))
+    results = []
+    sweep.run("QQQ", START, END, result_callback=results.append, collect_outcomes=True)
+    return sweep, results
+
+
+def test_full_window_matches_backtest_metrics(swept):
+    sweep, results = swept
+    outcomes = sweep.outcomes
+    assert outcomes.r_multiple.shape == (len(outcomes.days), 3)
+
+    summary = outcomes.summary()
+    for j, r in enumerate(results):
+        overall = r.result.overall
+        assert overall.n_trades > 0
+        assert outcomes.convexity(r.params) == overall
+        row = summary.iloc[j]
+        assert row["n_trades"] == overall.n_trades
+        assert row["expectancy_r"] == pytest.approx(overall.expectancy_r, rel=1e-12)
+        assert row["total_pnl"] == pytest.approx(overall.total_pnl, rel=1e-12)
+        assert row["skewness"] == pytest.approx(overall.skewness, rel=1e-9, abs=1e-12)
+        assert (row["stop_wins"], row["eod_losses"]) == (overall.stop_wins, overall.eod_losses)
+
+
+def test_yearly_and_bucket_breakdowns(swept):
+    sweep, results = swept
+    outcomes = sweep.outcomes
+    by_year = outcomes.summary_by_year()
+    for j, r in enumerate(results):
+        for year, metrics in PerformanceAnalyzer._calc_by_year(r.result.trades).items():
+            row = by_year.loc[(year, j)]
+            assert row["n_trades"] == metrics.n_trades
+            assert row["expectancy_r"] == pytest.approx(metrics.expectancy_r, rel=1e-12)
+
+    labels = pd.Series(np.where(outcomes.days.dayofweek < 2, "early", "late"), index=outcomes.days)
+    buckets = outcomes.summary_by(labels)
+    total = buckets.groupby(level="combo")["n_trades"].sum()
+    assert list(total) == list(outcomes.summary()["n_trades"])
+
+
+def test_walk_forward_from_outcomes_matches_reruns(swept, data_dir):
+    sweep, results = swept
+    params = results[0].params
+    engine = WalkForwardEngine(sweep._create_modified_ruleset(params), data_dir)
+    kwargs = dict(train_months=2, test_months=1, step_months=1)
+
+    rerun = engine.analyze("QQQ", START, END, **kwargs)
+    fast = engine.analyze("QQQ", START, END, outcomes=sweep.outcomes, combo=params, **kwargs)
+
+    assert len(fast.periods) == len(rerun.periods) > 0
+    for a, b in zip(fast.periods, rerun.periods):
+        assert a.train_metrics.n_trades == b.train_result.overall.n_trades
+        assert a.test_metrics.n_trades == b.test_result.overall.n_trades
+        assert a.train_expectancy == pytest.approx(b.train_expectancy, rel=1e-9, abs=1e-12)
+        assert a.test_expectancy == pytest.approx(b.test_expectancy, rel=1e-9, abs=1e-12)
+    assert fast.walk_forward_score == pytest.approx(rerun.walk_forward_score, rel=1e-9)
+
+
+def test_scores_match_scoring_components(swept):
+    sweep, results = swept
+    scores = sweep.outcomes.scores()
+    for j, r in enumerate(results):
+        row = scores.iloc[j]
+        pnl = [t.pnl for t in r.result.trades]
+        gross_loss = -sum(x for x in pnl if x < 0)
+        assert row["tail_ratio"] == pytest.approx(calculate_tail_ratio(r.result.overall.r_multiples), rel=1e-12)
+        assert row["profit_factor"] == pytest.approx(sum(x for x in pnl if x > 0) / gross_loss, rel=1e-12)
+
+        overall = r.result.overall
+        vectorized = composite_scores(
+            [r.result.equity.sharpe_ratio], [overall.expectancy_r], [row["tail_ratio"]],
+            [overall.win_rate], [row["profit_factor"]], [overall.n_trades],
+        )
+        assert vectorized[0] == pytest.approx(composite_score(r.result), rel=1e-12)
+
+
+def test_walk_forward_optimization_reselects_per_window(swept, data_dir):
+    sweep, results = swept
+    engine = WalkForwardEngine(sweep._create_modified_ruleset(results[0].params), data_dir)
+    analysis = engine.optimize("QQQ", START, END, outcomes=sweep.outcomes, train_months=2, min_trades=5)
+
+    outcomes = sweep.outcomes
+    assert len(analysis.periods) > 1
+    for period in analysis.periods:
+        scores = outcomes.scores(outcomes.window(period.train_start, period.train_end), min_trades=5)
+        assert period.train_score == scores["composite_score"].max()
+        j = outcomes.combo_index(period.selected_params)
+        assert scores["composite_score"].iloc[j] == period.train_score
+        assert period.test_metrics == outcomes.convexity(j, period.test_start, period.test_end)
+    assert analysis.oos_metrics.n_trades == sum(p.test_metrics.n_trades for p in analysis.periods)
+
+    # OOS scoring of a selection agrees with actually backtesting it on the test window
+    period = analysis.periods[-1]
+    rerun = BacktestEngine(
+        sweep._create_modified_ruleset(period.selected_params), data_dir, slippage_ticks=engine.slippage_ticks
+    ).run("QQQ", period.test_start, period.test_end)
+    assert rerun.overall.n_trades == period.test_metrics.n_trades > 0
+    assert rerun.overall.expectancy_r == pytest.approx(period.test_expectancy, rel=1e-9, abs=1e-12)
+
+
+def test_anchored_walk_forward_optimization(swept, data_dir):
+    sweep, results = swept
+    engine = WalkForwardEngine(sweep._create_modified_ruleset(results[0].params), data_dir)
+    analysis = engine.optimize("QQQ", START, END, outcomes=sweep.outcomes, train_months=2, anchored=True)
+
+    assert {p.train_start for p in analysis.periods} == {START}
+    train_ends = [p.train_end for p in analysis.periods]
+    assert train_ends == sorted(train_ends) and len(set(train_ends)) == len(train_ends)
+    assert all(p.test_start > p.train_end for p in analysis.periods)
+    assert analysis.to_dict()["periods"][0]["selected_params"] == analysis.periods[0].selected_params
+
+    with pytest.raises(ValueError, match="OutcomeMatrix or a ParameterSweep"):
+        engine.optimize("QQQ", START, END)
+
+
+def test_save_load_roundtrip(swept, tmp_path):
+    outcomes = swept[0].outcomes
+    outcomes.save(tmp_path / "outcomes")
+    loaded = OutcomeMatrix.load(tmp_path / "outcomes")
+
+    assert loaded.days.equals(outcomes.days)
+    pd.testing.assert_frame_equal(loaded.combos, outcomes.combos)
+    for name in ("r_multiple", "pnl", "initial_risk", "exit_reason"):
+        np.testing.assert_array_equal(getattr(loaded, name), getattr(outcomes, name))
+
+
+def test_engine_exit_reasons_roundtrip(tmp_path):
+    reasons = ["TP", "STOP", "EOD"]
+    frame = pd.DataFrame(
+        [(datetime(2024, 3, day, 10, 0, tzinfo=ET), 50.0, 25.0, reason) for day, reason in zip((4, 5, 6), reasons)],
+        columns=TRADE_COLUMNS,
+    )
+    OutcomeMatrix.from_trades([{"x": 1}], [frame]).save(tmp_path / "outcomes")
+    loaded = OutcomeMatrix.load(tmp_path / "outcomes")
+
+    assert [EXIT_REASONS[code] for code in loaded.exit_reason[:, 0]] == reasons
+
+
+def test_outcomes_from_cached_sweep(swept, data_dir, tmp_path):
+    cache_dir = tmp_path / "cache"
+    _sweep(data_dir, tmp_path / "features").run("QQQ", START, END, cache_dir=cache_dir)
+    cached = _sweep(data_dir, tmp_path / "features")
+    cached.run("QQQ", START, END, cache_dir=cache_dir, collect_outcomes=True)
+
+    np.testing.assert_array_equal(cached.outcomes.r_multiple, swept[0].outcomes.r_multiple)
+
+
+def test_multiple_trades_per_day_rejected(swept):
+    trades = swept[1][0].result.trades
+    frame = trades_frame(trades[:1] + trades[:1])
+    with pytest.raises(ValueError):
+        OutcomeMatrix.from_trades([{"x": 1}], [frame])
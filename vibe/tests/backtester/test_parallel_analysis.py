@@ -0,0 +1,69 @@
+"""
+Walk-forward and robustness backtests dispatched to a process pool over
+shared data must match the serial runs, in order, and report timing.
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from vibe.backtester.analysis.parallel_runs import BacktestTask, run_backtests
+from vibe.backtester.analysis.robustness import RobustnessAnalyzer
+from vibe.backtester.analysis.walk_forward import WalkForwardEngine
+from vibe.common.ruleset.loader import RuleSetLoader
+
+ET = ZoneInfo("America/New_York")
+START = datetime(2024, 1, 1, tzinfo=ET)
+END = datetime(2024, 5, 31, tzinfo=ET)
+
+pytestmark = pytest.mark.synthetic_data(days=110, seed=23)
+
+
+@pytest.fixture(scope="module")
+def ruleset():
+    return RuleSetLoader.from_name("orb_production")
+
+
+def _trades(result):
+    return [t.model_dump() for t in result.trades]
+
+
+def test_walk_forward_workers_match_serial(data_dir, ruleset):
+    engine = WalkForwardEngine(ruleset, data_dir, slippage_ticks=2)
+    kwargs = dict(train_months=2, test_months=1, step_months=1)
+    serial = engine.analyze("QQQ", START, END, **kwargs)
+    parallel = engine.analyze("QQQ", START, END, workers=2, **kwargs)
+
+    assert len(parallel.periods) == len(serial.periods) >= 2
+    for p, s in zip(parallel.periods, serial.periods):
+        assert _trades(p.train_result) == _trades(s.train_result)
+        assert _trades(p.test_result) == _trades(s.test_result)
+    assert parallel.walk_forward_score == serial.walk_forward_score
+
+    assert parallel.timing.workers == 2
+    assert len(parallel.timing.task_seconds) == 2 * len(parallel.periods)
+    assert parallel.timing.wall_seconds > 0
+    assert parallel.to_dict()["timing"]["workers"] == 2
+
+
+def test_robustness_workers_match_serial(data_dir, ruleset):
+    analyzer = RobustnessAnalyzer(ruleset, data_dir, baseline_slippage_ticks=4)
+    serial = analyzer.analyze("QQQ", START, END, noise_tests=3)
+    parallel = analyzer.analyze("QQQ", START, END, noise_tests=3, workers=2)
+
+    assert _trades(parallel.baseline_result) == _trades(serial.baseline_result)
+    assert [t.variation for t in parallel.test_results] == [t.variation for t in serial.test_results]
+    for p, s in zip(parallel.test_results, serial.test_results):
+        assert _trades(p.result) == _trades(s.result)
+    assert parallel.robustness_score == serial.robustness_score
+
+    assert list(parallel.timing.task_seconds)[0] == "baseline"
+    assert len(parallel.timing.task_seconds) == 4
+    assert serial.timing.workers == 1
+
+
+def test_run_backtests_rejects_zero_workers(data_dir, ruleset):
+    task = BacktestTask("only", ruleset, START, END, slippage_ticks=2, initial_capital=10_000.0)
+    with pytest.raises(ValueError):
+        run_backtests([task], data_dir, "QQQ", workers=0)
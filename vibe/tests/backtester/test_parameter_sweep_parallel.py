@@ -0,0 +1,92 @@
+"""
+ParameterSweep.run(workers=N): process-pool fan-out over shared memory-mapped
+bars must reproduce the serial sweep, isolate failing combinations and keep
+the pickle cache and callbacks working.
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vibe.backtester.analysis.parameter_sweep import ParameterDefinition, ParameterSweep
+from vibe.backtester.data.shared_frame import share_frame
+from vibe.backtester.data.synthetic import generate_minute_bars
+
+ET = ZoneInfo("America/New_York")
+START = datetime(2024, 1, 1, tzinfo=ET)
+END = datetime(2024, 3, 31, tzinfo=ET)
+RULESET = "vibe/rulesets/orb_production.yaml"
+
+pytestmark = pytest.mark.synthetic_data(days=30, seed=5)
+
+
+def _sweep(data_dir, feature_store, values=(5, 10, 15)):
+    return ParameterSweep(
+        base_ruleset_path=RULESET,
+        data_dir=data_dir,
+        parameters=[
+            ParameterDefinition("strategy.orb_duration_minutes", list(values), name="orb_duration"),
+            ParameterDefinition("strategy.orb_body_pct_filter", [0.0, 0.5], name="body_pct"),
+        ],
+        sweep_mode="grid",
+        feature_store=feature_store,
+    )
+
+
+def test_parallel_matches_serial(data_dir, feature_store):
+    serial = _sweep(data_dir, feature_store).run("QQQ", START, END)
+    parallel = _sweep(data_dir, feature_store).run("QQQ", START, END, workers=2)
+
+    assert len(serial) == 6
+    pd.testing.assert_frame_equal(parallel, serial)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_failing_combination_does_not_stop_sweep(data_dir, feature_store, workers):
+    progress = []
+    streamed = []
+    df = _sweep(data_dir, feature_store, values=(5, "not-a-number")).run(
+        "QQQ", START, END, workers=workers,
+        progress_callback=lambda i, total, params: progress.append((i, total)),
+        result_callback=streamed.append,
+    )
+
+    assert set(df["orb_duration"]) == {5}
+    assert len(df) == 2
+    assert len(streamed) == 2
+    # Every combination is reported exactly once, failures included
+    assert sorted(progress) == [(i, 4) for i in range(1, 5)]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_sweep_reuses_and_fills_cache(data_dir, feature_store, tmp_path, monkeypatch, workers):
+    cache_dir = tmp_path / "cache"
+    first = _sweep(data_dir, feature_store).run("QQQ", START, END, workers=workers, cache_dir=cache_dir)
+    assert len([p for p in cache_dir.iterdir() if p.is_dir()]) == 6
+
+    def no_backtests(*args, **kwargs):
+        raise AssertionError("cached combination was re-run")
+
+    monkeypatch.setattr(ParameterSweep, "_run_backtest", no_backtests)
+    second = _sweep(data_dir, feature_store).run("QQQ", START, END, workers=workers, cache_dir=cache_dir)
+    pd.testing.assert_frame_equal(second, first)
+
+
+def test_invalid_worker_count_rejected(data_dir, feature_store, tmp_path):
+    with pytest.raises(ValueError, match=">= 1"):
+        _sweep(data_dir, feature_store).run("QQQ", START, END, workers=0)
+    # Queued sweeps accept workers=0 (external workers only)
+    with pytest.raises(ValueError, match=">= 0"):
+        _sweep(data_dir, feature_store).run("QQQ", START, END, workers=-1, queue_path=tmp_path / "q.sqlite")
+
+
+def test_shared_frame_roundtrip_is_memory_mapped(tmp_path):
+    df = generate_minute_bars(days=2)
+    handle = share_frame(df, tmp_path / "bars")
+    loaded = handle.load()
+
+    pd.testing.assert_frame_equal(loaded, df)
+    assert isinstance(loaded["close"].to_numpy().base, np.memmap)
@@ -0,0 +1,103 @@
+"""
+Date-partitioned Parquet datasets: converter layout, partition pruning and
+predicate pushdown in ParquetLoader, and parity with the single-file layout.
+"""
+
+import asyncio
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from vibe.backtester.core.engine import BacktestEngine
+from vibe.backtester.data import parquet_dataset
+from vibe.backtester.data.bar_cache import BarCache
+from vibe.backtester.data.parquet_dataset import partition_files, read_bars
+from vibe.backtester.data.parquet_loader import ParquetLoader
+from vibe.backtester.data.synthetic import generate_minute_bars, write_synthetic_parquet
+from vibe.common.ruleset.loader import RuleSetLoader
+
+ET = ZoneInfo("America/New_York")
+WINDOW = (datetime(2024, 2, 5, 10, 0, tzinfo=ET), datetime(2024, 2, 20, 15, 0, tzinfo=ET))
+
+
+@pytest.fixture(scope="module")
+def bars():
+    return generate_minute_bars(start="2024-01-02", days=70, seed=13)
+
+
+@pytest.fixture(scope="module")
+def single_dir(tmp_path_factory, bars):
+    path = tmp_path_factory.mktemp("single")
+    write_synthetic_parquet(path, symbol="QQQ", df=bars)
+    return path
+
+
+@pytest.fixture(scope="module", params=["month", "day"])
+def partitioned_dir(tmp_path_factory, bars, request):
+    path = tmp_path_factory.mktemp(f"partitioned_{request.param}")
+    write_synthetic_parquet(path, symbol="QQQ", df=bars, partition=request.param)
+    return path
+
+
+def test_partitioned_layout(tmp_path, bars):
+    write_synthetic_parquet(tmp_path, symbol="QQQ", df=bars, partition="month")
+    files = sorted(p.relative_to(tmp_path).as_posix() for p in (tmp_path / "QQQ").rglob("*.parquet"))
+    assert files == [
+        "QQQ/year=2024/month=01/data.parquet",
+        "QQQ/year=2024/month=02/data.parquet",
+        "QQQ/year=2024/month=03/data.parquet",
+        "QQQ/year=2024/month=04/data.parquet",
+    ]
+
+    meta = pq.ParquetFile(tmp_path / files[0]).metadata
+    assert meta.num_row_groups > 1
+    assert meta.row_group(0).column(0).statistics.has_min_max
+
+
+def test_partition_pruning(partitioned_dir):
+    files = partition_files(partitioned_dir, "QQQ", *WINDOW)
+    spans = [parquet_dataset._partition_span(f) for f in files]
+    assert all(end > WINDOW[0] and start <= WINDOW[1] for start, end in spans)
+    assert len(files) < len(partition_files(partitioned_dir, "QQQ"))
+
+
+def test_read_bars_matches_single_file(single_dir, partitioned_dir, bars):
+    expected = bars[(bars.index >= WINDOW[0]) & (bars.index <= WINDOW[1])]
+    for data_dir in (single_dir, partitioned_dir):
+        pd.testing.assert_frame_equal(read_bars(data_dir, "QQQ", *WINDOW), expected, check_freq=False)
+
+    projected = read_bars(partitioned_dir, "QQQ", *WINDOW, columns=["close"])
+    assert list(projected.columns) == ["close"]
+    pd.testing.assert_series_equal(projected["close"], expected["close"], check_freq=False)
+
+
+def test_loader_reads_both_layouts(single_dir, partitioned_dir):
+    for kwargs in ({}, {"start_time": WINDOW[0], "end_time": WINDOW[1]}):
+        single = ParquetLoader(single_dir, ["QQQ"], **kwargs)
+        partitioned = ParquetLoader(partitioned_dir, ["QQQ"], **kwargs)
+        pd.testing.assert_frame_equal(
+            asyncio.run(partitioned.get_bars("QQQ", start_time=WINDOW[0], end_time=WINDOW[1])),
+            asyncio.run(single.get_bars("QQQ", start_time=WINDOW[0], end_time=WINDOW[1])),
+            check_freq=False,
+        )
+
+
+def test_cache_loads_only_overlapping_partitions(partitioned_dir):
+    cache = BarCache(max_bytes=1 << 30)
+    cache.bars(partitioned_dir, "QQQ", "5m", *WINDOW)
+    loaded = {key[1][0] for key in cache._entries}
+    assert loaded == {str(f.resolve()) for f in partition_files(partitioned_dir, "QQQ", *WINDOW)}
+
+
+@pytest.mark.parametrize("window", [WINDOW, (datetime(2024, 1, 1, tzinfo=ET), datetime(2024, 12, 31, tzinfo=ET))])
+def test_engine_results_identical_across_layouts(single_dir, partitioned_dir, window):
+    ruleset = RuleSetLoader.from_name("orb_production")
+    single = BacktestEngine(ruleset, single_dir).run("QQQ", *window)
+    partitioned = BacktestEngine(ruleset, partitioned_dir).run("QQQ", *window)
+
+    assert single.trades
+    assert [t.model_dump() for t in partitioned.trades] == [t.model_dump() for t in single.trades]
+    assert partitioned.equity.equity_curve.equals(single.equity.equity_curve)
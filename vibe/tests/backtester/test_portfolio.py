@@ -126,3 +126,77 @@ def test_check_exits_eod():
     pm.check_exits(bars, clock)
     assert len(pm.trade_history) == 1
     assert pm.trade_history[0].exit_reason == "EOD"
+
+
+def _minute(minute, low, high):
+    return Bar(
+        timestamp=datetime(2024, 1, 15, 10, minute, tzinfo=ET),
+        open=(low + high) / 2, high=high, low=low, close=(low + high) / 2, volume=1_000,
+    )
+
+
+def _ambiguous_long(pm):
+    from vibe.backtester.core.clock import SimulatedClock
+    clock = SimulatedClock()
+    clock.set_time(datetime(2024, 1, 15, 10, 0, tzinfo=ET))
+    pm.open_position(_fill(price=480.0, qty=10), stop_price=475.0, timestamp=clock.now(), take_profit=490.0)
+    # The 5m bar touches both stop (475) and TP (490)
+    return clock, {"QQQ": _bar(close=482.0, low=474.0, high=491.0)}
+
+
+def test_check_exits_both_touched_defaults_to_tp():
+    pm = PortfolioManager(10_000.0)
+    clock, bars = _ambiguous_long(pm)
+    pm.check_exits(bars, clock)
+    assert pm.trade_history[0].exit_reason == "TP"
+
+
+@pytest.mark.parametrize("minutes,reason,price", [
+    ([_minute(0, 479.0, 481.0), _minute(1, 474.0, 480.0), _minute(2, 480.0, 491.0)], "STOP", 475.0),
+    ([_minute(0, 479.0, 481.0), _minute(1, 480.0, 491.0), _minute(2, 474.0, 480.0)], "TP", 490.0),
+    ([_minute(0, 474.0, 491.0)], "TP", 490.0),  # still ambiguous within one minute: TP first
+])
+def test_check_exits_intrabar_resolves_first_touch(minutes, reason, price):
+    pm = PortfolioManager(10_000.0)
+    clock, bars = _ambiguous_long(pm)
+    calls = []
+    pm.check_exits(bars, clock, intrabar_bars=lambda symbol: calls.append(symbol) or minutes)
+    assert calls == ["QQQ"]
+    assert pm.trade_history[0].exit_reason == reason
+    assert pm.trade_history[0].exit_price == pytest.approx(price)
+
+
+def test_check_exits_intrabar_only_for_ambiguous_bars():
+    pm = PortfolioManager(10_000.0)
+    from vibe.backtester.core.clock import SimulatedClock
+    clock = SimulatedClock()
+    clock.set_time(datetime(2024, 1, 15, 10, 0, tzinfo=ET))
+    pm.open_position(_fill(price=480.0, qty=10), stop_price=475.0, timestamp=clock.now(), take_profit=490.0)
+
+    def fail(symbol):
+        raise AssertionError("unambiguous bar drilled into")
+
+    pm.check_exits({"QQQ": _bar(close=482.0, low=476.0, high=491.0)}, clock, intrabar_bars=fail)
+    assert pm.trade_history[0].exit_reason == "TP"
+
+
+def test_check_exits_intrabar_trailing_step_order():
+    """Breakeven step and a dip to entry in one bar: only a dip after the step stops out."""
+    from vibe.backtester.core.clock import SimulatedClock
+    config = {"method": "breakeven_plus_ticks", "trigger_r": 1.0, "plus_ticks": 0}
+    clock = SimulatedClock()
+    clock.set_time(datetime(2024, 1, 15, 10, 0, tzinfo=ET))
+    bar = {"QQQ": _bar(close=482.0, low=479.0, high=486.0)}
+
+    plain = PortfolioManager(10_000.0, trailing_stop_config=config)
+    plain.open_position(_fill(price=480.0, qty=10), stop_price=475.0, timestamp=clock.now())
+    plain.check_exits(bar, clock)
+    assert plain.trade_history[0].exit_reason == "STOP"
+    assert plain.trade_history[0].exit_price == pytest.approx(480.0)
+
+    dip_first = PortfolioManager(10_000.0, trailing_stop_config=config)
+    dip_first.open_position(_fill(price=480.0, qty=10), stop_price=475.0, timestamp=clock.now())
+    minutes = [_minute(0, 479.0, 481.0), _minute(1, 481.0, 486.0), _minute(2, 482.0, 484.0)]
+    dip_first.check_exits(bar, clock, intrabar_bars=lambda symbol: minutes)
+    assert not dip_first.trade_history
+    assert dip_first.positions["QQQ"].stop_price == pytest.approx(480.0)
@@ -0,0 +1,115 @@
+"""
+ResultCache: columnar result storage, content-addressed sweep cache keys and
+summary-only loads.
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import pytest
+
+from vibe.backtester.analysis import result_cache as result_cache_module
+from vibe.backtester.analysis.parameter_sweep import ParameterDefinition, ParameterSweep
+from vibe.backtester.analysis.regime_research import features as features_module
+from vibe.backtester.analysis.result_cache import ResultCache
+from vibe.backtester.core.engine import BacktestEngine
+from vibe.backtester.data.feature_store import FeatureStore
+from vibe.backtester.data.synthetic import generate_minute_bars, write_synthetic_parquet
+from vibe.common.ruleset.loader import RuleSetLoader
+
+ET = ZoneInfo("America/New_York")
+START = datetime(2024, 1, 1, tzinfo=ET)
+END = datetime(2024, 3, 31, tzinfo=ET)
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    path = tmp_path / "parquet"
+    write_synthetic_parquet(path, symbol="QQQ", days=30, seed=5)
+    return path
+
+
+@pytest.fixture(scope="module")
+def result(tmp_path_factory):
+    path = tmp_path_factory.mktemp("parquet")
+    write_synthetic_parquet(path, symbol="QQQ", days=30, seed=5)
+    return BacktestEngine(RuleSetLoader.from_name("orb_production"), path).run("QQQ", START, END)
+
+
+def _sweep(data_dir, tmp_path):
+    return ParameterSweep(
+        base_ruleset_path="vibe/rulesets/orb_production.yaml",
+        data_dir=data_dir,
+        parameters=[ParameterDefinition("strategy.orb_duration_minutes", [5, 15], name="orb_duration")],
+        sweep_mode="grid",
+        feature_store=FeatureStore(tmp_path / "features"),
+    )
+
+
+def test_roundtrip_restores_full_result(tmp_path, result):
+    assert result.trades
+    cache = ResultCache(tmp_path / "cache")
+    cache.save("k", result, summary={"n_trades": len(result.trades)})
+
+    assert cache.load_summary("k") == {"n_trades": len(result.trades)}
+    loaded = cache.load("k")
+    assert [t.model_dump() for t in loaded.trades] == [t.model_dump() for t in result.trades]
+    pd.testing.assert_series_equal(loaded.equity.equity_curve, result.equity.equity_curve, check_freq=False)
+    pd.testing.assert_series_equal(loaded.equity.drawdown_curve, result.equity.drawdown_curve, check_freq=False)
+    assert loaded.overall == result.overall
+    assert loaded.by_year == result.by_year
+    assert loaded.equity.sharpe_ratio == result.equity.sharpe_ratio
+    assert (loaded.symbol, loaded.start_date, loaded.ruleset_name) == (
+        result.symbol, result.start_date, result.ruleset_name,
+    )
+
+
+def test_missing_entry_returns_none(tmp_path):
+    cache = ResultCache(tmp_path)
+    assert "nope" not in cache
+    assert cache.load("nope") is None
+    assert cache.load_summary("nope") is None
+
+
+def test_sweep_key_tracks_data_and_engine_version(data_dir, tmp_path, monkeypatch):
+    sweep = _sweep(data_dir, tmp_path)
+    key = sweep._cache_key({"orb_duration": 5}, "QQQ", START, END)
+    assert key == sweep._cache_key({"orb_duration": 5}, "QQQ", START, END)
+    assert key != sweep._cache_key({"orb_duration": 15}, "QQQ", START, END)
+
+    monkeypatch.setattr(result_cache_module, "ENGINE_VERSION", 999)
+    assert sweep._cache_key({"orb_duration": 5}, "QQQ", START, END) != key
+    monkeypatch.undo()
+
+    # Pre-computed and in-run features give slightly different results
+    in_run = sweep._cache_key({"orb_duration": 5}, "QQQ", START, END, use_precomputed_features=False)
+    assert in_run != key
+    combinations = sweep._generate_combinations()
+    assert sweep._run_key(combinations, "QQQ", START, END, use_precomputed_features=False) != sweep._run_key(
+        combinations, "QQQ", START, END
+    )
+    # Feature code versions only matter to pre-computed runs
+    monkeypatch.setitem(features_module._FEATURE_VERSIONS, "adx_14", 2)
+    assert sweep._cache_key({"orb_duration": 5}, "QQQ", START, END) != key
+    assert sweep._cache_key({"orb_duration": 5}, "QQQ", START, END, use_precomputed_features=False) == in_run
+    monkeypatch.undo()
+
+    write_synthetic_parquet(data_dir, symbol="QQQ", df=generate_minute_bars(days=30, seed=6))
+    assert sweep._cache_key({"orb_duration": 5}, "QQQ", START, END) != key
+
+
+def test_cached_sweep_loads_summaries_only(data_dir, tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    first = _sweep(data_dir, tmp_path).run("QQQ", START, END, cache_dir=cache_dir)
+
+    def no_full_loads(*args, **kwargs):
+        raise AssertionError("sweep deserialized a full result")
+
+    monkeypatch.setattr(ParameterSweep, "_run_backtest", no_full_loads)
+    monkeypatch.setattr(ResultCache, "load", no_full_loads)
+    streamed = []
+    second = _sweep(data_dir, tmp_path).run("QQQ", START, END, cache_dir=cache_dir, result_callback=streamed.append)
+
+    pd.testing.assert_frame_equal(second, first)
+    assert all(r.result is None and r.summary for r in streamed)
@@ -0,0 +1,65 @@
+"""
+SlippageRepricer: re-pricing one run's trades per slippage value must equal
+full BacktestEngine runs, falling back to full runs where exits depend on
+the entry price.
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from vibe.backtester.analysis.robustness import RobustnessAnalyzer
+from vibe.backtester.core.engine import BacktestEngine
+from vibe.backtester.core.repricing import SlippageRepricer
+from vibe.tests.backtester.conftest import ruleset_with
+
+ET = ZoneInfo("America/New_York")
+START = datetime(2024, 1, 1, tzinfo=ET)
+END = datetime(2024, 4, 30, tzinfo=ET)
+
+pytestmark = pytest.mark.synthetic_data(days=80, seed=31)
+
+
+def _assert_same(actual, expected):
+    assert [t.model_dump() for t in actual.trades] == [t.model_dump() for t in expected.trades]
+    assert actual.equity.equity_curve.equals(expected.equity.equity_curve)
+    assert actual.overall == expected.overall
+
+
+def test_repriced_results_match_full_runs(data_dir):
+    ruleset = ruleset_with()
+    repricer = SlippageRepricer(ruleset, data_dir)
+    values = [8, 1, 4, 12]
+    results = repricer.run("QQQ", START, END, slippage_ticks=values)
+
+    assert repricer.rerun_slippages == []
+    assert len({r.trades[0].entry_price for r in results}) == len(values)
+    for slippage, actual in zip(values, results):
+        expected = BacktestEngine(ruleset, data_dir, slippage_ticks=slippage).run("QQQ", START, END)
+        assert expected.trades
+        _assert_same(actual, expected)
+
+
+def test_entry_anchored_trailing_stop_falls_back(data_dir):
+    ruleset = ruleset_with(
+        exit={"trailing_stop": {"method": "breakeven_plus_ticks", "trigger_r": 0.5, "plus_ticks": 3}}
+    )
+    repricer = SlippageRepricer(ruleset, data_dir)
+    results = repricer.run("QQQ", START, END, slippage_ticks=[2, 6])
+
+    assert repricer.rerun_slippages == [2, 6]
+    expected = BacktestEngine(ruleset, data_dir, slippage_ticks=6).run("QQQ", START, END)
+    _assert_same(results[1], expected)
+
+
+def test_robustness_reprice_matches_full_runs(data_dir):
+    analyzer = RobustnessAnalyzer(ruleset_with(), data_dir, baseline_slippage_ticks=4)
+    full = analyzer.analyze("QQQ", START, END, noise_tests=4)
+    fast = analyzer.analyze("QQQ", START, END, noise_tests=4, reprice=True)
+
+    _assert_same(fast.baseline_result, full.baseline_result)
+    for f, s in zip(fast.test_results, full.test_results):
+        assert f.variation == s.variation
+        _assert_same(f.result, s.result)
+    assert fast.robustness_score == full.robustness_score
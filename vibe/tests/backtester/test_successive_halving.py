@@ -0,0 +1,148 @@
+"""
+Adaptive search: successive halving must reach the exhaustive sweep's best
+parameters with fewer full-period backtests, and journal every budget level.
+"""
+
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from vibe.backtester.analysis.parameter_sweep import ParameterDefinition, ParameterSweep
+from vibe.backtester.data.synthetic import write_synthetic_parquet
+from vibe.backtester.optimization.adaptive import BudgetLevel, SuccessiveHalving, continuous_parameters
+from vibe.backtester.optimization.pipeline import OptimizationPipeline
+from vibe.research_journal.registry import ResearchRegistry
+
+ET = ZoneInfo("America/New_York")
+START = datetime(2024, 1, 1, tzinfo=ET)
+END = datetime(2024, 3, 31, tzinfo=ET)
+
+PARAMETERS = [
+    ParameterDefinition("strategy.orb_duration_minutes", [5, 15, 30], name="orb_duration"),
+    ParameterDefinition("exit.take_profit.multiplier", [2.0, 3.0], name="tp_multiplier"),
+]
+
+pytestmark = pytest.mark.synthetic_data(days=70, seed=3)
+
+
+def test_schedule_spans_end_at_end_date():
+    schedule = SuccessiveHalving(eta=3, min_span_days=365)
+    start, end = datetime(2015, 1, 1, tzinfo=ET), datetime(2024, 12, 31, tzinfo=ET)
+
+    spans = schedule.spans(start, end, n_candidates=27)
+    assert len(spans) == 3
+    assert spans[-1] == (start, end)
+    assert all(span_end == end for _, span_end in spans)
+    lengths = [(span_end - span_start).days for span_start, span_end in spans]
+    assert lengths == sorted(lengths)
+    assert lengths[0] >= 365
+    assert [schedule.n_survivors(n) for n in (27, 9)] == [9, 3]
+
+    # Too few candidates or too little history: a single full-period level
+    assert schedule.spans(start, end, n_candidates=2) == [(start, end)]
+    assert len(schedule.spans(end - timedelta(days=400), end, n_candidates=27)) == 1
+
+    with pytest.raises(ValueError):
+        SuccessiveHalving(eta=1)
+
+
+def test_continuous_parameters_are_float_valued(data_dir, feature_store):
+    sweep = ParameterSweep(
+        "vibe/rulesets/orb_production.yaml", data_dir, PARAMETERS, sweep_mode="grid", feature_store=feature_store
+    )
+    assert continuous_parameters(sweep) == {"tp_multiplier": (2.0, 3.0)}
+
+
+def test_halving_matches_exhaustive_best(data_dir, feature_store, tmp_path):
+    pipeline = OptimizationPipeline("vibe/rulesets/orb_production.yaml", data_dir, feature_store=feature_store)
+    # The final full-period level reuses the exhaustive sweep's cached results
+    cache_dir = tmp_path / "results"
+    exhaustive = pipeline.optimize("QQQ", START, END, PARAMETERS, sweep_mode="grid", cache_dir=cache_dir)
+
+    research_root = tmp_path / "research"
+    halving = pipeline.optimize(
+        "QQQ", START, END, PARAMETERS,
+        sweep_mode="grid",
+        cache_dir=cache_dir,
+        search_mode="halving",
+        halving_eta=2,
+        halving_min_span_days=20,
+        register_in_research_journal=True,
+        research_root=research_root,
+        hypothesis_title="Successive halving",
+        hypothesis_rationale="Short spans rank candidates like the full period",
+    )
+
+    levels = halving.search_levels
+    assert [level.n_evaluated for level in levels] == [6, 3, 2]
+    assert (levels[-1].start_date, levels[-1].end_date) == (START, END)
+    assert levels[0].start_date > levels[1].start_date > START
+    assert len(halving.sweep_results) < len(exhaustive.sweep_results)
+
+    assert {k: float(v) for k, v in halving.best_params.items()} == {
+        k: float(v) for k, v in exhaustive.best_params.items()
+    }
+    assert halving.best_score == pytest.approx(exhaustive.best_score, rel=1e-12)
+
+    registry = ResearchRegistry(research_root)
+    for level in levels:
+        tag = f"halving-level-{level.level + 1}"
+        experiments = registry.list_experiments(tags=[tag])
+        assert len(experiments) == level.n_evaluated
+        assert {e.dataset_config["start_date"] for e in experiments} == {
+            level.start_date.date().isoformat()
+        }
+        assert {e.hypothesis_id for e in experiments} == {halving.hypothesis_id}
+
+
+def test_tpe_stage_never_worse_than_halving(data_dir, feature_store):
+    pytest.importorskip("optuna")
+    pipeline = OptimizationPipeline("vibe/rulesets/orb_production.yaml", data_dir, feature_store=feature_store)
+    kwargs = dict(sweep_mode="grid", search_mode="halving", halving_eta=2, halving_min_span_days=20)
+
+    halving = pipeline.optimize("QQQ", START, END, PARAMETERS, **kwargs)
+    refined = pipeline.optimize("QQQ", START, END, PARAMETERS, tpe_trials=3, **kwargs)
+
+    assert refined.search_levels[-1].name == "tpe"
+    assert refined.search_levels[-1].n_evaluated == 3
+    assert refined.best_score >= halving.best_score
+
+
+def test_reoptimized_walk_forward_after_tpe_resweeps_grid(tmp_path, feature_store, monkeypatch):
+    import vibe.backtester.optimization.pipeline as pipeline_module
+
+    def fake_tpe(sweep, best, symbol, start_date, end_date, n_trials, level, cache_dir=None):
+        # A full-period trial off the grid: the sweep's outcomes no longer cover the winner
+        row = sweep_results[0].iloc[[0]].assign(tp_multiplier=2.5, composite_score=lambda r: r.composite_score + 1)
+        return BudgetLevel(level=level, start_date=start_date, end_date=end_date, results=row, name="tpe")
+
+    sweep_results = []
+    real_halving = pipeline_module.successive_halving
+
+    def halving(*args, **kwargs):
+        levels = real_halving(*args, **kwargs)
+        sweep_results.append(levels[-1].results)
+        return levels
+
+    monkeypatch.setattr(pipeline_module, "successive_halving", halving)
+    monkeypatch.setattr(pipeline_module, "refine_tpe", fake_tpe)
+
+    data_dir = tmp_path / "parquet"
+    write_synthetic_parquet(data_dir, symbol="QQQ", days=160, seed=3)
+    start, end = datetime(2024, 1, 1, tzinfo=ET), datetime(2024, 8, 9, tzinfo=ET)
+    pipeline = OptimizationPipeline("vibe/rulesets/orb_production.yaml", data_dir, feature_store=feature_store)
+    result = pipeline.optimize(
+        "QQQ", start, end,
+        [ParameterDefinition("exit.take_profit.multiplier", [2.0, 3.0], name="tp_multiplier")],
+        sweep_mode="grid",
+        search_mode="halving",
+        tpe_trials=1,
+        run_walk_forward=True,
+        walk_forward_reoptimize=True,
+    )
+
+    assert result.search_levels[-1].name == "tpe"
+    periods = result.walk_forward_analysis.periods
+    assert periods
+    assert all(p.selected_params["tp_multiplier"] in (2.0, 3.0) for p in periods)
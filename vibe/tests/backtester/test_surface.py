@@ -0,0 +1,95 @@
+"""
+Parameter surfaces: sweep results pivot into dense arrays, plateaus are
+connected low-gradient regions in any number of dimensions, and the robust
+optimum prefers a broad good region over an isolated spike.
+"""
+
+import itertools
+from collections import deque
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vibe.backtester.analysis.surface import SurfaceAnalyzer, _label_regions
+
+
+def _grid(values, score):
+    names = [f"p{i}" for i in range(len(values))]
+    frame = pd.DataFrame(list(itertools.product(*values)), columns=names)
+    frame["composite_score"] = score(frame)
+    return frame, names
+
+
+def _bfs_region_count(mask):
+    seen = np.zeros(mask.shape, dtype=bool)
+    count = 0
+    for start in map(tuple, np.argwhere(mask)):
+        if seen[start]:
+            continue
+        count += 1
+        seen[start] = True
+        queue = deque([start])
+        while queue:
+            cell = queue.popleft()
+            for axis in range(mask.ndim):
+                for step in (-1, 1):
+                    nxt = list(cell)
+                    nxt[axis] += step
+                    nxt = tuple(nxt)
+                    if 0 <= nxt[axis] < mask.shape[axis] and mask[nxt] and not seen[nxt]:
+                        seen[nxt] = True
+                        queue.append(nxt)
+    return count
+
+
+@pytest.mark.parametrize("shape", [(15, 15), (6, 6, 6), (5, 4, 3, 4)])
+def test_label_regions_match_bfs(shape):
+    mask = np.random.default_rng(len(shape)).random(shape) < 0.5
+    labels = _label_regions(mask)
+
+    assert labels.max() == _bfs_region_count(mask)
+    assert np.all((labels > 0) == mask)
+
+
+def test_nd_surface_pivots_every_cell():
+    frame, names = _grid([[1, 2, 3], [0.5, 1.0], [5, 15, 30, 60]], lambda f: f.p0 * 10 + f.p1 + f.p2 / 100)
+    frame = frame.sample(frac=1.0, random_state=0)
+    surface = SurfaceAnalyzer().create_nd_surface(frame.iloc[1:], names)
+
+    assert surface.shape == (3, 2, 4)
+    assert surface.n_evaluated == len(frame) - 1
+    cells = surface.params_at(np.argwhere(~np.isnan(surface.metric_array)))
+    merged = cells.merge(frame, on=names, suffixes=("", "_expected"))
+    np.testing.assert_allclose(merged["composite_score"], merged["composite_score_expected"])
+
+
+def test_plateaus_need_min_area_and_robust_optimum_avoids_spike():
+    # Broad flat top at p0 in 0..3, a single sharp spike at p0 = 8
+    def score(f):
+        base = np.where(f.p0 <= 3, 1.0, 0.0)
+        return base + np.where((f.p0 == 8) & (f.p1 == 2) & (f.p2 == 2), 5.0, 0.0)
+
+    frame, names = _grid([list(range(10)), list(range(5)), list(range(5))], score)
+    surface = SurfaceAnalyzer().create_nd_surface(frame, names)
+
+    regions = surface.plateau_regions(gradient_threshold=0.1, min_area=4)
+    assert regions.max() >= 1
+    assert surface.detect_plateaus(min_area=surface.metric_array.size + 1).size == 0
+
+    best_cell = np.unravel_index(np.nanargmax(surface.metric_array), surface.shape)
+    assert surface.params_at([best_cell]).iloc[0][names].to_dict() == {"p0": 8, "p1": 2, "p2": 2}
+    assert surface.robust_optimum(radius=1)["params"]["p0"] <= 3
+    assert surface.robust_optimum(radius=1, statistic="min")["params"]["p0"] <= 2
+
+
+def test_projection_matches_2d_surface():
+    frame, names = _grid([[1, 2, 3, 4], [10, 20, 30], [0.1, 0.2]], lambda f: f.p0 - f.p1 / 10 + f.p2)
+    analyzer = SurfaceAnalyzer()
+    projected = analyzer.create_nd_surface(frame, names).project("p0", "p1")
+    direct = analyzer.create_surface(frame[frame.p2 == 0.2], "p0", "p1")
+
+    assert projected.param_x_values == direct.param_x_values
+    assert projected.param_y_values == direct.param_y_values
+    np.testing.assert_allclose(projected.metric_matrix, direct.metric_matrix)
+    assert analyzer.summary_report(analyzer.create_nd_surface(frame, names))["grid_size"] == "4x3x2"
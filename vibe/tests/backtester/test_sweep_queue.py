@@ -0,0 +1,180 @@
+"""
+Distributed sweeps: combinations published to a SweepQueue are claimed under
+leases by worker processes, results match the in-process sweep, expired or
+crashed leases are re-run, and a restarted coordinator continues the queue.
+"""
+
+import os
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vibe.backtester.analysis.parameter_sweep import ParameterDefinition, ParameterSweep
+from vibe.backtester.analysis.sweep_queue import (
+    DONE,
+    FAILED,
+    LEASED,
+    PENDING,
+    SweepQueue,
+    decode_datetime,
+    encode_datetime,
+    run_worker,
+)
+
+ET = ZoneInfo("America/New_York")
+START = datetime(2024, 1, 1, tzinfo=ET)
+END = datetime(2024, 3, 31, tzinfo=ET)
+PARAMS = ["orb_duration", "tp_multiplier"]
+
+pytestmark = pytest.mark.synthetic_data(days=30, seed=4)
+
+
+def _sweep(data_dir, feature_store):
+    return ParameterSweep(
+        base_ruleset_path="vibe/rulesets/orb_production.yaml",
+        data_dir=data_dir,
+        parameters=[
+            ParameterDefinition("strategy.orb_duration_minutes", [5, 15], name="orb_duration"),
+            ParameterDefinition("exit.take_profit.multiplier", [2.0, 3.0], name="tp_multiplier"),
+        ],
+        sweep_mode="grid",
+        feature_store=feature_store,
+    )
+
+
+@pytest.fixture(scope="module")
+def serial(data_dir, feature_store):
+    sweep = _sweep(data_dir, feature_store)
+    return sweep.run("QQQ", START, END, collect_outcomes=True), sweep.outcomes
+
+
+def _by_params(df):
+    return df.sort_values(PARAMS).reset_index(drop=True)
+
+
+def _publish(sweep, queue_path):
+    combinations = sweep._generate_combinations()
+    SweepQueue(queue_path).publish(
+        sweep._run_key(combinations, "QQQ", START, END),
+        sweep._queue_spec("QQQ", START, END, use_precomputed_features=True),
+        combinations,
+    )
+    return combinations
+
+
+def test_queued_sweep_matches_serial(data_dir, feature_store, serial, tmp_path):
+    sweep = _sweep(data_dir, feature_store)
+    progress = []
+    df = sweep.run(
+        "QQQ", START, END,
+        queue_path=tmp_path / "queue.sqlite",
+        workers=2,
+        collect_outcomes=True,
+        progress_callback=lambda i, total, params: progress.append(i),
+    )
+
+    pd.testing.assert_frame_equal(_by_params(df), _by_params(serial[0]), check_dtype=False)
+    assert progress == [1, 2, 3, 4]
+    order = [serial[1].combo_index(params) for params in sweep.outcomes.combos.to_dict("records")]
+    np.testing.assert_array_equal(sweep.outcomes.r_multiple, serial[1].r_multiple[:, order])
+
+    queue = SweepQueue(tmp_path / "queue.sqlite")
+    assert queue.counts()[DONE] == 4
+    assert len({job.key for job in queue.finished()}) == 4
+
+
+def test_worker_rebuilds_sweep_from_spec(data_dir, feature_store, serial, tmp_path):
+    queue_path = tmp_path / "queue.sqlite"
+    _publish(_sweep(data_dir, feature_store), queue_path)
+
+    assert run_worker(queue_path, worker_id="solo", feature_store_dir=feature_store.root) == 4
+
+    queue = SweepQueue(queue_path)
+    assert queue.unfinished() == 0
+    rows = pd.DataFrame([{**job.params, **job.summary} for job in queue.finished()])
+    pd.testing.assert_frame_equal(_by_params(rows), _by_params(serial[0]), check_dtype=False)
+
+
+def test_restarted_coordinator_continues_queue(data_dir, feature_store, serial, tmp_path):
+    queue_path = tmp_path / "queue.sqlite"
+    sweep = _sweep(data_dir, feature_store)
+    _publish(sweep, queue_path)
+    run_worker(queue_path, worker_id="before-restart", max_jobs=2, feature_store_dir=feature_store.root)
+
+    df = sweep.run("QQQ", START, END, queue_path=queue_path, workers=1)
+
+    pd.testing.assert_frame_equal(_by_params(df), _by_params(serial[0]), check_dtype=False)
+    workers = SweepQueue(queue_path)._query("SELECT worker FROM jobs ORDER BY seq")
+    assert [w for (w,) in workers][:2] == ["before-restart", "before-restart"]
+    assert all(w != "before-restart" for (w,) in workers[2:])
+
+
+def test_crashed_worker_job_is_reassigned(data_dir, feature_store, serial, tmp_path, monkeypatch):
+    # Workers fork from this process, so the patch (and its marker file) reach them
+    marker = tmp_path / "crashed"
+    real_run = ParameterSweep._run_backtest
+
+    def crash_once(self, params, *args, **kwargs):
+        if params["orb_duration"] == 15 and not marker.exists():
+            marker.touch()
+            os._exit(1)
+        return real_run(self, params, *args, **kwargs)
+
+    monkeypatch.setattr(ParameterSweep, "_run_backtest", crash_once)
+    df = _sweep(data_dir, feature_store).run(
+        "QQQ", START, END, queue_path=tmp_path / "queue.sqlite", workers=1
+    )
+
+    assert marker.exists()
+    pd.testing.assert_frame_equal(_by_params(df), _by_params(serial[0]), check_dtype=False)
+
+
+def test_expired_leases_are_requeued_then_failed(tmp_path):
+    queue = SweepQueue(tmp_path / "queue.sqlite")
+    queue.publish("run-a", {"symbol": "QQQ"}, [{"x": 1}, {"x": 2}])
+
+    first = queue.claim("w1", lease_seconds=0.0)
+    assert first.params == {"x": 1}
+    assert queue.claim("w2", lease_seconds=60.0).params == {"x": 2}
+    assert queue.claim("w3") is None
+
+    time.sleep(0.01)
+    assert queue.requeue_expired(max_attempts=2) == 1
+    assert queue.counts() == {PENDING: 1, LEASED: 1, DONE: 0, FAILED: 0}
+    assert not queue.renew(first.key, "w1")
+
+    again = queue.claim("w3", lease_seconds=0.0)
+    assert (again.key, again.attempts) == (first.key, 2)
+    time.sleep(0.01)
+    queue.requeue_expired(max_attempts=2)
+    assert queue.counts()[FAILED] == 1
+    assert "lease lost 2 times" in queue.finished()[0].error
+
+    # A late result for a job another worker owns is still accepted once
+    assert queue.complete(queue.finished()[0].key, "w1", {"n": 1}) is False
+    second = [key for (key,) in queue._query("SELECT combo_key FROM jobs WHERE status = 'leased'")][0]
+    assert queue.complete(second, "w1", {"n": 2}) is True
+    assert queue.complete(second, "w2", {"n": 3}) is False
+    assert queue.unfinished() == 0
+
+
+def test_publish_keeps_recorded_jobs_and_rejects_other_runs(tmp_path):
+    queue = SweepQueue(tmp_path / "queue.sqlite")
+    assert queue.publish("run-a", {}, [{"x": 1}, {"x": 2}]) == 2
+    job = queue.claim("w1")
+    queue.complete(job.key, "w1", {"n": 1})
+
+    assert queue.publish("run-a", {}, [{"x": 1}, {"x": 2}, {"x": 3}]) == 1
+    assert queue.counts() == {PENDING: 2, LEASED: 0, DONE: 1, FAILED: 0}
+    with pytest.raises(ValueError, match="different sweep run"):
+        queue.publish("run-b", {}, [{"x": 1}])
+
+
+def test_datetime_spec_keeps_zone():
+    decoded = decode_datetime(encode_datetime(START))
+    assert decoded == START
+    assert decoded.tzinfo == ET
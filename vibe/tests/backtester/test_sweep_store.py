@@ -0,0 +1,121 @@
+"""
+Checkpointed sweeps: results stream to a SweepStore, an interrupted run
+resumes without re-running recorded combinations, and keep_top_k bounds
+the full results held.
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vibe.backtester.analysis.parameter_sweep import ParameterDefinition, ParameterSweep
+from vibe.backtester.analysis.sweep_store import SweepStore
+
+ET = ZoneInfo("America/New_York")
+START = datetime(2024, 1, 1, tzinfo=ET)
+END = datetime(2024, 3, 31, tzinfo=ET)
+PARAMS = ["orb_duration", "tp_multiplier"]
+
+pytestmark = pytest.mark.synthetic_data(days=60, seed=9)
+
+
+def _sweep(data_dir, feature_store):
+    return ParameterSweep(
+        base_ruleset_path="vibe/rulesets/orb_production.yaml",
+        data_dir=data_dir,
+        parameters=[
+            ParameterDefinition("strategy.orb_duration_minutes", [5, 15], name="orb_duration"),
+            ParameterDefinition("exit.take_profit.multiplier", [2.0, 3.0], name="tp_multiplier"),
+        ],
+        sweep_mode="grid",
+        feature_store=feature_store,
+    )
+
+
+@pytest.fixture(scope="module")
+def fresh(data_dir, feature_store):
+    sweep = _sweep(data_dir, feature_store)
+    return sweep.run("QQQ", START, END, collect_outcomes=True), sweep.outcomes
+
+
+def _by_params(df):
+    return df.sort_values(PARAMS).reset_index(drop=True)
+
+
+def test_results_stream_to_store(data_dir, feature_store, fresh, tmp_path):
+    results_dir = tmp_path / "run"
+    df = _sweep(data_dir, feature_store).run("QQQ", START, END, results_dir=results_dir)
+
+    store = SweepStore(results_dir)
+    manifest = store.read_manifest()
+    assert manifest["status"] == "complete"
+    assert (manifest["completed"], manifest["total"]) == (4, 4)
+    assert manifest["parameters"][0]["path"] == "strategy.orb_duration_minutes"
+
+    store.open(manifest["run_key"], manifest={}, resume=True)
+    pd.testing.assert_frame_equal(_by_params(store.results_frame()), _by_params(df), check_dtype=False)
+    store.close()
+    pd.testing.assert_frame_equal(_by_params(df), _by_params(fresh[0]))
+
+
+def test_resume_skips_recorded_combinations(data_dir, feature_store, fresh, tmp_path, monkeypatch):
+    results_dir = tmp_path / "run"
+    real_run = ParameterSweep._run_backtest
+    calls = []
+
+    def crash_after_two(self, params, *args, **kwargs):
+        if len(calls) == 2:
+            raise KeyboardInterrupt
+        calls.append(params)
+        return real_run(self, params, *args, **kwargs)
+
+    monkeypatch.setattr(ParameterSweep, "_run_backtest", crash_after_two)
+    with pytest.raises(KeyboardInterrupt):
+        _sweep(data_dir, feature_store).run("QQQ", START, END, results_dir=results_dir)
+    manifest = SweepStore(results_dir).read_manifest()
+    assert (manifest["status"], manifest["completed"]) == ("running", 2)
+
+    def count_runs(self, params, *args, **kwargs):
+        calls.append(params)
+        return real_run(self, params, *args, **kwargs)
+
+    monkeypatch.setattr(ParameterSweep, "_run_backtest", count_runs)
+    sweep = _sweep(data_dir, feature_store)
+    df = sweep.run("QQQ", START, END, results_dir=results_dir, resume=True, collect_outcomes=True)
+
+    assert len(calls) == 4
+    pd.testing.assert_frame_equal(_by_params(df), _by_params(fresh[0]))
+    order = [fresh[1].combo_index(params) for params in sweep.outcomes.combos.to_dict("records")]
+    np.testing.assert_array_equal(sweep.outcomes.r_multiple, fresh[1].r_multiple[:, order])
+    assert SweepStore(results_dir).read_manifest()["status"] == "complete"
+
+
+def test_resume_rejects_different_run(data_dir, feature_store, tmp_path):
+    results_dir = tmp_path / "run"
+    _sweep(data_dir, feature_store).run("QQQ", START, END, results_dir=results_dir)
+    with pytest.raises(ValueError, match="different run"):
+        _sweep(data_dir, feature_store).run(
+            "QQQ", START, datetime(2024, 2, 29, tzinfo=ET), results_dir=results_dir, resume=True
+        )
+
+
+def test_keep_top_k_bounds_full_results(data_dir, feature_store, fresh, tmp_path):
+    results_dir = tmp_path / "run"
+    streamed = []
+    sweep = _sweep(data_dir, feature_store)
+    df = sweep.run(
+        "QQQ", START, END, results_dir=results_dir, keep_top_k=1, result_callback=streamed.append
+    )
+
+    assert len(df) == 4
+    assert sum(r.result is not None for r in streamed) == 1
+    (best,) = sweep.top_results
+    assert best.result is not None
+    assert best.summary["composite_score"] == df["composite_score"].max()
+
+    store = SweepStore(results_dir)
+    assert len(list(store.top_k.root.iterdir())) == 1
+    assert store.load_full(best.params).overall == best.result.overall
@@ -0,0 +1,89 @@
+"""
+Parity suite: VectorizedORBEngine vs the event-driven BacktestEngine.
+
+Documented tolerance is zero on the legacy execution path — trades must be
+identical field for field and the equity curve identical bar for bar.
+Synthetic data includes a half-day session (no 15:55 bar, so the position
+carries overnight) and a truncated final session (position open at the end).
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from vibe.backtester.core.engine import BacktestEngine
+from vibe.backtester.core.vectorized import VectorizedORBEngine
+from vibe.backtester.data.synthetic import generate_minute_bars, write_synthetic_parquet
+from vibe.tests.backtester.conftest import ruleset_with
+
+ET = ZoneInfo("America/New_York")
+START = datetime(2024, 1, 1, tzinfo=ET)
+END = datetime(2024, 12, 31, tzinfo=ET)
+
+
+@pytest.fixture(scope="module")
+def data_dir(tmp_path_factory):
+    df = generate_minute_bars(days=60, seed=21)
+    dates = sorted(set(df.index.date))
+    half_day, last_day = dates[10], dates[-1]
+    drop = ((df.index.date == half_day) & (df.index.hour >= 13)) | (
+        (df.index.date == last_day) & (df.index.hour >= 12)
+    )
+    path = tmp_path_factory.mktemp("synthetic_parquet")
+    write_synthetic_parquet(path, symbol="QQQ", df=df[~drop])
+    return path
+
+
+CASES = {
+    "production": {},
+    "take_profit": {"exit": {"take_profit": {"method": "orb_range_multiple", "multiplier": 1.0}}},
+    "breakeven_trail": {"exit": {"trailing_stop": {"method": "breakeven_plus_ticks", "trigger_r": 0.5, "plus_ticks": 3}}},
+    "stepped_trail": {"exit": {"trailing_stop": {
+        "method": "stepped_r_multiple",
+        "steps": [{"at": 0.5, "move_stop_to": 0.0}, {"at": 1.0, "move_stop_to": 0.5}],
+    }}},
+    "body_breakout_15m_orb": {"strategy": {"breakout_evaluation": "body", "orb_duration_minutes": 15}},
+    "no_body_filter_early_cutoff": {"strategy": {"orb_body_pct_filter": 0.0, "entry_cutoff_time": "11:00"}},
+    "volume_filter": {"trade_filter": {"volume_confirmation": True, "volume_threshold": 1.3}},
+}
+
+
+@pytest.mark.parametrize("case", sorted(CASES))
+@pytest.mark.parametrize("slippage_ticks", [0, 5])
+def test_vectorized_matches_event_engine(data_dir, case, slippage_ticks):
+    ruleset = ruleset_with(**CASES[case])
+    expected = BacktestEngine(ruleset, data_dir, slippage_ticks=slippage_ticks).run("QQQ", START, END)
+    actual = VectorizedORBEngine(ruleset, data_dir, slippage_ticks=slippage_ticks).run("QQQ", START, END)
+
+    assert expected.trades
+    assert [t.model_dump() for t in actual.trades] == [t.model_dump() for t in expected.trades]
+    assert actual.equity.equity_curve.equals(expected.equity.equity_curve)
+    assert actual.overall == expected.overall
+
+
+def test_parity_data_exercises_edge_cases(data_dir):
+    """Guard against the fixture silently losing the scenarios it exists for."""
+    with_tp = VectorizedORBEngine(ruleset_with(**CASES["take_profit"]), data_dir).run("QQQ", START, END).trades
+    assert {t.side for t in with_tp} == {"buy", "sell"}
+    assert {"TP", "STOP", "EOD"} <= {t.exit_reason for t in with_tp}
+
+    production = VectorizedORBEngine(ruleset_with(), data_dir).run("QQQ", START, END).trades
+    assert any(t.exit_time.date() != t.entry_time.date() for t in production)
+
+
+def test_run_ending_mid_session_matches_event_engine(data_dir):
+    """A position still open when the data ends is marked to market, never closed."""
+    ruleset = ruleset_with(strategy={"orb_body_pct_filter": 0.0})
+    end = datetime(2024, 3, 22, 11, 0, tzinfo=ET)  # last session is cut at 12:00
+    result = VectorizedORBEngine(ruleset, data_dir).run("QQQ", START, end)
+    expected = BacktestEngine(ruleset, data_dir).run("QQQ", START, end)
+    assert len(result.trades) == len(expected.trades)
+    assert result.equity.equity_curve.equals(expected.equity.equity_curve)
+
+
+def test_empty_range_returns_no_trades(data_dir):
+    ruleset = ruleset_with()
+    empty_start = datetime(2030, 1, 1, tzinfo=ET)
+    result = VectorizedORBEngine(ruleset, data_dir).run("QQQ", empty_start, datetime(2030, 2, 1, tzinfo=ET))
+    assert result.trades == []
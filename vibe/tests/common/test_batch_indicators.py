@@ -0,0 +1,61 @@
+"""
+Vectorized batch indicators (atr_series_fast, adx_series_fast,
+rolling_percentile_rank_fast) against the reference loop implementations.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from vibe.common.indicators.batch import (
+    adx_series,
+    adx_series_fast,
+    atr_series,
+    atr_series_fast,
+    rolling_percentile_rank,
+    rolling_percentile_rank_fast,
+)
+
+
+def _ohlc(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame(
+        {"high": close + rng.uniform(0, 2, n), "low": close - rng.uniform(0, 2, n), "close": close},
+        index=pd.date_range("2022-01-03", periods=n, freq="D"),
+    )
+
+
+@pytest.mark.parametrize("n", [1, 13, 14, 15, 28, 29, 500])
+@pytest.mark.parametrize("length", [5, 14])
+def test_wilder_indicators_match_reference(n, length):
+    df = _ohlc(n)
+    pd.testing.assert_series_equal(atr_series_fast(df, length), atr_series(df, length), rtol=1e-12)
+    pd.testing.assert_series_equal(adx_series_fast(df, length), adx_series(df, length), rtol=1e-12)
+
+
+def test_nan_input_poisons_later_values_like_reference():
+    df = _ohlc(200)
+    df.iloc[120, df.columns.get_loc("close")] = np.nan
+    df.iloc[150, df.columns.get_loc("high")] = np.nan
+    pd.testing.assert_series_equal(atr_series_fast(df), atr_series(df), rtol=1e-12)
+    pd.testing.assert_series_equal(adx_series_fast(df), adx_series(df), rtol=1e-12)
+
+
+@pytest.mark.parametrize("window", [1, 2, 3, 17, 64, 252])
+def test_percentile_rank_matches_reference(window):
+    rng = np.random.default_rng(window)
+    continuous = pd.Series(rng.normal(size=1000))
+    # Heavy ties: strictly-below counting must match
+    ties = pd.Series(rng.integers(0, 10, 1000).astype(float))
+    ties.iloc[[5, 400, 401]] = np.nan
+
+    for series in (continuous, ties):
+        pd.testing.assert_series_equal(
+            rolling_percentile_rank_fast(series, window), rolling_percentile_rank(series, window)
+        )
+
+
+def test_percentile_rank_shorter_than_window():
+    series = pd.Series([1.0, 2.0, 3.0])
+    assert rolling_percentile_rank_fast(series, 5).isna().all()